@@ -0,0 +1,439 @@
+"""
+Module untuk HTTP/JSON API Dapur Umum (asyncio, tanpa dependency luar).
+Dipakai tablet di posko distribusi untuk registrasi korban, distribusi
+makanan dan membaca stok/laporan dari DapurService yang sama.
+
+Endpoint:
+    GET  /stok                 Laporan stok bahan
+    GET  /porsi                Total porsi tersedia
+    GET  /gizi                 Status kebutuhan gizi
+    GET  /laporan/korban       Laporan korban
+    GET  /laporan/distribusi   Laporan distribusi
+    GET  /stok/riwayat         ?bahan=...&waktu=ISO[&mulai=ISO] stok bahan pada waktu tertentu
+    POST /bahan                {"jenis", "nama", "jumlah", "satuan", "per_porsi"}
+    POST /korban               {"nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"}
+    POST /distribusi           {"id_korban", "jumlah_porsi"}
+    POST /distribusi/batch     {"permintaan": [[id_korban, jumlah_porsi], ...], "catatan"}
+
+Koneksi HTTP/1.1 bersifat keep-alive dan mendukung pipelining: permintaan
+dibaca terus dari koneksi sementara permintaan sebelumnya masih diproses,
+dan respons dikirim sesuai urutan permintaan. Pemanggilan DapurService
+(yang bisa blocking, misal SQLite) dijalankan di thread pool executor.
+
+Cara pakai:
+    python -m api.server --port 8080
+    python -m api.server --port 8080 --db dapur_umum.db
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from urllib.parse import parse_qsl
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from models.bahan_makanan import BahanMakanan, buat_bahan
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from services.dapur_service import DapurService
+import argparse
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+BATAS_HEADER = 100
+BATAS_BODY = 1024 * 1024
+BATAS_PIPELINE = 32
+
+# Hasil handler: (status HTTP, payload JSON)
+Respons = Tuple[int, Any]
+
+
+class GalatHTTP(Exception):
+    """Permintaan tidak valid; dikirim ke klien sebagai respons error."""
+
+    def __init__(self, status: int, pesan: str):
+        super().__init__(pesan)
+        self.status = status
+
+
+class Permintaan:
+    """Satu permintaan HTTP yang sudah diurai."""
+
+    __slots__ = ('metode', 'path', 'header', 'body', 'keep_alive', 'query')
+
+    def __init__(self, metode: str, path: str, header: Dict[str, str], body: bytes,
+                 keep_alive: bool, query: str = ""):
+        self.metode = metode
+        self.path = path
+        self.header = header
+        self.body = body
+        self.keep_alive = keep_alive
+        self.query = dict(parse_qsl(query))
+
+    def json(self) -> Dict[str, Any]:
+        """
+        Mengurai body sebagai objek JSON.
+
+        Raises:
+            GalatHTTP: Jika body bukan objek JSON
+        """
+        try:
+            data = json.loads(self.body or b"{}")
+        except ValueError:
+            raise GalatHTTP(400, "Body bukan JSON yang valid")
+        if not isinstance(data, dict):
+            raise GalatHTTP(400, "Body harus berupa objek JSON")
+        return data
+
+
+def distribusi_ke_dict(distribusi: DistribusiMakanan) -> Dict[str, Any]:
+    """Konversi object distribusi ke dict JSON."""
+    return {
+        'id_distribusi': distribusi.get_id_distribusi(),
+        'id_korban': distribusi.get_id_korban(),
+        'jumlah_porsi': distribusi.get_jumlah_porsi(),
+        'waktu_distribusi': distribusi.get_waktu_distribusi().isoformat(timespec='seconds'),
+        'catatan': distribusi.get_catatan(),
+    }
+
+
+def bahan_dari_dict(data: Dict[str, Any]) -> BahanMakanan:
+    """
+    Membuat bahan dari dict JSON sesuai jenisnya (Polymorphism).
+
+    Raises:
+        ValueError: Jika jenis tidak dikenal atau data tidak valid
+    """
+    per_porsi = data.get('per_porsi')
+    return buat_bahan(str(data.get('jenis') or ''), str(data.get('nama') or ''),
+                      float(data.get('jumlah', 0)), str(data.get('satuan') or 'kg'),
+                      float(per_porsi) if per_porsi is not None else None)
+
+
+class DapurHTTPServer:
+    """
+    HTTP/JSON server asyncio di atas DapurService.
+
+    Event loop hanya mengurus I/O jaringan dan parsing; setiap handler
+    dijalankan di executor. Pada satu koneksi, permintaan GET boleh diproses
+    bersamaan, sedangkan POST menunggu semua permintaan sebelumnya selesai
+    (dan permintaan berikutnya menunggu POST tersebut), sehingga pipelining
+    tidak mengubah urutan efek perubahan data.
+    """
+
+    def __init__(self, service: DapurService, host: str = "127.0.0.1", port: int = 8080,
+                 executor: Optional[Executor] = None, jumlah_worker: int = 8,
+                 timeout_idle: float = 15.0):
+        """
+        Constructor dengan Dependency Injection service.
+
+        Args:
+            service: DapurService yang dilayani
+            host: Alamat bind
+            port: Port (0 = dipilih OS)
+            executor: Executor untuk handler (default ThreadPoolExecutor)
+            jumlah_worker: Jumlah thread jika executor dibuat sendiri
+            timeout_idle: Detik sebelum koneksi keep-alive yang diam ditutup
+        """
+        self.__service = service
+        self.__host = host
+        self.__port = port
+        self.__executor_sendiri = executor is None
+        self.__executor = executor or ThreadPoolExecutor(jumlah_worker,
+                                                         thread_name_prefix="api-worker")
+        self.__timeout_idle = timeout_idle
+        self.__server: Optional[asyncio.AbstractServer] = None
+        self.__rute: Dict[Tuple[str, str], Callable[[Permintaan], Respons]] = {
+            ("GET", "/stok"): lambda p: (200, self.__service.get_laporan_stok()),
+            ("GET", "/porsi"): lambda p: (
+                200, {'total_porsi_tersedia': self.__service.hitung_total_porsi_tersedia()}),
+            ("GET", "/gizi"): lambda p: (200, self.__service.cek_kebutuhan_gizi()),
+            ("GET", "/laporan/korban"): lambda p: (200, self.__service.get_laporan_korban()),
+            ("GET", "/laporan/distribusi"): lambda p: (
+                200, self.__service.get_laporan_distribusi()),
+            ("GET", "/stok/riwayat"): self.__riwayat_stok,
+            ("POST", "/bahan"): self.__tambah_bahan,
+            ("POST", "/korban"): self.__registrasi_korban,
+            ("POST", "/distribusi"): self.__distribusi,
+            ("POST", "/distribusi/batch"): self.__distribusi_batch,
+        }
+
+    # -------------------------------------------------------------- handler
+
+    def __tambah_bahan(self, permintaan: Permintaan) -> Respons:
+        bahan = bahan_dari_dict(permintaan.json())
+        self.__service.tambah_bahan(bahan)
+        return 201, {'nama': bahan.get_nama(), 'jumlah': bahan.get_jumlah(),
+                     'porsi': bahan.hitung_porsi()}
+
+    def __riwayat_stok(self, permintaan: Permintaan) -> Respons:
+        query = permintaan.query
+        if not query.get('bahan'):
+            raise GalatHTTP(400, "Parameter 'bahan' wajib diisi")
+        waktu = datetime.fromisoformat(query['waktu']) if query.get('waktu') else None
+        mulai = datetime.fromisoformat(query['mulai']) if query.get('mulai') else None
+        return 200, self.__service.get_riwayat_stok(query['bahan'], waktu, mulai)
+
+    def __registrasi_korban(self, permintaan: Permintaan) -> Respons:
+        data = permintaan.json()
+        korban = Korban(str(data.get('nama') or ''), str(data.get('id') or ''),
+                        str(data.get('kebutuhan_khusus') or 'Umum'),
+                        int(data.get('jumlah_tanggungan', 1)))
+        self.__service.registrasi_korban(korban)
+        return 201, {'id': korban.get_id(), 'nama': korban.get_name()}
+
+    def __distribusi(self, permintaan: Permintaan) -> Respons:
+        data = permintaan.json()
+        distribusi = self.__service.distribusi_makanan(str(data.get('id_korban') or ''),
+                                                       int(data.get('jumlah_porsi', 0)))
+        return 201, distribusi_ke_dict(distribusi)
+
+    def __distribusi_batch(self, permintaan: Permintaan) -> Respons:
+        data = permintaan.json()
+        daftar = data.get('permintaan')
+        if not isinstance(daftar, list):
+            raise GalatHTTP(400, "Field 'permintaan' harus berupa list [id_korban, jumlah_porsi]")
+        hasil = self.__service.distribusi_makanan_batch(
+            [(str(item[0]), int(item[1])) for item in daftar], str(data.get('catatan') or ''))
+        for item in hasil:
+            if item['distribusi'] is not None:
+                item['distribusi'] = distribusi_ke_dict(item['distribusi'])
+        return 200, {'hasil': hasil, 'berhasil': sum(1 for h in hasil if h['berhasil'])}
+
+    def proses(self, permintaan: Permintaan) -> Respons:
+        """
+        Menjalankan handler untuk satu permintaan (dipanggil di executor).
+
+        Returns:
+            Respons: Status HTTP dan payload JSON
+        """
+        handler = self.__rute.get((permintaan.metode, permintaan.path))
+        if handler is None:
+            if any(path == permintaan.path for _, path in self.__rute):
+                return 405, {'error': f"Metode {permintaan.metode} tidak diizinkan"}
+            return 404, {'error': f"Path {permintaan.path} tidak ditemukan"}
+        try:
+            return handler(permintaan)
+        except GalatHTTP as e:
+            return e.status, {'error': str(e)}
+        except (ValueError, TypeError, IndexError) as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            logger.exception("Error tidak terduga pada %s %s", permintaan.metode, permintaan.path)
+            return 500, {'error': f"Kesalahan internal: {e}"}
+
+    # ------------------------------------------------------------ jaringan
+
+    async def mulai(self) -> int:
+        """
+        Mulai menerima koneksi.
+
+        Returns:
+            int: Port yang dipakai (berguna jika port=0)
+        """
+        self.__server = await asyncio.start_server(self.__tangani_koneksi,
+                                                   self.__host, self.__port)
+        port = self.__server.sockets[0].getsockname()[1]
+        logger.info("API Dapur Umum mendengarkan di http://%s:%s", self.__host, port)
+        return port
+
+    async def berhenti(self) -> None:
+        """Berhenti menerima koneksi dan mematikan executor milik server."""
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+        if self.__executor_sendiri:
+            self.__executor.shutdown(wait=True)
+        logger.info("API Dapur Umum dihentikan")
+
+    async def __baca_permintaan(self, reader: asyncio.StreamReader) -> Optional[Permintaan]:
+        """
+        Membaca satu permintaan dari stream.
+
+        Returns:
+            Optional[Permintaan]: None jika klien menutup koneksi
+
+        Raises:
+            GalatHTTP: Jika permintaan tidak valid
+            asyncio.TimeoutError: Jika koneksi diam lebih lama dari timeout_idle
+        """
+        baris = await asyncio.wait_for(reader.readline(), self.__timeout_idle)
+        if not baris:
+            return None
+        try:
+            metode, target, versi = baris.decode("latin-1").split()
+        except ValueError:
+            raise GalatHTTP(400, "Request line tidak valid")
+        if not versi.startswith("HTTP/1."):
+            raise GalatHTTP(505, f"Versi {versi} tidak didukung")
+
+        header: Dict[str, str] = {}
+        while True:
+            baris = await reader.readline()
+            if baris in (b"\r\n", b"\n", b""):
+                break
+            if len(header) >= BATAS_HEADER:
+                raise GalatHTTP(431, "Header terlalu banyak")
+            nama, _, nilai = baris.decode("latin-1").partition(":")
+            header[nama.strip().lower()] = nilai.strip()
+
+        if "chunked" in header.get("transfer-encoding", "").lower():
+            raise GalatHTTP(501, "Transfer-Encoding chunked tidak didukung")
+        try:
+            panjang = int(header.get("content-length", "0"))
+        except ValueError:
+            raise GalatHTTP(400, "Content-Length tidak valid")
+        if panjang < 0 or panjang > BATAS_BODY:
+            raise GalatHTTP(413, "Body terlalu besar")
+        body = await reader.readexactly(panjang) if panjang else b""
+
+        koneksi = header.get("connection", "").lower()
+        keep_alive = koneksi != "close" if versi == "HTTP/1.1" else koneksi == "keep-alive"
+        path, _, query = target.partition("?")
+        return Permintaan(metode.upper(), path, header, body, keep_alive, query)
+
+    def __jadwalkan(self, permintaan: Permintaan,
+                    tunggu: List['asyncio.Future']) -> 'asyncio.Future':
+        """Menjadwalkan handler di executor setelah future 'tunggu' selesai."""
+        loop = asyncio.get_running_loop()
+
+        async def jalankan() -> Respons:
+            if tunggu:
+                await asyncio.wait(tunggu)
+            return await loop.run_in_executor(self.__executor, self.proses, permintaan)
+
+        return asyncio.ensure_future(jalankan())
+
+    async def __tangani_koneksi(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Membaca permintaan (pipelining) dan menjadwalkan pemrosesannya."""
+        antrean: asyncio.Queue = asyncio.Queue(BATAS_PIPELINE)
+        penulis = asyncio.ensure_future(self.__tulis_respons(antrean, writer))
+        penghalang: List[asyncio.Future] = []      # POST terakhir
+        sejak_penghalang: List[asyncio.Future] = []
+        try:
+            while not penulis.done():
+                permintaan = await self.__baca_permintaan(reader)
+                if permintaan is None:
+                    break
+                if permintaan.metode == "GET":
+                    future = self.__jadwalkan(permintaan, penghalang)
+                    sejak_penghalang.append(future)
+                else:
+                    future = self.__jadwalkan(permintaan, penghalang + sejak_penghalang)
+                    penghalang, sejak_penghalang = [future], []
+                await antrean.put((future, permintaan.keep_alive))
+                if not permintaan.keep_alive:
+                    break
+        except GalatHTTP as e:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result((e.status, {'error': str(e)}))
+            await antrean.put((future, False))
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            await antrean.put(None)
+            await penulis
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def __tulis_respons(self, antrean: asyncio.Queue,
+                              writer: asyncio.StreamWriter) -> None:
+        """Menulis respons sesuai urutan permintaan."""
+        terputus = False
+        while True:
+            item = await antrean.get()
+            if item is None:
+                return
+            future, keep_alive = item
+            status, payload = await future
+            if terputus:
+                continue
+            try:
+                writer.write(self.__format_respons(status, payload, keep_alive))
+                await writer.drain()
+            except ConnectionError:
+                terputus = True
+            if not keep_alive:
+                terputus = True
+
+    @staticmethod
+    def __format_respons(status: int, payload: Any, keep_alive: bool) -> bytes:
+        """Menyusun respons HTTP/1.1 dengan body JSON."""
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        try:
+            alasan = HTTPStatus(status).phrase
+        except ValueError:
+            alasan = "Unknown"
+        kepala = (f"HTTP/1.1 {status} {alasan}\r\n"
+                  f"Content-Type: application/json; charset=utf-8\r\n"
+                  f"Content-Length: {len(body)}\r\n"
+                  f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        return kepala.encode("latin-1") + body
+
+
+def buat_service(db_path: Optional[str] = None) -> DapurService:
+    """
+    Membuat DapurService dengan repository memori atau SQLite. Keduanya
+    memakai ledger stok; hanya SQLite yang menyimpannya setelah restart.
+
+    Args:
+        db_path: Path database SQLite (None = repository memori)
+    """
+    if db_path:
+        from repositories.sqlite_repository import (
+            buka_koneksi, SQLiteBahanRepository, SQLiteKorbanRepository,
+            SQLiteDistribusiRepository
+        )
+        koneksi = buka_koneksi(db_path)
+        return DapurService(SQLiteBahanRepository(koneksi), SQLiteKorbanRepository(koneksi),
+                            SQLiteDistribusiRepository(koneksi))
+    from repositories.bahan_repository import BahanRepository
+    from repositories.korban_repository import KorbanRepository
+    from repositories.distribusi_repository import DistribusiRepository
+    from repositories.buku_stok import BukuStok
+    return DapurService(BahanRepository(BukuStok()), KorbanRepository(), DistribusiRepository())
+
+
+async def layani(server: DapurHTTPServer) -> None:
+    """Menjalankan server sampai dibatalkan (Ctrl+C)."""
+    await server.mulai()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.berhenti()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point: python -m api.server."""
+    from utils.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="HTTP/JSON API Dapur Umum")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db", help="Path database SQLite (default: memori)")
+    parser.add_argument("--worker", type=int, default=8,
+                        help="Jumlah thread executor (SQLite selalu 1 karena koneksi dipakai bersama)")
+    args = parser.parse_args(argv)
+
+    setup_logging(level=logging.WARNING)
+    # Satu koneksi SQLite dipakai bersama, jadi akses ke database diserialkan
+    jumlah_worker = 1 if args.db else args.worker
+    server = DapurHTTPServer(buat_service(args.db), args.host, args.port,
+                             jumlah_worker=jumlah_worker)
+    print(f"API Dapur Umum berjalan di http://{args.host}:{args.port} (Ctrl+C untuk berhenti)")
+    try:
+        asyncio.run(layani(server))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+"""
+Load test lokal untuk HTTP/JSON API Dapur Umum (api/server.py).
+
+Membuka beberapa koneksi keep-alive dan mengirim permintaan secara
+pipelined (beberapa permintaan sekaligus per koneksi), lalu mengukur
+permintaan per detik dan latensi p50/p99. Tanpa --url, server dijalankan
+di proses yang sama (thread terpisah) dengan dataset sintetis.
+
+Campuran beban:
+    baca        GET /porsi
+    laporan     GET /gizi
+    distribusi  POST /distribusi (setiap permintaan ke korban berbeda)
+
+Cara pakai:
+    python benchmarks/bench_api.py --koneksi 16 --pipeline 8 --permintaan 20000
+    python benchmarks/bench_api.py --url 127.0.0.1:8080 --campuran baca
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Tambahkan parent directory ke sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.server import DapurHTTPServer, buat_service
+from bench_service import persentil
+from models.person import Korban
+from models.bahan_makanan import BahanPokok, BahanProtein
+from utils.logging_config import mode_senyap
+
+CAMPURAN = {
+    'baca': ('baca',),
+    'laporan': ('laporan',),
+    'distribusi': ('distribusi',),
+    'campur': ('baca', 'baca', 'baca', 'laporan', 'distribusi'),
+}
+
+
+def buat_permintaan(jenis: str, nomor: int) -> bytes:
+    """Menyusun permintaan HTTP mentah untuk satu jenis operasi."""
+    if jenis == 'distribusi':
+        body = json.dumps({"id_korban": f"KRB-{nomor:07d}", "jumlah_porsi": 1}).encode()
+        return (b"POST /distribusi HTTP/1.1\r\nHost: bench\r\n"
+                b"Content-Type: application/json\r\nContent-Length: "
+                + str(len(body)).encode() + b"\r\n\r\n" + body)
+    path = b"/porsi" if jenis == 'baca' else b"/gizi"
+    return b"GET " + path + b" HTTP/1.1\r\nHost: bench\r\n\r\n"
+
+
+async def baca_status(reader: asyncio.StreamReader) -> int:
+    """Membaca satu respons dan mengembalikan status HTTP-nya."""
+    status = int((await reader.readline()).split()[1])
+    panjang = 0
+    while True:
+        baris = await reader.readline()
+        if baris == b"\r\n":
+            break
+        if baris[:15].lower() == b"content-length:":
+            panjang = int(baris[15:])
+    await reader.readexactly(panjang)
+    return status
+
+
+async def klien(host: str, port: int, jenis_list: Tuple[str, ...], nomor: List[int],
+                jumlah: int, pipeline: int, latensi: List[float], status: Counter) -> None:
+    """Satu koneksi: kirim blok pipelined sebanyak 'pipeline' lalu baca semua responsnya."""
+    reader, writer = await asyncio.open_connection(host, port)
+    terkirim = 0
+    while terkirim < jumlah:
+        blok = min(pipeline, jumlah - terkirim)
+        data = []
+        for _ in range(blok):
+            nomor[0] += 1
+            data.append(buat_permintaan(jenis_list[nomor[0] % len(jenis_list)], nomor[0]))
+        awal = time.perf_counter()
+        writer.write(b"".join(data))
+        for _ in range(blok):
+            status[await baca_status(reader)] += 1
+            latensi.append(time.perf_counter() - awal)
+        terkirim += blok
+    writer.close()
+
+
+async def jalankan_beban(host: str, port: int, campuran: str, koneksi: int,
+                         permintaan: int, pipeline: int) -> Dict[str, float]:
+    """
+    Menjalankan load test.
+
+    Returns:
+        Dict: permintaan/detik, latensi p50/p99 (ms) dan jumlah per status HTTP
+    """
+    latensi: List[float] = []
+    status: Counter = Counter()
+    nomor = [0]
+    per_koneksi = permintaan // koneksi
+    awal = time.perf_counter()
+    await asyncio.gather(*(klien(host, port, CAMPURAN[campuran], nomor, per_koneksi,
+                                 pipeline, latensi, status) for _ in range(koneksi)))
+    durasi = time.perf_counter() - awal
+    urut = sorted(int(x * 1_000_000) for x in latensi)
+    return {
+        'permintaan_per_detik': len(latensi) / durasi,
+        'p50_ms': persentil(urut, 50) / 1000,
+        'p99_ms': persentil(urut, 99) / 1000,
+        'status': dict(status),
+    }
+
+
+def jalankan_server_lokal(jumlah_korban: int, worker: int) -> Tuple[str, int]:
+    """
+    Menjalankan server dengan dataset sintetis di thread latar.
+
+    Returns:
+        Tuple[str, int]: host dan port server
+    """
+    service = buat_service()
+    service.tambah_bahan(BahanPokok("Beras", jumlah_korban * 1.0, "kg", 250.0))
+    service.tambah_bahan(BahanProtein("Telur", jumlah_korban * 1.0, "butir", 0.5))
+    for i in range(1, jumlah_korban + 1):
+        service.registrasi_korban(Korban(f"Korban {i}", f"KRB-{i:07d}", "Umum", 3))
+
+    siap = threading.Event()
+    alamat: List[int] = []
+
+    def jalankan() -> None:
+        async def utama() -> None:
+            server = DapurHTTPServer(service, port=0, jumlah_worker=worker)
+            alamat.append(await server.mulai())
+            siap.set()
+            await asyncio.Event().wait()
+        asyncio.run(utama())
+
+    threading.Thread(target=jalankan, name="api-server", daemon=True).start()
+    siap.wait()
+    return "127.0.0.1", alamat[0]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point load test."""
+    parser = argparse.ArgumentParser(description="Load test HTTP/JSON API Dapur Umum")
+    parser.add_argument("--url", help="host:port server yang sudah berjalan (default: server lokal)")
+    parser.add_argument("--campuran", choices=tuple(CAMPURAN), default="campur")
+    parser.add_argument("--koneksi", type=int, default=16, help="Jumlah koneksi keep-alive")
+    parser.add_argument("--pipeline", type=int, default=8,
+                        help="Jumlah permintaan yang dikirim sekaligus per koneksi")
+    parser.add_argument("--permintaan", type=int, default=20000, help="Total permintaan")
+    parser.add_argument("--worker", type=int, default=8, help="Thread executor server lokal")
+    args = parser.parse_args(argv)
+
+    with mode_senyap(('models', 'repositories', 'services', 'api'), level=logging.CRITICAL):
+        if args.url:
+            host, _, port = args.url.rpartition(":")
+            port = int(port)
+        else:
+            host, port = jalankan_server_lokal(args.permintaan, args.worker)
+        hasil = asyncio.run(jalankan_beban(host, port, args.campuran, args.koneksi,
+                                           args.permintaan, args.pipeline))
+
+    print(f"Campuran {args.campuran}, {args.koneksi} koneksi, pipeline {args.pipeline}")
+    print(f"  Permintaan/detik : {hasil['permintaan_per_detik']:,.0f}")
+    print(f"  Latensi p50      : {hasil['p50_ms']:.2f} ms")
+    print(f"  Latensi p99      : {hasil['p99_ms']:.2f} ms")
+    print(f"  Status HTTP      : {hasil['status']}")
+    return 0 if set(hasil['status']) <= {200, 201} else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Benchmark distribusi bersamaan dari beberapa posko (thread).
+
+Setiap posko menjalankan DapurService.distribusi_makanan terhadap inventori
+yang sama. Waktu layanan di posko (mencatat penerima, menyerahkan makanan)
+disimulasikan dengan --latensi dan terjadi di luar lock, sehingga throughput
+naik seiring jumlah posko selama lock repository dan lock bahan hanya dipegang
+sebentar. Tanpa latensi, pekerjaan murni Python dibatasi GIL sehingga
+throughput relatif datar - yang diukur di sini adalah tidak adanya kolaps
+karena kontensi lock.
+
+Setelah setiap putaran, invariant dicek: stok tidak negatif dan stok yang
+terpakai sama dengan porsi yang tercatat di repository distribusi.
+
+Cara pakai:
+    python benchmarks/bench_konkuren.py --posko 1,2,4,8 --transaksi 4000
+    python benchmarks/bench_konkuren.py --latensi 2 --transaksi 800
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Tambahkan parent directory ke sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.person import Korban
+from models.bahan_makanan import BahanPokok
+from repositories.korban_repository import KorbanRepository
+from repositories.bahan_repository import BahanRepository
+from repositories.distribusi_repository import DistribusiRepository
+from services.dapur_service import DapurService
+from utils.logging_config import mode_senyap
+
+KG_PER_PORSI = 0.25
+
+
+def jalankan_putaran(jumlah_posko: int, transaksi: int, latensi: float,
+                     rasio_stok: float) -> Dict[str, float]:
+    """
+    Menjalankan satu putaran benchmark.
+
+    Args:
+        jumlah_posko: Jumlah thread posko
+        transaksi: Total distribusi yang diminta (dibagi rata ke semua posko)
+        latensi: Waktu layanan per transaksi di posko (detik, di luar lock)
+        rasio_stok: Stok awal sebagai proporsi dari porsi yang diminta
+            (< 1 memaksa sebagian permintaan ditolak karena stok habis)
+
+    Returns:
+        Dict: transaksi/detik, jumlah berhasil/ditolak dan hasil cek invariant
+
+    Raises:
+        AssertionError: Jika stok negatif atau tidak sesuai porsi tercatat
+    """
+    stok_awal = transaksi * rasio_stok * KG_PER_PORSI
+    beras = BahanPokok("Beras", stok_awal, "kg", 250.0)
+    distribusi_repo = DistribusiRepository()
+    service = DapurService(BahanRepository(), KorbanRepository(), distribusi_repo)
+    service.tambah_bahan(beras)
+    for i in range(transaksi):
+        # Satu korban per transaksi agar ID distribusi (per detik per korban) unik
+        service.registrasi_korban(Korban(f"Korban {i}", f"KRB-{i:06d}", "Umum", 1))
+
+    berhasil = [0] * jumlah_posko
+    mulai = threading.Barrier(jumlah_posko + 1)
+
+    def posko(nomor: int) -> None:
+        mulai.wait()
+        for i in range(nomor, transaksi, jumlah_posko):
+            if latensi:
+                time.sleep(latensi)
+            try:
+                service.distribusi_makanan(f"KRB-{i:06d}", 1)
+                berhasil[nomor] += 1
+            except ValueError:
+                pass
+
+    threads = [threading.Thread(target=posko, args=(n,)) for n in range(jumlah_posko)]
+    for t in threads:
+        t.start()
+    mulai.wait()
+    awal = time.perf_counter()
+    for t in threads:
+        t.join()
+    durasi = time.perf_counter() - awal
+
+    total_berhasil = sum(berhasil)
+    terpakai = stok_awal - beras.get_jumlah()
+    assert beras.get_jumlah() >= 0, "Stok negatif"
+    assert distribusi_repo.get_total_porsi_terdistribusi() == total_berhasil
+    assert abs(terpakai - total_berhasil * KG_PER_PORSI) < 1e-6, "Stok tidak sesuai distribusi"
+    return {
+        'posko': jumlah_posko,
+        'transaksi_per_detik': transaksi / durasi,
+        'berhasil': total_berhasil,
+        'ditolak': transaksi - total_berhasil,
+        'sisa_stok_kg': beras.get_jumlah(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark distribusi dari banyak posko")
+    parser.add_argument("--posko", default="1,2,4,8",
+                        help="Daftar jumlah posko (thread), dipisah koma")
+    parser.add_argument("--transaksi", type=int, default=4000,
+                        help="Jumlah distribusi per putaran")
+    parser.add_argument("--latensi", type=float, default=0.0,
+                        help="Waktu layanan per transaksi di posko (milidetik)")
+    parser.add_argument("--rasio-stok", type=float, default=0.75,
+                        help="Stok awal sebagai proporsi porsi yang diminta")
+    args = parser.parse_args(argv)
+
+    print(f"{'Posko':>6} {'Transaksi/detik':>16} {'Skala':>7} {'Berhasil':>9} "
+          f"{'Ditolak':>8} {'Sisa stok':>10}")
+    dasar = None
+    with mode_senyap(level=logging.CRITICAL):
+        for jumlah_posko in (int(p) for p in args.posko.split(",")):
+            hasil = jalankan_putaran(jumlah_posko, args.transaksi, args.latensi / 1000,
+                                     args.rasio_stok)
+            dasar = dasar or hasil['transaksi_per_detik']
+            print(f"{hasil['posko']:>6} {hasil['transaksi_per_detik']:>16,.0f} "
+                  f"{hasil['transaksi_per_detik'] / dasar:>6.2f}x {hasil['berhasil']:>9} "
+                  f"{hasil['ditolak']:>8} {hasil['sisa_stok_kg']:>10.2f}")
+    print("Invariant stok terpenuhi di semua putaran")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
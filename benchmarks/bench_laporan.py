@@ -0,0 +1,107 @@
+"""
+Benchmark mesin laporan paralel (MesinLaporan) terhadap jumlah proses.
+
+Membuat dataset sintetis korban dan distribusi, lalu menghitung laporan
+lengkap (rincian + baris detail) secara serial dan dengan process pool
+berbagai ukuran. Setiap putaran dicek menghasilkan laporan yang sama persis
+dengan perhitungan serial. Speedup mendekati linear selama jumlah proses
+tidak melebihi jumlah core; bagian serial (membaca repository dan menggabung
+hasil) membatasi speedup maksimum.
+
+Cara pakai:
+    python benchmarks/bench_laporan.py --jumlah 500000 --proses 1,2,4,8
+    python benchmarks/bench_laporan.py --jumlah 200000 --tanpa-detail
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Tambahkan parent directory ke sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from repositories.korban_repository import KorbanRepository
+from repositories.distribusi_repository import DistribusiRepository
+from services.laporan_paralel import MesinLaporan
+from utils.logging_config import mode_senyap
+
+KEBUTUHAN = ("Umum", "Lansia", "Bayi", "Sakit")
+DETIK_PER_HARI = 86400
+
+
+def isi_dataset(jumlah: int) -> tuple:
+    """
+    Membuat repository korban dan distribusi berisi `jumlah` entitas masing-masing.
+
+    Returns:
+        tuple: (korban_repo, distribusi_repo)
+    """
+    korban_repo, distribusi_repo = KorbanRepository(), DistribusiRepository()
+    awal = time.time() - 30 * DETIK_PER_HARI
+    with mode_senyap():
+        korban_repo.add_many(
+            Korban(f"Korban {i}", f"KRB-{i:07d}", KEBUTUHAN[i % 4], 1 + i % 6)
+            for i in range(jumlah))
+        distribusi_repo.add_many(
+            DistribusiMakanan(f"DIST-{i:09d}", f"KRB-{i % jumlah:07d}", 1 + i % 10, "",
+                              datetime.fromtimestamp(awal + i * 30 * DETIK_PER_HARI / jumlah))
+            for i in range(jumlah))
+    return korban_repo, distribusi_repo
+
+
+def ukur(mesin: MesinLaporan, dengan_detail: bool) -> tuple:
+    """Menjalankan laporan lengkap sekali. Returns: (detik, hasil)."""
+    awal = time.perf_counter()
+    hasil = mesin.laporan_lengkap(dengan_detail)
+    return time.perf_counter() - awal, hasil
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point benchmark."""
+    core = os.cpu_count() or 1
+    bawaan = ",".join(str(n) for n in (1, 2, 4, 8, 16) if n <= max(core, 1))
+    parser = argparse.ArgumentParser(description="Benchmark laporan paralel")
+    parser.add_argument("--jumlah", type=int, default=200_000,
+                        help="Jumlah korban dan jumlah distribusi")
+    parser.add_argument("--proses", default=bawaan,
+                        help="Daftar jumlah proses dipisah koma (default: 1,2,4,.. sampai jumlah core)")
+    parser.add_argument("--chunk", type=int, default=20_000, help="Entitas per chunk")
+    parser.add_argument("--tanpa-detail", action="store_true",
+                        help="Hanya rincian angka, tanpa baris detail get_info()")
+    parser.add_argument("--output", help="Simpan hasil ke file JSON")
+    args = parser.parse_args(argv)
+    dengan_detail = not args.tanpa_detail
+
+    korban_repo, distribusi_repo = isi_dataset(args.jumlah)
+    print(f"Dataset {args.jumlah:,} korban + {args.jumlah:,} distribusi, {core} core")
+
+    durasi_serial, acuan = ukur(MesinLaporan(korban_repo, distribusi_repo, 0, args.chunk), dengan_detail)
+    print(f"{'Proses':>7} {'Detik':>8} {'Speedup':>8} {'Efisiensi':>10}")
+    print(f"{'serial':>7} {durasi_serial:>8.2f} {1.0:>7.2f}x {'-':>10}")
+
+    putaran: List[Dict] = []
+    for jumlah_proses in (int(p) for p in args.proses.split(",")):
+        durasi, hasil = ukur(MesinLaporan(korban_repo, distribusi_repo, jumlah_proses, args.chunk),
+                             dengan_detail)
+        assert hasil == acuan, "Hasil paralel berbeda dari serial"
+        speedup = durasi_serial / durasi
+        putaran.append({'proses': jumlah_proses, 'detik': durasi, 'speedup': speedup})
+        print(f"{jumlah_proses:>7} {durasi:>8.2f} {speedup:>7.2f}x {speedup / jumlah_proses:>9.0%}")
+    print("Semua hasil paralel sama dengan perhitungan serial")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({'jumlah': args.jumlah, 'core': core, 'detail': dengan_detail,
+                       'serial_detik': durasi_serial, 'putaran': putaran}, f, indent=2)
+        print(f"Hasil disimpan ke {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
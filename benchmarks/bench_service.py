@@ -0,0 +1,272 @@
+"""
+Benchmark skalabilitas operasi DapurService dan repository.
+
+Membuat dataset sintetis (korban dan distribusi) pada beberapa skala, lalu
+mengukur setiap operasi: throughput, latensi p50/p99 dan puncak memori.
+Hasil disimpan sebagai JSON dan bisa dibandingkan dengan hasil sebelumnya.
+
+Cara pakai:
+    python benchmarks/bench_service.py --skala 1k,100k --output hasil.json
+    python benchmarks/bench_service.py --skala 1k,100k --baseline hasil.json
+    python benchmarks/bench_service.py --skala 1m --repo kolom
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Tambahkan parent directory ke sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+from repositories.korban_repository import KorbanRepository
+from repositories.bahan_repository import BahanRepository
+from repositories.distribusi_repository import DistribusiRepository
+from repositories.columnar_distribusi_repository import ColumnarDistribusiRepository
+from repositories.sqlite_repository import (
+    buka_koneksi, SQLiteBahanRepository, SQLiteKorbanRepository, SQLiteDistribusiRepository
+)
+from services.dapur_service import DapurService
+from utils.logging_config import mode_senyap
+
+SKALA = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+KEBUTUHAN = ("Umum", "Lansia", "Bayi", "Sakit")
+UKURAN_BLOK = 50_000
+
+
+def buat_repositories(jenis_repo: str, direktori: str) -> Tuple:
+    """
+    Membuat repository bahan, korban dan distribusi sesuai jenis.
+
+    Args:
+        jenis_repo: "memori", "kolom" (distribusi berbasis kolom) atau "sqlite"
+        direktori: Direktori sementara untuk file database
+
+    Returns:
+        Tuple: (bahan_repo, korban_repo, distribusi_repo) yang masih kosong
+    """
+    if jenis_repo == "sqlite":
+        koneksi = buka_koneksi(os.path.join(direktori, "bench.db"))
+        return (SQLiteBahanRepository(koneksi), SQLiteKorbanRepository(koneksi),
+                SQLiteDistribusiRepository(koneksi))
+    distribusi_repo = ColumnarDistribusiRepository() if jenis_repo == "kolom" else DistribusiRepository()
+    return BahanRepository(), KorbanRepository(), distribusi_repo
+
+
+def isi_dataset(service: DapurService, repo_korban, repo_distribusi, jumlah: int) -> None:
+    """
+    Mengisi service dengan dataset sintetis: `jumlah` korban, `jumlah` distribusi
+    dan stok bahan yang cukup besar agar distribusi tidak pernah kehabisan.
+    Data dimuat per blok lewat add_many agar memori tetap terkendali.
+    """
+    with mode_senyap():
+        service.tambah_bahan(BahanPokok("Beras", 1e9, "kg", 250.0))
+        service.tambah_bahan(BahanProtein("Ayam", 1e9, "kg", 0.15))
+        service.tambah_bahan(BahanSayuran("Kangkung", 1e9, "kg", 0.1))
+        for awal in range(0, jumlah, UKURAN_BLOK):
+            akhir = min(jumlah, awal + UKURAN_BLOK)
+            repo_korban.add_many(
+                Korban(f"Korban {i}", f"KRB-{i:07d}", KEBUTUHAN[i % 4], 1 + i % 6)
+                for i in range(awal, akhir))
+            repo_distribusi.add_many(
+                DistribusiMakanan(f"DIST-DATA-{i:09d}", f"KRB-{i % jumlah:07d}", 1 + i % 10)
+                for i in range(awal, akhir))
+
+
+def persentil(data_urut: List[int], p: float) -> int:
+    """Persentil (nearest-rank) dari list yang sudah terurut."""
+    if not data_urut:
+        return 0
+    indeks = max(0, min(len(data_urut) - 1, int(round(p / 100 * len(data_urut))) - 1))
+    return data_urut[indeks]
+
+
+def ukur_operasi(operasi: Callable[[int], object], ulangan: int,
+                 ulangan_memori: int = 3) -> Dict[str, float]:
+    """
+    Mengukur satu operasi yang dipanggil `ulangan` kali dengan argumen 0..ulangan-1.
+
+    Latensi diukur tanpa tracemalloc (agar tidak terdistorsi); puncak memori
+    diukur terpisah pada beberapa panggilan tambahan.
+
+    Args:
+        operasi: Fungsi yang dipanggil dengan nomor iterasi
+        ulangan: Jumlah panggilan yang diukur latensinya
+        ulangan_memori: Jumlah panggilan tambahan untuk mengukur puncak memori
+
+    Returns:
+        Dict: ulangan, throughput_per_detik, p50_us, p99_us, maks_us, puncak_memori_kb
+    """
+    latensi = []
+    gc.collect()
+    mulai_total = time.perf_counter_ns()
+    for i in range(ulangan):
+        mulai = time.perf_counter_ns()
+        operasi(i)
+        latensi.append(time.perf_counter_ns() - mulai)
+    total_ns = time.perf_counter_ns() - mulai_total
+
+    gc.collect()
+    tracemalloc.start()
+    for i in range(ulangan, ulangan + ulangan_memori):
+        operasi(i)
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latensi.sort()
+    return {
+        'ulangan': ulangan,
+        'throughput_per_detik': round(ulangan / (total_ns / 1e9), 1) if total_ns else 0.0,
+        'p50_us': round(persentil(latensi, 50) / 1000, 2),
+        'p99_us': round(persentil(latensi, 99) / 1000, 2),
+        'maks_us': round(latensi[-1] / 1000, 2) if latensi else 0.0,
+        'puncak_memori_kb': round(puncak / 1024, 1),
+    }
+
+
+def jalankan_skala(nama_skala: str, jumlah: int, jenis_repo: str,
+                   ulangan: int, ulangan_laporan: int) -> Dict[str, Dict]:
+    """
+    Menjalankan semua operasi untuk satu skala dataset.
+
+    Args:
+        nama_skala: Label skala (misal "100k")
+        jumlah: Jumlah korban dan distribusi di dataset
+        jenis_repo: Jenis repository (lihat buat_repositories)
+        ulangan: Jumlah panggilan untuk operasi per item
+        ulangan_laporan: Jumlah panggilan untuk operasi laporan / agregat (O(n))
+
+    Returns:
+        Dict: Nama operasi -> hasil ukur_operasi
+    """
+    with tempfile.TemporaryDirectory() as direktori:
+        bahan_repo, korban_repo, distribusi_repo = buat_repositories(jenis_repo, direktori)
+        service = DapurService(bahan_repo, korban_repo, distribusi_repo)
+        mulai = time.perf_counter()
+        isi_dataset(service, korban_repo, distribusi_repo, jumlah)
+        print(f"[{nama_skala}] dataset {jumlah:,} korban/distribusi dimuat "
+              f"dalam {time.perf_counter() - mulai:.1f} detik")
+
+        # nama operasi -> (fungsi, jumlah panggilan, jumlah panggilan untuk memori)
+        operasi = {
+            'registrasi_korban': (lambda i: service.registrasi_korban(
+                Korban(f"Baru {i}", f"KRB-BARU-{i:07d}", KEBUTUHAN[i % 4], 2)), ulangan, 3),
+            'distribusi_makanan': (lambda i: service.distribusi_makanan(
+                f"KRB-{i % jumlah:07d}", 1 + i % 3), ulangan, 3),
+            'hitung_total_porsi_tersedia': (lambda i: service.hitung_total_porsi_tersedia(),
+                                            ulangan, 3),
+            'cek_kebutuhan_gizi': (lambda i: service.cek_kebutuhan_gizi(), ulangan_laporan, 1),
+            'get_laporan_stok': (lambda i: service.get_laporan_stok(), ulangan_laporan, 1),
+            'get_laporan_korban': (lambda i: service.get_laporan_korban(), ulangan_laporan, 1),
+            'get_laporan_distribusi': (lambda i: service.get_laporan_distribusi(),
+                                       ulangan_laporan, 1),
+        }
+
+        hasil = {}
+        for nama, (fungsi, n, n_memori) in operasi.items():
+            hasil[nama] = ukur_operasi(fungsi, n, n_memori)
+            print(f"[{nama_skala}] {nama:<30}{hasil[nama]['throughput_per_detik']:>14,.1f} op/s"
+                  f"{hasil[nama]['p50_us']:>12,.1f} us p50{hasil[nama]['p99_us']:>12,.1f} us p99"
+                  f"{hasil[nama]['puncak_memori_kb']:>12,.1f} KB")
+        return hasil
+
+
+def bandingkan(hasil: Dict, baseline: Dict, toleransi: float) -> List[str]:
+    """
+    Membandingkan hasil dengan baseline.
+
+    Args:
+        hasil: Hasil run sekarang (bagian 'hasil' dari JSON)
+        baseline: Hasil run sebelumnya (bagian 'hasil' dari JSON)
+        toleransi: Penurunan throughput maksimal yang dianggap wajar (0.1 = 10%)
+
+    Returns:
+        List[str]: Daftar operasi yang mengalami regresi
+    """
+    regresi = []
+    print(f"\n{'Skala':<7}{'Operasi':<30}{'Throughput':>12}{'p50':>10}{'p99':>10}")
+    print("-" * 69)
+    for nama_skala, per_operasi in hasil.items():
+        for nama, data in per_operasi.items():
+            dasar = baseline.get(nama_skala, {}).get(nama)
+            if not dasar or not dasar['throughput_per_detik']:
+                continue
+            rasio = data['throughput_per_detik'] / dasar['throughput_per_detik']
+            p50 = data['p50_us'] / dasar['p50_us'] if dasar['p50_us'] else 1.0
+            p99 = data['p99_us'] / dasar['p99_us'] if dasar['p99_us'] else 1.0
+            tanda = ""
+            if rasio < 1 - toleransi:
+                tanda = "  <- REGRESI"
+                regresi.append(f"{nama_skala}/{nama}")
+            print(f"{nama_skala:<7}{nama:<30}{rasio:>11.2f}x{p50:>9.2f}x{p99:>9.2f}x{tanda}")
+    return regresi
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark skalabilitas DapurService")
+    parser.add_argument("--skala", default="1k,100k",
+                        help=f"Daftar skala dipisah koma dari {', '.join(SKALA)} (default: 1k,100k)")
+    parser.add_argument("--repo", choices=("memori", "kolom", "sqlite"), default="memori",
+                        help="Jenis repository (default: memori)")
+    parser.add_argument("--ulangan", type=int, default=2000,
+                        help="Jumlah panggilan untuk operasi per item (default: 2000)")
+    parser.add_argument("--ulangan-laporan", type=int, default=5,
+                        help="Jumlah panggilan untuk operasi laporan (default: 5)")
+    parser.add_argument("--output", help="Simpan hasil ke file JSON")
+    parser.add_argument("--baseline", help="File JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--toleransi", type=float, default=0.10,
+                        help="Toleransi penurunan throughput sebelum dianggap regresi (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    daftar_skala = [s.strip().lower() for s in args.skala.split(",") if s.strip()]
+    tidak_dikenal = [s for s in daftar_skala if s not in SKALA]
+    if tidak_dikenal:
+        parser.error(f"Skala tidak dikenal: {', '.join(tidak_dikenal)}")
+
+    hasil = {}
+    for nama_skala in daftar_skala:
+        hasil[nama_skala] = jalankan_skala(nama_skala, SKALA[nama_skala], args.repo,
+                                           args.ulangan, args.ulangan_laporan)
+        gc.collect()
+
+    laporan = {
+        'meta': {
+            'waktu': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repo': args.repo,
+            'ulangan': args.ulangan,
+            'ulangan_laporan': args.ulangan_laporan,
+        },
+        'hasil': hasil,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(laporan, f, indent=2)
+        print(f"\nHasil disimpan ke {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('repo') != args.repo:
+            print("Peringatan: baseline memakai jenis repository yang berbeda")
+        regresi = bandingkan(hasil, baseline.get('hasil', {}), args.toleransi)
+        if regresi:
+            print(f"\n{len(regresi)} operasi mengalami regresi: {', '.join(regresi)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,6 +3,8 @@ Main Application - Entry Point untuk Sistem Manajemen Dapur Umum.
 Orchestrator yang menghubungkan semua layer (Models, Repositories, Services).
 """
 
+import argparse
+import json
 import logging
 from datetime import datetime
 import sys
@@ -10,14 +12,25 @@ import os
 
 # Import repositories
 from repositories.bahan_repository import BahanRepository
+from repositories.buku_stok import BukuStok
 from repositories.korban_repository import KorbanRepository
 from repositories.distribusi_repository import DistribusiRepository
+from repositories.jurnal import Jurnal
+from repositories.snapshot_biner import SnapshotBiner, tulis_snapshot
+from repositories.snapshot_repository import SnapshotKorbanRepository, SnapshotDistribusiRepository
+from repositories.sqlite_repository import (
+    buka_koneksi, SQLiteBahanRepository, SQLiteKorbanRepository, SQLiteDistribusiRepository
+)
 
 # Import services
 from services.dapur_service import DapurService
+from services.korban_importer import KorbanImporter
+from services.bahan_importer import BahanImporter
+from services.distribusi_importer import DistribusiImporter
 
 # Import models
-from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+from models.bahan_makanan import BahanMakanan, BahanPokok, BahanProtein, BahanSayuran
+from models.distribusi import DistribusiMakanan
 from models.person import Korban, Relawan
 
 # Import utils
@@ -25,20 +38,18 @@ from utils.formatter import (
     format_laporan_tabel, format_status_gizi, 
     validasi_input_angka, validasi_input_integer, buat_id_unik
 )
+from utils.logging_config import hentikan_logging, setup_logging
+from utils.tabel import FORMAT_TABEL, Kolom, tulis_tabel
 
 
-# Setup logging (Modul 12)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('dapur_umum.log'),
-        logging.StreamHandler()
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
+# Jumlah baris per halaman pada pager CLI
+UKURAN_HALAMAN = 20
+
+# Di atas jumlah entitas ini rincian laporan interaktif dihitung di process pool
+AMBANG_LAPORAN_PARALEL = 50_000
+
 
 class DapurUmumApp:
     """
@@ -46,16 +57,49 @@ class DapurUmumApp:
     Menerapkan Layered Architecture dan Dependency Injection.
     """
     
-    def __init__(self):
-        """Constructor - inisialisasi semua dependencies."""
+    def __init__(self, db_path: str = None, jurnal_dir: str = None, snapshot_path: str = None,
+                 data_dummy: bool = True):
+        """
+        Constructor - inisialisasi semua dependencies.
+        
+        Args:
+            db_path (str): Path database SQLite. Jika None, data disimpan di memori.
+            jurnal_dir (str): Direktori jurnal distribusi untuk mode memori.
+                Jika diisi, riwayat distribusi tetap ada setelah aplikasi ditutup.
+            snapshot_path (str): Path snapshot biner untuk mode memori. State dimuat
+                dari file ini saat start (jika ada) dan disimpan ke file ini saat
+                aplikasi ditutup. Jika snapshot dimuat, jurnal_dir diabaikan.
+                Penulisan ulang memuat seluruh state ke memori (simpan_state),
+                jadi impor berjuta baris dengan memori tetap hanya lewat db_path.
+            data_dummy (bool): Muat data demo jika repository korban masih kosong.
+                False untuk mode batch (tanpa interaksi).
+        """
         logger.info("="*60)
         logger.info("Sistem Manajemen Dapur Umum & Gizi Pengungsi DIMULAI")
         logger.info("="*60)
         
         # Inisialisasi Repositories (Data Layer)
-        self.bahan_repo = BahanRepository()
-        self.korban_repo = KorbanRepository()
-        self.distribusi_repo = DistribusiRepository()
+        self.snapshot_path = None if db_path else snapshot_path
+        self._snapshot = None
+        if db_path:
+            koneksi = buka_koneksi(db_path)
+            self.bahan_repo = SQLiteBahanRepository(koneksi)
+            self.korban_repo = SQLiteKorbanRepository(koneksi)
+            self.distribusi_repo = SQLiteDistribusiRepository(koneksi)
+        elif self.snapshot_path and os.path.exists(self.snapshot_path):
+            # Korban dan distribusi dibaca langsung dari snapshot (lazy);
+            # bahan jumlahnya sedikit sehingga langsung dimuat ke memori
+            self._snapshot = SnapshotBiner(self.snapshot_path)
+            self.bahan_repo = BahanRepository(BukuStok())
+            for i in range(self._snapshot.jumlah('bahan')):
+                self.bahan_repo.add(self._snapshot.bahan(i))
+            self.korban_repo = SnapshotKorbanRepository(self._snapshot)
+            self.distribusi_repo = SnapshotDistribusiRepository(self._snapshot)
+        else:
+            self.bahan_repo = BahanRepository(BukuStok())
+            self.korban_repo = KorbanRepository()
+            jurnal = Jurnal(jurnal_dir) if jurnal_dir else None
+            self.distribusi_repo = DistribusiRepository(jurnal)
         
         # Inisialisasi Service dengan Dependency Injection (DIP)
         self.dapur_service = DapurService(
@@ -64,8 +108,9 @@ class DapurUmumApp:
             self.distribusi_repo
         )
         
-        # Load data dummy untuk testing
-        self._load_data_dummy()
+        # Load data dummy untuk testing (hanya jika database masih kosong)
+        if data_dummy and self.korban_repo.count() == 0:
+            self._load_data_dummy()
     
     def _load_data_dummy(self):
         """Load data dummy untuk keperluan demo."""
@@ -146,7 +191,7 @@ class DapurUmumApp:
             print(f"\n❌ ERROR saat loading data dummy!")
             print(f"   Error: {e}")
             print(f"   Type: {type(e).__name__}")
-            logger.error(f"Error loading data dummy:  {e}", exc_info=True)
+            logger.error("Error loading data dummy:  %s", e, exc_info=True)
             
             import traceback
             print("\n📋 Traceback:")
@@ -212,7 +257,7 @@ class DapurUmumApp:
             print(f"   Dapat membuat:  {bahan.hitung_porsi()} porsi")
         except Exception as e:
             print(f"❌ Error:  {e}")
-            logger.error(f"Error tambah bahan pokok: {e}")
+            logger.error("Error tambah bahan pokok: %s", e)
     
     def _tambah_bahan_protein(self):
         """Menambah bahan protein."""
@@ -229,7 +274,7 @@ class DapurUmumApp:
             print(f"   Dapat membuat: {bahan.hitung_porsi()} porsi")
         except Exception as e:
             print(f"❌ Error: {e}")
-            logger.error(f"Error tambah bahan protein: {e}")
+            logger.error("Error tambah bahan protein: %s", e)
     
     def _tambah_bahan_sayuran(self):
         """Menambah bahan sayuran."""
@@ -246,7 +291,7 @@ class DapurUmumApp:
             print(f"   Dapat membuat: {bahan.hitung_porsi()} porsi")
         except Exception as e:
             print(f"❌ Error: {e}")
-            logger.error(f"Error tambah bahan sayuran: {e}")
+            logger.error("Error tambah bahan sayuran: %s", e)
     
     def _lihat_semua_bahan(self):
         """Menampilkan semua bahan."""
@@ -277,15 +322,15 @@ class DapurUmumApp:
             
             # Detail per bahan
             print("\n📋 Detail Porsi Per Bahan:")
-            for i, bahan in enumerate(bahan_list, 1):
-                porsi = bahan.hitung_porsi()
-                print(f"   {i}. {bahan.get_nama()}: {porsi} porsi")
+            porsi_per_bahan = self.dapur_service.hitung_porsi_per_bahan()
+            for i, (nama, porsi) in enumerate(porsi_per_bahan.items(), 1):
+                print(f"   {i}. {nama}: {porsi} porsi")
             
             print()
             
         except Exception as e:
             print(f"\n❌ Error saat menampilkan bahan: {e}")
-            logger.error(f"Error _lihat_semua_bahan: {e}", exc_info=True)
+            logger.error("Error _lihat_semua_bahan: %s", e, exc_info=True)
             import traceback
             traceback.print_exc()
     
@@ -310,6 +355,7 @@ class DapurUmumApp:
             print("2. Lihat Semua Korban")
             print("3. Cari Korban by ID")
             print("4. Update Jumlah Tanggungan")
+            print("5. Impor Korban dari File (CSV/JSONL)")
             print("0. Kembali")
             print("="*60)
             
@@ -323,6 +369,8 @@ class DapurUmumApp:
                 self._cari_korban()
             elif pilihan == "4":
                 self._update_tanggungan()
+            elif pilihan == "5":
+                self._impor_korban()
             elif pilihan == "0":
                 break
             else:
@@ -356,18 +404,33 @@ class DapurUmumApp:
             print(f"   Tanggungan: {tanggungan} orang")
         except Exception as e:
             print(f"❌ Error:  {e}")
-            logger.error(f"Error registrasi korban: {e}")
+            logger.error("Error registrasi korban: %s", e)
+    
+    def _impor_korban(self):
+        """Impor massal korban dari file registrasi lapangan."""
+        try:
+            print("\n--- Impor Korban dari File ---")
+            print("Kolom: nama, id, kebutuhan_khusus, jumlah_tanggungan")
+            path = input("Path file (.csv / .jsonl): ").strip()
+            path_error = path + ".error.csv"
+            
+            importer = KorbanImporter(self.korban_repo, jumlah_proses=os.cpu_count() or 1)
+            ringkasan = importer.impor(path, path_error)
+            
+            print(f"✅ Impor selesai: {ringkasan['berhasil']} korban terdaftar")
+            if ringkasan['ditolak']:
+                print(f"⚠️ {ringkasan['ditolak']} baris ditolak, lihat {path_error}")
+        except Exception as e:
+            print(f"❌ Error:  {e}")
+            logger.error("Error impor korban: %s", e)
     
     def _lihat_semua_korban(self):
-        """Menampilkan semua korban."""
-        korban_list = self.korban_repo.get_all()
-        
-        if not korban_list:
+        """Menampilkan semua korban (per halaman)."""
+        if self.korban_repo.count() == 0:
             print("\n⚠️ Belum ada korban terdaftar.")
             return
         
-        data = [k.get_info() for k in korban_list]
-        print(format_laporan_tabel(data, "DAFTAR KORBAN TERDAFTAR"))
+        self._tampilkan_berhalaman('korban', "DAFTAR KORBAN TERDAFTAR")
         
         total_tanggungan = self.korban_repo.get_total_tanggungan()
         print(f"\n📊 Total Tanggungan: {total_tanggungan} orang\n")
@@ -404,6 +467,7 @@ class DapurUmumApp:
             
             tanggungan_baru = validasi_input_integer("Jumlah tanggungan baru: ", 1)
             korban.set_jumlah_tanggungan(tanggungan_baru)
+            self.korban_repo.update(korban)
             
             print(f"✅ Tanggungan berhasil diupdate menjadi {tanggungan_baru} orang")
         except Exception as e:
@@ -468,18 +532,15 @@ class DapurUmumApp:
             
         except Exception as e:
             print(f"❌ Error: {e}")
-            logger.error(f"Error distribusi:  {e}")
+            logger.error("Error distribusi:  %s", e)
     
     def _lihat_riwayat_distribusi(self):
-        """Menampilkan semua riwayat distribusi."""
-        distribusi_list = self.distribusi_repo.get_all()
-        
-        if not distribusi_list:
+        """Menampilkan semua riwayat distribusi (per halaman)."""
+        if self.distribusi_repo.count() == 0:
             print("\n⚠️ Belum ada distribusi dilakukan.")
             return
         
-        data = [d.get_info() for d in distribusi_list]
-        print(format_laporan_tabel(data, "RIWAYAT DISTRIBUSI MAKANAN"))
+        self._tampilkan_berhalaman('distribusi', "RIWAYAT DISTRIBUSI MAKANAN")
         
         total_porsi = self.distribusi_repo.get_total_porsi_terdistribusi()
         print(f"\n📊 Total Porsi Terdistribusi: {total_porsi} porsi\n")
@@ -497,7 +558,7 @@ class DapurUmumApp:
             data = [d.get_info() for d in riwayat]
             print(format_laporan_tabel(data, f"RIWAYAT DISTRIBUSI - {id_korban}"))
             
-            total = sum(d.get_jumlah_porsi() for d in riwayat)
+            total = self.distribusi_repo.get_total_porsi_korban(id_korban)
             print(f"\n📊 Total Porsi Diterima: {total} porsi\n")
             
         except Exception as e:
@@ -557,7 +618,7 @@ class DapurUmumApp:
     
     def _laporan_korban(self):
         """Menampilkan laporan data korban."""
-        laporan = self.dapur_service. get_laporan_korban()
+        laporan = self.dapur_service.get_ringkasan_korban()
         
         print("\n" + "="*60)
         print("LAPORAN DATA KORBAN".center(60))
@@ -566,16 +627,14 @@ class DapurUmumApp:
         print(f"Total Tanggungan       : {laporan['total_tanggungan']} orang")
         print("="*60)
         
-        if laporan['detail_korban']:
-            print("\nDetail Korban:")
-            for i, detail in enumerate(laporan['detail_korban'], 1):
-                print(f"{i}.  {detail}")
+        if laporan['total_korban'] and self._konfirmasi("Tampilkan detail korban?"):
+            self._tampilkan_berhalaman('korban', "DETAIL KORBAN")
         
         print()
     
     def _laporan_distribusi(self):
         """Menampilkan laporan distribusi."""
-        laporan = self.dapur_service. get_laporan_distribusi()
+        laporan = self.dapur_service.get_ringkasan_distribusi()
         
         print("\n" + "="*60)
         print("LAPORAN DISTRIBUSI MAKANAN".center(60))
@@ -584,10 +643,8 @@ class DapurUmumApp:
         print(f"Total Porsi Tersalur  : {laporan['total_porsi_terdistribusi']} porsi")
         print("="*60)
         
-        if laporan['detail_distribusi']:
-            print("\nDetail Distribusi:")
-            for i, detail in enumerate(laporan['detail_distribusi'], 1):
-                print(f"{i}.  {detail}")
+        if laporan['total_distribusi'] and self._konfirmasi("Tampilkan detail distribusi?"):
+            self._tampilkan_berhalaman('distribusi', "DETAIL DISTRIBUSI")
         
         print()
     
@@ -598,7 +655,7 @@ class DapurUmumApp:
         print("="*70)
         
         # Laporan Stok
-        laporan_stok = self.dapur_service.get_laporan_stok()
+        laporan_stok = self.dapur_service.get_ringkasan_stok()
         print("\n📦 STOK BAHAN MAKANAN")
         print("-" * 70)
         print(f"  Total Jenis Bahan    : {laporan_stok['total_jenis_bahan']}")
@@ -606,19 +663,30 @@ class DapurUmumApp:
         print(f"  Bahan Stok Rendah    : {laporan_stok['bahan_stok_rendah']}")
         
         # Laporan Korban
-        laporan_korban = self.dapur_service.get_laporan_korban()
+        laporan_korban = self.dapur_service.get_ringkasan_korban()
         print("\n👥 DATA KORBAN")
         print("-" * 70)
         print(f"  Total Korban         : {laporan_korban['total_korban']} orang")
         print(f"  Total Tanggungan     : {laporan_korban['total_tanggungan']} orang")
         
         # Laporan Distribusi
-        laporan_dist = self.dapur_service. get_laporan_distribusi()
+        laporan_dist = self.dapur_service.get_ringkasan_distribusi()
         print("\n🍽️ DISTRIBUSI MAKANAN")
         print("-" * 70)
         print(f"  Total Distribusi     :  {laporan_dist['total_distribusi']} kali")
         print(f"  Total Porsi Tersalur : {laporan_dist['total_porsi_terdistribusi']} porsi")
         
+        # Rincian per kategori/hari; data besar dihitung paralel agar konsol tidak lama membeku
+        besar = laporan_korban['total_korban'] + laporan_dist['total_distribusi'] > AMBANG_LAPORAN_PARALEL
+        rincian = self.dapur_service.buat_mesin_laporan(
+            (os.cpu_count() or 1) if besar else 0).laporan_lengkap()
+        print("\n📊 RINCIAN")
+        print("-" * 70)
+        for kebutuhan, jumlah in rincian['korban']['korban_per_kebutuhan'].items():
+            print(f"  Korban {kebutuhan:<14}: {jumlah} orang")
+        print(f"  Korban Terlayani     : {rincian['distribusi']['korban_terlayani']} orang")
+        print(f"  Rata-rata Porsi      : {rincian['distribusi']['rata_rata_porsi']} porsi/distribusi")
+        
         # Status Gizi
         status = self.dapur_service.cek_kebutuhan_gizi()
         print("\n⚕️ STATUS KEBUTUHAN GIZI")
@@ -712,6 +780,66 @@ class DapurUmumApp:
         
         input("\nTekan Enter untuk kembali...")
     
+    def _konfirmasi(self, pertanyaan: str) -> bool:
+        """Meminta jawaban y/n dari user."""
+        return input(f"\n{pertanyaan} (y/n): ").strip().lower() == 'y'
+    
+    def _tampilkan_berhalaman(self, jenis: str, judul: str, ukuran: int = UKURAN_HALAMAN):
+        """
+        Pager CLI: menampilkan detail laporan satu halaman setiap kali,
+        sehingga hanya satu halaman data yang diambil dari repository.
+        
+        Args:
+            jenis (str): 'bahan', 'korban' atau 'distribusi'
+            judul (str): Judul tabel
+            ukuran (int): Jumlah baris per halaman
+        """
+        print("\n" + "="*80)
+        print(judul.center(80))
+        print("="*80)
+        
+        kursor, nomor = None, 0
+        while True:
+            halaman = self.dapur_service.get_halaman_detail(jenis, kursor, ukuran)
+            for info in halaman['detail']:
+                nomor += 1
+                print(f"{nomor}. {info}")
+            kursor = halaman['kursor_berikut']
+            if kursor is None:
+                break
+            jawab = input(f"-- {nomor} baris ditampilkan. Enter: halaman berikutnya, q: berhenti -- ")
+            if jawab.strip().lower() == 'q':
+                break
+        print("="*80)
+    
+    def simpan_state(self):
+        """
+        Menyimpan seluruh state ke snapshot biner (snapshot_path).
+        Semua data diambil lebih dulu karena snapshot lama mungkin masih
+        dibaca oleh repository; setelah ini repository snapshot tidak dipakai lagi.
+        """
+        bahan = self.bahan_repo.get_all()
+        korban = self.korban_repo.get_all()
+        distribusi = self.distribusi_repo.get_all()
+        if self._snapshot is not None:
+            self._snapshot.tutup()
+            self._snapshot = None
+        tulis_snapshot(self.snapshot_path, bahan, korban, distribusi)
+    
+    def tutup(self, simpan: bool = True):
+        """
+        Menutup resource persisten (jurnal distribusi, snapshot) sebelum keluar.
+        
+        Args:
+            simpan (bool): Tulis ulang snapshot (jika dipakai). False untuk
+                perintah yang hanya membaca, agar snapshot tidak dimaterialisasi
+                dan ditulis ulang tanpa perubahan.
+        """
+        if isinstance(self.distribusi_repo, DistribusiRepository):
+            self.distribusi_repo.tutup()
+        if self.snapshot_path and simpan:
+            self.simpan_state()
+    
     def run(self):
         """Main loop aplikasi."""
         print("\n")
@@ -758,24 +886,275 @@ class DapurUmumApp:
                 break
             except Exception as e:
                 print(f"\n❌ Terjadi error: {e}")
-                logger.error(f"Error di main loop: {e}", exc_info=True)
+                logger.error("Error di main loop: %s", e, exc_info=True)
                 import traceback
                 traceback.print_exc()
                 input("Tekan Enter untuk melanjutkan...")
 
 
-def main():
-    """Entry point utama aplikasi."""
+# Kode keluar mode batch (untuk cron / skrip shell)
+KELUAR_OK = 0
+KELUAR_ERROR = 1
+KELUAR_USAGE = 2        # dipakai argparse untuk argumen yang salah
+KELUAR_SEBAGIAN = 3     # sebagian baris file ditolak
+KELUAR_WASPADA = 4
+KELUAR_KRITIS = 5
+
+KELUAR_STATUS_GIZI = {'AMAN': KELUAR_OK, 'WASPADA': KELUAR_WASPADA, 'KRITIS': KELUAR_KRITIS}
+
+
+FORMAT_WAKTU_EKSPOR = "%Y-%m-%d %H:%M:%S"
+
+# Kolom tabel untuk subcommand export
+KOLOM_EKSPOR = {
+    'bahan': [
+        Kolom("Nama", BahanMakanan.get_nama),
+        Kolom("Jenis", lambda b: type(b).__name__),
+        Kolom("Jumlah", BahanMakanan.get_jumlah, rata="kanan"),
+        Kolom("Satuan", BahanMakanan.get_satuan),
+        Kolom("Porsi", lambda b: b.hitung_porsi(), rata="kanan"),
+    ],
+    'korban': [
+        Kolom("ID", Korban.get_id),
+        Kolom("Nama", Korban.get_name),
+        Kolom("Kebutuhan", Korban.get_kebutuhan_khusus),
+        Kolom("Tanggungan", Korban.get_jumlah_tanggungan, rata="kanan"),
+        Kolom("Terdaftar", lambda k: k.get_registered_date().strftime(FORMAT_WAKTU_EKSPOR)),
+    ],
+    'distribusi': [
+        Kolom("ID Distribusi", DistribusiMakanan.get_id_distribusi),
+        Kolom("ID Korban", DistribusiMakanan.get_id_korban),
+        Kolom("Porsi", DistribusiMakanan.get_jumlah_porsi, rata="kanan"),
+        Kolom("Waktu", lambda d: d.get_waktu_distribusi().strftime(FORMAT_WAKTU_EKSPOR)),
+        Kolom("Catatan", DistribusiMakanan.get_catatan),
+    ],
+}
+
+
+def buat_parser() -> argparse.ArgumentParser:
+    """Menyusun parser argumen: tanpa subcommand aplikasi berjalan interaktif."""
+    parser = argparse.ArgumentParser(
+        description="Sistem Manajemen Dapur Umum & Gizi Pengungsi. "
+                    "Tanpa subcommand, aplikasi berjalan dalam mode menu interaktif.")
+    parser.add_argument("--db", default=os.environ.get("DAPUR_UMUM_DB"),
+                        help="Database SQLite (default: $DAPUR_UMUM_DB)")
+    parser.add_argument("--jurnal", default=os.environ.get("DAPUR_UMUM_JURNAL"),
+                        help="Direktori jurnal distribusi mode memori (default: $DAPUR_UMUM_JURNAL)")
+    parser.add_argument("--snapshot", default=os.environ.get("DAPUR_UMUM_SNAPSHOT"),
+                        help="Snapshot biner mode memori; seluruh state dimuat ke memori "
+                             "saat ditulis ulang, untuk impor besar pakai --db "
+                             "(default: $DAPUR_UMUM_SNAPSHOT)")
+    parser.add_argument("--log", default="dapur_umum.log", help="File log mode batch")
+    sub = parser.add_subparsers(dest="perintah", metavar="PERINTAH")
+
+    def tambah_opsi_file(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--format", dest="format_file", choices=("csv", "jsonl"),
+                       help="Format file (default: dari ekstensi)")
+        p.add_argument("--error", help="File CSV untuk baris yang ditolak")
+        p.add_argument("--chunk", type=int, default=5000, help="Jumlah baris per chunk")
+
+    p = sub.add_parser("import-korban", help="Impor korban dari CSV/JSONL")
+    p.add_argument("file")
+    tambah_opsi_file(p)
+    p.add_argument("--proses", type=int, default=0,
+                   help="Jumlah proses validasi paralel (0 = tanpa process pool)")
+
+    p = sub.add_parser("import-bahan", help="Impor penerimaan bahan dari CSV/JSONL")
+    p.add_argument("file")
+    tambah_opsi_file(p)
+
+    p = sub.add_parser("distribute", help="Distribusi massal dari CSV/JSONL")
+    p.add_argument("--file", required=True)
+    tambah_opsi_file(p)
+    p.add_argument("--catatan", default="", help="Catatan untuk setiap distribusi")
+
+    p = sub.add_parser("report", help="Cetak laporan")
+    p.add_argument("--jenis", choices=("stok", "korban", "distribusi", "gizi", "lengkap"),
+                   default="lengkap")
+    p.add_argument("--format", choices=("json", "text"), default="text")
+    p.add_argument("--rinci", action="store_true",
+                   help="Sertakan rincian per kebutuhan/hari (korban, distribusi, lengkap)")
+    p.add_argument("--proses", type=int, default=0,
+                   help="Jumlah proses untuk rincian (0 = tanpa process pool)")
+
+    p = sub.add_parser("export", help="Ekspor data sebagai tabel teks/CSV/TSV (streaming)")
+    p.add_argument("jenis", choices=tuple(KOLOM_EKSPOR))
+    p.add_argument("--format", choices=FORMAT_TABEL, default="csv")
+    p.add_argument("--output", help="File tujuan (default: stdout)")
+
+    p = sub.add_parser("check-gizi", help="Cek status gizi (kode keluar 0/4/5 = AMAN/WASPADA/KRITIS)")
+    p.add_argument("--format", choices=("json", "text"), default="text")
+
+    p = sub.add_parser("stock-at", help="Stok bahan pada waktu tertentu dari ledger mutasi (butuh --db)")
+    p.add_argument("bahan")
+    p.add_argument("--waktu", type=datetime.fromisoformat,
+                   help="Waktu ISO, misal 2026-01-01T06:00 (default: sekarang)")
+    p.add_argument("--mulai", type=datetime.fromisoformat,
+                   help="Sertakan ringkasan masuk/keluar sejak waktu ini")
+    p.add_argument("--format", choices=("json", "text"), default="json")
+    return parser
+
+
+def cetak_hasil(data: dict, format_keluaran: str = "json") -> None:
+    """Mencetak hasil perintah batch ke stdout sebagai JSON atau baris 'kunci: nilai'."""
+    if format_keluaran == "json":
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+        return
+    for kunci, nilai in data.items():
+        if isinstance(nilai, dict):
+            print(f"[{kunci}]")
+            for k, v in nilai.items():
+                print(f"{k}: {v}")
+        else:
+            print(f"{kunci}: {nilai}")
+
+
+# Subcommand batch yang mengubah state (snapshot hanya ditulis ulang setelah perintah ini)
+PERINTAH_MENGUBAH = ("import-korban", "import-bahan", "distribute")
+# Subcommand yang tidak berarti tanpa --db / --snapshot: hasil impor/distribusi
+# hilang saat proses selesai (--jurnal hanya menyimpan distribusi) dan
+# check-gizi pada state kosong selalu KRITIS
+PERINTAH_BUTUH_PENYIMPANAN = PERINTAH_MENGUBAH + ("check-gizi",)
+# Ledger stok hanya persisten di SQLite (tabel mutasi_stok); di mode memori
+# dan snapshot riwayat stok dimulai saat aplikasi dijalankan
+PERINTAH_BUTUH_DB = ("stock-at",)
+
+
+def jalankan_perintah(app: DapurUmumApp, args: argparse.Namespace) -> int:
+    """
+    Menjalankan satu subcommand batch.
+
+    Returns:
+        int: Kode keluar (KELUAR_*)
+    """
+    service = app.dapur_service
+    if args.perintah in PERINTAH_MENGUBAH:
+        if args.perintah == "import-korban":
+            importer = KorbanImporter(app.korban_repo, args.chunk, args.proses)
+            ringkasan = importer.impor(args.file, args.error, args.format_file)
+        elif args.perintah == "import-bahan":
+            importer = BahanImporter(app.bahan_repo, args.chunk)
+            ringkasan = importer.impor(args.file, args.error, args.format_file)
+        else:
+            importer = DistribusiImporter(service, args.chunk)
+            ringkasan = importer.impor(args.file, args.error, args.format_file, args.catatan)
+        cetak_hasil(ringkasan)
+        return KELUAR_SEBAGIAN if ringkasan['ditolak'] else KELUAR_OK
+
+    if args.perintah == "export":
+        repo = {'bahan': app.bahan_repo, 'korban': app.korban_repo,
+                'distribusi': app.distribusi_repo}[args.jenis]
+        judul = f"DATA {args.jenis.upper()}"
+        if args.output:
+            with open(args.output, "w", newline="", encoding="utf-8") as sink:
+                tulis_tabel(sink, repo.iter_semua(), KOLOM_EKSPOR[args.jenis], args.format, judul)
+        else:
+            tulis_tabel(sys.stdout, repo.iter_semua(), KOLOM_EKSPOR[args.jenis], args.format, judul)
+        return KELUAR_OK
+
+    if args.perintah == "stock-at":
+        cetak_hasil(service.get_riwayat_stok(args.bahan, args.waktu, args.mulai), args.format)
+        return KELUAR_OK
+
+    if args.perintah == "check-gizi":
+        status = service.cek_kebutuhan_gizi()
+        cetak_hasil(status, args.format)
+        return KELUAR_STATUS_GIZI.get(status['status'], KELUAR_ERROR)
+
+    # Laporan batch hanya berisi angka ringkasan (tanpa baris detail)
+    laporan = {
+        'stok': service.get_ringkasan_stok,
+        'korban': service.get_ringkasan_korban,
+        'distribusi': service.get_ringkasan_distribusi,
+        'gizi': service.cek_kebutuhan_gizi,
+    }
+    if args.jenis == "lengkap":
+        hasil = {jenis: buat() for jenis, buat in laporan.items()}
+    else:
+        hasil = laporan[args.jenis]()
+    if args.rinci and args.jenis in ("korban", "distribusi", "lengkap"):
+        mesin = service.buat_mesin_laporan(args.proses)
+        if args.jenis == "lengkap":
+            rincian = mesin.laporan_lengkap()
+            hasil['korban'].update(rincian['korban'])
+            hasil['distribusi'].update(rincian['distribusi'])
+        elif args.jenis == "korban":
+            hasil.update(mesin.laporan_korban(dengan_detail=False))
+        else:
+            hasil.update(mesin.laporan_distribusi(dengan_detail=False))
+    cetak_hasil(hasil, args.format)
+    return KELUAR_OK
+
+
+def jalankan_batch(args: argparse.Namespace) -> int:
+    """
+    Mode batch: tanpa banner, menu maupun data demo. Log hanya ditulis ke file,
+    stdout hanya berisi hasil perintah, dan pesan error ditulis ke stderr.
+
+    Returns:
+        int: Kode keluar (KELUAR_*)
+    """
+    if args.perintah in PERINTAH_BUTUH_PENYIMPANAN and not (args.db or args.snapshot):
+        print(f"Error: perintah {args.perintah} membutuhkan --db atau --snapshot "
+              "(tanpa penyimpanan persisten data hilang saat proses selesai)", file=sys.stderr)
+        return KELUAR_USAGE
+    if args.perintah in PERINTAH_BUTUH_DB and not args.db:
+        print(f"Error: perintah {args.perintah} membutuhkan --db "
+              "(riwayat stok hanya disimpan di database SQLite)", file=sys.stderr)
+        return KELUAR_USAGE
+    setup_logging(log_file=args.log or None, konsol=False)
+    try:
+        app = DapurUmumApp(args.db, args.jurnal, args.snapshot, data_dummy=False)
+        try:
+            return jalankan_perintah(app, args)
+        finally:
+            app.tutup(simpan=args.perintah in PERINTAH_MENGUBAH)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        logger.error("Perintah %s gagal: %s", args.perintah, e)
+        return KELUAR_ERROR
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        logger.critical("Perintah %s gagal: %s", args.perintah, e, exc_info=True)
+        return KELUAR_ERROR
+    finally:
+        hentikan_logging()
+
+
+def main(argv=None) -> int:
+    """
+    Entry point utama aplikasi.
+
+    Args:
+        argv: Argumen command line (default: sys.argv)
+
+    Returns:
+        int: Kode keluar proses
+    """
+    args = buat_parser().parse_args(argv)
+    if args.perintah:
+        return jalankan_batch(args)
+
+    # Setup logging (Modul 12) - ditulis oleh thread listener, bukan thread menu.
+    # DAPUR_UMUM_LOG_SAMPEL=N meneruskan 1 dari setiap N event INFO yang sama.
+    setup_logging(sampel=int(os.environ.get("DAPUR_UMUM_LOG_SAMPEL", "1")))
     try:
-        app = DapurUmumApp()
-        app.run()
+        # --db / DAPUR_UMUM_DB untuk menyimpan data secara persisten di SQLite,
+        # --jurnal / DAPUR_UMUM_JURNAL untuk menjurnal riwayat distribusi di mode memori,
+        # atau --snapshot / DAPUR_UMUM_SNAPSHOT untuk memuat/menyimpan state sebagai snapshot biner
+        app = DapurUmumApp(args.db, args.jurnal, args.snapshot)
+        try:
+            app.run()
+        finally:
+            app.tutup()
     except Exception as e:
         print(f"❌ FATAL ERROR: {e}")
-        logger.critical(f"Fatal error saat startup: {e}", exc_info=True)
+        logger.critical("Fatal error saat startup: %s", e, exc_info=True)
         import traceback
         traceback.print_exc()
-        sys.exit(1)
+        return KELUAR_ERROR
+    return KELUAR_OK
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
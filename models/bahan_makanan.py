@@ -5,12 +5,21 @@ Menerapkan konsep Inheritance dan Polymorphism.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from contextlib import ExitStack
+from typing import Callable, Dict, Optional, Sequence, Tuple
+from models.observable import Observable
 import logging
+import sys
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Toleransi pembulatan float saat membandingkan kebutuhan dengan stok
+TOLERANSI_STOK = 1e-9
 
-class BahanMakanan(ABC):
+
+class BahanMakanan(Observable, ABC):
     """
     Abstract Base Class untuk bahan makanan. 
     
@@ -18,10 +27,18 @@ class BahanMakanan(ABC):
         __nama (str): Nama bahan makanan (private)
         __jumlah (float): Jumlah stok (private)
         __satuan (str): Satuan (kg, liter, porsi) (private)
-        __tanggal_masuk (datetime): Waktu bahan masuk (private)
+        __tanggal_masuk_epoch (float): Waktu bahan masuk sebagai epoch detik (private)
+        __lock (threading.Lock): Lock per bahan untuk perubahan stok (private)
+        __pencatat (tuple): Pencatat mutasi stok, dipanggil di bawah __lock (private)
     """
     
-    def __init__(self, nama: str, jumlah: float, satuan:  str):
+    __slots__ = ('__nama', '__jumlah', '__satuan', '__tanggal_masuk_epoch', '__lock', '__pencatat')
+    
+    # Pengali stok sebelum dibagi faktor porsi (lihat get_faktor_porsi)
+    KONVERSI_SATUAN = 1.0
+    
+    def __init__(self, nama: str, jumlah: float, satuan:  str,
+                 tanggal_masuk: Optional[datetime] = None):
         """
         Constructor untuk BahanMakanan. 
         
@@ -29,6 +46,7 @@ class BahanMakanan(ABC):
             nama (str): Nama bahan
             jumlah (float): Jumlah stok
             satuan (str): Satuan pengukuran
+            tanggal_masuk (datetime): Waktu bahan masuk (default: sekarang)
             
         Raises:
             ValueError: Jika jumlah negatif atau nama kosong
@@ -40,9 +58,11 @@ class BahanMakanan(ABC):
         
         self.__nama = nama
         self.__jumlah = jumlah
-        self.__satuan = satuan
-        self.__tanggal_masuk = datetime.now()
-        logger.info(f"Bahan {nama} sebanyak {jumlah} {satuan} ditambahkan")
+        self.__satuan = sys.intern(satuan)  # satuan berulang (kg, liter, porsi)
+        self.__tanggal_masuk_epoch = tanggal_masuk.timestamp() if tanggal_masuk else time.time()
+        self.__lock = threading.Lock()
+        self.__pencatat = ()
+        logger.info("Bahan %s sebanyak %s %s ditambahkan", nama, jumlah, satuan)
     
     # Getter methods
     def get_nama(self) -> str:
@@ -59,7 +79,43 @@ class BahanMakanan(ABC):
     
     def get_tanggal_masuk(self) -> datetime:
         """Getter untuk tanggal masuk."""
-        return self.__tanggal_masuk
+        return datetime.fromtimestamp(self.__tanggal_masuk_epoch)
+    
+    def tambah_pencatat_mutasi(self, callback: Callable[['BahanMakanan', float, float], None],
+                               awal: Optional[Callable[[float, float], None]] = None) -> None:
+        """
+        Mendaftarkan pencatat mutasi stok. Berbeda dengan pengamat, pencatat
+        dipanggil di bawah lock bahan dengan (bahan, selisih, waktu_epoch)
+        sehingga setiap mutasi tercatat tepat satu kali dan berurutan, termasuk
+        mutasi bersamaan. Pencatat harus cepat dan tidak boleh mengambil lock
+        lain selain lock miliknya sendiri.
+        
+        Args:
+            callback: Fungsi (bahan, selisih, waktu_epoch) untuk setiap mutasi
+            awal: Fungsi (stok, waktu_epoch) yang dipanggil sekali dengan stok
+                saat pendaftaran, di bawah lock yang sama (opsional)
+        """
+        with self.__lock:
+            self.__pencatat = self.__pencatat + (callback,)
+            if awal is not None:
+                awal(self.__jumlah, time.time())
+    
+    def hapus_pencatat_mutasi(self, callback: Callable[['BahanMakanan', float, float], None]) -> None:
+        """
+        Menghapus pencatat mutasi yang sebelumnya didaftarkan.
+        
+        Args:
+            callback: Fungsi pencatat yang dihapus
+        """
+        with self.__lock:
+            self.__pencatat = tuple(c for c in self.__pencatat if c != callback)
+    
+    def __catat_mutasi(self, selisih: float) -> None:
+        """Memanggil pencatat mutasi; pemanggil harus memegang __lock."""
+        if self.__pencatat:
+            epoch = time.time()
+            for callback in self.__pencatat:
+                callback(self, selisih, epoch)
     
     # Setter methods dengan validasi
     def tambah_stok(self, jumlah:  float) -> None:
@@ -74,8 +130,11 @@ class BahanMakanan(ABC):
         """
         if jumlah < 0:
             raise ValueError("Jumlah tambahan tidak boleh negatif")
-        self.__jumlah += jumlah
-        logger.info(f"Stok {self.__nama} bertambah {jumlah} {self.__satuan}")
+        with self.__lock:
+            self.__jumlah += jumlah
+            self.__catat_mutasi(jumlah)
+        logger.info("Stok %s bertambah %s %s", self.__nama, jumlah, self.__satuan)
+        self._beritahu_pengamat()
     
     def kurangi_stok(self, jumlah: float) -> None:
         """
@@ -87,12 +146,97 @@ class BahanMakanan(ABC):
         Raises: 
             ValueError: Jika jumlah negatif atau melebihi stok
         """
+        if not self.kurangi_stok_jika_cukup(jumlah):
+            raise ValueError(f"Stok tidak cukup.  Tersedia: {self.__jumlah} {self.__satuan}")
+    
+    def kurangi_stok_jika_cukup(self, jumlah: float) -> bool:
+        """
+        Mengurangi stok hanya jika mencukupi, secara atomik.
+        Cek dan pengurangan dilakukan di bawah lock bahan ini sehingga aman
+        dipanggil bersamaan dari beberapa posko (thread). Pengamat dipanggil
+        setelah lock dilepas agar lock bahan tidak pernah menunggu lock repository.
+        
+        Args:
+            jumlah (float): Jumlah yang dikurangi
+            
+        Returns:
+            bool: True jika stok dikurangi, False jika stok tidak cukup
+            
+        Raises:
+            ValueError: Jika jumlah negatif
+        """
         if jumlah < 0:
             raise ValueError("Jumlah pengurangan tidak boleh negatif")
-        if jumlah > self.__jumlah:
-            raise ValueError(f"Stok tidak cukup.  Tersedia: {self.__jumlah} {self.__satuan}")
-        self.__jumlah -= jumlah
-        logger.info(f"Stok {self.__nama} berkurang {jumlah} {self.__satuan}")
+        with self.__lock:
+            if jumlah > self.__jumlah:
+                return False
+            self.__jumlah -= jumlah
+            self.__catat_mutasi(-jumlah)
+        logger.info("Stok %s berkurang %s %s", self.__nama, jumlah, self.__satuan)
+        self._beritahu_pengamat()
+        return True
+    
+    @staticmethod
+    def kurangi_stok_bersama(pengurangan: Sequence[Tuple['BahanMakanan', float]]) -> bool:
+        """
+        Mengurangi stok beberapa bahan sekaligus secara all-or-nothing.
+        Lock semua bahan diambil berurutan menurut nama (mencegah deadlock antar
+        posko), semua stok dicek, baru kemudian semua dikurangi. Jika satu bahan
+        saja kurang, tidak ada stok yang berubah.
+        
+        Args:
+            pengurangan: Pasangan (bahan, jumlah) yang akan dikurangi
+            
+        Returns:
+            bool: True jika semua stok dikurangi, False jika ada yang tidak cukup
+            
+        Raises:
+            ValueError: Jika ada jumlah negatif
+        """
+        total: Dict[int, Tuple['BahanMakanan', float]] = {}
+        for bahan, jumlah in pengurangan:
+            if jumlah < 0:
+                raise ValueError("Jumlah pengurangan tidak boleh negatif")
+            lama = total.get(id(bahan), (bahan, 0.0))[1]
+            total[id(bahan)] = (bahan, lama + jumlah)
+        urutan = sorted(total.values(), key=lambda p: (p[0].__nama, id(p[0])))
+        
+        with ExitStack() as stack:
+            for bahan, _ in urutan:
+                stack.enter_context(bahan.__lock)
+            if any(jumlah > bahan.__jumlah + TOLERANSI_STOK for bahan, jumlah in urutan):
+                return False
+            for bahan, jumlah in urutan:
+                lama = bahan.__jumlah
+                bahan.__jumlah = max(lama - jumlah, 0.0)
+                bahan.__catat_mutasi(bahan.__jumlah - lama)
+        
+        for bahan, jumlah in urutan:
+            logger.info("Stok %s berkurang %s %s", bahan.__nama, jumlah, bahan.__satuan)
+            bahan._beritahu_pengamat()
+        return True
+    
+    @abstractmethod
+    def get_faktor_porsi(self) -> float:
+        """
+        Method abstract untuk faktor porsi mentah sesuai jenis bahan.
+        Porsi = int(jumlah * KONVERSI_SATUAN / faktor), sama dengan hitung_porsi().
+        
+        Returns:
+            float: Faktor porsi (gram, unit atau kg per porsi)
+        """
+        pass
+    
+    @abstractmethod
+    def get_takaran_per_porsi(self) -> float:
+        """
+        Method abstract untuk takaran satu porsi dalam satuan stok bahan.
+        Dipakai resep bawaan sehingga konsumsi sama dengan hitung_porsi().
+        
+        Returns:
+            float: Jumlah stok yang terpakai per porsi
+        """
+        pass
     
     @abstractmethod
     def hitung_porsi(self) -> int:
@@ -116,7 +260,7 @@ class BahanMakanan(ABC):
         nama = self.__nama
         jumlah = self.__jumlah
         satuan = self.__satuan
-        tanggal_str = self.__tanggal_masuk.strftime('%Y-%m-%d %H:%M')
+        tanggal_str = self.get_tanggal_masuk().strftime('%Y-%m-%d %H:%M')
         
         # Format yang AMAN - tidak ada spasi di format specifier
         return f"{nama}:  {jumlah:.2f} {satuan} | Masuk: {tanggal_str}"
@@ -131,8 +275,13 @@ class BahanPokok(BahanMakanan):
         __gram_per_porsi (float): Gram per porsi standar
     """
     
+    __slots__ = ('__gram_per_porsi',)
+    
+    KONVERSI_SATUAN = 1000.0  # kg -> gram
+    
     def __init__(self, nama: str, jumlah: float, satuan: str = "kg", 
-                 gram_per_porsi: float = 250.0):
+                 gram_per_porsi: float = 250.0,
+                 tanggal_masuk: Optional[datetime] = None):
         """
         Constructor untuk BahanPokok. 
         
@@ -141,14 +290,23 @@ class BahanPokok(BahanMakanan):
             jumlah (float): Jumlah stok dalam kg
             satuan (str): Satuan (default: kg)
             gram_per_porsi (float): Gram per porsi (default: 250g)
+            tanggal_masuk (datetime): Waktu bahan masuk (default: sekarang)
         """
-        super().__init__(nama, jumlah, satuan)
+        super().__init__(nama, jumlah, satuan, tanggal_masuk)
         self.__gram_per_porsi = gram_per_porsi
     
     def get_gram_per_porsi(self) -> float:
         """Getter untuk gram per porsi."""
         return self.__gram_per_porsi
     
+    def get_faktor_porsi(self) -> float:
+        """Faktor porsi: gram per porsi."""
+        return self.__gram_per_porsi
+    
+    def get_takaran_per_porsi(self) -> float:
+        """Takaran per porsi dalam kg (gram per porsi / 1000)."""
+        return self.__gram_per_porsi / 1000
+    
     # Method Overriding (Polymorphism)
     def hitung_porsi(self) -> int:
         """
@@ -172,8 +330,11 @@ class BahanProtein(BahanMakanan):
         __unit_per_porsi (float): Unit per porsi (misal: 2 telur/porsi)
     """
     
+    __slots__ = ('__unit_per_porsi',)
+    
     def __init__(self, nama: str, jumlah: float, satuan: str = "kg", 
-                 unit_per_porsi: float = 0.15):
+                 unit_per_porsi: float = 0.15,
+                 tanggal_masuk: Optional[datetime] = None):
         """
         Constructor untuk BahanProtein. 
         
@@ -182,14 +343,23 @@ class BahanProtein(BahanMakanan):
             jumlah (float): Jumlah stok
             satuan (str): Satuan
             unit_per_porsi (float): Unit per porsi (default: 0.15 kg = 150g)
+            tanggal_masuk (datetime): Waktu bahan masuk (default: sekarang)
         """
-        super().__init__(nama, jumlah, satuan)
+        super().__init__(nama, jumlah, satuan, tanggal_masuk)
         self.__unit_per_porsi = unit_per_porsi
     
     def get_unit_per_porsi(self) -> float:
         """Getter untuk unit per porsi."""
         return self.__unit_per_porsi
     
+    def get_faktor_porsi(self) -> float:
+        """Faktor porsi: unit per porsi."""
+        return self.__unit_per_porsi
+    
+    def get_takaran_per_porsi(self) -> float:
+        """Takaran per porsi dalam satuan stok (unit per porsi)."""
+        return self.__unit_per_porsi
+    
     # Method Overriding (Polymorphism)
     def hitung_porsi(self) -> int:
         """
@@ -208,8 +378,11 @@ class BahanSayuran(BahanMakanan):
     Mewarisi dari BahanMakanan (Inheritance).
     """
     
+    __slots__ = ('__kg_per_porsi',)
+    
     def __init__(self, nama: str, jumlah: float, satuan: str = "kg", 
-                 kg_per_porsi: float = 0.1):
+                 kg_per_porsi: float = 0.1,
+                 tanggal_masuk: Optional[datetime] = None):
         """
         Constructor untuk BahanSayuran.
         
@@ -218,14 +391,23 @@ class BahanSayuran(BahanMakanan):
             jumlah (float): Jumlah stok
             satuan (str): Satuan
             kg_per_porsi (float): Kg per porsi (default: 0.1 kg = 100g)
+            tanggal_masuk (datetime): Waktu bahan masuk (default: sekarang)
         """
-        super().__init__(nama, jumlah, satuan)
+        super().__init__(nama, jumlah, satuan, tanggal_masuk)
         self.__kg_per_porsi = kg_per_porsi
     
     def get_kg_per_porsi(self) -> float:
         """Getter untuk kg per porsi."""
         return self.__kg_per_porsi
     
+    def get_faktor_porsi(self) -> float:
+        """Faktor porsi: kg per porsi."""
+        return self.__kg_per_porsi
+    
+    def get_takaran_per_porsi(self) -> float:
+        """Takaran per porsi dalam kg."""
+        return self.__kg_per_porsi
+    
     # Method Overriding (Polymorphism)
     def hitung_porsi(self) -> int:
         """
@@ -235,4 +417,61 @@ class BahanSayuran(BahanMakanan):
             int: Jumlah porsi yang bisa dibuat
         """
         porsi = int(self.get_jumlah() / self.__kg_per_porsi)
-        return porsi
\ No newline at end of file
+        return porsi
+
+# Jenis bahan -> class konkret (dipakai saat membuat bahan dari data teks/JSON)
+JENIS_BAHAN = {
+    'pokok': BahanPokok,
+    'protein': BahanProtein,
+    'sayuran': BahanSayuran,
+}
+
+
+def buat_bahan(jenis: str, nama: str, jumlah: float, satuan: str = "kg",
+               per_porsi: Optional[float] = None,
+               tanggal_masuk: Optional[datetime] = None) -> BahanMakanan:
+    """
+    Factory bahan makanan berdasarkan nama jenisnya (Polymorphism).
+    
+    Args:
+        jenis (str): 'pokok', 'protein' atau 'sayuran'
+        nama (str): Nama bahan
+        jumlah (float): Jumlah stok
+        satuan (str): Satuan (default: kg)
+        per_porsi (float): Takaran per porsi sesuai jenis (default: bawaan class)
+        tanggal_masuk (datetime): Waktu bahan masuk (default: sekarang)
+        
+    Returns:
+        BahanMakanan: Object bahan sesuai jenis
+        
+    Raises:
+        ValueError: Jika jenis tidak dikenal atau data tidak valid
+    """
+    cls = JENIS_BAHAN.get(jenis)
+    if cls is None:
+        raise ValueError(f"Jenis bahan harus salah satu dari: {', '.join(JENIS_BAHAN)}")
+    if per_porsi is None:
+        return cls(nama, jumlah, satuan, tanggal_masuk=tanggal_masuk)
+    if per_porsi <= 0:
+        raise ValueError("Takaran per porsi harus positif")
+    return cls(nama, jumlah, satuan, per_porsi, tanggal_masuk)
+
+
+def jenis_dan_faktor(bahan: BahanMakanan) -> Tuple[str, float]:
+    """
+    Kebalikan buat_bahan: nama jenis dan takaran per porsi sebuah bahan,
+    untuk disimpan (SQLite, snapshot biner) lalu direkonstruksi lagi.
+    
+    Args:
+        bahan (BahanMakanan): Bahan yang disimpan
+        
+    Returns:
+        Tuple[str, float]: Jenis ('pokok', 'protein', 'sayuran') dan faktor porsi
+        
+    Raises:
+        ValueError: Jika class bahan tidak terdaftar di JENIS_BAHAN
+    """
+    for jenis, cls in JENIS_BAHAN.items():
+        if isinstance(bahan, cls):
+            return jenis, bahan.get_faktor_porsi()
+    raise ValueError(f"Jenis bahan {type(bahan).__name__} tidak didukung")
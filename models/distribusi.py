@@ -5,12 +5,15 @@ Menerapkan konsep Enkapsulasi dan Object Composition.
 
 from datetime import datetime
 from typing import Optional
+from models.observable import Observable
 import logging
+import sys
+import time
 
 logger = logging.getLogger(__name__)
 
 
-class DistribusiMakanan:
+class DistribusiMakanan(Observable):
     """
     Class untuk merepresentasikan distribusi makanan kepada korban.
     
@@ -18,12 +21,16 @@ class DistribusiMakanan:
         __id_distribusi (str): ID unik distribusi (private)
         __id_korban (str): ID korban penerima (private)
         __jumlah_porsi (int): Jumlah porsi yang didistribusikan (private)
-        __waktu_distribusi (datetime): Waktu distribusi (private)
+        __waktu_epoch (float): Waktu distribusi sebagai epoch detik (private)
         __catatan (str): Catatan tambahan (private)
+    
+    Memakai __slots__ dan timestamp epoch agar jutaan record distribusi tetap hemat memori.
     """
     
+    __slots__ = ('__id_distribusi', '__id_korban', '__jumlah_porsi', '__waktu_epoch', '__catatan')
+    
     def __init__(self, id_distribusi: str, id_korban: str, jumlah_porsi: int, 
-                 catatan: str = ""):
+                 catatan: str = "", waktu_distribusi: Optional[datetime] = None):
         """
         Constructor untuk DistribusiMakanan.
         
@@ -32,6 +39,7 @@ class DistribusiMakanan:
             id_korban (str): ID korban penerima
             jumlah_porsi (int): Jumlah porsi
             catatan (str): Catatan tambahan
+            waktu_distribusi (datetime): Waktu distribusi (default: sekarang)
             
         Raises:
             ValueError: Jika jumlah_porsi < 1
@@ -40,11 +48,12 @@ class DistribusiMakanan:
             raise ValueError("Jumlah porsi minimal 1")
         
         self.__id_distribusi = id_distribusi
-        self.__id_korban = id_korban
+        # ID korban berulang di banyak distribusi, cukup satu object string
+        self.__id_korban = sys.intern(id_korban)
         self.__jumlah_porsi = jumlah_porsi
-        self.__waktu_distribusi = datetime.now()
+        self.__waktu_epoch = waktu_distribusi.timestamp() if waktu_distribusi else time.time()
         self.__catatan = catatan
-        logger.info(f"Distribusi {id_distribusi}:  {jumlah_porsi} porsi ke korban {id_korban}")
+        logger.info("Distribusi %s:  %s porsi ke korban %s", id_distribusi, jumlah_porsi, id_korban)
     
     # Getter methods (Enkapsulasi)
     def get_id_distribusi(self) -> str:
@@ -61,7 +70,11 @@ class DistribusiMakanan:
     
     def get_waktu_distribusi(self) -> datetime:
         """Getter untuk waktu distribusi."""
-        return self.__waktu_distribusi
+        return datetime.fromtimestamp(self.__waktu_epoch)
+    
+    def get_waktu_epoch(self) -> float:
+        """Getter untuk waktu distribusi sebagai epoch detik (tanpa membuat datetime)."""
+        return self.__waktu_epoch
     
     def get_catatan(self) -> str:
         """Getter untuk catatan."""
@@ -75,7 +88,8 @@ class DistribusiMakanan:
             catatan (str): Catatan baru
         """
         self.__catatan = catatan
-        logger.info(f"Catatan distribusi {self.__id_distribusi} diperbarui")
+        logger.info("Catatan distribusi %s diperbarui", self.__id_distribusi)
+        self._beritahu_pengamat()
     
     def get_info(self) -> str:
         """
@@ -87,7 +101,7 @@ class DistribusiMakanan:
         info = (f"Distribusi {self.__id_distribusi} | "
                 f"Korban: {self.__id_korban} | "
                 f"Porsi: {self.__jumlah_porsi} | "
-                f"Waktu: {self.__waktu_distribusi.strftime('%Y-%m-%d %H:%M')}")
+                f"Waktu: {self.get_waktu_distribusi().strftime('%Y-%m-%d %H:%M')}")
         if self.__catatan:
             info += f" | Catatan:  {self.__catatan}"
         return info
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Module katalog porsi berbasis kolom.
+Menghitung porsi ribuan lot bahan dalam satu ekspresi vektor
+(jumlah * konversi / faktor) alih-alih memanggil hitung_porsi() per object.
+Hasilnya identik dengan method polymorphic masing-masing class bahan.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+from models.bahan_makanan import BahanMakanan
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional - perhitungan memakai loop Python
+    np = None
+
+
+class KatalogPorsi:
+    """
+    Katalog porsi: tiga kolom paralel (jumlah stok, faktor porsi, konversi
+    satuan) plus nama bahan. Porsi per item = int(jumlah * konversi / faktor)
+    dengan urutan operasi yang sama seperti hitung_porsi() sehingga hasil
+    float-nya persis sama. Dengan NumPy kolom dibaca langsung dari buffer
+    array tanpa salinan.
+    """
+
+    def __init__(self):
+        """Constructor - inisialisasi kolom kosong."""
+        self.__nama: List[str] = []
+        self.__posisi: Dict[str, int] = {}
+        self.__jumlah = array('d')
+        self.__faktor = array('d')
+        self.__konversi = array('d')
+
+    @classmethod
+    def dari_bahan(cls, bahan_list: Iterable[BahanMakanan]) -> 'KatalogPorsi':
+        """
+        Membuat katalog dari daftar bahan.
+
+        Args:
+            bahan_list: Bahan yang dimasukkan (boleh generator)
+
+        Returns:
+            KatalogPorsi: Katalog berisi semua bahan
+        """
+        katalog = cls()
+        for bahan in bahan_list:
+            katalog.simpan(bahan)
+        return katalog
+
+    def simpan(self, bahan: BahanMakanan) -> None:
+        """
+        Menambah bahan ke katalog atau memperbarui barisnya jika nama sudah ada.
+
+        Args:
+            bahan: Bahan yang disimpan
+
+        Raises:
+            ValueError: Jika faktor porsi tidak positif
+        """
+        faktor = bahan.get_faktor_porsi()
+        if faktor <= 0:
+            raise ValueError(f"Faktor porsi {bahan.get_nama()} harus positif")
+        i = self.__posisi.get(bahan.get_nama())
+        if i is None:
+            self.__posisi[bahan.get_nama()] = len(self.__nama)
+            self.__nama.append(bahan.get_nama())
+            self.__jumlah.append(bahan.get_jumlah())
+            self.__faktor.append(faktor)
+            self.__konversi.append(bahan.KONVERSI_SATUAN)
+        else:
+            self.__jumlah[i] = bahan.get_jumlah()
+            self.__faktor[i] = faktor
+            self.__konversi[i] = bahan.KONVERSI_SATUAN
+
+    def __len__(self) -> int:
+        return len(self.__nama)
+
+    def __porsi_numpy(self):
+        """Porsi per item sebagai array NumPy int64 (satu ekspresi vektor)."""
+        jumlah = np.frombuffer(self.__jumlah, dtype=np.float64)
+        faktor = np.frombuffer(self.__faktor, dtype=np.float64)
+        konversi = np.frombuffer(self.__konversi, dtype=np.float64)
+        # astype memotong ke arah nol, sama seperti int()
+        return (jumlah * konversi / faktor).astype(np.int64)
+
+    def porsi_per_item(self) -> List[int]:
+        """
+        Porsi setiap bahan sesuai urutan masuk katalog.
+
+        Returns:
+            List[int]: Porsi per bahan
+        """
+        if np is not None and self.__nama:
+            return self.__porsi_numpy().tolist()
+        return [int(j * k / f) for j, k, f in zip(self.__jumlah, self.__konversi, self.__faktor)]
+
+    def porsi_per_bahan(self) -> Dict[str, int]:
+        """
+        Porsi setiap bahan per nama.
+
+        Returns:
+            Dict[str, int]: Nama bahan -> porsi
+        """
+        return dict(zip(self.__nama, self.porsi_per_item()))
+
+    def porsi_minimum(self) -> Optional[int]:
+        """
+        Porsi bahan bottleneck (sama dengan get_porsi_minimum repository).
+
+        Returns:
+            Optional[int]: Porsi minimum, None jika katalog kosong
+        """
+        if not self.__nama:
+            return None
+        if np is not None:
+            return int(self.__porsi_numpy().min())
+        return min(self.porsi_per_item())
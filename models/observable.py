@@ -0,0 +1,47 @@
+"""
+Module untuk mekanisme Observer sederhana pada entitas.
+Dipakai agar pihak lain (misal index repository) tahu saat state entitas berubah.
+"""
+
+from typing import Callable, List
+
+
+class Observable:
+    """
+    Mixin Observer Pattern untuk entitas.
+
+    Entitas memanggil _beritahu_pengamat() setelah setter mengubah state,
+    sehingga setiap pengamat terdaftar dipanggil dengan entitas tersebut.
+    List pengamat baru dibuat saat pengamat pertama didaftarkan.
+    """
+
+    __slots__ = ('_pengamat',)
+
+    def tambah_pengamat(self, callback: Callable[[object], None]) -> None:
+        """
+        Mendaftarkan pengamat perubahan.
+
+        Args:
+            callback: Fungsi yang dipanggil dengan entitas setelah berubah
+        """
+        pengamat = getattr(self, '_pengamat', None)
+        if pengamat is None:
+            pengamat = []
+            self._pengamat = pengamat
+        pengamat.append(callback)
+
+    def hapus_pengamat(self, callback: Callable[[object], None]) -> None:
+        """
+        Menghapus pengamat yang sebelumnya didaftarkan.
+
+        Args:
+            callback: Fungsi pengamat yang dihapus
+        """
+        pengamat: List = getattr(self, '_pengamat', None) or []
+        if callback in pengamat:
+            pengamat.remove(callback)
+
+    def _beritahu_pengamat(self) -> None:
+        """Memanggil semua pengamat setelah state entitas berubah."""
+        for callback in list(getattr(self, '_pengamat', None) or ()):
+            callback(self)
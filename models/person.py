@@ -5,28 +5,38 @@ Menerapkan konsep Inheritance dan Polymorphism.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Optional
+from models.observable import Observable
 import logging
+import sys
+import time
 
 logger = logging.getLogger(__name__)
 
 
-class Person(ABC):
+class Person(Observable, ABC):
     """
     Abstract Base Class untuk representasi manusia.
     
     Attributes:
         __name (str): Nama lengkap person (private)
         __id (str): ID unik person (private)
-        __registered_date (datetime): Tanggal registrasi (private)
+        __registered_epoch (float): Tanggal registrasi sebagai epoch detik (private)
+    
+    Memakai __slots__ dan timestamp epoch agar hemat memori untuk ratusan ribu korban.
     """
     
-    def __init__(self, name: str, person_id: str):
+    __slots__ = ('__name', '__id', '__registered_epoch')
+    
+    def __init__(self, name: str, person_id: str,
+                 registered_date: Optional[datetime] = None):
         """
         Constructor untuk Person.
         
         Args:
             name (str): Nama lengkap
             person_id (str): ID unik
+            registered_date (datetime): Tanggal registrasi (default: sekarang)
             
         Raises:
             ValueError: Jika name atau person_id kosong
@@ -36,8 +46,8 @@ class Person(ABC):
         
         self.__name = name
         self.__id = person_id
-        self.__registered_date = datetime.now()
-        logger.info(f"Person {name} dengan ID {person_id} berhasil dibuat")
+        self.__registered_epoch = registered_date.timestamp() if registered_date else time.time()
+        logger.info("Person %s dengan ID %s berhasil dibuat", name, person_id)
     
     # Getter methods (Enkapsulasi)
     def get_name(self) -> str:
@@ -50,7 +60,11 @@ class Person(ABC):
     
     def get_registered_date(self) -> datetime:
         """Getter untuk tanggal registrasi."""
-        return self.__registered_date
+        return datetime.fromtimestamp(self.__registered_epoch)
+    
+    def get_registered_epoch(self) -> float:
+        """Getter untuk tanggal registrasi sebagai epoch detik (tanpa membuat datetime)."""
+        return self.__registered_epoch
     
     # Setter methods dengan validasi
     def set_name(self, name: str) -> None:
@@ -66,7 +80,8 @@ class Person(ABC):
         if not name:
             raise ValueError("Name tidak boleh kosong")
         self.__name = name
-        logger.info(f"Nama person ID {self.__id} diubah menjadi {name}")
+        logger.info("Nama person ID %s diubah menjadi %s", self.__id, name)
+        self._beritahu_pengamat()
     
     @abstractmethod
     def get_info(self) -> str:
@@ -90,8 +105,11 @@ class Korban(Person):
         __jumlah_tanggungan (int): Jumlah anggota keluarga
     """
     
+    __slots__ = ('__kebutuhan_khusus', '__jumlah_tanggungan')
+    
     def __init__(self, name: str, person_id: str, kebutuhan_khusus: str = "Umum", 
-                 jumlah_tanggungan: int = 1):
+                 jumlah_tanggungan: int = 1,
+                 registered_date: Optional[datetime] = None):
         """
         Constructor untuk Korban.
         
@@ -100,18 +118,20 @@ class Korban(Person):
             person_id (str): ID korban
             kebutuhan_khusus (str): Kategori kebutuhan (Umum/Lansia/Bayi/Sakit)
             jumlah_tanggungan (int): Jumlah tanggungan
+            registered_date (datetime): Tanggal registrasi (default: sekarang)
             
         Raises:
             ValueError: Jika jumlah_tanggungan < 1
         """
-        super().__init__(name, person_id)  # Memanggil constructor parent
+        super().__init__(name, person_id, registered_date)  # Memanggil constructor parent
         
         if jumlah_tanggungan < 1:
             raise ValueError("Jumlah tanggungan minimal 1")
         
-        self.__kebutuhan_khusus = kebutuhan_khusus
+        # Kategori berulang (Umum/Lansia/...) di-intern agar satu object string dipakai bersama
+        self.__kebutuhan_khusus = sys.intern(kebutuhan_khusus)
         self.__jumlah_tanggungan = jumlah_tanggungan
-        logger.info(f"Korban {name} terdaftar dengan {jumlah_tanggungan} tanggungan")
+        logger.info("Korban %s terdaftar dengan %s tanggungan", name, jumlah_tanggungan)
     
     # Getter dan Setter
     def get_kebutuhan_khusus(self) -> str:
@@ -135,7 +155,8 @@ class Korban(Person):
         if jumlah < 1:
             raise ValueError("Jumlah tanggungan minimal 1")
         self.__jumlah_tanggungan = jumlah
-        logger.info(f"Tanggungan korban {self. get_id()} diubah menjadi {jumlah}")
+        logger.info("Tanggungan korban %s diubah menjadi %s", self.get_id(), jumlah)
+        self._beritahu_pengamat()
     
     # Method Overriding (Polymorphism)
     def get_info(self) -> str:
@@ -161,6 +182,8 @@ class Relawan(Person):
         __jam_kerja (int): Total jam kerja relawan
     """
     
+    __slots__ = ('__keahlian', '__jam_kerja')
+    
     def __init__(self, name: str, person_id: str, keahlian: str = "Umum"):
         """
         Constructor untuk Relawan.
@@ -171,9 +194,9 @@ class Relawan(Person):
             keahlian (str): Keahlian relawan
         """
         super().__init__(name, person_id)
-        self.__keahlian = keahlian
+        self.__keahlian = sys.intern(keahlian)
         self.__jam_kerja = 0
-        logger.info(f"Relawan {name} dengan keahlian {keahlian} terdaftar")
+        logger.info("Relawan %s dengan keahlian %s terdaftar", name, keahlian)
     
     def get_keahlian(self) -> str:
         """Getter untuk keahlian."""
@@ -196,7 +219,7 @@ class Relawan(Person):
         if jam < 0:
             raise ValueError("Jam kerja tidak boleh negatif")
         self.__jam_kerja += jam
-        logger.info(f"Relawan {self.get_id()} menambah {jam} jam kerja")
+        logger.info("Relawan %s menambah %s jam kerja", self.get_id(), jam)
     
     # Method Overriding (Polymorphism)
     def get_info(self) -> str:
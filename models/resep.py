@@ -0,0 +1,116 @@
+"""
+Module untuk representasi resep/menu dapur umum.
+Resep menentukan takaran setiap bahan untuk satu porsi, sehingga
+perhitungan porsi tersedia dan pengurangan stok memakai aturan yang sama.
+"""
+
+from typing import Dict, Iterable, List, Mapping
+from models.bahan_makanan import BahanMakanan
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Resep:
+    """
+    Class untuk resep satu menu.
+
+    Attributes:
+        __nama (str): Nama menu (private)
+        __takaran (Dict[str, float]): Nama bahan -> takaran per porsi
+            dalam satuan stok bahan tersebut (private)
+    """
+
+    __slots__ = ('__nama', '__takaran')
+
+    def __init__(self, nama: str, takaran: Mapping[str, float]):
+        """
+        Constructor untuk Resep.
+
+        Args:
+            nama (str): Nama menu
+            takaran (Mapping[str, float]): Nama bahan -> takaran per porsi
+
+        Raises:
+            ValueError: Jika nama kosong, resep tanpa bahan atau takaran tidak positif
+        """
+        if not nama:
+            raise ValueError("Nama resep tidak boleh kosong")
+        if not takaran:
+            raise ValueError("Resep minimal berisi satu bahan")
+        for nama_bahan, jumlah in takaran.items():
+            if not nama_bahan:
+                raise ValueError("Nama bahan dalam resep tidak boleh kosong")
+            if jumlah <= 0:
+                raise ValueError(f"Takaran {nama_bahan} harus positif")
+
+        self.__nama = nama
+        self.__takaran = dict(takaran)
+        logger.info("Resep %s dengan %s bahan dibuat", nama, len(self.__takaran))
+
+    @classmethod
+    def dari_bahan(cls, bahan_list: Iterable[BahanMakanan], nama: str = "Menu Standar") -> 'Resep':
+        """
+        Membuat resep dari takaran bawaan setiap bahan (get_takaran_per_porsi).
+
+        Args:
+            bahan_list: Bahan yang dipakai
+            nama (str): Nama menu
+
+        Returns:
+            Resep: Resep berisi semua bahan
+        """
+        return cls(nama, {b.get_nama(): b.get_takaran_per_porsi() for b in bahan_list})
+
+    def get_nama(self) -> str:
+        """Getter untuk nama resep."""
+        return self.__nama
+
+    def get_takaran(self) -> Dict[str, float]:
+        """Getter untuk takaran per porsi (salinan)."""
+        return dict(self.__takaran)
+
+    def get_nama_bahan(self) -> List[str]:
+        """Nama bahan dalam resep, urut abjad."""
+        return sorted(self.__takaran)
+
+    def kebutuhan(self, jumlah_porsi: int) -> Dict[str, float]:
+        """
+        Menghitung kebutuhan setiap bahan untuk sejumlah porsi.
+
+        Args:
+            jumlah_porsi (int): Jumlah porsi
+
+        Returns:
+            Dict[str, float]: Nama bahan -> jumlah yang dibutuhkan
+
+        Raises:
+            ValueError: Jika jumlah porsi negatif
+        """
+        if jumlah_porsi < 0:
+            raise ValueError("Jumlah porsi tidak boleh negatif")
+        return {nama: jumlah_porsi * takaran for nama, takaran in self.__takaran.items()}
+
+    def hitung_porsi(self, stok: Mapping[str, float]) -> int:
+        """
+        Menghitung porsi yang bisa dibuat dari stok dalam satu lintasan:
+        minimum stok / takaran atas semua bahan resep (bahan yang tidak ada = 0).
+
+        Args:
+            stok (Mapping[str, float]): Nama bahan -> jumlah stok
+
+        Returns:
+            int: Jumlah porsi yang bisa dibuat
+        """
+        return max(min(int(stok.get(nama, 0.0) / takaran)
+                       for nama, takaran in self.__takaran.items()), 0)
+
+    def get_info(self) -> str:
+        """
+        Mendapatkan informasi resep.
+
+        Returns:
+            str: Informasi resep
+        """
+        bahan = ", ".join(f"{nama} {self.__takaran[nama]:g}" for nama in self.get_nama_bahan())
+        return f"Resep {self.__nama}: {bahan} per porsi"
@@ -3,26 +3,45 @@ Module untuk Repository Bahan Makanan.
 Implementasi konkret dari IRepository (DIP).
 """
 
-from typing import List, Optional, Dict
-from repositories.base_repository import IRepository
+from typing import List, Optional, Dict, Sequence, Tuple
+from repositories.base_repository import Halaman, UrutanSisip, sinkron
+from repositories.indexed_repository import IndexedRepository, OrderedIndex, MinIndex
+from repositories.buku_stok import BukuStok
 from models.bahan_makanan import BahanMakanan
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class BahanRepository(IRepository[BahanMakanan]):
+class BahanRepository(IndexedRepository[BahanMakanan]):
     """
     Repository untuk mengelola data Bahan Makanan.
     Implementasi IRepository (Dependency Inversion Principle).
     Menerapkan Single Responsibility Principle. 
+    
+    Jika diberi BukuStok, setiap bahan yang masuk repository diikuti ledger
+    sehingga semua mutasi stoknya (termasuk lewat tambah/kurangi stok) tercatat.
     """
     
-    def __init__(self):
-        """Constructor - inisialisasi storage dictionary."""
+    # Secondary index (dijaga otomatis saat add/update/delete dan tambah/kurangi stok)
+    idx_jumlah = OrderedIndex(BahanMakanan.get_jumlah)
+    # Agregat bottleneck: porsi terkecil di antara semua bahan (Polymorphism via hitung_porsi)
+    idx_porsi = MinIndex(lambda bahan: bahan.hitung_porsi())
+    
+    def __init__(self, buku_stok: Optional[BukuStok] = None):
+        """
+        Constructor - inisialisasi storage dictionary dan index.
+        
+        Args:
+            buku_stok: Ledger mutasi stok (None = tanpa riwayat stok)
+        """
+        super().__init__()
         self.__storage: Dict[str, BahanMakanan] = {}
+        self.__urutan = UrutanSisip()
+        self.__buku_stok = buku_stok
         logger. info("BahanRepository diinisialisasi")
     
+    @sinkron
     def add(self, entity: BahanMakanan) -> None:
         """
         Menambah bahan makanan baru atau update jika sudah ada.
@@ -34,11 +53,16 @@ class BahanRepository(IRepository[BahanMakanan]):
         if nama in self.__storage:
             # Jika sudah ada, tambahkan stoknya
             self.__storage[nama].tambah_stok(entity.get_jumlah())
-            logger.info(f"Stok {nama} ditambahkan")
+            logger.info("Stok %s ditambahkan", nama)
         else:
             self.__storage[nama] = entity
-            logger.info(f"Bahan {nama} ditambahkan ke repository")
+            self.__urutan.tambah(nama)
+            self._indeks_tambah(entity)
+            if self.__buku_stok is not None:
+                self.__buku_stok.ikuti(entity)
+            logger.info("Bahan %s ditambahkan ke repository", nama)
     
+    @sinkron
     def get_by_id(self, entity_id: str) -> Optional[BahanMakanan]: 
         """
         Mengambil bahan berdasarkan nama (sebagai ID).
@@ -51,6 +75,7 @@ class BahanRepository(IRepository[BahanMakanan]):
         """
         return self.__storage.get(entity_id)
     
+    @sinkron
     def get_all(self) -> List[BahanMakanan]:
         """
         Mengambil semua bahan. 
@@ -60,6 +85,34 @@ class BahanRepository(IRepository[BahanMakanan]):
         """
         return list(self.__storage.values())
     
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah bahan.
+        
+        Returns:
+            int: Jumlah bahan
+        """
+        return len(self.__storage)
+    
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman bahan menurut urutan bahan pertama kali masuk.
+        Kursor adalah nomor urut sisip (keyset, lihat UrutanSisip); hanya
+        entitas di halaman ini yang disalin.
+        
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah bahan per halaman
+            
+        Returns:
+            Halaman: List bahan dan kursor halaman berikutnya (None jika habis)
+        """
+        ids, kursor_berikut = self.__urutan.halaman(kursor, ukuran)
+        return [self.__storage[n] for n in ids], kursor_berikut
+    
+    @sinkron
     def update(self, entity: BahanMakanan) -> bool:
         """
         Memperbarui data bahan. 
@@ -72,12 +125,18 @@ class BahanRepository(IRepository[BahanMakanan]):
         """
         nama = entity.get_nama()
         if nama not in self.__storage:
-            logger.warning(f"Bahan {nama} tidak ditemukan untuk update")
+            logger.warning("Bahan %s tidak ditemukan untuk update", nama)
             return False
+        lama = self.__storage[nama]
+        self._indeks_ganti(lama, entity)
+        if self.__buku_stok is not None and lama is not entity:
+            self.__buku_stok.lepas(lama, stok_habis=False)
+            self.__buku_stok.ikuti(entity)
         self.__storage[nama] = entity
-        logger.info(f"Bahan {nama} diperbarui")
+        logger.info("Bahan %s diperbarui", nama)
         return True
     
+    @sinkron
     def delete(self, entity_id: str) -> bool:
         """
         Menghapus bahan.
@@ -89,12 +148,21 @@ class BahanRepository(IRepository[BahanMakanan]):
             bool: True jika berhasil
         """
         if entity_id in self.__storage:
-            del self.__storage[entity_id]
-            logger. info(f"Bahan {entity_id} dihapus")
+            lama = self.__storage.pop(entity_id)
+            self.__urutan.hapus(entity_id)
+            self._indeks_hapus(lama)
+            if self.__buku_stok is not None:
+                self.__buku_stok.lepas(lama)
+            logger.info("Bahan %s dihapus", entity_id)
             return True
-        logger.warning(f"Bahan {entity_id} tidak ditemukan untuk dihapus")
+        logger.warning("Bahan %s tidak ditemukan untuk dihapus", entity_id)
         return False
     
+    def _id_entitas(self, entity: BahanMakanan) -> str:
+        """Nama bahan sebagai kunci storage."""
+        return entity.get_nama()
+    
+    @sinkron
     def get_stok_rendah(self, threshold: float = 10.0) -> List[BahanMakanan]: 
         """
         Mendapatkan bahan dengan stok rendah.
@@ -105,4 +173,44 @@ class BahanRepository(IRepository[BahanMakanan]):
         Returns:
             List[BahanMakanan]:  List bahan dengan stok rendah
         """
-        return [b for b in self.__storage.values() if b.get_jumlah() < threshold]
\ No newline at end of file
+        return [self.__storage[n] for n in self.idx_jumlah.rentang(atas=threshold)]
+    
+    def get_buku_stok(self) -> Optional[BukuStok]:
+        """Ledger mutasi stok repository ini (None jika tidak dipakai)."""
+        return self.__buku_stok
+    
+    @sinkron
+    def get_porsi_minimum(self) -> Optional[int]:
+        """
+        Mendapatkan porsi terkecil di antara semua bahan (bottleneck) dalam O(1).
+        Nilai dijaga oleh idx_porsi setiap kali stok atau isi repository berubah.
+        
+        Returns:
+            Optional[int]: Porsi minimum, None jika repository kosong
+        """
+        return self.idx_porsi.minimum()
+    
+    def kurangi_stok_bersama(self, pengurangan: Sequence[Tuple[BahanMakanan, float]]) -> bool:
+        """
+        Mengurangi stok beberapa bahan secara all-or-nothing.
+        Object bahan di repository ini adalah object yang sama dengan hasil
+        get_by_id, jadi cukup memakai lock per bahan (BahanMakanan.kurangi_stok_bersama);
+        index diperbarui lewat Observer.
+        
+        Args:
+            pengurangan: Pasangan (bahan, jumlah) yang akan dikurangi
+            
+        Returns:
+            bool: True jika semua stok dikurangi, False jika ada yang tidak cukup
+        """
+        return BahanMakanan.kurangi_stok_bersama(pengurangan)
+    
+    def kembalikan_stok(self, pengurangan: Sequence[Tuple[BahanMakanan, float]]) -> None:
+        """
+        Mengembalikan stok yang dikurangi kurangi_stok_bersama.
+        
+        Args:
+            pengurangan: Pasangan (bahan, jumlah) yang dikembalikan
+        """
+        for bahan, jumlah in pengurangan:
+            bahan.tambah_stok(jumlah)
@@ -4,9 +4,161 @@ Menerapkan Dependency Inversion Principle (SOLID).
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Generic
+import functools
 
 T = TypeVar('T')
+F = TypeVar('F', bound=Callable)
+
+# Satu halaman data: (entitas, kursor halaman berikutnya atau None jika habis)
+Halaman = Tuple[List[T], Optional[str]]
+
+
+def sinkron(method: F) -> F:
+    """
+    Decorator untuk method repository yang harus berjalan di bawah lock
+    repository (self._lock). Lock yang dipakai adalah threading.RLock agar
+    method yang memanggil method lain - atau callback Observer yang dipicu
+    dari dalam method tersebut - di thread yang sama tidak deadlock.
+    """
+    @functools.wraps(method)
+    def pembungkus(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return pembungkus
+
+
+def baca_kursor(kursor: Optional[str], ukuran: int) -> int:
+    """
+    Memvalidasi ukuran halaman dan mengubah kursor menjadi bilangan bulat.
+
+    Args:
+        kursor: Kursor dari halaman sebelumnya (None = halaman pertama)
+        ukuran: Jumlah entitas per halaman
+
+    Returns:
+        int: Nilai kursor (0 untuk halaman pertama)
+
+    Raises:
+        ValueError: Jika ukuran < 1 atau kursor tidak valid
+    """
+    if ukuran < 1:
+        raise ValueError("Ukuran halaman minimal 1")
+    if kursor is None:
+        return 0
+    try:
+        nilai = int(kursor)
+    except (TypeError, ValueError):
+        raise ValueError(f"Kursor halaman tidak valid: {kursor}")
+    if nilai < 0:
+        raise ValueError(f"Kursor halaman tidak valid: {kursor}")
+    return nilai
+
+
+def batas_waktu(mulai: Optional[datetime], akhir: Optional[datetime]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Mengubah batas rentang waktu [mulai, akhir) menjadi epoch detik.
+
+    Args:
+        mulai: Batas bawah inklusif (None = tanpa batas)
+        akhir: Batas atas eksklusif (None = tanpa batas)
+
+    Returns:
+        Tuple: (epoch_mulai, epoch_akhir), None untuk batas yang tidak diisi
+    """
+    return (None if mulai is None else mulai.timestamp(),
+            None if akhir is None else akhir.timestamp())
+
+
+class UrutanSisip:
+    """
+    Urutan sisip entitas untuk keyset pagination repository in-memory.
+
+    Setiap ID mendapat nomor urut yang naik terus dan tidak pernah dipakai
+    ulang. Kursor halaman adalah nomor urut entitas terakhir yang dikirim,
+    sehingga halaman berikutnya dicari dengan bisect (O(log n + ukuran)) dan
+    penghapusan di antara dua halaman tidak membuat entitas terlewat.
+    ID yang dihapus ditandai kosong lalu dipadatkan saat lebih dari separuh
+    slot kosong (O(1) teramortisasi); nomor urut tidak berubah saat dipadatkan.
+    """
+
+    def __init__(self):
+        self.__berikut = 1
+        self.__urut = array('q')
+        self.__id: List[Optional[str]] = []
+        self.__urut_per_id: Dict[str, int] = {}
+        self.__kosong = 0
+
+    def tambah(self, entity_id: str) -> None:
+        """Menambahkan ID di akhir urutan (diabaikan jika sudah ada)."""
+        if entity_id in self.__urut_per_id:
+            return
+        self.__urut_per_id[entity_id] = self.__berikut
+        self.__urut.append(self.__berikut)
+        self.__id.append(entity_id)
+        self.__berikut += 1
+
+    def hapus(self, entity_id: str) -> None:
+        """Mengeluarkan ID dari urutan."""
+        urut = self.__urut_per_id.pop(entity_id, None)
+        if urut is None:
+            return
+        self.__id[bisect_right(self.__urut, urut) - 1] = None
+        self.__kosong += 1
+        if self.__kosong * 2 > len(self.__id):
+            hidup = [i for i, entity_id in enumerate(self.__id) if entity_id is not None]
+            self.__urut = array('q', (self.__urut[i] for i in hidup))
+            self.__id = [self.__id[i] for i in hidup]
+            self.__kosong = 0
+
+    def halaman(self, kursor: Optional[str], ukuran: int) -> Tuple[List[str], Optional[str]]:
+        """
+        ID satu halaman setelah kursor.
+
+        Args:
+            kursor: Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran: Jumlah ID per halaman
+
+        Returns:
+            Tuple: ID di halaman ini dan kursor halaman berikutnya (None jika habis)
+
+        Raises:
+            ValueError: Jika ukuran atau kursor tidak valid
+        """
+        posisi = bisect_right(self.__urut, baca_kursor(kursor, ukuran))
+        isi: List[str] = []
+        while posisi < len(self.__id):
+            entity_id = self.__id[posisi]
+            if entity_id is not None:
+                if len(isi) == ukuran:
+                    return isi, str(self.__urut_per_id[isi[-1]])
+                isi.append(entity_id)
+            posisi += 1
+        return isi, None
+
+
+def potong_halaman(entitas: Iterable[T], kursor: Optional[str], ukuran: int) -> Halaman:
+    """
+    Mengambil satu halaman dari iterable dengan kursor berupa posisi (offset).
+    Satu elemen ekstra dibaca untuk mengetahui apakah masih ada halaman berikutnya.
+
+    Args:
+        entitas: Sumber data (misal dict.values(); tidak disalin seluruhnya)
+        kursor: Posisi awal dari halaman sebelumnya (None = halaman pertama)
+        ukuran: Jumlah entitas per halaman
+
+    Returns:
+        Halaman: Entitas di halaman ini dan kursor halaman berikutnya
+    """
+    awal = baca_kursor(kursor, ukuran)
+    isi = list(islice(entitas, awal, awal + ukuran + 1))
+    if len(isi) > ukuran:
+        return isi[:ukuran], str(awal + ukuran)
+    return isi, None
 
 
 class IRepository(ABC, Generic[T]):
@@ -75,4 +227,51 @@ class IRepository(ABC, Generic[T]):
         Returns:
             bool: True jika berhasil, False jika gagal
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def count(self) -> int:
+        """
+        Menghitung jumlah entitas.
+        Implementasi default memakai get_all(); subclass sebaiknya override
+        dengan cara yang tidak perlu menyalin seluruh data.
+        
+        Returns:
+            int: Jumlah entitas
+        """
+        return len(self.get_all())
+    
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman entitas (cursor paging).
+        Implementasi default memakai get_all(); subclass sebaiknya override
+        agar hanya entitas di halaman tersebut yang dibaca.
+        
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah entitas per halaman
+            
+        Returns:
+            Halaman: List entitas dan kursor halaman berikutnya (None jika habis)
+            
+        Raises:
+            ValueError: Jika ukuran atau kursor tidak valid
+        """
+        return potong_halaman(self.get_all(), kursor, ukuran)
+    
+    def iter_semua(self, ukuran_halaman: int = 500) -> Iterator[T]:
+        """
+        Generator semua entitas yang membaca data per halaman,
+        sehingga memori yang dipakai sebesar satu halaman.
+        
+        Args:
+            ukuran_halaman (int): Jumlah entitas yang dibaca sekaligus
+            
+        Yields:
+            T: Entitas satu per satu
+        """
+        kursor = None
+        while True:
+            halaman, kursor = self.get_halaman(kursor, ukuran_halaman)
+            yield from halaman
+            if kursor is None:
+                return
@@ -0,0 +1,232 @@
+"""
+Module buku stok (ledger) append-only untuk mutasi stok bahan.
+Setiap perubahan stok dicatat sebagai event (waktu, selisih) di kolom array
+per bahan, dengan checkpoint stok setiap N event, sehingga stok pada waktu
+tertentu bisa dihitung tanpa memutar ulang seluruh riwayat.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from models.bahan_makanan import BahanMakanan
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _RiwayatBahan:
+    """
+    Event stok satu bahan: kolom waktu (epoch, tidak pernah mundur) dan
+    selisih stok, plus checkpoint[k] = stok setelah k * interval event.
+    """
+
+    __slots__ = ('waktu', 'selisih', 'checkpoint', 'stok')
+
+    def __init__(self):
+        self.waktu = array('d')
+        self.selisih = array('d')
+        self.checkpoint = array('d', [0.0])
+        self.stok = 0.0
+
+
+class BukuStok:
+    """
+    Ledger mutasi stok bahan (event sourcing).
+
+    Bahan yang diikuti (ikuti) didaftari pencatat mutasi; setiap perubahan
+    stok mengirim selisih dan waktunya dari dalam lock bahan, lalu selisih itu
+    ditambahkan sebagai event baru. Tidak ada event yang diubah atau dihapus. Checkpoint menyimpan
+    stok absolut bahan setiap interval_checkpoint event, jadi stok pada waktu T
+    cukup bisect ke event terakhir <= T lalu menjumlah paling banyak
+    interval_checkpoint selisih dari checkpoint terdekat: O(log n + interval).
+
+    Karena selisih dikirim di bawah lock bahan, mutasi bersamaan pada bahan
+    yang sama tetap tercatat satu per satu (misal -5 lalu +5 menjadi dua
+    event). Urutan lock selalu lock bahan lalu lock ledger.
+    """
+
+    def __init__(self, interval_checkpoint: int = 64):
+        """
+        Args:
+            interval_checkpoint: Jumlah event di antara dua checkpoint
+
+        Raises:
+            ValueError: Jika interval kurang dari 1
+        """
+        if interval_checkpoint < 1:
+            raise ValueError("Interval checkpoint minimal 1")
+        self.__interval = interval_checkpoint
+        self.__lock = threading.Lock()
+        self.__riwayat: Dict[str, _RiwayatBahan] = {}
+
+    def ikuti(self, bahan: BahanMakanan) -> None:
+        """
+        Mulai mencatat mutasi stok bahan; stoknya saat ini dicatat sebagai event.
+
+        Args:
+            bahan: Bahan yang diikuti
+        """
+        nama = bahan.get_nama()
+        bahan.tambah_pencatat_mutasi(self._pada_mutasi_bahan,
+                                     awal=lambda stok, epoch: self.catat(nama, stok, epoch))
+
+    def lepas(self, bahan: BahanMakanan, stok_habis: bool = True) -> None:
+        """
+        Berhenti mengikuti bahan.
+
+        Args:
+            bahan: Bahan yang dilepas
+            stok_habis: True jika bahan keluar dari inventori (stok dicatat 0),
+                False jika object diganti bahan lain bernama sama
+        """
+        bahan.hapus_pencatat_mutasi(self._pada_mutasi_bahan)
+        if stok_habis:
+            self.catat(bahan.get_nama(), 0.0)
+
+    def _pada_mutasi_bahan(self, bahan: BahanMakanan, selisih: float, waktu_epoch: float) -> None:
+        """Pencatat mutasi bahan (dipanggil di bawah lock bahan)."""
+        self.catat_selisih(bahan.get_nama(), selisih, waktu_epoch)
+
+    def catat(self, nama_bahan: str, stok: float, waktu_epoch: Optional[float] = None) -> None:
+        """
+        Mencatat stok terbaru bahan sebagai event selisih (O(1) teramortisasi).
+        Waktu yang lebih awal dari event terakhir disamakan dengan event
+        terakhir agar kolom waktu tetap terurut.
+
+        Args:
+            nama_bahan: Nama bahan
+            stok: Stok bahan setelah perubahan
+            waktu_epoch: Waktu perubahan (default: sekarang)
+        """
+        epoch = time.time() if waktu_epoch is None else waktu_epoch
+        with self.__lock:
+            riwayat = self.__riwayat.get(nama_bahan)
+            if riwayat is None:
+                riwayat = self.__riwayat[nama_bahan] = _RiwayatBahan()
+            self.__tambah_event(riwayat, stok - riwayat.stok, stok, epoch)
+
+    def catat_selisih(self, nama_bahan: str, selisih: float,
+                      waktu_epoch: Optional[float] = None) -> None:
+        """
+        Mencatat satu mutasi stok bahan apa adanya (O(1) teramortisasi).
+
+        Args:
+            nama_bahan: Nama bahan
+            selisih: Perubahan stok; positif = masuk, negatif = keluar
+            waktu_epoch: Waktu perubahan (default: sekarang)
+        """
+        epoch = time.time() if waktu_epoch is None else waktu_epoch
+        with self.__lock:
+            riwayat = self.__riwayat.get(nama_bahan)
+            if riwayat is None:
+                riwayat = self.__riwayat[nama_bahan] = _RiwayatBahan()
+            self.__tambah_event(riwayat, selisih, riwayat.stok + selisih, epoch)
+
+    def __tambah_event(self, riwayat: _RiwayatBahan, selisih: float, stok: float,
+                       epoch: float) -> None:
+        """Menambahkan event (selisih 0 dilewati); pemanggil memegang __lock."""
+        if selisih == 0:
+            return
+        if riwayat.waktu and epoch < riwayat.waktu[-1]:
+            epoch = riwayat.waktu[-1]
+        riwayat.waktu.append(epoch)
+        riwayat.selisih.append(selisih)
+        riwayat.stok = stok
+        if len(riwayat.selisih) % self.__interval == 0:
+            # Stok absolut (bukan jumlah selisih) agar galat float tidak menumpuk
+            riwayat.checkpoint.append(stok)
+
+    def get_stok_pada(self, nama_bahan: str, waktu: datetime) -> float:
+        """
+        Stok bahan pada waktu tertentu.
+
+        Args:
+            nama_bahan: Nama bahan
+            waktu: Waktu yang ditanyakan (event tepat pada waktu ini ikut dihitung)
+
+        Returns:
+            float: Stok saat itu (0 jika bahan belum tercatat)
+        """
+        with self.__lock:
+            riwayat = self.__riwayat.get(nama_bahan)
+            if riwayat is None:
+                return 0.0
+            return self.__stok_setelah(riwayat, bisect_right(riwayat.waktu, waktu.timestamp()))
+
+    def __stok_setelah(self, riwayat: _RiwayatBahan, n: int) -> float:
+        """Stok setelah n event pertama: checkpoint terdekat + sisa selisih."""
+        k = n // self.__interval
+        stok = riwayat.checkpoint[k]
+        for i in range(k * self.__interval, n):
+            stok += riwayat.selisih[i]
+        return stok
+
+    def get_mutasi(self, nama_bahan: str, mulai: Optional[datetime] = None,
+                   akhir: Optional[datetime] = None) -> List[Tuple[datetime, float]]:
+        """
+        Event mutasi bahan dengan mulai <= waktu < akhir (untuk audit).
+
+        Args:
+            nama_bahan: Nama bahan
+            mulai: Batas bawah inklusif (None = tanpa batas)
+            akhir: Batas atas eksklusif (None = tanpa batas)
+
+        Returns:
+            List[Tuple[datetime, float]]: (waktu, selisih); positif = masuk, negatif = keluar
+        """
+        with self.__lock:
+            riwayat = self.__riwayat.get(nama_bahan)
+            if riwayat is None:
+                return []
+            awal = 0 if mulai is None else bisect_left(riwayat.waktu, mulai.timestamp())
+            ujung = len(riwayat.waktu) if akhir is None else bisect_left(riwayat.waktu, akhir.timestamp())
+            return [(datetime.fromtimestamp(riwayat.waktu[i]), riwayat.selisih[i])
+                    for i in range(awal, max(awal, ujung))]
+
+    def get_ringkasan_mutasi(self, nama_bahan: str, mulai: datetime,
+                             akhir: datetime) -> Dict[str, float]:
+        """
+        Ringkasan mutasi bahan dalam rentang [mulai, akhir), misal untuk
+        mencocokkan stok keluar dengan porsi yang didistribusikan.
+
+        Args:
+            nama_bahan: Nama bahan
+            mulai: Batas bawah inklusif
+            akhir: Batas atas eksklusif
+
+        Returns:
+            Dict: stok_awal, masuk, keluar, stok_akhir
+        """
+        with self.__lock:
+            riwayat = self.__riwayat.get(nama_bahan) or _RiwayatBahan()
+            awal = bisect_left(riwayat.waktu, mulai.timestamp())
+            ujung = max(awal, bisect_left(riwayat.waktu, akhir.timestamp()))
+            stok_awal = self.__stok_setelah(riwayat, awal)
+            selisih = riwayat.selisih[awal:ujung]
+        masuk = sum(s for s in selisih if s > 0)
+        keluar = -sum(s for s in selisih if s < 0)
+        return {
+            'stok_awal': stok_awal,
+            'masuk': masuk,
+            'keluar': keluar,
+            'stok_akhir': stok_awal + masuk - keluar,
+        }
+
+    def jumlah_event(self, nama_bahan: Optional[str] = None) -> int:
+        """
+        Jumlah event tercatat.
+
+        Args:
+            nama_bahan: Nama bahan (None = semua bahan)
+
+        Returns:
+            int: Jumlah event
+        """
+        with self.__lock:
+            if nama_bahan is not None:
+                riwayat = self.__riwayat.get(nama_bahan)
+                return len(riwayat.selisih) if riwayat else 0
+            return sum(len(r.selisih) for r in self.__riwayat.values())
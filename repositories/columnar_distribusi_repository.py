@@ -0,0 +1,429 @@
+"""
+Module untuk Repository Distribusi berbasis kolom (columnar).
+Alternatif DistribusiRepository untuk riwayat distribusi yang sangat besar:
+data disimpan per kolom di buffer array, bukan satu object per distribusi.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+from repositories.base_repository import Halaman, IRepository, baca_kursor, batas_waktu, sinkron
+from models.distribusi import DistribusiMakanan
+import logging
+import sys
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional - agregasi memakai loop Python
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_DETIK_PER_HARI = 86400
+
+
+class ColumnarDistribusiRepository(IRepository[DistribusiMakanan]):
+    """
+    Repository Distribusi Makanan dengan penyimpanan kolom.
+
+    Kolom jumlah_porsi, waktu (epoch) dan surrogate key korban disimpan di
+    array yang bisa bertambah; catatan disimpan di tabel samping karena
+    kebanyakan kosong. Baris yang dihapus ditandai (tombstone) agar kolom
+    tetap append-only. Index waktu berupa dua kolom paralel (epoch terurut
+    dan nomor baris) untuk query rentang dengan bisect; distribusi yang datang
+    urut waktu cukup di-append. Object DistribusiMakanan hanya dibuat saat diminta
+    (get_by_id, get_all, get_by_korban) dan merupakan salinan - gunakan
+    update() untuk menyimpan perubahan. Method publik memakai lock repository
+    (@sinkron) sehingga aman dipakai beberapa posko sekaligus.
+    """
+
+    def __init__(self):
+        """Constructor - inisialisasi lock dan kolom kosong."""
+        self._lock = threading.RLock()
+        self.__porsi = array('q')
+        self.__waktu = array('d')
+        self.__kunci_korban = array('q')
+        self.__hidup = bytearray()
+        self.__id_distribusi: List[str] = []
+        self.__baris_per_id: Dict[str, int] = {}
+        self.__catatan: Dict[int, str] = {}
+
+        # Index waktu: epoch terurut dan baris pasangannya (hanya baris hidup)
+        self.__urut_waktu = array('d')
+        self.__urut_baris = array('q')
+
+        # Surrogate key korban: id_korban <-> integer
+        self.__id_korban: List[str] = []
+        self.__kunci_per_korban: Dict[str, int] = {}
+        self.__baris_per_korban: Dict[int, array] = {}
+
+        # Counter berjalan
+        self.__jumlah_hidup = 0
+        self.__total_porsi = 0
+        self.__porsi_per_korban = array('q')
+        logger.info("ColumnarDistribusiRepository diinisialisasi")
+
+    def __kunci_korban_untuk(self, id_korban: str) -> int:
+        """Mengambil (atau membuat) surrogate key untuk ID korban."""
+        kunci = self.__kunci_per_korban.get(id_korban)
+        if kunci is None:
+            kunci = len(self.__id_korban)
+            self.__id_korban.append(sys.intern(id_korban))
+            self.__kunci_per_korban[id_korban] = kunci
+            self.__baris_per_korban[kunci] = array('q')
+            self.__porsi_per_korban.append(0)
+        return kunci
+
+    def __tambah_baris(self, entity: DistribusiMakanan) -> None:
+        """Menambahkan satu distribusi sebagai baris baru di semua kolom."""
+        baris = len(self.__id_distribusi)
+        kunci = self.__kunci_korban_untuk(entity.get_id_korban())
+        porsi = entity.get_jumlah_porsi()
+        waktu = entity.get_waktu_epoch()
+
+        self.__id_distribusi.append(entity.get_id_distribusi())
+        self.__baris_per_id[entity.get_id_distribusi()] = baris
+        self.__porsi.append(porsi)
+        self.__waktu.append(waktu)
+        self.__kunci_korban.append(kunci)
+        self.__hidup.append(1)
+        if entity.get_catatan():
+            self.__catatan[baris] = entity.get_catatan()
+        self.__baris_per_korban[kunci].append(baris)
+        self.__indeks_waktu_sisip(waktu, baris)
+
+        self.__jumlah_hidup += 1
+        self.__total_porsi += porsi
+        self.__porsi_per_korban[kunci] += porsi
+
+    def __indeks_waktu_sisip(self, waktu: float, baris: int) -> None:
+        """Menyisipkan baris ke index waktu (O(1) jika waktu tidak mundur)."""
+        if not self.__urut_waktu or waktu >= self.__urut_waktu[-1]:
+            self.__urut_waktu.append(waktu)
+            self.__urut_baris.append(baris)
+        else:
+            posisi = bisect_right(self.__urut_waktu, waktu)
+            self.__urut_waktu.insert(posisi, waktu)
+            self.__urut_baris.insert(posisi, baris)
+
+    def __indeks_waktu_buang(self, waktu: float, baris: int) -> None:
+        """Mengeluarkan baris dari index waktu."""
+        posisi = bisect_left(self.__urut_waktu, waktu)
+        while self.__urut_baris[posisi] != baris:
+            posisi += 1
+        del self.__urut_waktu[posisi]
+        del self.__urut_baris[posisi]
+
+    def __posisi_waktu(self, mulai: Optional[datetime], akhir: Optional[datetime]) -> tuple:
+        """Posisi awal dan akhir index waktu untuk rentang [mulai, akhir)."""
+        bawah, atas = batas_waktu(mulai, akhir)
+        awal = 0 if bawah is None else bisect_left(self.__urut_waktu, bawah)
+        ujung = len(self.__urut_waktu) if atas is None else bisect_left(self.__urut_waktu, atas)
+        return awal, max(awal, ujung)
+
+    def __materialisasi(self, baris: int) -> DistribusiMakanan:
+        """Membuat object DistribusiMakanan dari satu baris kolom."""
+        return DistribusiMakanan(self.__id_distribusi[baris],
+                                 self.__id_korban[self.__kunci_korban[baris]],
+                                 self.__porsi[baris],
+                                 self.__catatan.get(baris, ""),
+                                 datetime.fromtimestamp(self.__waktu[baris]))
+
+    @sinkron
+    def add(self, entity: DistribusiMakanan) -> None:
+        """
+        Menambah distribusi baru.
+
+        Args:
+            entity (DistribusiMakanan): Distribusi yang akan ditambahkan
+
+        Raises:
+            ValueError: Jika ID sudah ada
+        """
+        if entity.get_id_distribusi() in self.__baris_per_id:
+            raise ValueError(f"Distribusi {entity.get_id_distribusi()} sudah ada")
+        self.__tambah_baris(entity)
+        logger.info("Distribusi %s ditambahkan", entity.get_id_distribusi())
+
+    @sinkron
+    def add_many(self, entities: Iterable[DistribusiMakanan]) -> None:
+        """
+        Menambah banyak distribusi sekaligus (utuh atau tidak sama sekali).
+
+        Args:
+            entities (Iterable[DistribusiMakanan]): Distribusi yang akan ditambahkan
+
+        Raises:
+            ValueError: Jika ada ID yang sudah ada atau duplikat di dalam batch
+        """
+        entities = list(entities)
+        id_batch = set()
+        for entity in entities:
+            id_distribusi = entity.get_id_distribusi()
+            if id_distribusi in self.__baris_per_id or id_distribusi in id_batch:
+                raise ValueError(f"Distribusi {id_distribusi} sudah ada")
+            id_batch.add(id_distribusi)
+        for entity in entities:
+            self.__tambah_baris(entity)
+        logger.info("%s distribusi ditambahkan secara bulk", len(entities))
+
+    @sinkron
+    def get_by_id(self, entity_id: str) -> Optional[DistribusiMakanan]:
+        """
+        Mengambil distribusi berdasarkan ID (dimaterialisasi saat diminta).
+
+        Args:
+            entity_id (str): ID distribusi
+
+        Returns:
+            Optional[DistribusiMakanan]: Distribusi jika ditemukan
+        """
+        baris = self.__baris_per_id.get(entity_id)
+        return self.__materialisasi(baris) if baris is not None else None
+
+    @sinkron
+    def get_all(self) -> List[DistribusiMakanan]:
+        """
+        Mengambil semua distribusi (dimaterialisasi saat diminta).
+
+        Returns:
+            List[DistribusiMakanan]: List semua distribusi
+        """
+        return [self.__materialisasi(b) for b in range(len(self.__hidup)) if self.__hidup[b]]
+
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah distribusi.
+
+        Returns:
+            int: Jumlah distribusi
+        """
+        return self.__jumlah_hidup
+
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman distribusi menurut urutan baris.
+        Kursor adalah nomor baris berikutnya; karena kolom append-only,
+        kursor tetap valid walaupun ada distribusi yang dihapus di antara halaman.
+
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah distribusi per halaman
+
+        Returns:
+            Halaman: List distribusi dan kursor halaman berikutnya (None jika habis)
+        """
+        baris = baca_kursor(kursor, ukuran)
+        isi = []
+        while baris < len(self.__hidup) and len(isi) < ukuran:
+            if self.__hidup[baris]:
+                isi.append(self.__materialisasi(baris))
+            baris += 1
+        # Lewati tombstone agar halaman terakhir tidak kosong
+        while baris < len(self.__hidup) and not self.__hidup[baris]:
+            baris += 1
+        return isi, (str(baris) if baris < len(self.__hidup) else None)
+
+    @sinkron
+    def update(self, entity: DistribusiMakanan) -> bool:
+        """
+        Memperbarui distribusi langsung di kolom.
+
+        Args:
+            entity (DistribusiMakanan): Distribusi yang diperbarui
+
+        Returns:
+            bool: True jika berhasil
+        """
+        baris = self.__baris_per_id.get(entity.get_id_distribusi())
+        if baris is None:
+            return False
+
+        kunci_lama = self.__kunci_korban[baris]
+        kunci_baru = self.__kunci_korban_untuk(entity.get_id_korban())
+        porsi_lama, porsi_baru = self.__porsi[baris], entity.get_jumlah_porsi()
+
+        self.__porsi_per_korban[kunci_lama] -= porsi_lama
+        self.__porsi_per_korban[kunci_baru] += porsi_baru
+        self.__total_porsi += porsi_baru - porsi_lama
+        if kunci_baru != kunci_lama:
+            self.__baris_per_korban[kunci_lama].remove(baris)
+            self.__baris_per_korban[kunci_baru].append(baris)
+
+        waktu_baru = entity.get_waktu_epoch()
+        if waktu_baru != self.__waktu[baris]:
+            self.__indeks_waktu_buang(self.__waktu[baris], baris)
+            self.__indeks_waktu_sisip(waktu_baru, baris)
+
+        self.__porsi[baris] = porsi_baru
+        self.__kunci_korban[baris] = kunci_baru
+        self.__waktu[baris] = waktu_baru
+        if entity.get_catatan():
+            self.__catatan[baris] = entity.get_catatan()
+        else:
+            self.__catatan.pop(baris, None)
+        return True
+
+    @sinkron
+    def delete(self, entity_id: str) -> bool:
+        """
+        Menghapus distribusi (baris ditandai tombstone).
+
+        Args:
+            entity_id (str): ID distribusi
+
+        Returns:
+            bool: True jika berhasil
+        """
+        baris = self.__baris_per_id.pop(entity_id, None)
+        if baris is None:
+            return False
+        kunci = self.__kunci_korban[baris]
+        self.__hidup[baris] = 0
+        self.__catatan.pop(baris, None)
+        self.__baris_per_korban[kunci].remove(baris)
+        self.__indeks_waktu_buang(self.__waktu[baris], baris)
+        self.__jumlah_hidup -= 1
+        self.__total_porsi -= self.__porsi[baris]
+        self.__porsi_per_korban[kunci] -= self.__porsi[baris]
+        logger.info("Distribusi %s dihapus", entity_id)
+        return True
+
+    @sinkron
+    def get_by_korban(self, id_korban: str) -> List[DistribusiMakanan]:
+        """
+        Mengambil riwayat distribusi untuk korban tertentu.
+
+        Args:
+            id_korban (str): ID korban
+
+        Returns:
+            List[DistribusiMakanan]: List distribusi untuk korban
+        """
+        kunci = self.__kunci_per_korban.get(id_korban)
+        if kunci is None:
+            return []
+        return [self.__materialisasi(b) for b in self.__baris_per_korban[kunci]]
+
+    @sinkron
+    def get_by_waktu(self, mulai: Optional[datetime] = None,
+                     akhir: Optional[datetime] = None) -> List[DistribusiMakanan]:
+        """
+        Mengambil distribusi dengan mulai <= waktu < akhir, terurut menurut waktu.
+        Biaya O(log n + k); hanya baris dalam rentang yang dimaterialisasi.
+
+        Args:
+            mulai (datetime): Batas bawah inklusif (None = tanpa batas)
+            akhir (datetime): Batas atas eksklusif (None = tanpa batas)
+
+        Returns:
+            List[DistribusiMakanan]: Distribusi dalam rentang waktu
+        """
+        awal, ujung = self.__posisi_waktu(mulai, akhir)
+        return [self.__materialisasi(b) for b in self.__urut_baris[awal:ujung]]
+
+    @sinkron
+    def count_by_waktu(self, mulai: Optional[datetime] = None,
+                       akhir: Optional[datetime] = None) -> int:
+        """
+        Jumlah distribusi dengan mulai <= waktu < akhir dalam O(log n).
+
+        Args:
+            mulai (datetime): Batas bawah inklusif (None = tanpa batas)
+            akhir (datetime): Batas atas eksklusif (None = tanpa batas)
+
+        Returns:
+            int: Jumlah distribusi dalam rentang waktu
+        """
+        awal, ujung = self.__posisi_waktu(mulai, akhir)
+        return ujung - awal
+
+    @sinkron
+    def get_total_porsi_korban(self, id_korban: str) -> int:
+        """
+        Total porsi yang sudah diterima korban tertentu (O(1)).
+
+        Args:
+            id_korban (str): ID korban
+
+        Returns:
+            int: Total porsi untuk korban
+        """
+        kunci = self.__kunci_per_korban.get(id_korban)
+        return self.__porsi_per_korban[kunci] if kunci is not None else 0
+
+    @sinkron
+    def get_total_porsi_terdistribusi(self) -> int:
+        """
+        Menghitung total porsi yang sudah didistribusikan (O(1)).
+
+        Returns:
+            int: Total porsi
+        """
+        return self.__total_porsi
+
+    @sinkron
+    def hitung_total_porsi(self) -> int:
+        """
+        Menghitung ulang total porsi langsung dari kolom (vektorisasi jika NumPy tersedia).
+        Berguna untuk verifikasi counter berjalan.
+
+        Returns:
+            int: Total porsi dari baris yang masih ada
+        """
+        if np is not None:
+            porsi = np.frombuffer(self.__porsi, dtype=np.int64)
+            hidup = np.frombuffer(self.__hidup, dtype=np.uint8)
+            return int(porsi[hidup.astype(bool)].sum())
+        return sum(p for p, h in zip(self.__porsi, self.__hidup) if h)
+
+    @sinkron
+    def get_porsi_per_korban(self) -> Dict[str, int]:
+        """
+        Total porsi per korban untuk semua korban yang pernah menerima distribusi.
+
+        Returns:
+            Dict[str, int]: id_korban -> total porsi
+        """
+        if np is not None:
+            porsi = np.frombuffer(self.__porsi, dtype=np.int64)
+            kunci = np.frombuffer(self.__kunci_korban, dtype=np.int64)
+            hidup = np.frombuffer(self.__hidup, dtype=np.uint8).astype(bool)
+            total = np.bincount(kunci[hidup], weights=porsi[hidup],
+                                minlength=len(self.__id_korban))
+            return {self.__id_korban[k]: int(t) for k, t in enumerate(total) if t}
+        return {self.__id_korban[k]: t for k, t in enumerate(self.__porsi_per_korban) if t}
+
+    @sinkron
+    def get_porsi_per_hari(self) -> Dict[date, int]:
+        """
+        Total porsi per hari (zona waktu lokal), vektorisasi jika NumPy tersedia.
+
+        Returns:
+            Dict[date, int]: Tanggal -> total porsi, terurut menurut tanggal
+        """
+        if not self.__jumlah_hidup:
+            return {}
+        # Offset UTC lokal saat ini dipakai untuk semua baris (asumsi tanpa DST)
+        offset = datetime.now().astimezone().utcoffset().total_seconds()
+        if np is not None:
+            waktu = np.frombuffer(self.__waktu, dtype=np.float64)
+            porsi = np.frombuffer(self.__porsi, dtype=np.int64)
+            hidup = np.frombuffer(self.__hidup, dtype=np.uint8).astype(bool)
+            hari = np.floor((waktu[hidup] + offset) / _DETIK_PER_HARI).astype(np.int64)
+            unik, posisi = np.unique(hari, return_inverse=True)
+            total = np.bincount(posisi, weights=porsi[hidup])
+            pasangan = zip(unik.tolist(), total.tolist())
+        else:
+            per_hari: Dict[int, int] = {}
+            for w, p, h in zip(self.__waktu, self.__porsi, self.__hidup):
+                if h:
+                    k = int((w + offset) // _DETIK_PER_HARI)
+                    per_hari[k] = per_hari.get(k, 0) + p
+            pasangan = sorted(per_hari.items())
+        epoch = date(1970, 1, 1).toordinal()
+        return {date.fromordinal(epoch + int(h)): int(t) for h, t in pasangan}
@@ -2,25 +2,59 @@
 Module untuk Repository Distribusi Makanan.
 """
 
-from typing import List, Optional, Dict
-from repositories.base_repository import IRepository
+from datetime import datetime
+from typing import Iterable, List, Optional, Dict
+from repositories.base_repository import Halaman, UrutanSisip, batas_waktu, sinkron
+from repositories.indexed_repository import IndexedRepository, HashIndex, OrderedIndex
+from repositories.jurnal import Jurnal
 from models.distribusi import DistribusiMakanan
+from utils.logging_config import mode_senyap
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class DistribusiRepository(IRepository[DistribusiMakanan]):
+class DistribusiRepository(IndexedRepository[DistribusiMakanan]):
     """
     Repository untuk mengelola data Distribusi Makanan.
     Implementasi IRepository (Dependency Inversion Principle).
+    
+    Menyimpan index per korban, index terurut waktu dan counter berjalan (total porsi keseluruhan
+    dan per korban) agar laporan tidak perlu memindai semua distribusi.
+    
+    Jika diberi Jurnal, setiap add/update/delete (termasuk perubahan lewat
+    setter entitas) dicatat ke jurnal append-only, dan state dibangun ulang
+    dari snapshot + ekor jurnal saat repository dibuat.
     """
     
-    def __init__(self):
-        """Constructor - inisialisasi storage dictionary."""
+    # Secondary index per korban
+    idx_korban = HashIndex(DistribusiMakanan.get_id_korban)
+    # Index terurut waktu distribusi (epoch) untuk query rentang waktu
+    idx_waktu = OrderedIndex(DistribusiMakanan.get_waktu_epoch)
+    
+    def __init__(self, jurnal: Optional[Jurnal] = None, snapshot_minimal: int = 10000):
+        """
+        Constructor - inisialisasi storage dictionary, index dan counter.
+        
+        Args:
+            jurnal: Jurnal untuk persistensi (None = hanya di memori)
+            snapshot_minimal: Jumlah record jurnal minimal sebelum snapshot dibuat.
+                Snapshot dibuat saat jurnal melebihi nilai ini dan jumlah distribusi,
+                sehingga biaya snapshot teramortisasi O(1) per perubahan.
+        """
+        super().__init__()
         self.__storage: Dict[str, DistribusiMakanan] = {}
+        self.__urutan = UrutanSisip()
+        self.__total_porsi = 0
+        self.__porsi_per_korban: Dict[str, int] = {}
+        self.__snapshot_minimal = snapshot_minimal
+        self.__jurnal: Optional[Jurnal] = None
+        if jurnal is not None:
+            self.__putar_ulang(jurnal)
+            self.__jurnal = jurnal
         logger.info("DistribusiRepository diinisialisasi")
     
+    @sinkron
     def add(self, entity: DistribusiMakanan) -> None:
         """
         Menambah distribusi baru. 
@@ -34,8 +68,41 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
         if entity. get_id_distribusi() in self.__storage:
             raise ValueError(f"Distribusi {entity.get_id_distribusi()} sudah ada")
         self.__storage[entity.get_id_distribusi()] = entity
-        logger.info(f"Distribusi {entity.get_id_distribusi()} ditambahkan")
+        self.__urutan.tambah(entity.get_id_distribusi())
+        self._indeks_tambah(entity)
+        self.__catat_porsi(entity, 1)
+        self.__catat_jurnal("add", self.__ke_record(entity))
+        logger.info("Distribusi %s ditambahkan", entity.get_id_distribusi())
     
+    @sinkron
+    def add_many(self, entities: Iterable[DistribusiMakanan]) -> None:
+        """
+        Menambah banyak distribusi sekaligus.
+        Semua ID dicek lebih dulu sehingga batch disimpan utuh atau tidak sama sekali.
+        
+        Args:
+            entities (Iterable[DistribusiMakanan]): Distribusi yang akan ditambahkan
+            
+        Raises:
+            ValueError: Jika ada ID yang sudah ada atau duplikat di dalam batch
+        """
+        entities = list(entities)
+        id_batch = set()
+        for entity in entities:
+            id_distribusi = entity.get_id_distribusi()
+            if id_distribusi in self.__storage or id_distribusi in id_batch:
+                raise ValueError(f"Distribusi {id_distribusi} sudah ada")
+            id_batch.add(id_distribusi)
+        for entity in entities:
+            self.__storage[entity.get_id_distribusi()] = entity
+            self.__urutan.tambah(entity.get_id_distribusi())
+            self._indeks_tambah(entity)
+            self.__catat_porsi(entity, 1)
+            self.__catat_jurnal("add", self.__ke_record(entity), snapshot=False)
+        self.__mungkin_snapshot()
+        logger.info("%s distribusi ditambahkan secara bulk", len(entities))
+    
+    @sinkron
     def get_by_id(self, entity_id: str) -> Optional[DistribusiMakanan]:
         """
         Mengambil distribusi berdasarkan ID.
@@ -48,6 +115,7 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
         """
         return self.__storage.get(entity_id)
     
+    @sinkron
     def get_all(self) -> List[DistribusiMakanan]:
         """
         Mengambil semua distribusi.
@@ -57,6 +125,24 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
         """
         return list(self.__storage.values())
     
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman distribusi menurut urutan distribusi dicatat.
+        Kursor adalah nomor urut sisip (keyset, lihat UrutanSisip); hanya
+        entitas di halaman ini yang disalin.
+        
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah distribusi per halaman
+            
+        Returns:
+            Halaman: List distribusi dan kursor halaman berikutnya (None jika habis)
+        """
+        ids, kursor_berikut = self.__urutan.halaman(kursor, ukuran)
+        return [self.__storage[i] for i in ids], kursor_berikut
+    
+    @sinkron
     def update(self, entity: DistribusiMakanan) -> bool:
         """
         Memperbarui distribusi.
@@ -67,11 +153,19 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
         Returns:
             bool: True jika berhasil
         """
-        if entity.get_id_distribusi() not in self.__storage:
+        lama = self.__storage.get(entity.get_id_distribusi())
+        if lama is None:
             return False
+        self.__catat_porsi(lama, -1)
+        self._indeks_ganti(lama, entity)
         self.__storage[entity.get_id_distribusi()] = entity
+        self.__catat_porsi(entity, 1)
+        if lama is not entity:
+            # Object yang sama sudah dicatat lewat _pada_perubahan_entitas
+            self.__catat_jurnal("update", self.__ke_record(entity))
         return True
     
+    @sinkron
     def delete(self, entity_id: str) -> bool:
         """
         Menghapus distribusi. 
@@ -83,11 +177,16 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
             bool: True jika berhasil
         """
         if entity_id in self.__storage:
-            del self.__storage[entity_id]
-            logger.info(f"Distribusi {entity_id} dihapus")
+            lama = self.__storage.pop(entity_id)
+            self.__urutan.hapus(entity_id)
+            self._indeks_hapus(lama)
+            self.__catat_porsi(lama, -1)
+            self.__catat_jurnal("delete", entity_id)
+            logger.info("Distribusi %s dihapus", entity_id)
             return True
         return False
     
+    @sinkron
     def get_by_korban(self, id_korban: str) -> List[DistribusiMakanan]:
         """
         Mengambil riwayat distribusi untuk korban tertentu.
@@ -98,9 +197,53 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
         Returns:
             List[DistribusiMakanan]: List distribusi untuk korban
         """
-        return [d for d in self.__storage.values() 
-                if d.get_id_korban() == id_korban]
+        return [self.__storage[i] for i in self.idx_korban.cari(id_korban)]
     
+    @sinkron
+    def get_by_waktu(self, mulai: Optional[datetime] = None,
+                     akhir: Optional[datetime] = None) -> List[DistribusiMakanan]:
+        """
+        Mengambil distribusi dengan mulai <= waktu < akhir, terurut menurut waktu.
+        Memakai bisect pada index idx_waktu: O(log n + k).
+        
+        Args:
+            mulai (datetime): Batas bawah inklusif (None = tanpa batas)
+            akhir (datetime): Batas atas eksklusif (None = tanpa batas)
+            
+        Returns:
+            List[DistribusiMakanan]: Distribusi dalam rentang waktu
+        """
+        return [self.__storage[i] for i in self.idx_waktu.rentang(*batas_waktu(mulai, akhir))]
+    
+    @sinkron
+    def count_by_waktu(self, mulai: Optional[datetime] = None,
+                       akhir: Optional[datetime] = None) -> int:
+        """
+        Jumlah distribusi dengan mulai <= waktu < akhir dalam O(log n).
+        
+        Args:
+            mulai (datetime): Batas bawah inklusif (None = tanpa batas)
+            akhir (datetime): Batas atas eksklusif (None = tanpa batas)
+            
+        Returns:
+            int: Jumlah distribusi dalam rentang waktu
+        """
+        return self.idx_waktu.hitung_rentang(*batas_waktu(mulai, akhir))
+    
+    @sinkron
+    def get_total_porsi_korban(self, id_korban: str) -> int:
+        """
+        Total porsi yang sudah diterima korban tertentu (O(1), dari counter).
+        
+        Args:
+            id_korban (str): ID korban
+            
+        Returns:
+            int: Total porsi untuk korban
+        """
+        return self.__porsi_per_korban.get(id_korban, 0)
+    
+    @sinkron
     def get_total_porsi_terdistribusi(self) -> int:
         """
         Menghitung total porsi yang sudah didistribusikan.
@@ -108,4 +251,83 @@ class DistribusiRepository(IRepository[DistribusiMakanan]):
         Returns:
             int: Total porsi
         """
-        return sum(d.get_jumlah_porsi() for d in self.__storage.values())
\ No newline at end of file
+        return self.__total_porsi
+    
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah distribusi.
+        
+        Returns:
+            int: Jumlah distribusi
+        """
+        return len(self.__storage)
+    
+    @sinkron
+    def tutup(self) -> None:
+        """Menulis sisa jurnal ke disk dan menutupnya (jika memakai jurnal)."""
+        if self.__jurnal is not None:
+            self.__jurnal.tutup()
+    
+    def _id_entitas(self, entity: DistribusiMakanan) -> str:
+        """ID distribusi sebagai kunci storage."""
+        return entity.get_id_distribusi()
+    
+    @sinkron
+    def _pada_perubahan_entitas(self, entity: DistribusiMakanan) -> None:
+        """Perubahan lewat setter (misal set_catatan) juga dicatat ke jurnal."""
+        super()._pada_perubahan_entitas(entity)
+        self.__catat_jurnal("update", self.__ke_record(entity))
+    
+    @staticmethod
+    def __ke_record(entity: DistribusiMakanan) -> list:
+        """Serialisasi distribusi untuk jurnal/snapshot."""
+        return [entity.get_id_distribusi(), entity.get_id_korban(), entity.get_jumlah_porsi(),
+                entity.get_waktu_distribusi().timestamp(), entity.get_catatan()]
+    
+    @staticmethod
+    def __dari_record(record: list) -> DistribusiMakanan:
+        """Membuat distribusi dari record jurnal/snapshot."""
+        id_distribusi, id_korban, porsi, waktu, catatan = record
+        return DistribusiMakanan(id_distribusi, id_korban, porsi, catatan,
+                                 datetime.fromtimestamp(waktu))
+    
+    def __putar_ulang(self, jurnal: Jurnal) -> None:
+        """Membangun ulang state dari snapshot terakhir dan ekor jurnal."""
+        with mode_senyap():
+            for operasi, data in jurnal.muat():
+                if operasi == "add":
+                    self.add(self.__dari_record(data))
+                elif operasi == "update":
+                    self.update(self.__dari_record(data))
+                elif operasi == "delete":
+                    self.delete(data)
+        logger.info("%s distribusi dipulihkan dari jurnal", len(self.__storage))
+    
+    def __catat_jurnal(self, operasi: str, data, snapshot: bool = True) -> None:
+        """Mencatat perubahan ke jurnal (jika ada) lalu snapshot bila perlu."""
+        if self.__jurnal is None:
+            return
+        self.__jurnal.catat(operasi, data)
+        if snapshot:
+            self.__mungkin_snapshot()
+    
+    def __mungkin_snapshot(self) -> None:
+        """Membuat snapshot jika jurnal sudah lebih panjang dari state."""
+        if self.__jurnal is None:
+            return
+        if self.__jurnal.entri_sejak_snapshot() >= max(self.__snapshot_minimal, len(self.__storage)):
+            self.__jurnal.simpan_snapshot(self.__ke_record(e) for e in self.__storage.values())
+    
+    def __catat_porsi(self, entity: DistribusiMakanan, arah: int) -> None:
+        """
+        Memperbarui counter berjalan saat distribusi masuk (arah=1) atau keluar (arah=-1).
+        """
+        porsi = entity.get_jumlah_porsi() * arah
+        id_korban = entity.get_id_korban()
+        self.__total_porsi += porsi
+        sisa = self.__porsi_per_korban.get(id_korban, 0) + porsi
+        if sisa:
+            self.__porsi_per_korban[id_korban] = sisa
+        else:
+            self.__porsi_per_korban.pop(id_korban, None)
\ No newline at end of file
@@ -0,0 +1,323 @@
+"""
+Module untuk Secondary Index pada Repository.
+Index dideklarasikan sebagai atribut class pada subclass IndexedRepository,
+lalu dijaga tetap konsisten saat add/update/delete maupun saat setter entitas dipanggil.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from repositories.base_repository import IRepository, sinkron
+import threading
+
+T = TypeVar('T')
+
+
+class _DataIndeks(ABC):
+    """
+    State sebuah index untuk satu instance repository.
+
+    Menyimpan kunci terakhir setiap entitas agar posisi lama bisa dihapus
+    saat entitas berubah tanpa harus memindai seluruh index.
+    """
+
+    def __init__(self, key_fn: Callable[[Any], Any]):
+        self._key_fn = key_fn
+        self._kunci: Dict[str, Any] = {}
+
+    def tambah(self, entity_id: str, entity: Any) -> None:
+        """Memasukkan entitas ke index."""
+        kunci = self._key_fn(entity)
+        self._kunci[entity_id] = kunci
+        self._sisipkan(kunci, entity_id)
+
+    def hapus(self, entity_id: str) -> None:
+        """Mengeluarkan entitas dari index."""
+        if entity_id in self._kunci:
+            self._buang(self._kunci.pop(entity_id), entity_id)
+
+    def perbarui(self, entity_id: str, entity: Any) -> None:
+        """Memindahkan entitas ke posisi baru jika kuncinya berubah."""
+        kunci_baru = self._key_fn(entity)
+        kunci_lama = self._kunci.get(entity_id)
+        if entity_id in self._kunci and kunci_lama == kunci_baru:
+            return
+        self.hapus(entity_id)
+        self._kunci[entity_id] = kunci_baru
+        self._sisipkan(kunci_baru, entity_id)
+
+    @abstractmethod
+    def _sisipkan(self, kunci: Any, entity_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def _buang(self, kunci: Any, entity_id: str) -> None:
+        pass
+
+
+class _DataHashIndex(_DataIndeks):
+    """State HashIndex: kunci -> kumpulan ID (dict dipakai sebagai ordered set)."""
+
+    def __init__(self, key_fn: Callable[[Any], Any]):
+        super().__init__(key_fn)
+        self.__bucket: Dict[Any, Dict[str, None]] = {}
+
+    def _sisipkan(self, kunci: Any, entity_id: str) -> None:
+        self.__bucket.setdefault(kunci, {})[entity_id] = None
+
+    def _buang(self, kunci: Any, entity_id: str) -> None:
+        bucket = self.__bucket.get(kunci)
+        if bucket is not None:
+            bucket.pop(entity_id, None)
+            if not bucket:
+                del self.__bucket[kunci]
+
+    def cari(self, kunci: Any) -> List[str]:
+        """
+        Mengambil ID entitas dengan kunci tertentu dalam O(k).
+
+        Args:
+            kunci: Nilai kunci yang dicari
+
+        Returns:
+            List[str]: ID entitas yang cocok
+        """
+        return list(self.__bucket.get(kunci, ()))
+
+    def hitung(self, kunci: Any) -> int:
+        """Jumlah entitas dengan kunci tertentu dalam O(1)."""
+        return len(self.__bucket.get(kunci, ()))
+
+
+class _DataOrderedIndex(_DataIndeks):
+    """State OrderedIndex: list terurut (kunci, id) dengan pencarian bisect."""
+
+    def __init__(self, key_fn: Callable[[Any], Any]):
+        super().__init__(key_fn)
+        self.__urut: List[Tuple[Any, str]] = []
+
+    def _sisipkan(self, kunci: Any, entity_id: str) -> None:
+        insort(self.__urut, (kunci, entity_id))
+
+    def _buang(self, kunci: Any, entity_id: str) -> None:
+        posisi = bisect_left(self.__urut, (kunci, entity_id))
+        if posisi < len(self.__urut) and self.__urut[posisi] == (kunci, entity_id):
+            del self.__urut[posisi]
+
+    def _posisi(self, bawah: Any = None, atas: Any = None) -> Tuple[int, int]:
+        """Posisi awal dan akhir untuk rentang setengah terbuka [bawah, atas)."""
+        awal = 0 if bawah is None else bisect_left(self.__urut, (bawah,))
+        akhir = len(self.__urut) if atas is None else bisect_left(self.__urut, (atas,))
+        return awal, max(awal, akhir)
+
+    def rentang(self, bawah: Any = None, atas: Any = None) -> List[str]:
+        """
+        Mengambil ID entitas dengan bawah <= kunci < atas, terurut menurut kunci.
+        Biaya O(log n + k).
+
+        Args:
+            bawah: Batas bawah inklusif (None = tanpa batas)
+            atas: Batas atas eksklusif (None = tanpa batas)
+
+        Returns:
+            List[str]: ID entitas yang cocok
+        """
+        awal, akhir = self._posisi(bawah, atas)
+        return [entity_id for _, entity_id in self.__urut[awal:akhir]]
+
+    def hitung_rentang(self, bawah: Any = None, atas: Any = None) -> int:
+        """Jumlah entitas dengan bawah <= kunci < atas dalam O(log n)."""
+        awal, akhir = self._posisi(bawah, atas)
+        return akhir - awal
+
+
+class _DataMinIndex(_DataIndeks):
+    """
+    State MinIndex: binary min-heap dengan peta posisi (indexed heap).
+    Nilai minimum dibaca dalam O(1); sisip, hapus dan perubahan kunci O(log n).
+    """
+
+    def __init__(self, key_fn: Callable[[Any], Any]):
+        super().__init__(key_fn)
+        self.__heap: List[Tuple[Any, str]] = []
+        self.__posisi: Dict[str, int] = {}
+
+    def _sisipkan(self, kunci: Any, entity_id: str) -> None:
+        self.__heap.append((kunci, entity_id))
+        self.__posisi[entity_id] = len(self.__heap) - 1
+        self.__naik(len(self.__heap) - 1)
+
+    def _buang(self, kunci: Any, entity_id: str) -> None:
+        i = self.__posisi.pop(entity_id, None)
+        if i is None:
+            return
+        terakhir = self.__heap.pop()
+        if i < len(self.__heap):
+            self.__heap[i] = terakhir
+            self.__posisi[terakhir[1]] = i
+            self.__naik(i)
+            self.__turun(self.__posisi[terakhir[1]])
+
+    def __tukar(self, i: int, j: int) -> None:
+        heap = self.__heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.__posisi[heap[i][1]] = i
+        self.__posisi[heap[j][1]] = j
+
+    def __naik(self, i: int) -> None:
+        while i > 0:
+            induk = (i - 1) // 2
+            if self.__heap[i] >= self.__heap[induk]:
+                break
+            self.__tukar(i, induk)
+            i = induk
+
+    def __turun(self, i: int) -> None:
+        n = len(self.__heap)
+        while True:
+            kecil = i
+            for anak in (2 * i + 1, 2 * i + 2):
+                if anak < n and self.__heap[anak] < self.__heap[kecil]:
+                    kecil = anak
+            if kecil == i:
+                break
+            self.__tukar(i, kecil)
+            i = kecil
+
+    def minimum(self) -> Any:
+        """
+        Kunci terkecil di index dalam O(1).
+
+        Returns:
+            Kunci minimum, atau None jika index kosong
+        """
+        return self.__heap[0][0] if self.__heap else None
+
+    def minimum_id(self) -> Optional[str]:
+        """ID entitas dengan kunci terkecil (None jika index kosong)."""
+        return self.__heap[0][1] if self.__heap else None
+
+
+class _Index(ABC):
+    """
+    Deklarasi index pada class repository (descriptor).
+
+    Diakses lewat instance repository, deklarasi ini mengembalikan state
+    index milik instance tersebut.
+    """
+
+    def __init__(self, key_fn: Callable[[Any], Any]):
+        """
+        Args:
+            key_fn: Fungsi yang mengambil kunci index dari entitas
+                    (misal Korban.get_kebutuhan_khusus)
+        """
+        self.key_fn = key_fn
+        self.nama: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.nama = name
+
+    def __get__(self, instance: Optional['IndexedRepository'], owner: type = None):
+        if instance is None:
+            return self
+        return instance._data_indeks(self.nama)
+
+    @abstractmethod
+    def buat_data(self) -> _DataIndeks:
+        """Membuat state index kosong untuk satu instance repository."""
+        pass
+
+
+class HashIndex(_Index):
+    """Index hash untuk pencarian kesamaan (kunci == nilai)."""
+
+    def buat_data(self) -> _DataHashIndex:
+        return _DataHashIndex(self.key_fn)
+
+
+class OrderedIndex(_Index):
+    """Index terurut untuk pencarian rentang pada atribut numerik."""
+
+    def buat_data(self) -> _DataOrderedIndex:
+        return _DataOrderedIndex(self.key_fn)
+
+
+class MinIndex(_Index):
+    """Index agregat minimum (bottleneck) yang diperbarui secara inkremental."""
+
+    def buat_data(self) -> _DataMinIndex:
+        return _DataMinIndex(self.key_fn)
+
+
+class IndexedRepository(IRepository[T]):
+    """
+    Base class untuk repository yang memiliki secondary index.
+
+    Subclass cukup mendeklarasikan index (HashIndex, OrderedIndex, MinIndex)
+    sebagai atribut class, misalnya::
+
+        class KorbanRepository(IndexedRepository[Korban]):
+            idx_kebutuhan = HashIndex(Korban.get_kebutuhan_khusus)
+
+    lalu memanggil _indeks_tambah/_indeks_ganti/_indeks_hapus dari add/update/delete.
+    Perubahan lewat setter entitas diikuti otomatis melalui Observer.
+
+    Setiap instance punya lock sendiri (self._lock); subclass menandai method
+    publiknya dengan @sinkron agar storage dan index aman diakses banyak thread.
+    """
+
+    def __init__(self):
+        """Constructor - membuat lock dan state untuk setiap index yang dideklarasikan."""
+        self._lock = threading.RLock()
+        self.__data: Dict[str, _DataIndeks] = {
+            nama: deklarasi.buat_data()
+            for nama, deklarasi in self._deklarasi_indeks()
+        }
+
+    @classmethod
+    def _deklarasi_indeks(cls) -> Iterator[Tuple[str, _Index]]:
+        """Mengumpulkan semua deklarasi index dari class dan parent-nya."""
+        sudah = set()
+        for klass in cls.__mro__:
+            for nama, nilai in vars(klass).items():
+                if isinstance(nilai, _Index) and nama not in sudah:
+                    sudah.add(nama)
+                    yield nama, nilai
+
+    def _data_indeks(self, nama: str) -> _DataIndeks:
+        return self.__data[nama]
+
+    @abstractmethod
+    def _id_entitas(self, entity: T) -> str:
+        """Mengambil ID entitas yang dipakai sebagai kunci storage."""
+        pass
+
+    def _indeks_tambah(self, entity: T) -> None:
+        """Mendaftarkan entitas baru ke semua index dan mulai mengamatinya."""
+        entity_id = self._id_entitas(entity)
+        for data in self.__data.values():
+            data.tambah(entity_id, entity)
+        entity.tambah_pengamat(self._pada_perubahan_entitas)
+
+    def _indeks_hapus(self, entity: T) -> None:
+        """Mengeluarkan entitas dari semua index dan berhenti mengamatinya."""
+        entity.hapus_pengamat(self._pada_perubahan_entitas)
+        entity_id = self._id_entitas(entity)
+        for data in self.__data.values():
+            data.hapus(entity_id)
+
+    def _indeks_ganti(self, lama: T, baru: T) -> None:
+        """Mengganti object entitas lama dengan object baru (ID sama)."""
+        if lama is baru:
+            self._pada_perubahan_entitas(baru)
+            return
+        self._indeks_hapus(lama)
+        self._indeks_tambah(baru)
+
+    @sinkron
+    def _pada_perubahan_entitas(self, entity: T) -> None:
+        """Callback Observer: menyesuaikan index setelah setter entitas dipanggil."""
+        entity_id = self._id_entitas(entity)
+        for data in self.__data.values():
+            data.perbarui(entity_id, entity)
@@ -0,0 +1,193 @@
+"""
+Module untuk inventori bahan multi-lokasi (gudang pusat dan posko).
+Setiap lokasi adalah satu shard BahanRepository dengan agregat porsinya
+sendiri; ringkasan lintas lokasi digabung dari agregat per shard tanpa
+memindai setiap lot bahan.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+from repositories.base_repository import sinkron
+from repositories.bahan_repository import BahanRepository
+from models.bahan_makanan import BahanMakanan
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Satu baris perintah transfer: (lokasi_asal, lokasi_tujuan, nama_bahan, jumlah)
+PerintahTransfer = Tuple[str, str, str, float]
+
+
+class InventoriMultiLokasi:
+    """
+    Inventori bahan yang dikunci oleh lokasi.
+
+    Bahan bernama sama boleh ada di beberapa lokasi sebagai lot terpisah.
+    Repository tiap lokasi (get_repo) bisa langsung diinjeksikan ke
+    DapurService posko tersebut. Porsi siap masak per lokasi dibaca dari
+    agregat MinIndex shard-nya (O(1)), sehingga total lintas lokasi hanya
+    sebanding dengan jumlah lokasi. Method publik memakai lock inventori
+    (@sinkron) agar transfer terlihat atomik bagi pembaca ringkasan.
+    """
+
+    def __init__(self, lokasi: Iterable[str] = ()):
+        """
+        Args:
+            lokasi: Nama lokasi awal (misal 'Gudang Pusat', 'Posko A')
+        """
+        self._lock = threading.RLock()
+        self.__shard: Dict[str, BahanRepository] = {}
+        for nama in lokasi:
+            self.tambah_lokasi(nama)
+
+    @sinkron
+    def tambah_lokasi(self, lokasi: str) -> BahanRepository:
+        """
+        Menambah lokasi baru (idempoten).
+
+        Args:
+            lokasi: Nama lokasi
+
+        Returns:
+            BahanRepository: Repository bahan lokasi tersebut
+
+        Raises:
+            ValueError: Jika nama lokasi kosong
+        """
+        if not lokasi:
+            raise ValueError("Nama lokasi tidak boleh kosong")
+        if lokasi not in self.__shard:
+            self.__shard[lokasi] = BahanRepository()
+            logger.info("Lokasi %s ditambahkan ke inventori", lokasi)
+        return self.__shard[lokasi]
+
+    @sinkron
+    def get_lokasi(self) -> List[str]:
+        """Daftar nama lokasi sesuai urutan penambahan."""
+        return list(self.__shard)
+
+    @sinkron
+    def get_repo(self, lokasi: str) -> BahanRepository:
+        """
+        Repository bahan satu lokasi.
+
+        Raises:
+            ValueError: Jika lokasi tidak dikenal
+        """
+        repo = self.__shard.get(lokasi)
+        if repo is None:
+            raise ValueError(f"Lokasi {lokasi} tidak dikenal")
+        return repo
+
+    def add(self, lokasi: str, bahan: BahanMakanan) -> None:
+        """
+        Menyimpan bahan di lokasi (stok digabung jika nama sudah ada di sana).
+
+        Args:
+            lokasi: Nama lokasi
+            bahan: Bahan yang disimpan
+
+        Raises:
+            ValueError: Jika lokasi tidak dikenal
+        """
+        self.get_repo(lokasi).add(bahan)
+
+    @sinkron
+    def get_stok(self, nama_bahan: str) -> Dict[str, float]:
+        """
+        Stok satu bahan di setiap lokasi yang menyimpannya.
+
+        Args:
+            nama_bahan: Nama bahan
+
+        Returns:
+            Dict[str, float]: Lokasi -> jumlah stok
+        """
+        stok = {}
+        for lokasi, repo in self.__shard.items():
+            bahan = repo.get_by_id(nama_bahan)
+            if bahan is not None:
+                stok[lokasi] = bahan.get_jumlah()
+        return stok
+
+    @sinkron
+    def get_porsi_per_lokasi(self) -> Dict[str, int]:
+        """
+        Porsi siap masak di setiap lokasi dari agregat bottleneck shard-nya.
+
+        Returns:
+            Dict[str, int]: Lokasi -> porsi (0 jika lokasi kosong)
+        """
+        return {lokasi: repo.get_porsi_minimum() or 0 for lokasi, repo in self.__shard.items()}
+
+    def hitung_total_porsi_tersedia(self) -> int:
+        """
+        Total porsi lintas lokasi: jumlah porsi siap masak setiap lokasi.
+        Bahan di lokasi berbeda tidak saling melengkapi tanpa transfer,
+        jadi yang digabung adalah ringkasan per shard, bukan stok per lot.
+
+        Returns:
+            int: Total porsi tersedia
+        """
+        return sum(self.get_porsi_per_lokasi().values())
+
+    @sinkron
+    def get_ringkasan(self) -> Dict[str, Dict[str, int]]:
+        """
+        Ringkasan per lokasi (jumlah jenis bahan dan porsi) dari agregat shard.
+
+        Returns:
+            Dict: Lokasi -> {'total_jenis_bahan', 'total_porsi_tersedia'}
+        """
+        return {lokasi: {'total_jenis_bahan': repo.count(),
+                         'total_porsi_tersedia': repo.get_porsi_minimum() or 0}
+                for lokasi, repo in self.__shard.items()}
+
+    @sinkron
+    def transfer(self, perintah: Iterable[PerintahTransfer]) -> int:
+        """
+        Memindahkan stok antar lokasi dalam satu batch secara atomik.
+
+        Semua perintah divalidasi dulu, lalu stok semua lot asal dikurangi
+        sekaligus lewat BahanMakanan.kurangi_stok_bersama (all-or-nothing),
+        baru stok lokasi tujuan ditambah. Jika satu perintah tidak valid atau
+        satu lot asal kurang, tidak ada stok yang berpindah. Lot baru di lokasi
+        tujuan memakai class dan takaran per porsi yang sama dengan lot asal.
+
+        Args:
+            perintah: Baris (lokasi_asal, lokasi_tujuan, nama_bahan, jumlah)
+
+        Returns:
+            int: Jumlah perintah yang dijalankan
+
+        Raises:
+            ValueError: Jika ada perintah tidak valid atau stok asal tidak cukup
+        """
+        rencana: List[Tuple[BahanMakanan, str, float]] = []
+        for asal, tujuan, nama_bahan, jumlah in perintah:
+            if jumlah <= 0:
+                raise ValueError(f"Jumlah transfer {nama_bahan} harus positif")
+            if asal == tujuan:
+                raise ValueError(f"Lokasi asal dan tujuan {nama_bahan} sama: {asal}")
+            self.get_repo(tujuan)
+            bahan = self.get_repo(asal).get_by_id(nama_bahan)
+            if bahan is None:
+                raise ValueError(f"Bahan {nama_bahan} tidak ada di {asal}")
+            rencana.append((bahan, tujuan, jumlah))
+        if not rencana:
+            return 0
+
+        if not BahanMakanan.kurangi_stok_bersama([(bahan, jumlah) for bahan, _, jumlah in rencana]):
+            raise ValueError("Stok lokasi asal tidak cukup untuk transfer")
+
+        for bahan, tujuan, jumlah in rencana:
+            repo_tujuan = self.__shard[tujuan]
+            lot = repo_tujuan.get_by_id(bahan.get_nama())
+            if lot is None:
+                repo_tujuan.add(type(bahan)(bahan.get_nama(), jumlah, bahan.get_satuan(),
+                                            bahan.get_faktor_porsi()))
+            else:
+                lot.tambah_stok(jumlah)
+        logger.info("Transfer %s perintah antar lokasi selesai", len(rencana))
+        return len(rencana)
+
@@ -0,0 +1,261 @@
+"""
+Module untuk Jurnal append-only dengan snapshot.
+Dipakai repository in-memory agar perubahan data tidak hilang saat aplikasi ditutup.
+
+Layout di direktori jurnal:
+    <nama>.snapshot  - state lengkap terakhir (ditulis atomik lewat file sementara)
+    <nama>.jurnal    - perubahan setelah snapshot, satu record JSON per baris
+
+Setiap record jurnal berbentuk [seq, operasi, data]. Saat start, snapshot dimuat
+lalu hanya record dengan seq > seq snapshot yang diputar ulang. Baris terakhir
+yang terpotong (crash saat menulis) diabaikan dan dibuang dari file.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+VERSI_SNAPSHOT = 1
+
+
+class Jurnal:
+    """
+    Jurnal append-only dengan group commit.
+
+    catat() hanya menambahkan record ke buffer memori; thread latar menulis
+    dan fsync buffer setiap interval_fsync detik (atau lebih cepat saat buffer
+    penuh), sehingga banyak record berbagi satu fsync. Record yang belum
+    di-fsync bisa hilang jika proses crash - panggil sinkronkan() jika perlu
+    jaminan langsung, dan tutup() saat aplikasi selesai.
+    """
+
+    def __init__(self, direktori: str, nama: str = "distribusi",
+                 interval_fsync: float = 0.05, batas_buffer: int = 1000):
+        """
+        Constructor Jurnal.
+
+        Args:
+            direktori: Direktori penyimpanan jurnal dan snapshot
+            nama: Prefix nama file
+            interval_fsync: Jeda maksimal (detik) sebelum record di-fsync
+            batas_buffer: Jumlah record di buffer yang memicu flush lebih awal
+        """
+        os.makedirs(direktori, exist_ok=True)
+        self.__direktori = direktori
+        self.__path_jurnal = os.path.join(direktori, f"{nama}.jurnal")
+        self.__path_snapshot = os.path.join(direktori, f"{nama}.snapshot")
+        self.__interval = interval_fsync
+        self.__batas_buffer = batas_buffer
+
+        self.__lock = threading.Lock()              # buffer dan seq
+        self.__lock_io = threading.Lock()           # file jurnal
+        self.__ada_data = threading.Condition(self.__lock)
+        self.__buffer: List[str] = []
+        self.__seq = 0
+        self.__seq_snapshot = 0
+        self.__entri_sejak_snapshot = 0
+        self.__file = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__berhenti = False
+        self.__dimuat = False
+
+    # ------------------------------------------------------------------ baca
+
+    def muat(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Membaca state tersimpan: semua record snapshot sebagai ('add', data),
+        lalu ekor jurnal sebagai (operasi, data) sesuai urutan aslinya.
+
+        Returns:
+            Iterator[Tuple[str, Any]]: Pasangan (operasi, data)
+
+        Raises:
+            ValueError: Jika file snapshot rusak atau versinya tidak dikenal
+        """
+        if os.path.exists(self.__path_snapshot):
+            yield from self.__baca_snapshot()
+
+        jumlah_ekor = 0
+        for seq, operasi, data in self.__baca_jurnal():
+            self.__seq = max(self.__seq, seq)
+            if seq > self.__seq_snapshot:
+                jumlah_ekor += 1
+                yield operasi, data
+        self.__entri_sejak_snapshot = jumlah_ekor
+        self.__dimuat = True
+        logger.info("Jurnal %s dimuat: snapshot seq %s, %s record ekor diputar ulang",
+                    self.__path_jurnal, self.__seq_snapshot, jumlah_ekor)
+
+    def __baca_snapshot(self) -> Iterator[Tuple[str, Any]]:
+        """Membaca file snapshot dan memvalidasi header/footer."""
+        with open(self.__path_snapshot, "rb") as f:
+            header = json.loads(f.readline() or b"{}")
+            if header.get("versi") != VERSI_SNAPSHOT:
+                raise ValueError(f"Versi snapshot tidak dikenal: {header.get('versi')}")
+            self.__seq_snapshot = self.__seq = header["seq"]
+            jumlah = 0
+            for baris in f:
+                record = json.loads(baris)
+                if isinstance(record, dict):
+                    if record.get("jumlah") != jumlah:
+                        raise ValueError("Snapshot rusak: jumlah record tidak cocok")
+                    return
+                jumlah += 1
+                yield "add", record
+        raise ValueError("Snapshot rusak: footer tidak ditemukan")
+
+    def __baca_jurnal(self) -> Iterator[Tuple[int, str, Any]]:
+        """Membaca record jurnal yang utuh dan membuang ekor yang terpotong."""
+        if not os.path.exists(self.__path_jurnal):
+            return
+        offset_valid = 0
+        with open(self.__path_jurnal, "rb") as f:
+            for baris in f:
+                if not baris.endswith(b"\n"):
+                    break
+                try:
+                    seq, operasi, data = json.loads(baris)
+                except ValueError:
+                    break
+                offset_valid += len(baris)
+                yield seq, operasi, data
+            ukuran = f.seek(0, os.SEEK_END)
+        if ukuran > offset_valid:
+            logger.warning("Ekor jurnal %s terpotong, %s byte dibuang",
+                           self.__path_jurnal, ukuran - offset_valid)
+            os.truncate(self.__path_jurnal, offset_valid)
+
+    # ----------------------------------------------------------------- tulis
+
+    def catat(self, operasi: str, data: Any) -> None:
+        """
+        Menambahkan satu record ke jurnal (group commit, tidak menunggu fsync).
+
+        Args:
+            operasi: Nama operasi, misal 'add', 'update', 'delete'
+            data: Data record yang bisa diserialisasi JSON
+        """
+        with self.__lock:
+            if self.__file is None:
+                self.__buka()
+            self.__seq += 1
+            self.__buffer.append(json.dumps([self.__seq, operasi, data],
+                                            separators=(",", ":")) + "\n")
+            self.__entri_sejak_snapshot += 1
+            if len(self.__buffer) >= self.__batas_buffer:
+                self.__ada_data.notify()
+
+    def __buka(self) -> None:
+        """Membuka file jurnal untuk append dan menjalankan thread flush."""
+        if not self.__dimuat and (os.path.exists(self.__path_snapshot)
+                                  or os.path.exists(self.__path_jurnal)):
+            # Tanpa muat(), seq akan mulai dari 0 dan record baru hilang saat replay
+            raise RuntimeError("Jurnal yang sudah ada harus dimuat (muat()) sebelum dicatat")
+        self.__file = open(self.__path_jurnal, "ab")
+        self.__berhenti = False
+        self.__thread = threading.Thread(target=self.__loop_flush,
+                                         name="jurnal-flush", daemon=True)
+        self.__thread.start()
+
+    def __loop_flush(self) -> None:
+        """Thread latar: flush + fsync buffer secara berkala."""
+        while True:
+            with self.__lock:
+                if not self.__berhenti:
+                    self.__ada_data.wait(self.__interval)
+                berhenti = self.__berhenti
+            self.sinkronkan()
+            if berhenti:
+                return
+
+    def sinkronkan(self) -> None:
+        """Menulis semua record di buffer ke disk dan melakukan fsync."""
+        with self.__lock_io:
+            with self.__lock:
+                buffer, self.__buffer = self.__buffer, []
+            if buffer and self.__file is not None:
+                self.__file.write("".join(buffer).encode("utf-8"))
+                self.__file.flush()
+                os.fsync(self.__file.fileno())
+
+    def entri_sejak_snapshot(self) -> int:
+        """Jumlah record jurnal sejak snapshot terakhir."""
+        return self.__entri_sejak_snapshot
+
+    def simpan_snapshot(self, records: Iterable[Any]) -> None:
+        """
+        Menyimpan state lengkap sebagai snapshot lalu mengosongkan jurnal.
+        Snapshot ditulis ke file sementara dan diganti secara atomik, sehingga
+        crash di tengah proses tetap menyisakan snapshot lama + jurnal utuh.
+
+        Args:
+            records: Semua record state saat ini (format sama dengan data 'add')
+        """
+        with self.__lock_io:
+            with self.__lock:
+                buffer, self.__buffer = self.__buffer, []
+                seq = self.__seq
+                if self.__file is not None and buffer:
+                    self.__file.write("".join(buffer).encode("utf-8"))
+                    self.__file.flush()
+
+                sementara = self.__path_snapshot + ".tmp"
+                jumlah = 0
+                with open(sementara, "wb") as f:
+                    f.write(json.dumps({"versi": VERSI_SNAPSHOT, "seq": seq}).encode() + b"\n")
+                    for record in records:
+                        f.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+                        jumlah += 1
+                    f.write(json.dumps({"jumlah": jumlah}).encode() + b"\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(sementara, self.__path_snapshot)
+                self.__fsync_direktori()
+
+                # Semua record sampai seq sudah ada di snapshot
+                if self.__file is not None:
+                    self.__file.truncate(0)
+                    os.fsync(self.__file.fileno())
+                elif os.path.exists(self.__path_jurnal):
+                    os.truncate(self.__path_jurnal, 0)
+                self.__seq_snapshot = seq
+                self.__entri_sejak_snapshot = 0
+        logger.info("Snapshot %s disimpan: %s record, seq %s", self.__path_snapshot, jumlah, seq)
+
+    def __fsync_direktori(self) -> None:
+        """fsync direktori agar rename snapshot tahan crash (jika didukung OS)."""
+        try:
+            fd = os.open(self.__direktori, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def tutup(self) -> None:
+        """Menghentikan thread flush, menulis sisa buffer dan menutup file."""
+        with self.__lock:
+            self.__berhenti = True
+            self.__ada_data.notify()
+            thread = self.__thread
+        if thread is not None:
+            thread.join()
+        self.sinkronkan()
+        with self.__lock_io:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+            self.__thread = None
+
+    def __enter__(self) -> 'Jurnal':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.tutup()
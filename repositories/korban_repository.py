@@ -3,26 +3,34 @@ Module untuk Repository Korban.
 Implementasi konkret dari IRepository (DIP).
 """
 
-from typing import List, Optional, Dict
-from repositories.base_repository import IRepository
+from typing import Iterable, List, Optional, Dict
+from repositories.base_repository import Halaman, UrutanSisip, sinkron
+from repositories.indexed_repository import IndexedRepository, HashIndex, OrderedIndex
 from models.person import Korban
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class KorbanRepository(IRepository[Korban]):
+class KorbanRepository(IndexedRepository[Korban]):
     """
     Repository untuk mengelola data Korban.
     Implementasi IRepository (Dependency Inversion Principle).
     Menerapkan Single Responsibility Principle - hanya mengurus penyimpanan data.
     """
     
+    # Secondary index (dijaga otomatis saat add/update/delete dan setter Korban)
+    idx_kebutuhan = HashIndex(Korban.get_kebutuhan_khusus)
+    idx_tanggungan = OrderedIndex(Korban.get_jumlah_tanggungan)
+    
     def __init__(self):
-        """Constructor - inisialisasi storage dictionary."""
+        """Constructor - inisialisasi storage dictionary dan index."""
+        super().__init__()
         self.__storage: Dict[str, Korban] = {}
+        self.__urutan = UrutanSisip()
         logger.info("KorbanRepository diinisialisasi")
     
+    @sinkron
     def add(self, entity: Korban) -> None:
         """
         Menambah korban baru.
@@ -36,8 +44,36 @@ class KorbanRepository(IRepository[Korban]):
         if entity.get_id() in self.__storage:
             raise ValueError(f"Korban dengan ID {entity.get_id()} sudah ada")
         self.__storage[entity. get_id()] = entity
-        logger.info(f"Korban {entity.get_id()} ditambahkan ke repository")
+        self.__urutan.tambah(entity.get_id())
+        self._indeks_tambah(entity)
+        logger.info("Korban %s ditambahkan ke repository", entity.get_id())
+    
+    @sinkron
+    def add_many(self, entities: Iterable[Korban]) -> List[Korban]:
+        """
+        Menambah banyak korban sekaligus (bulk path untuk impor data).
+        Duplikasi dicek terhadap set ID, bukan get_by_id per baris.
+        
+        Args:
+            entities (Iterable[Korban]): Korban yang akan ditambahkan
+            
+        Returns:
+            List[Korban]: Korban yang ditolak karena ID sudah ada / duplikat di batch
+        """
+        ditolak = []
+        jumlah = 0
+        for entity in entities:
+            if entity.get_id() in self.__storage:
+                ditolak.append(entity)
+                continue
+            self.__storage[entity.get_id()] = entity
+            self.__urutan.tambah(entity.get_id())
+            self._indeks_tambah(entity)
+            jumlah += 1
+        logger.info("%s korban ditambahkan secara bulk, %s duplikat", jumlah, len(ditolak))
+        return ditolak
     
+    @sinkron
     def get_by_id(self, entity_id: str) -> Optional[Korban]:
         """
         Mengambil korban berdasarkan ID.
@@ -50,6 +86,7 @@ class KorbanRepository(IRepository[Korban]):
         """
         return self.__storage.get(entity_id)
     
+    @sinkron
     def get_all(self) -> List[Korban]:
         """
         Mengambil semua korban. 
@@ -59,6 +96,34 @@ class KorbanRepository(IRepository[Korban]):
         """
         return list(self.__storage.values())
     
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah korban.
+        
+        Returns:
+            int: Jumlah korban
+        """
+        return len(self.__storage)
+    
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman korban menurut urutan registrasi.
+        Kursor adalah nomor urut sisip (keyset, lihat UrutanSisip); hanya
+        entitas di halaman ini yang disalin.
+        
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah korban per halaman
+            
+        Returns:
+            Halaman: List korban dan kursor halaman berikutnya (None jika habis)
+        """
+        ids, kursor_berikut = self.__urutan.halaman(kursor, ukuran)
+        return [self.__storage[i] for i in ids], kursor_berikut
+    
+    @sinkron
     def update(self, entity: Korban) -> bool:
         """
         Memperbarui data korban.
@@ -70,12 +135,14 @@ class KorbanRepository(IRepository[Korban]):
             bool: True jika berhasil
         """
         if entity.get_id() not in self.__storage:
-            logger.warning(f"Korban {entity.get_id()} tidak ditemukan untuk update")
+            logger.warning("Korban %s tidak ditemukan untuk update", entity.get_id())
             return False
+        self._indeks_ganti(self.__storage[entity.get_id()], entity)
         self.__storage[entity.get_id()] = entity
-        logger. info(f"Korban {entity.get_id()} diperbarui")
+        logger.info("Korban %s diperbarui", entity.get_id())
         return True
     
+    @sinkron
     def delete(self, entity_id: str) -> bool:
         """
         Menghapus korban. 
@@ -87,12 +154,18 @@ class KorbanRepository(IRepository[Korban]):
             bool: True jika berhasil
         """
         if entity_id in self.__storage:
-            del self.__storage[entity_id]
-            logger.info(f"Korban {entity_id} dihapus")
+            self._indeks_hapus(self.__storage.pop(entity_id))
+            self.__urutan.hapus(entity_id)
+            logger.info("Korban %s dihapus", entity_id)
             return True
-        logger.warning(f"Korban {entity_id} tidak ditemukan untuk dihapus")
+        logger.warning("Korban %s tidak ditemukan untuk dihapus", entity_id)
         return False
     
+    def _id_entitas(self, entity: Korban) -> str:
+        """ID korban sebagai kunci storage."""
+        return entity.get_id()
+    
+    @sinkron
     def get_by_kebutuhan(self, kebutuhan:  str) -> List[Korban]:
         """
         Mengambil korban berdasarkan kebutuhan khusus.
@@ -103,9 +176,22 @@ class KorbanRepository(IRepository[Korban]):
         Returns: 
             List[Korban]:  List korban dengan kebutuhan tertentu
         """
-        return [k for k in self.__storage.values() 
-                if k.get_kebutuhan_khusus() == kebutuhan]
+        return [self.__storage[i] for i in self.idx_kebutuhan.cari(kebutuhan)]
+    
+    @sinkron
+    def get_by_tanggungan_minimal(self, minimal: int) -> List[Korban]:
+        """
+        Mengambil korban dengan jumlah tanggungan >= minimal (misal keluarga besar).
+        
+        Args:
+            minimal (int): Batas bawah jumlah tanggungan
+            
+        Returns:
+            List[Korban]: List korban, terurut dari tanggungan terkecil
+        """
+        return [self.__storage[i] for i in self.idx_tanggungan.rentang(bawah=minimal)]
     
+    @sinkron
     def get_total_tanggungan(self) -> int:
         """
         Menghitung total tanggungan semua korban.
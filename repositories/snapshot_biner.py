@@ -0,0 +1,278 @@
+"""
+Module untuk Snapshot biner state aplikasi (bahan, korban, distribusi).
+
+Format file (little-endian, versi 1):
+
+    header      : magic, versi, lalu jumlah/offset setiap seksi dan agregat
+    string      : offset (uint64, n+1 buah) + blob UTF-8; record merujuk string
+                  lewat indeks uint32, string berulang disimpan sekali
+    bahan       : record lebar tetap, urutan asli
+    korban      : record lebar tetap, terurut menurut ID (binary search)
+    distribusi  : record lebar tetap, terurut menurut ID (binary search)
+    porsi_korban: total porsi per ID korban, terurut menurut ID korban
+
+File dibuka lewat mmap sehingga membuka snapshot tidak membaca isi record;
+object entitas baru dibuat saat record-nya diakses.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from models.bahan_makanan import BahanMakanan, buat_bahan, jenis_dan_faktor
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+import logging
+import mmap
+import os
+import struct
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"DUSNAP"
+VERSI = 1
+
+# Struct per seksi - field pertama record korban/distribusi adalah indeks string ID
+_STRUCT_SEKSI = {
+    'bahan': struct.Struct('<IIIddd'),       # nama, jenis, satuan, jumlah, faktor, tanggal_masuk
+    'korban': struct.Struct('<IIIId'),       # id, nama, kebutuhan, tanggungan, registered
+    'distribusi': struct.Struct('<IIIId'),   # id, id_korban, catatan, porsi, waktu
+    'porsi_korban': struct.Struct('<IQ'),    # id_korban, total porsi
+}
+_SEKSI = tuple(_STRUCT_SEKSI)
+# magic, versi, jumlah string, offset string, (jumlah, offset) per seksi,
+# total tanggungan, total porsi
+_HEADER = struct.Struct('<6sHQQ' + 'QQ' * len(_SEKSI) + 'QQ')
+_OFFSET = struct.Struct('<Q')
+
+
+class _TabelString:
+    """Pengumpul string unik untuk penulisan snapshot."""
+
+    def __init__(self):
+        self.__indeks: Dict[str, int] = {}
+        self.daftar: List[str] = []
+
+    def __call__(self, teks: str) -> int:
+        indeks = self.__indeks.get(teks)
+        if indeks is None:
+            indeks = self.__indeks[teks] = len(self.daftar)
+            self.daftar.append(teks)
+        return indeks
+
+
+def tulis_snapshot(path: str, bahan: Iterable[BahanMakanan], korban: Iterable[Korban],
+                   distribusi: Iterable[DistribusiMakanan]) -> Dict[str, int]:
+    """
+    Menulis snapshot biner state aplikasi.
+    File ditulis ke path sementara lalu diganti secara atomik.
+
+    Args:
+        path: Path file snapshot
+        bahan: Semua bahan makanan
+        korban: Semua korban
+        distribusi: Semua distribusi
+
+    Returns:
+        Dict[str, int]: Jumlah record per seksi
+    """
+    string = _TabelString()
+    korban = sorted(korban, key=Korban.get_id)
+    distribusi = sorted(distribusi, key=DistribusiMakanan.get_id_distribusi)
+
+    seksi: Dict[str, List[bytes]] = {nama: [] for nama in _SEKSI}
+    for b in bahan:
+        jenis, faktor = jenis_dan_faktor(b)
+        seksi['bahan'].append(_STRUCT_SEKSI['bahan'].pack(
+            string(b.get_nama()), string(jenis), string(b.get_satuan()),
+            b.get_jumlah(), faktor, b.get_tanggal_masuk().timestamp()))
+
+    total_tanggungan = 0
+    for k in korban:
+        total_tanggungan += k.get_jumlah_tanggungan()
+        seksi['korban'].append(_STRUCT_SEKSI['korban'].pack(
+            string(k.get_id()), string(k.get_name()), string(k.get_kebutuhan_khusus()),
+            k.get_jumlah_tanggungan(), k.get_registered_date().timestamp()))
+
+    porsi_per_korban: Dict[str, int] = {}
+    for d in distribusi:
+        porsi_per_korban[d.get_id_korban()] = (porsi_per_korban.get(d.get_id_korban(), 0)
+                                               + d.get_jumlah_porsi())
+        seksi['distribusi'].append(_STRUCT_SEKSI['distribusi'].pack(
+            string(d.get_id_distribusi()), string(d.get_id_korban()), string(d.get_catatan()),
+            d.get_jumlah_porsi(), d.get_waktu_distribusi().timestamp()))
+    for id_korban in sorted(porsi_per_korban):
+        seksi['porsi_korban'].append(_STRUCT_SEKSI['porsi_korban'].pack(
+            string(id_korban), porsi_per_korban[id_korban]))
+
+    blob = [teks.encode("utf-8") for teks in string.daftar]
+    offset_string = _HEADER.size
+    offset_blob = offset_string + _OFFSET.size * (len(blob) + 1)
+    posisi = offset_blob + sum(len(b) for b in blob)
+
+    field_seksi = []
+    for nama in _SEKSI:
+        field_seksi += [len(seksi[nama]), posisi]
+        posisi += len(seksi[nama]) * _STRUCT_SEKSI[nama].size
+
+    sementara = path + ".tmp"
+    with open(sementara, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSI, len(blob), offset_string, *field_seksi,
+                             total_tanggungan, sum(porsi_per_korban.values())))
+        akhir = offset_blob
+        f.write(_OFFSET.pack(akhir))
+        for b in blob:
+            akhir += len(b)
+            f.write(_OFFSET.pack(akhir))
+        for b in blob:
+            f.write(b)
+        for nama in _SEKSI:
+            f.write(b"".join(seksi[nama]))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(sementara, path)
+
+    jumlah = {nama: len(seksi[nama]) for nama in _SEKSI}
+    logger.info("Snapshot biner %s ditulis: %s", path, jumlah)
+    return jumlah
+
+
+class SnapshotBiner:
+    """
+    Pembaca snapshot biner lewat mmap.
+
+    Membuka snapshot hanya membaca header; record dibaca langsung dari
+    memory map saat dibutuhkan (struct.unpack_from), dan object entitas
+    dibuat dengan bahan(i), korban(i), distribusi(i).
+    """
+
+    def __init__(self, path: str):
+        """
+        Membuka snapshot.
+
+        Args:
+            path: Path file snapshot
+
+        Raises:
+            ValueError: Jika file bukan snapshot atau versinya tidak didukung
+        """
+        self.__mm = None
+        self.__file = open(path, "rb")
+        try:
+            self.__mm = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError(f"File snapshot {path} kosong")
+        if len(self.__mm) < _HEADER.size:
+            self.tutup()
+            raise ValueError(f"File {path} bukan snapshot dapur umum")
+
+        header = _HEADER.unpack_from(self.__mm, 0)
+        magic, versi, self.__jumlah_string, self.__offset_string = header[:4]
+        if magic != MAGIC:
+            self.tutup()
+            raise ValueError(f"File {path} bukan snapshot dapur umum")
+        if versi != VERSI:
+            self.tutup()
+            raise ValueError(f"Versi snapshot {versi} tidak didukung")
+
+        field_seksi = header[4:4 + 2 * len(_SEKSI)]
+        self.__seksi: Dict[str, Tuple[int, int]] = {
+            nama: (field_seksi[2 * i], field_seksi[2 * i + 1]) for i, nama in enumerate(_SEKSI)
+        }
+        self.__total_tanggungan, self.__total_porsi = header[-2:]
+        self.__cache_string: Dict[int, str] = {}
+        logger.info("Snapshot biner %s dibuka: %s", path,
+                    {nama: n for nama, (n, _) in self.__seksi.items()})
+
+    # ----------------------------------------------------------- akses dasar
+
+    def string(self, indeks: int) -> str:
+        """Mengambil string ke-i dari tabel string."""
+        teks = self.__cache_string.get(indeks)
+        if teks is None:
+            awal, akhir = struct.unpack_from('<QQ', self.__mm,
+                                             self.__offset_string + _OFFSET.size * indeks)
+            teks = self.__mm[awal:akhir].decode("utf-8")
+            # Cache hanya string pendek yang sering berulang (kategori, satuan)
+            if len(self.__cache_string) < 4096 and len(teks) <= 16:
+                self.__cache_string[indeks] = teks
+        return teks
+
+    def jumlah(self, seksi: str) -> int:
+        """Jumlah record di seksi ('bahan', 'korban', 'distribusi', 'porsi_korban')."""
+        return self.__seksi[seksi][0]
+
+    def baris(self, seksi: str, i: int) -> tuple:
+        """Field mentah record ke-i di seksi (indeks string belum di-decode)."""
+        jumlah, offset = self.__seksi[seksi]
+        if not 0 <= i < jumlah:
+            raise IndexError(f"Record {seksi} ke-{i} di luar jangkauan")
+        format_ = _STRUCT_SEKSI[seksi]
+        return format_.unpack_from(self.__mm, offset + i * format_.size)
+
+    def kunci(self, seksi: str, i: int) -> str:
+        """ID (field string pertama) record ke-i."""
+        return self.string(self.baris(seksi, i)[0])
+
+    def cari(self, seksi: str, kunci: str) -> Optional[int]:
+        """
+        Binary search record berdasarkan ID pada seksi yang terurut.
+
+        Returns:
+            Optional[int]: Nomor record, atau None jika tidak ada
+        """
+        bawah, atas = 0, self.jumlah(seksi)
+        while bawah < atas:
+            tengah = (bawah + atas) // 2
+            if self.kunci(seksi, tengah) < kunci:
+                bawah = tengah + 1
+            else:
+                atas = tengah
+        if bawah < self.jumlah(seksi) and self.kunci(seksi, bawah) == kunci:
+            return bawah
+        return None
+
+    def get_total_tanggungan(self) -> int:
+        """Total tanggungan seluruh korban di snapshot."""
+        return self.__total_tanggungan
+
+    def get_total_porsi(self) -> int:
+        """Total porsi seluruh distribusi di snapshot."""
+        return self.__total_porsi
+
+    def get_porsi_korban(self, id_korban: str) -> int:
+        """Total porsi distribusi untuk korban tertentu di snapshot."""
+        i = self.cari('porsi_korban', id_korban)
+        return self.baris('porsi_korban', i)[1] if i is not None else 0
+
+    # --------------------------------------------------------- materialisasi
+
+    def bahan(self, i: int) -> BahanMakanan:
+        """Membuat object bahan dari record ke-i."""
+        nama, jenis, satuan, jumlah, faktor, tanggal = self.baris('bahan', i)
+        return buat_bahan(self.string(jenis), self.string(nama), jumlah, self.string(satuan),
+                          faktor, datetime.fromtimestamp(tanggal))
+
+    def korban(self, i: int) -> Korban:
+        """Membuat object korban dari record ke-i."""
+        id_korban, nama, kebutuhan, tanggungan, registered = self.baris('korban', i)
+        return Korban(self.string(nama), self.string(id_korban), self.string(kebutuhan),
+                      tanggungan, datetime.fromtimestamp(registered))
+
+    def distribusi(self, i: int) -> DistribusiMakanan:
+        """Membuat object distribusi dari record ke-i."""
+        id_distribusi, id_korban, catatan, porsi, waktu = self.baris('distribusi', i)
+        return DistribusiMakanan(self.string(id_distribusi), self.string(id_korban),
+                                 porsi, self.string(catatan), datetime.fromtimestamp(waktu))
+
+    def tutup(self) -> None:
+        """Menutup memory map dan file."""
+        if self.__mm is not None:
+            self.__mm.close()
+            self.__mm = None
+        self.__file.close()
+
+    def __enter__(self) -> 'SnapshotBiner':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.tutup()
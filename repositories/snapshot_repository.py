@@ -0,0 +1,344 @@
+"""
+Module untuk Repository yang dibaca langsung dari SnapshotBiner.
+Data snapshot tidak di-deserialisasi di awal: object entitas dibuat saat
+diakses, dan perubahan disimpan di lapisan overlay di memori.
+"""
+
+from abc import abstractmethod
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+from repositories.base_repository import Halaman, IRepository, baca_kursor
+from repositories.snapshot_biner import SnapshotBiner
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class _SnapshotOverlayRepository(IRepository[T]):
+    """
+    Base class repository "copy-on-write" di atas satu seksi snapshot.
+
+    - Record snapshot dicari dengan binary search dan dimaterialisasi saat
+      pertama diakses lewat get_by_id; object tersebut lalu disimpan di overlay
+      sehingga akses berikutnya (dan perubahan lewat setter) memakai object yang sama.
+    - Iterasi, paging dan filter (iter_semua, get_halaman, get_all, get_by_*)
+      membaca record yang belum tertimpa sebagai salinan baca tanpa mengisi
+      overlay, sehingga memori tetap kecil walaupun seluruh snapshot dibaca.
+    - add/update menulis ke overlay, delete menandai ID snapshot sebagai terhapus.
+    - ID snapshot yang sudah ada di overlay atau terhapus disebut "tertimpa";
+      subclass memakai hook _pada_timpa untuk mengoreksi agregat snapshot.
+    """
+
+    _SEKSI = ""
+
+    def __init__(self, snapshot: SnapshotBiner):
+        """
+        Args:
+            snapshot: Snapshot biner yang sudah dibuka
+        """
+        self._snapshot = snapshot
+        self.__overlay: Dict[str, T] = {}
+        self.__tertimpa: Set[str] = set()
+        self.__dihapus: Set[str] = set()
+        self.__id_baru: Dict[str, None] = {}   # ID yang tidak ada di snapshot (terurut)
+
+    @abstractmethod
+    def _id_entitas(self, entity: T) -> str:
+        """Mengambil ID entitas."""
+        pass
+
+    @abstractmethod
+    def _materialisasi(self, baris: int) -> T:
+        """Membuat object entitas dari record snapshot ke-i."""
+        pass
+
+    def _pada_timpa(self, baris: int) -> None:
+        """Hook: record snapshot ke-i tidak lagi dipakai apa adanya."""
+        pass
+
+    def _pada_masuk(self, entity: T) -> None:
+        """Hook: entitas masuk ke overlay."""
+        pass
+
+    def _pada_keluar(self, entity: T) -> None:
+        """Hook: entitas keluar dari overlay."""
+        pass
+
+    def _overlay(self) -> Iterable[T]:
+        """Semua entitas di overlay (termaterialisasi, baru atau diubah)."""
+        return self.__overlay.values()
+
+    def __timpa(self, entity_id: str, baris: int) -> None:
+        self.__tertimpa.add(entity_id)
+        self._pada_timpa(baris)
+
+    def __masukkan(self, entity_id: str, entity: T) -> None:
+        lama = self.__overlay.get(entity_id)
+        if lama is not None:
+            self._pada_keluar(lama)
+        self.__overlay[entity_id] = entity
+        self._pada_masuk(entity)
+
+    def _ambil(self, entity_id: str, baris: Optional[int] = None) -> Optional[T]:
+        """Mengambil entitas dari overlay atau memateralisasi record snapshot."""
+        entity = self.__overlay.get(entity_id)
+        if entity is not None or entity_id in self.__tertimpa:
+            return entity
+        if baris is None:
+            baris = self._snapshot.cari(self._SEKSI, entity_id)
+            if baris is None:
+                return None
+        entity = self._materialisasi(baris)
+        self.__timpa(entity_id, baris)
+        self.__masukkan(entity_id, entity)
+        return entity
+
+    def _ada(self, entity_id: str) -> bool:
+        """Apakah ID ada (di overlay atau snapshot yang belum dihapus)."""
+        if entity_id in self.__overlay:
+            return True
+        return (entity_id not in self.__tertimpa
+                and self._snapshot.cari(self._SEKSI, entity_id) is not None)
+
+    def add(self, entity: T) -> None:
+        """
+        Menambah entitas baru ke overlay.
+
+        Raises:
+            ValueError: Jika ID sudah ada
+        """
+        entity_id = self._id_entitas(entity)
+        if self._ada(entity_id):
+            raise ValueError(f"ID {entity_id} sudah ada")
+        if entity_id in self.__dihapus:
+            # ID snapshot yang pernah dihapus dipakai lagi
+            self.__dihapus.discard(entity_id)
+        elif self._snapshot.cari(self._SEKSI, entity_id) is None:
+            self.__id_baru[entity_id] = None
+        self.__masukkan(entity_id, entity)
+
+    def get_by_id(self, entity_id: str) -> Optional[T]:
+        """Mengambil entitas berdasarkan ID (dimaterialisasi saat pertama diakses)."""
+        return self._ambil(entity_id)
+
+    def iter_semua(self, ukuran_halaman: int = 500) -> Iterator[T]:
+        """
+        Iterasi semua entitas: urutan snapshot (menurut ID), lalu entitas baru.
+        Record dibaca langsung dari mmap sehingga ukuran_halaman tidak dipakai;
+        record yang belum tertimpa adalah salinan baca (tidak masuk overlay).
+        """
+        return (entity for _, entity in self.__iter_dari(0))
+
+    def _filter(self, cocok_mentah: Callable[[tuple], bool],
+                cocok_entitas: Callable[[T], bool]) -> Iterator[T]:
+        """
+        Iterasi entitas yang cocok. Record snapshot disaring dari field mentah
+        (tanpa membuat object); hanya record yang cocok dimaterialisasi, sebagai
+        salinan baca yang tidak masuk overlay. Entitas di overlay disaring
+        dengan cocok_entitas.
+        """
+        for baris in range(self._snapshot.jumlah(self._SEKSI)):
+            mentah = self._snapshot.baris(self._SEKSI, baris)
+            entity_id = self._snapshot.string(mentah[0])
+            if entity_id in self.__tertimpa:
+                entity = self.__overlay.get(entity_id)
+                if entity is not None and cocok_entitas(entity):
+                    yield entity
+            elif cocok_mentah(mentah):
+                yield self._materialisasi(baris)
+        for entity_id in list(self.__id_baru):
+            entity = self.__overlay.get(entity_id)
+            if entity is not None and cocok_entitas(entity):
+                yield entity
+
+    def __iter_dari(self, posisi: int) -> Iterator[Tuple[int, T]]:
+        """
+        Iterasi (posisi berikutnya, entitas) mulai dari posisi gabungan:
+        nomor record snapshot, dilanjutkan urutan ID baru. Record yang belum
+        tertimpa dibaca sebagai salinan tanpa dimasukkan ke overlay.
+        """
+        jumlah = self._snapshot.jumlah(self._SEKSI)
+        for baris in range(posisi, jumlah):
+            entity_id = self._snapshot.kunci(self._SEKSI, baris)
+            if entity_id in self.__tertimpa:
+                entity = self.__overlay.get(entity_id)
+                if entity is None:
+                    continue
+            else:
+                entity = self._materialisasi(baris)
+            yield baris + 1, entity
+        awal = max(posisi, jumlah)
+        # Salinan daftar ID agar add/delete selama iterasi tidak mengganggu
+        for i, entity_id in enumerate(list(self.__id_baru)[awal - jumlah:], awal):
+            entity = self.__overlay.get(entity_id)
+            if entity is not None:
+                yield i + 1, entity
+
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman entitas (urutan sama dengan iter_semua).
+        Membaca halaman tidak menambah isi overlay, sehingga memori tetap kecil
+        walaupun seluruh snapshot dipaging. Object record snapshot yang belum
+        pernah diakses adalah salinan baca - gunakan get_by_id untuk mengubahnya.
+        """
+        isi = list(islice(self.__iter_dari(baca_kursor(kursor, ukuran)), ukuran + 1))
+        if len(isi) > ukuran:
+            return [entity for _, entity in isi[:ukuran]], str(isi[ukuran - 1][0])
+        return [entity for _, entity in isi], None
+
+    def get_all(self) -> List[T]:
+        """Mengambil semua entitas (record snapshot dimaterialisasi sebagai salinan baca)."""
+        return list(self.iter_semua())
+
+    def count(self) -> int:
+        """Jumlah entitas tanpa materialisasi."""
+        return self._snapshot.jumlah(self._SEKSI) - len(self.__dihapus) + len(self.__id_baru)
+
+    def update(self, entity: T) -> bool:
+        """Memperbarui entitas (object baru disimpan di overlay)."""
+        entity_id = self._id_entitas(entity)
+        if self._ambil(entity_id) is None:
+            return False
+        self.__masukkan(entity_id, entity)
+        return True
+
+    def delete(self, entity_id: str) -> bool:
+        """Menghapus entitas."""
+        if self._ambil(entity_id) is None:
+            return False
+        self._pada_keluar(self.__overlay.pop(entity_id))
+        if entity_id in self.__id_baru:
+            del self.__id_baru[entity_id]
+        else:
+            self.__dihapus.add(entity_id)
+        return True
+
+
+class SnapshotKorbanRepository(_SnapshotOverlayRepository[Korban]):
+    """
+    Repository korban yang dibaca dari seksi 'korban' SnapshotBiner.
+    Total tanggungan memakai agregat snapshot dan dikoreksi oleh overlay.
+    """
+
+    _SEKSI = 'korban'
+
+    def __init__(self, snapshot: SnapshotBiner):
+        super().__init__(snapshot)
+        self.__koreksi_tanggungan = 0
+        logger.info("SnapshotKorbanRepository diinisialisasi")
+
+    def _id_entitas(self, entity: Korban) -> str:
+        return entity.get_id()
+
+    def _materialisasi(self, baris: int) -> Korban:
+        return self._snapshot.korban(baris)
+
+    def _pada_timpa(self, baris: int) -> None:
+        self.__koreksi_tanggungan += self._snapshot.baris(self._SEKSI, baris)[3]
+
+    def add_many(self, entities: Iterable[Korban]) -> List[Korban]:
+        """
+        Menambah banyak korban sekaligus.
+
+        Returns:
+            List[Korban]: Korban yang ditolak karena ID sudah ada / duplikat di batch
+        """
+        ditolak = []
+        for entity in entities:
+            try:
+                self.add(entity)
+            except ValueError:
+                ditolak.append(entity)
+        return ditolak
+
+    def get_by_kebutuhan(self, kebutuhan: str) -> List[Korban]:
+        """Mengambil korban dengan kebutuhan khusus tertentu."""
+        string = self._snapshot.string
+        return list(self._filter(lambda mentah: string(mentah[2]) == kebutuhan,
+                                 lambda k: k.get_kebutuhan_khusus() == kebutuhan))
+
+    def get_by_tanggungan_minimal(self, minimal: int) -> List[Korban]:
+        """Mengambil korban dengan jumlah tanggungan >= minimal."""
+        cocok = self._filter(lambda mentah: mentah[3] >= minimal,
+                             lambda k: k.get_jumlah_tanggungan() >= minimal)
+        return sorted(cocok, key=Korban.get_jumlah_tanggungan)
+
+    def get_total_tanggungan(self) -> int:
+        """
+        Total tanggungan: agregat snapshot dikoreksi record yang tertimpa,
+        ditambah tanggungan terkini di overlay (O(ukuran overlay)).
+        """
+        return (self._snapshot.get_total_tanggungan() - self.__koreksi_tanggungan
+                + sum(k.get_jumlah_tanggungan() for k in self._overlay()))
+
+
+class SnapshotDistribusiRepository(_SnapshotOverlayRepository[DistribusiMakanan]):
+    """
+    Repository distribusi yang dibaca dari seksi 'distribusi' SnapshotBiner.
+    Total porsi (keseluruhan dan per korban) memakai agregat snapshot dan
+    counter koreksi, sehingga tetap O(1) / O(log n) tanpa materialisasi.
+    """
+
+    _SEKSI = 'distribusi'
+
+    def __init__(self, snapshot: SnapshotBiner):
+        super().__init__(snapshot)
+        self.__koreksi_total = 0
+        self.__koreksi_korban: Dict[str, int] = {}
+        logger.info("SnapshotDistribusiRepository diinisialisasi")
+
+    def _id_entitas(self, entity: DistribusiMakanan) -> str:
+        return entity.get_id_distribusi()
+
+    def _materialisasi(self, baris: int) -> DistribusiMakanan:
+        return self._snapshot.distribusi(baris)
+
+    def __koreksi(self, id_korban: str, porsi: int) -> None:
+        self.__koreksi_total += porsi
+        self.__koreksi_korban[id_korban] = self.__koreksi_korban.get(id_korban, 0) + porsi
+
+    def _pada_timpa(self, baris: int) -> None:
+        _, id_korban, _, porsi, _ = self._snapshot.baris(self._SEKSI, baris)
+        self.__koreksi(self._snapshot.string(id_korban), -porsi)
+
+    def _pada_masuk(self, entity: DistribusiMakanan) -> None:
+        self.__koreksi(entity.get_id_korban(), entity.get_jumlah_porsi())
+
+    def _pada_keluar(self, entity: DistribusiMakanan) -> None:
+        self.__koreksi(entity.get_id_korban(), -entity.get_jumlah_porsi())
+
+    def add_many(self, entities: Iterable[DistribusiMakanan]) -> None:
+        """
+        Menambah banyak distribusi sekaligus (utuh atau tidak sama sekali).
+
+        Raises:
+            ValueError: Jika ada ID yang sudah ada atau duplikat di dalam batch
+        """
+        entities = list(entities)
+        id_batch = set()
+        for entity in entities:
+            id_distribusi = entity.get_id_distribusi()
+            if self._ada(id_distribusi) or id_distribusi in id_batch:
+                raise ValueError(f"Distribusi {id_distribusi} sudah ada")
+            id_batch.add(id_distribusi)
+        for entity in entities:
+            self.add(entity)
+
+    def get_by_korban(self, id_korban: str) -> List[DistribusiMakanan]:
+        """Mengambil riwayat distribusi untuk korban tertentu."""
+        string = self._snapshot.string
+        return list(self._filter(lambda mentah: string(mentah[1]) == id_korban,
+                                 lambda d: d.get_id_korban() == id_korban))
+
+    def get_total_porsi_korban(self, id_korban: str) -> int:
+        """Total porsi yang sudah diterima korban tertentu."""
+        return (self._snapshot.get_porsi_korban(id_korban)
+                + self.__koreksi_korban.get(id_korban, 0))
+
+    def get_total_porsi_terdistribusi(self) -> int:
+        """Total porsi yang sudah didistribusikan."""
+        return self._snapshot.get_total_porsi() + self.__koreksi_total
@@ -0,0 +1,911 @@
+"""
+Module untuk Repository berbasis SQLite.
+Implementasi konkret dari IRepository (DIP) yang menyimpan data secara persisten,
+sehingga data tidak hilang saat aplikasi di-restart dan tidak harus muat di memori.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from repositories.base_repository import Halaman, IRepository, baca_kursor, batas_waktu, sinkron
+from repositories.buku_stok import BukuStok
+from models.bahan_makanan import BahanMakanan, TOLERANSI_STOK, buat_bahan, jenis_dan_faktor
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# Skema database. Kolom yang dipakai untuk query filter diberi index
+# agar get_by_kebutuhan, get_by_korban, get_by_waktu dan get_stok_rendah tidak full table scan.
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS bahan (
+    nama            TEXT PRIMARY KEY,
+    jenis           TEXT NOT NULL,
+    jumlah          REAL NOT NULL,
+    satuan          TEXT NOT NULL,
+    faktor_porsi    REAL NOT NULL,
+    tanggal_masuk   REAL NOT NULL,
+    porsi           INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_bahan_jumlah ON bahan (jumlah);
+
+CREATE TABLE IF NOT EXISTS korban (
+    id                  TEXT PRIMARY KEY,
+    nama                TEXT NOT NULL,
+    kebutuhan_khusus    TEXT NOT NULL,
+    jumlah_tanggungan   INTEGER NOT NULL,
+    registered_date     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_korban_kebutuhan ON korban (kebutuhan_khusus);
+
+CREATE TABLE IF NOT EXISTS distribusi (
+    id_distribusi       TEXT PRIMARY KEY,
+    id_korban           TEXT NOT NULL,
+    jumlah_porsi        INTEGER NOT NULL,
+    waktu_distribusi    REAL NOT NULL,
+    catatan             TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_distribusi_korban ON distribusi (id_korban);
+CREATE INDEX IF NOT EXISTS idx_distribusi_waktu ON distribusi (waktu_distribusi);
+
+-- Ledger stok persisten (append-only), diisi trigger _SKEMA_MUTASI
+CREATE TABLE IF NOT EXISTS mutasi_stok (
+    nama        TEXT NOT NULL,
+    waktu       REAL NOT NULL,
+    selisih     REAL NOT NULL
+);
+"""
+
+# Rumus kolom porsi, sama seperti hitung_porsi() tiap jenis bahan ({p} = prefix kolom)
+_RUMUS_PORSI = """CAST(CASE {p}jenis
+        WHEN 'pokok' THEN {p}jumlah * 1000 / {p}faktor_porsi
+        ELSE {p}jumlah / {p}faktor_porsi END AS INTEGER)"""
+
+# Objek yang bergantung pada kolom porsi; dibuat setelah migrasi skema.
+# Kolom porsi dihitung ulang oleh trigger, sehingga MIN(porsi) cukup membaca index.
+_SKEMA_PORSI = """
+CREATE INDEX IF NOT EXISTS idx_bahan_porsi ON bahan (porsi);
+CREATE TRIGGER IF NOT EXISTS trg_bahan_porsi_insert AFTER INSERT ON bahan
+BEGIN
+    UPDATE bahan SET porsi = {rumus}
+    WHERE nama = NEW.nama;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_bahan_porsi_update AFTER UPDATE OF jenis, jumlah, faktor_porsi ON bahan
+BEGIN
+    UPDATE bahan SET porsi = {rumus}
+    WHERE nama = NEW.nama;
+END;
+""".format(rumus=_RUMUS_PORSI.format(p="NEW."))
+
+# Epoch detik saat ini di SQL (sama dengan time.time())
+_EPOCH_SEKARANG = "(julianday('now') - 2440587.5) * 86400.0"
+
+# Setiap perubahan bahan.jumlah dicatat sebagai selisih di mutasi_stok dalam
+# transaksi yang sama, apa pun jalur tulisnya (add, update, pengurangan stok).
+_SKEMA_MUTASI = """
+CREATE TRIGGER IF NOT EXISTS trg_bahan_mutasi_insert AFTER INSERT ON bahan
+WHEN NEW.jumlah != 0
+BEGIN
+    INSERT INTO mutasi_stok (nama, waktu, selisih) VALUES (NEW.nama, {sekarang}, NEW.jumlah);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_bahan_mutasi_update AFTER UPDATE OF jumlah ON bahan
+WHEN NEW.jumlah != OLD.jumlah
+BEGIN
+    INSERT INTO mutasi_stok (nama, waktu, selisih)
+    VALUES (NEW.nama, {sekarang}, NEW.jumlah - OLD.jumlah);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_bahan_mutasi_delete AFTER DELETE ON bahan
+WHEN OLD.jumlah != 0
+BEGIN
+    INSERT INTO mutasi_stok (nama, waktu, selisih) VALUES (OLD.nama, {sekarang}, -OLD.jumlah);
+END;
+""".format(sekarang=_EPOCH_SEKARANG)
+
+# Versi skema yang disimpan di PRAGMA user_version
+# (0 = database lama tanpa kolom bahan.porsi, 1 = dengan kolom porsi,
+#  2 = dengan ledger mutasi_stok)
+VERSI_SKEMA = 2
+
+
+class KoneksiDapur(sqlite3.Connection):
+    """
+    Koneksi SQLite dengan satu lock bersama untuk semua repository yang memakainya.
+    Koneksi dibuka dengan check_same_thread=False, jadi setiap query dan
+    transaksi (with koneksi) harus berjalan di bawah lock ini.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+
+
+def _lock_koneksi(koneksi: sqlite3.Connection) -> threading.RLock:
+    """Lock milik koneksi dari buka_koneksi; koneksi lain mendapat lock baru per repository."""
+    lock = getattr(koneksi, 'lock', None)
+    return lock if lock is not None else threading.RLock()
+
+
+def buka_koneksi(db_path: str) -> sqlite3.Connection:
+    """
+    Membuka koneksi SQLite yang siap dipakai oleh repository.
+
+    Mengaktifkan WAL mode (pembaca tidak memblokir penulis) dan membuat
+    skema tabel beserta index jika belum ada. Repository yang memakai koneksi
+    yang sama berbagi lock koneksi (KoneksiDapur.lock).
+
+    Args:
+        db_path (str): Path file database (atau ":memory:")
+
+    Returns:
+        sqlite3.Connection: Koneksi database
+    """
+    koneksi = sqlite3.connect(db_path, check_same_thread=False, factory=KoneksiDapur)
+    koneksi.execute("PRAGMA journal_mode=WAL")
+    koneksi.execute("PRAGMA synchronous=NORMAL")
+    koneksi.executescript(_SKEMA)
+    _migrasi_skema(koneksi)
+    koneksi.executescript(_SKEMA_PORSI)
+    koneksi.executescript(_SKEMA_MUTASI)
+    logger.info("Koneksi SQLite dibuka: %s", db_path)
+    return koneksi
+
+
+def _migrasi_skema(koneksi: sqlite3.Connection) -> None:
+    """
+    Memperbarui database lama ke VERSI_SKEMA berdasarkan PRAGMA user_version.
+
+    Versi 1 menambah kolom bahan.porsi lalu mengisinya untuk baris yang sudah
+    ada (database baru sudah punya kolomnya dari CREATE TABLE). Versi 2 mencatat
+    stok bahan yang sudah ada sebagai mutasi awal di mutasi_stok (trigger
+    mutasi baru dibuat setelah migrasi, jadi stok tidak tercatat dua kali).
+
+    Args:
+        koneksi (sqlite3.Connection): Koneksi database
+    """
+    versi = koneksi.execute("PRAGMA user_version").fetchone()[0]
+    if versi >= VERSI_SKEMA:
+        return
+    with koneksi:
+        if versi < 1:
+            kolom = {baris[1] for baris in koneksi.execute("PRAGMA table_info(bahan)")}
+            if 'porsi' not in kolom:
+                koneksi.execute("ALTER TABLE bahan ADD COLUMN porsi INTEGER NOT NULL DEFAULT 0")
+            koneksi.execute("UPDATE bahan SET porsi = " + _RUMUS_PORSI.format(p=""))
+        if versi < 2:
+            koneksi.execute("INSERT INTO mutasi_stok (nama, waktu, selisih) "
+                            f"SELECT nama, {_EPOCH_SEKARANG}, jumlah FROM bahan WHERE jumlah != 0")
+        koneksi.execute(f"PRAGMA user_version = {VERSI_SKEMA}")
+    logger.info("Skema database dimigrasi dari versi %s ke %s", versi, VERSI_SKEMA)
+
+
+def _halaman_rowid(koneksi: sqlite3.Connection, sql_select: str, dari_baris: Callable,
+                   kursor: Optional[str], ukuran: int) -> Halaman:
+    """
+    Keyset pagination berdasarkan rowid: setiap halaman memakai
+    "WHERE rowid > kursor LIMIT n" sehingga biayanya tidak bergantung
+    pada posisi halaman dan tetap benar walaupun ada baris yang dihapus.
+    """
+    setelah = baca_kursor(kursor, ukuran)
+    sql = sql_select.replace("SELECT ", "SELECT rowid, ", 1) + " WHERE rowid > ? ORDER BY rowid LIMIT ?"
+    hasil = koneksi.execute(sql, (setelah, ukuran + 1)).fetchall()
+    isi = [dari_baris(baris[1:]) for baris in hasil[:ukuran]]
+    return isi, (str(hasil[ukuran - 1][0]) if len(hasil) > ukuran else None)
+
+
+def _ke_epoch(dt: datetime) -> float:
+    """Konversi datetime ke epoch detik untuk disimpan di kolom REAL."""
+    return dt.timestamp()
+
+
+def _dari_epoch(epoch: float) -> datetime:
+    """Konversi epoch detik dari database kembali ke datetime."""
+    return datetime.fromtimestamp(epoch)
+
+
+class SQLiteBahanRepository(IRepository[BahanMakanan]):
+    """
+    Repository Bahan Makanan berbasis SQLite.
+    Perilaku sama dengan BahanRepository (nama sebagai ID, add meng-aggregate stok).
+    
+    Setiap mutasi stok dicatat trigger ke tabel mutasi_stok, jadi riwayat stok
+    tetap ada setelah restart; get_buku_stok memuatnya ke BukuStok.
+    """
+
+    _SQL_INSERT = ("INSERT INTO bahan (nama, jenis, jumlah, satuan, faktor_porsi, tanggal_masuk) "
+                   "VALUES (?, ?, ?, ?, ?, ?)")
+    _SQL_TAMBAH_STOK = "UPDATE bahan SET jumlah = jumlah + ? WHERE nama = ?"
+    _SQL_SELECT = "SELECT nama, jenis, jumlah, satuan, faktor_porsi, tanggal_masuk FROM bahan"
+
+    def __init__(self, koneksi: sqlite3.Connection):
+        """
+        Constructor dengan koneksi yang sudah dibuka (lihat buka_koneksi).
+
+        Args:
+            koneksi (sqlite3.Connection): Koneksi database
+        """
+        self.__koneksi = koneksi
+        self._lock = _lock_koneksi(koneksi)
+        self.__buku_stok = BukuStok()
+        self.__mutasi_terakhir = 0  # rowid mutasi_stok terakhir yang sudah dimuat
+        logger.info("SQLiteBahanRepository diinisialisasi")
+
+    def _ke_baris(self, entity: BahanMakanan) -> tuple:
+        """Konversi object bahan ke tuple parameter INSERT."""
+        jenis, faktor = jenis_dan_faktor(entity)
+        return (entity.get_nama(), jenis, entity.get_jumlah(), entity.get_satuan(),
+                faktor, _ke_epoch(entity.get_tanggal_masuk()))
+
+    @staticmethod
+    def _dari_baris(baris: tuple) -> BahanMakanan:
+        """Rekonstruksi object bahan sesuai jenisnya dari baris database."""
+        nama, jenis, jumlah, satuan, faktor, tanggal_masuk = baris
+        return buat_bahan(jenis, nama, jumlah, satuan, faktor, _dari_epoch(tanggal_masuk))
+
+    @sinkron
+    def add(self, entity: BahanMakanan) -> None:
+        """
+        Menambah bahan makanan baru atau menambah stok jika sudah ada.
+
+        Args:
+            entity (BahanMakanan): Bahan yang akan ditambahkan
+        """
+        with self.__koneksi:
+            cursor = self.__koneksi.execute(self._SQL_TAMBAH_STOK,
+                                            (entity.get_jumlah(), entity.get_nama()))
+            if cursor.rowcount == 0:
+                self.__koneksi.execute(self._SQL_INSERT, self._ke_baris(entity))
+                logger.info("Bahan %s ditambahkan ke database", entity.get_nama())
+            else:
+                logger.info("Stok %s ditambahkan", entity.get_nama())
+
+    @sinkron
+    def add_many(self, entities: Iterable[BahanMakanan]) -> None:
+        """
+        Menambah banyak bahan sekaligus dalam satu transaksi (executemany).
+        Bahan yang sudah ada akan ditambah stoknya.
+
+        Args:
+            entities (Iterable[BahanMakanan]): Bahan yang akan ditambahkan
+        """
+        baris = [self._ke_baris(e) for e in entities]
+        with self.__koneksi:
+            self.__koneksi.executemany(
+                self._SQL_INSERT + " ON CONFLICT(nama) DO UPDATE SET jumlah = jumlah + excluded.jumlah",
+                baris)
+        logger.info("%s bahan ditambahkan secara bulk", len(baris))
+
+    @sinkron
+    def get_by_id(self, entity_id: str) -> Optional[BahanMakanan]:
+        """
+        Mengambil bahan berdasarkan nama (sebagai ID).
+
+        Args:
+            entity_id (str): Nama bahan
+
+        Returns:
+            Optional[BahanMakanan]: Bahan jika ditemukan
+        """
+        baris = self.__koneksi.execute(self._SQL_SELECT + " WHERE nama = ?",
+                                       (entity_id,)).fetchone()
+        return self._dari_baris(baris) if baris else None
+
+    @sinkron
+    def get_all(self) -> List[BahanMakanan]:
+        """
+        Mengambil semua bahan.
+
+        Returns:
+            List[BahanMakanan]: List semua bahan
+        """
+        return [self._dari_baris(b) for b in
+                self.__koneksi.execute(self._SQL_SELECT + " ORDER BY rowid")]
+
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah bahan.
+
+        Returns:
+            int: Jumlah bahan
+        """
+        return self.__koneksi.execute("SELECT COUNT(*) FROM bahan").fetchone()[0]
+
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman bahan (keyset pagination berdasarkan rowid).
+
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah bahan per halaman
+
+        Returns:
+            Halaman: List bahan dan kursor halaman berikutnya (None jika habis)
+        """
+        return _halaman_rowid(self.__koneksi, self._SQL_SELECT, self._dari_baris, kursor, ukuran)
+
+    @sinkron
+    def update(self, entity: BahanMakanan) -> bool:
+        """
+        Memperbarui data bahan.
+
+        Args:
+            entity (BahanMakanan): Bahan yang diperbarui
+
+        Returns:
+            bool: True jika berhasil
+        """
+        jenis, faktor = jenis_dan_faktor(entity)
+        with self.__koneksi:
+            cursor = self.__koneksi.execute(
+                "UPDATE bahan SET jenis = ?, jumlah = ?, satuan = ?, faktor_porsi = ? WHERE nama = ?",
+                (jenis, entity.get_jumlah(), entity.get_satuan(), faktor, entity.get_nama()))
+        if cursor.rowcount == 0:
+            logger.warning("Bahan %s tidak ditemukan untuk update", entity.get_nama())
+            return False
+        logger.info("Bahan %s diperbarui", entity.get_nama())
+        return True
+
+    @sinkron
+    def delete(self, entity_id: str) -> bool:
+        """
+        Menghapus bahan.
+
+        Args:
+            entity_id (str): Nama bahan
+
+        Returns:
+            bool: True jika berhasil
+        """
+        with self.__koneksi:
+            cursor = self.__koneksi.execute("DELETE FROM bahan WHERE nama = ?", (entity_id,))
+        if cursor.rowcount == 0:
+            logger.warning("Bahan %s tidak ditemukan untuk dihapus", entity_id)
+            return False
+        logger.info("Bahan %s dihapus", entity_id)
+        return True
+
+    @sinkron
+    def get_stok_rendah(self, threshold: float = 10.0) -> List[BahanMakanan]:
+        """
+        Mendapatkan bahan dengan stok rendah (memakai index idx_bahan_jumlah).
+
+        Args:
+            threshold (float): Batas stok rendah
+
+        Returns:
+            List[BahanMakanan]: List bahan dengan stok rendah
+        """
+        return [self._dari_baris(b) for b in
+                self.__koneksi.execute(self._SQL_SELECT + " WHERE jumlah < ? ORDER BY jumlah",
+                                       (threshold,))]
+
+    @sinkron
+    def get_porsi_minimum(self) -> Optional[int]:
+        """
+        Mendapatkan porsi terkecil di antara semua bahan (memakai index idx_bahan_porsi).
+
+        Returns:
+            Optional[int]: Porsi minimum, None jika tabel kosong
+        """
+        return self.__koneksi.execute("SELECT MIN(porsi) FROM bahan").fetchone()[0]
+
+    @sinkron
+    def get_buku_stok(self) -> BukuStok:
+        """
+        Ledger mutasi stok yang dibangun dari tabel mutasi_stok. Hanya baris
+        yang belum dimuat (rowid > terakhir) yang dibaca, jadi pemanggilan
+        berikutnya O(mutasi baru).
+
+        Returns:
+            BukuStok: Ledger berisi seluruh mutasi yang tersimpan di database
+        """
+        for rowid, nama, waktu, selisih in self.__koneksi.execute(
+                "SELECT rowid, nama, waktu, selisih FROM mutasi_stok WHERE rowid > ? ORDER BY rowid",
+                (self.__mutasi_terakhir,)):
+            self.__buku_stok.catat_selisih(nama, selisih, waktu)
+            self.__mutasi_terakhir = rowid
+        return self.__buku_stok
+
+    @sinkron
+    def kurangi_stok_bersama(self, pengurangan: Sequence[Tuple[BahanMakanan, float]]) -> bool:
+        """
+        Mengurangi stok beberapa bahan secara all-or-nothing di database.
+        Cek dan pengurangan dilakukan oleh UPDATE ... WHERE jumlah >= ? dalam
+        satu transaksi, jadi object bahan hasil get_by_id (salinan) tidak
+        dipakai sebagai sumber stok dan posko bersamaan tidak bisa oversell.
+
+        Args:
+            pengurangan: Pasangan (bahan, jumlah) yang akan dikurangi
+
+        Returns:
+            bool: True jika semua stok dikurangi, False jika ada yang tidak cukup
+
+        Raises:
+            ValueError: Jika ada jumlah negatif
+        """
+        total = self.__total_per_nama(pengurangan)
+        with self.__koneksi:
+            for nama, jumlah in total.items():
+                cursor = self.__koneksi.execute(
+                    "UPDATE bahan SET jumlah = MAX(jumlah - ?, 0) WHERE nama = ? AND jumlah + ? >= ?",
+                    (jumlah, nama, TOLERANSI_STOK, jumlah))
+                if cursor.rowcount == 0:
+                    self.__koneksi.rollback()
+                    return False
+        return True
+
+    @sinkron
+    def kembalikan_stok(self, pengurangan: Sequence[Tuple[BahanMakanan, float]]) -> None:
+        """
+        Mengembalikan stok yang dikurangi kurangi_stok_bersama (satu transaksi).
+
+        Args:
+            pengurangan: Pasangan (bahan, jumlah) yang dikembalikan
+        """
+        with self.__koneksi:
+            self.__koneksi.executemany(
+                self._SQL_TAMBAH_STOK,
+                [(jumlah, nama) for nama, jumlah in self.__total_per_nama(pengurangan).items()])
+
+    @staticmethod
+    def __total_per_nama(pengurangan: Sequence[Tuple[BahanMakanan, float]]) -> Dict[str, float]:
+        """Menjumlahkan pengurangan per nama bahan (bahan yang sama bisa muncul dua kali)."""
+        total: Dict[str, float] = {}
+        for bahan, jumlah in pengurangan:
+            if jumlah < 0:
+                raise ValueError("Jumlah pengurangan tidak boleh negatif")
+            total[bahan.get_nama()] = total.get(bahan.get_nama(), 0.0) + jumlah
+        return total
+
+
+class SQLiteKorbanRepository(IRepository[Korban]):
+    """
+    Repository Korban berbasis SQLite.
+    Perilaku sama dengan KorbanRepository (ID duplikat ditolak).
+    """
+
+    _SQL_INSERT = ("INSERT INTO korban (id, nama, kebutuhan_khusus, jumlah_tanggungan, registered_date) "
+                   "VALUES (?, ?, ?, ?, ?)")
+    _SQL_SELECT = "SELECT id, nama, kebutuhan_khusus, jumlah_tanggungan, registered_date FROM korban"
+    # Batas jumlah parameter per query IN (...) agar aman untuk SQLite lama
+    _UKURAN_BLOK_IN = 500
+
+    def __init__(self, koneksi: sqlite3.Connection):
+        """
+        Constructor dengan koneksi yang sudah dibuka (lihat buka_koneksi).
+
+        Args:
+            koneksi (sqlite3.Connection): Koneksi database
+        """
+        self.__koneksi = koneksi
+        self._lock = _lock_koneksi(koneksi)
+        logger.info("SQLiteKorbanRepository diinisialisasi")
+
+    @staticmethod
+    def _ke_baris(entity: Korban) -> tuple:
+        """Konversi object korban ke tuple parameter INSERT."""
+        return (entity.get_id(), entity.get_name(), entity.get_kebutuhan_khusus(),
+                entity.get_jumlah_tanggungan(), _ke_epoch(entity.get_registered_date()))
+
+    @staticmethod
+    def _dari_baris(baris: tuple) -> Korban:
+        """Rekonstruksi object korban dari baris database."""
+        id_korban, nama, kebutuhan, tanggungan, registered_date = baris
+        return Korban(nama, id_korban, kebutuhan, tanggungan, _dari_epoch(registered_date))
+
+    @sinkron
+    def add(self, entity: Korban) -> None:
+        """
+        Menambah korban baru.
+
+        Args:
+            entity (Korban): Korban yang akan ditambahkan
+
+        Raises:
+            ValueError: Jika ID sudah ada
+        """
+        try:
+            with self.__koneksi:
+                self.__koneksi.execute(self._SQL_INSERT, self._ke_baris(entity))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Korban dengan ID {entity.get_id()} sudah ada")
+        logger.info("Korban %s ditambahkan ke database", entity.get_id())
+
+    @sinkron
+    def add_many(self, entities: Iterable[Korban]) -> List[Korban]:
+        """
+        Menambah banyak korban sekaligus dalam satu transaksi (executemany).
+        ID yang sudah ada dicek per blok dengan satu query IN (...) dan sebuah set.
+
+        Args:
+            entities (Iterable[Korban]): Korban yang akan ditambahkan
+
+        Returns:
+            List[Korban]: Korban yang ditolak karena ID sudah ada / duplikat di batch
+        """
+        entities = list(entities)
+        sudah_ada = set()
+        for awal in range(0, len(entities), self._UKURAN_BLOK_IN):
+            blok = [e.get_id() for e in entities[awal:awal + self._UKURAN_BLOK_IN]]
+            query = "SELECT id FROM korban WHERE id IN ({})".format(",".join("?" * len(blok)))
+            sudah_ada.update(baris[0] for baris in self.__koneksi.execute(query, blok))
+
+        ditolak, baris = [], []
+        for entity in entities:
+            if entity.get_id() in sudah_ada:
+                ditolak.append(entity)
+                continue
+            sudah_ada.add(entity.get_id())
+            baris.append(self._ke_baris(entity))
+        with self.__koneksi:
+            self.__koneksi.executemany(self._SQL_INSERT, baris)
+        logger.info("%s korban ditambahkan secara bulk, %s duplikat", len(baris), len(ditolak))
+        return ditolak
+
+    @sinkron
+    def get_by_id(self, entity_id: str) -> Optional[Korban]:
+        """
+        Mengambil korban berdasarkan ID.
+
+        Args:
+            entity_id (str): ID korban
+
+        Returns:
+            Optional[Korban]: Korban jika ditemukan
+        """
+        baris = self.__koneksi.execute(self._SQL_SELECT + " WHERE id = ?",
+                                       (entity_id,)).fetchone()
+        return self._dari_baris(baris) if baris else None
+
+    @sinkron
+    def get_all(self) -> List[Korban]:
+        """
+        Mengambil semua korban.
+
+        Returns:
+            List[Korban]: List semua korban
+        """
+        return [self._dari_baris(b) for b in
+                self.__koneksi.execute(self._SQL_SELECT + " ORDER BY rowid")]
+
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah korban.
+
+        Returns:
+            int: Jumlah korban
+        """
+        return self.__koneksi.execute("SELECT COUNT(*) FROM korban").fetchone()[0]
+
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman korban (keyset pagination berdasarkan rowid).
+
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah korban per halaman
+
+        Returns:
+            Halaman: List korban dan kursor halaman berikutnya (None jika habis)
+        """
+        return _halaman_rowid(self.__koneksi, self._SQL_SELECT, self._dari_baris, kursor, ukuran)
+
+    @sinkron
+    def update(self, entity: Korban) -> bool:
+        """
+        Memperbarui data korban.
+
+        Args:
+            entity (Korban): Korban yang diperbarui
+
+        Returns:
+            bool: True jika berhasil
+        """
+        with self.__koneksi:
+            cursor = self.__koneksi.execute(
+                "UPDATE korban SET nama = ?, kebutuhan_khusus = ?, jumlah_tanggungan = ? WHERE id = ?",
+                (entity.get_name(), entity.get_kebutuhan_khusus(),
+                 entity.get_jumlah_tanggungan(), entity.get_id()))
+        if cursor.rowcount == 0:
+            logger.warning("Korban %s tidak ditemukan untuk update", entity.get_id())
+            return False
+        logger.info("Korban %s diperbarui", entity.get_id())
+        return True
+
+    @sinkron
+    def delete(self, entity_id: str) -> bool:
+        """
+        Menghapus korban.
+
+        Args:
+            entity_id (str): ID korban
+
+        Returns:
+            bool: True jika berhasil
+        """
+        with self.__koneksi:
+            cursor = self.__koneksi.execute("DELETE FROM korban WHERE id = ?", (entity_id,))
+        if cursor.rowcount == 0:
+            logger.warning("Korban %s tidak ditemukan untuk dihapus", entity_id)
+            return False
+        logger.info("Korban %s dihapus", entity_id)
+        return True
+
+    @sinkron
+    def get_by_kebutuhan(self, kebutuhan: str) -> List[Korban]:
+        """
+        Mengambil korban berdasarkan kebutuhan khusus (memakai index idx_korban_kebutuhan).
+
+        Args:
+            kebutuhan (str): Jenis kebutuhan khusus
+
+        Returns:
+            List[Korban]: List korban dengan kebutuhan tertentu
+        """
+        return [self._dari_baris(b) for b in
+                self.__koneksi.execute(self._SQL_SELECT + " WHERE kebutuhan_khusus = ?",
+                                       (kebutuhan,))]
+
+    @sinkron
+    def get_total_tanggungan(self) -> int:
+        """
+        Menghitung total tanggungan semua korban.
+
+        Returns:
+            int: Total tanggungan
+        """
+        return self.__koneksi.execute(
+            "SELECT COALESCE(SUM(jumlah_tanggungan), 0) FROM korban").fetchone()[0]
+
+
+class SQLiteDistribusiRepository(IRepository[DistribusiMakanan]):
+    """
+    Repository Distribusi Makanan berbasis SQLite.
+    Perilaku sama dengan DistribusiRepository (ID duplikat ditolak).
+    """
+
+    _SQL_INSERT = ("INSERT INTO distribusi (id_distribusi, id_korban, jumlah_porsi, waktu_distribusi, catatan) "
+                   "VALUES (?, ?, ?, ?, ?)")
+    _SQL_SELECT = ("SELECT id_distribusi, id_korban, jumlah_porsi, waktu_distribusi, catatan "
+                   "FROM distribusi")
+
+    def __init__(self, koneksi: sqlite3.Connection):
+        """
+        Constructor dengan koneksi yang sudah dibuka (lihat buka_koneksi).
+
+        Args:
+            koneksi (sqlite3.Connection): Koneksi database
+        """
+        self.__koneksi = koneksi
+        self._lock = _lock_koneksi(koneksi)
+        logger.info("SQLiteDistribusiRepository diinisialisasi")
+
+    @staticmethod
+    def _ke_baris(entity: DistribusiMakanan) -> tuple:
+        """Konversi object distribusi ke tuple parameter INSERT."""
+        return (entity.get_id_distribusi(), entity.get_id_korban(), entity.get_jumlah_porsi(),
+                _ke_epoch(entity.get_waktu_distribusi()), entity.get_catatan())
+
+    @staticmethod
+    def _dari_baris(baris: tuple) -> DistribusiMakanan:
+        """Rekonstruksi object distribusi dari baris database."""
+        id_distribusi, id_korban, porsi, waktu, catatan = baris
+        return DistribusiMakanan(id_distribusi, id_korban, porsi, catatan, _dari_epoch(waktu))
+
+    @sinkron
+    def add(self, entity: DistribusiMakanan) -> None:
+        """
+        Menambah distribusi baru.
+
+        Args:
+            entity (DistribusiMakanan): Distribusi yang akan ditambahkan
+
+        Raises:
+            ValueError: Jika ID sudah ada
+        """
+        try:
+            with self.__koneksi:
+                self.__koneksi.execute(self._SQL_INSERT, self._ke_baris(entity))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Distribusi {entity.get_id_distribusi()} sudah ada")
+        logger.info("Distribusi %s ditambahkan", entity.get_id_distribusi())
+
+    @sinkron
+    def add_many(self, entities: Iterable[DistribusiMakanan]) -> None:
+        """
+        Menambah banyak distribusi sekaligus dalam satu transaksi (executemany).
+
+        Args:
+            entities (Iterable[DistribusiMakanan]): Distribusi yang akan ditambahkan
+
+        Raises:
+            ValueError: Jika ada ID duplikat (seluruh batch dibatalkan)
+        """
+        baris = [self._ke_baris(e) for e in entities]
+        try:
+            with self.__koneksi:
+                self.__koneksi.executemany(self._SQL_INSERT, baris)
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Batch distribusi berisi ID duplikat: {e}")
+        logger.info("%s distribusi ditambahkan secara bulk", len(baris))
+
+    @sinkron
+    def get_by_id(self, entity_id: str) -> Optional[DistribusiMakanan]:
+        """
+        Mengambil distribusi berdasarkan ID.
+
+        Args:
+            entity_id (str): ID distribusi
+
+        Returns:
+            Optional[DistribusiMakanan]: Distribusi jika ditemukan
+        """
+        baris = self.__koneksi.execute(self._SQL_SELECT + " WHERE id_distribusi = ?",
+                                       (entity_id,)).fetchone()
+        return self._dari_baris(baris) if baris else None
+
+    @sinkron
+    def get_all(self) -> List[DistribusiMakanan]:
+        """
+        Mengambil semua distribusi.
+
+        Returns:
+            List[DistribusiMakanan]: List semua distribusi
+        """
+        return [self._dari_baris(b) for b in
+                self.__koneksi.execute(self._SQL_SELECT + " ORDER BY rowid")]
+
+    @sinkron
+    def count(self) -> int:
+        """
+        Menghitung jumlah distribusi.
+
+        Returns:
+            int: Jumlah distribusi
+        """
+        return self.__koneksi.execute("SELECT COUNT(*) FROM distribusi").fetchone()[0]
+
+    @sinkron
+    def get_halaman(self, kursor: Optional[str] = None, ukuran: int = 100) -> Halaman:
+        """
+        Mengambil satu halaman distribusi (keyset pagination berdasarkan rowid).
+
+        Args:
+            kursor (str): Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran (int): Jumlah distribusi per halaman
+
+        Returns:
+            Halaman: List distribusi dan kursor halaman berikutnya (None jika habis)
+        """
+        return _halaman_rowid(self.__koneksi, self._SQL_SELECT, self._dari_baris, kursor, ukuran)
+
+    @sinkron
+    def update(self, entity: DistribusiMakanan) -> bool:
+        """
+        Memperbarui distribusi.
+
+        Args:
+            entity (DistribusiMakanan): Distribusi yang diperbarui
+
+        Returns:
+            bool: True jika berhasil
+        """
+        with self.__koneksi:
+            cursor = self.__koneksi.execute(
+                "UPDATE distribusi SET id_korban = ?, jumlah_porsi = ?, waktu_distribusi = ?, "
+                "catatan = ? WHERE id_distribusi = ?",
+                (entity.get_id_korban(), entity.get_jumlah_porsi(),
+                 _ke_epoch(entity.get_waktu_distribusi()), entity.get_catatan(),
+                 entity.get_id_distribusi()))
+        return cursor.rowcount > 0
+
+    @sinkron
+    def delete(self, entity_id: str) -> bool:
+        """
+        Menghapus distribusi.
+
+        Args:
+            entity_id (str): ID distribusi
+
+        Returns:
+            bool: True jika berhasil
+        """
+        with self.__koneksi:
+            cursor = self.__koneksi.execute("DELETE FROM distribusi WHERE id_distribusi = ?",
+                                            (entity_id,))
+        if cursor.rowcount == 0:
+            return False
+        logger.info("Distribusi %s dihapus", entity_id)
+        return True
+
+    @sinkron
+    def get_by_korban(self, id_korban: str) -> List[DistribusiMakanan]:
+        """
+        Mengambil riwayat distribusi untuk korban tertentu (memakai index idx_distribusi_korban).
+
+        Args:
+            id_korban (str): ID korban
+
+        Returns:
+            List[DistribusiMakanan]: List distribusi untuk korban
+        """
+        return [self._dari_baris(b) for b in
+                self.__koneksi.execute(self._SQL_SELECT + " WHERE id_korban = ? ORDER BY rowid",
+                                       (id_korban,))]
+
+    @staticmethod
+    def _filter_waktu(mulai: Optional[datetime], akhir: Optional[datetime]) -> tuple:
+        """Klausa WHERE dan parameter untuk rentang waktu [mulai, akhir)."""
+        syarat, parameter = [], []
+        for batas, operator in zip(batas_waktu(mulai, akhir), (">=", "<")):
+            if batas is not None:
+                syarat.append(f"waktu_distribusi {operator} ?")
+                parameter.append(batas)
+        return (" WHERE " + " AND ".join(syarat) if syarat else ""), tuple(parameter)
+
+    @sinkron
+    def get_by_waktu(self, mulai: Optional[datetime] = None,
+                     akhir: Optional[datetime] = None) -> List[DistribusiMakanan]:
+        """
+        Mengambil distribusi dengan mulai <= waktu < akhir, terurut menurut waktu
+        (range scan pada index idx_distribusi_waktu).
+
+        Args:
+            mulai (datetime): Batas bawah inklusif (None = tanpa batas)
+            akhir (datetime): Batas atas eksklusif (None = tanpa batas)
+
+        Returns:
+            List[DistribusiMakanan]: Distribusi dalam rentang waktu
+        """
+        where, parameter = self._filter_waktu(mulai, akhir)
+        return [self._dari_baris(b) for b in self.__koneksi.execute(
+            self._SQL_SELECT + where + " ORDER BY waktu_distribusi, rowid", parameter)]
+
+    @sinkron
+    def count_by_waktu(self, mulai: Optional[datetime] = None,
+                       akhir: Optional[datetime] = None) -> int:
+        """
+        Jumlah distribusi dengan mulai <= waktu < akhir (cukup membaca index).
+
+        Args:
+            mulai (datetime): Batas bawah inklusif (None = tanpa batas)
+            akhir (datetime): Batas atas eksklusif (None = tanpa batas)
+
+        Returns:
+            int: Jumlah distribusi dalam rentang waktu
+        """
+        where, parameter = self._filter_waktu(mulai, akhir)
+        return self.__koneksi.execute("SELECT COUNT(*) FROM distribusi" + where,
+                                      parameter).fetchone()[0]
+
+    @sinkron
+    def get_total_porsi_korban(self, id_korban: str) -> int:
+        """
+        Total porsi yang sudah diterima korban tertentu (memakai index idx_distribusi_korban).
+
+        Args:
+            id_korban (str): ID korban
+
+        Returns:
+            int: Total porsi untuk korban
+        """
+        return self.__koneksi.execute(
+            "SELECT COALESCE(SUM(jumlah_porsi), 0) FROM distribusi WHERE id_korban = ?",
+            (id_korban,)).fetchone()[0]
+
+    @sinkron
+    def get_total_porsi_terdistribusi(self) -> int:
+        """
+        Menghitung total porsi yang sudah didistribusikan.
+
+        Returns:
+            int: Total porsi
+        """
+        return self.__koneksi.execute(
+            "SELECT COALESCE(SUM(jumlah_porsi), 0) FROM distribusi").fetchone()[0]
@@ -0,0 +1,90 @@
+"""
+Module untuk impor stok bahan makanan dari file CSV / JSONL.
+Menerapkan SRP - fokus pada pembacaan, validasi dan pemuatan data penerimaan bahan.
+"""
+
+from typing import Dict, Optional
+from repositories.base_repository import IRepository
+from models.bahan_makanan import BahanMakanan, buat_bahan
+from services.impor_file import PencatatTolak, baca_chunk, tentukan_format
+from utils.logging_config import mode_senyap
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def bahan_dari_baris(baris: Optional[Dict]) -> BahanMakanan:
+    """
+    Membuat bahan dari satu baris data (key: jenis, nama, jumlah, satuan, per_porsi).
+
+    Raises:
+        ValueError: Jika baris tidak valid
+    """
+    if not isinstance(baris, dict):
+        raise ValueError("Format baris tidak valid")
+    try:
+        jumlah = float(baris.get("jumlah"))
+    except (TypeError, ValueError):
+        raise ValueError(f"Jumlah bukan angka: {baris.get('jumlah')}")
+    if jumlah <= 0:
+        raise ValueError("Jumlah bahan harus positif")
+    per_porsi = baris.get("per_porsi")
+    try:
+        per_porsi = None if per_porsi in (None, "") else float(per_porsi)
+    except (TypeError, ValueError):
+        raise ValueError(f"Takaran per porsi bukan angka: {per_porsi}")
+    return buat_bahan(str(baris.get("jenis") or "").strip().lower(),
+                      str(baris.get("nama") or "").strip(), jumlah,
+                      str(baris.get("satuan") or "kg").strip(), per_porsi)
+
+
+class BahanImporter:
+    """
+    Importer streaming untuk penerimaan bahan dalam jumlah besar.
+    Bahan dengan nama yang sudah ada menambah stoknya (perilaku repository.add).
+    """
+
+    def __init__(self, bahan_repo: IRepository[BahanMakanan], ukuran_chunk: int = 5000):
+        """
+        Constructor dengan Dependency Injection repository bahan.
+
+        Args:
+            bahan_repo: Repository bahan
+            ukuran_chunk: Jumlah baris yang dibaca per chunk
+        """
+        if ukuran_chunk < 1:
+            raise ValueError("Ukuran chunk minimal 1")
+        self.__bahan_repo = bahan_repo
+        self.__ukuran_chunk = ukuran_chunk
+
+    def impor(self, path: str, path_error: Optional[str] = None,
+              format_file: Optional[str] = None) -> Dict[str, int]:
+        """
+        Mengimpor bahan dari file CSV (header: jenis,nama,jumlah,satuan,per_porsi)
+        atau JSONL (satu object JSON per baris dengan key yang sama).
+
+        Args:
+            path: Path file sumber
+            path_error: Path file CSV untuk baris yang ditolak (opsional)
+            format_file: "csv" atau "jsonl" (default: dari ekstensi file)
+
+        Returns:
+            Dict: Ringkasan 'total_baris', 'berhasil' dan 'ditolak'
+        """
+        format_file = tentukan_format(path, format_file)
+        ringkasan = {'total_baris': 0, 'berhasil': 0, 'ditolak': 0}
+        with PencatatTolak(path_error) as tolak, mode_senyap():
+            for chunk in baca_chunk(path, format_file, self.__ukuran_chunk):
+                ringkasan['total_baris'] += len(chunk)
+                for nomor, baris in chunk:
+                    try:
+                        self.__bahan_repo.add(bahan_dari_baris(baris))
+                    except ValueError as e:
+                        tolak(nomor, str(e), baris)
+                        continue
+                    ringkasan['berhasil'] += 1
+            ringkasan['ditolak'] = tolak.jumlah
+
+        logger.info("Impor bahan dari %s: %s berhasil, %s ditolak",
+                    path, ringkasan['berhasil'], ringkasan['ditolak'])
+        return ringkasan
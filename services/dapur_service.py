@@ -3,16 +3,35 @@ Module untuk Service Layer Dapur Umum.
 Menerapkan Business Logic dan SOLID Principles.
 """
 
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
 from repositories.base_repository import IRepository
-from models.bahan_makanan import BahanMakanan, BahanPokok, BahanProtein
+from models.bahan_makanan import BahanMakanan
+from models.katalog_porsi import KatalogPorsi
+from models.resep import Resep
 from models.person import Korban
 from models.distribusi import DistribusiMakanan
-from datetime import datetime
+from services.laporan_paralel import MesinLaporan
+from services.prakiraan_konsumsi import PrakiraanKonsumsi
+from utils.id_generator import id_berikutnya, id_berikutnya_banyak
+from utils.logging_config import senyap_thread
 import logging
+import math
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Asumsi kebutuhan jika riwayat distribusi belum cukup untuk prakiraan
+MAKAN_PER_HARI = 3
+# Batas bawah kebutuhan harian per tanggungan walaupun prakiraan lebih rendah
+# (hari sepi distribusi tidak boleh membuat stok tampak cukup berbulan-bulan)
+MAKAN_MINIMUM_PER_HARI = 2
+# Jumlah hari penuh sejak distribusi pertama sebelum prakiraan dipakai
+HARI_PRAKIRAAN_MINIMUM = 3
+
+# Jenis detail yang bisa dipaging lewat get_halaman_detail / iter_detail
+JENIS_DETAIL = ('bahan', 'korban', 'distribusi')
+
 
 class DapurService:
     """
@@ -26,7 +45,8 @@ class DapurService:
     def __init__(self, 
                  bahan_repo: IRepository[BahanMakanan],
                  korban_repo: IRepository[Korban],
-                 distribusi_repo: IRepository[DistribusiMakanan]):
+                 distribusi_repo: IRepository[DistribusiMakanan],
+                 resep: Optional[Resep] = None):
         """
         Constructor dengan Dependency Injection (DIP).
         
@@ -34,12 +54,32 @@ class DapurService:
             bahan_repo:  Repository untuk bahan makanan
             korban_repo: Repository untuk korban
             distribusi_repo:  Repository untuk distribusi
+            resep: Resep menu yang dimasak (None = semua bahan di inventori
+                dengan takaran bawaan masing-masing)
         """
         self.__bahan_repo = bahan_repo
         self.__korban_repo = korban_repo
         self.__distribusi_repo = distribusi_repo
+        self.__resep = resep
+        # Prakiraan konsumsi dibangun saat pertama dipakai, lalu diperbarui per distribusi
+        self.__prakiraan: Optional[PrakiraanKonsumsi] = None
+        self.__lock_prakiraan = threading.Lock()
         logger.info("DapurService diinisialisasi dengan dependency injection")
     
+    def get_resep(self) -> Optional[Resep]:
+        """Getter untuk resep aktif (None = resep bawaan dari inventori)."""
+        return self.__resep
+    
+    def set_resep(self, resep: Optional[Resep]) -> None:
+        """
+        Mengganti resep menu yang dimasak.
+        
+        Args:
+            resep: Resep baru (None = kembali ke resep bawaan dari inventori)
+        """
+        self.__resep = resep
+        logger.info("Resep aktif: %s", resep.get_nama() if resep else "bawaan inventori")
+    
     def tambah_bahan(self, bahan: BahanMakanan) -> None:
         """
         Menambah bahan makanan ke inventori.
@@ -55,13 +95,13 @@ class DapurService:
                 raise ValueError("Jumlah bahan harus positif")
             
             self.__bahan_repo.add(bahan)
-            logger.info(f"Bahan {bahan.get_nama()} berhasil ditambahkan")
+            logger.info("Bahan %s berhasil ditambahkan", bahan.get_nama())
             
             # Warning jika stok masih rendah
             if bahan.get_jumlah() < 20:
-                logger.warning(f"Stok {bahan. get_nama()} masih rendah: {bahan.get_jumlah()}")
+                logger.warning("Stok %s masih rendah: %s", bahan.get_nama(), bahan.get_jumlah())
         except Exception as e: 
-            logger.error(f"Error tambah bahan: {e}")
+            logger.error("Error tambah bahan: %s", e)
             raise
     
     def registrasi_korban(self, korban: Korban) -> None:
@@ -80,9 +120,9 @@ class DapurService:
                 raise ValueError(f"Korban dengan ID {korban.get_id()} sudah terdaftar")
             
             self.__korban_repo.add(korban)
-            logger.info(f"Korban {korban.get_name()} berhasil diregistrasi")
+            logger.info("Korban %s berhasil diregistrasi", korban.get_name())
         except Exception as e:
-            logger.error(f"Error registrasi korban: {e}")
+            logger.error("Error registrasi korban: %s", e)
             raise
     
     def distribusi_makanan(self, id_korban: str, jumlah_porsi: int) -> DistribusiMakanan:
@@ -110,128 +150,465 @@ class DapurService:
             if jumlah_porsi > porsi_tersedia:
                 raise ValueError(f"Porsi tidak cukup.  Tersedia: {porsi_tersedia}, Diminta: {jumlah_porsi}")
             
-            # Kurangi stok bahan (simplified - ambil dari bahan pokok)
-            bahan_list = self.__bahan_repo. get_all()
-            for bahan in bahan_list:
-                if isinstance(bahan, BahanPokok):
-                    # Hitung kebutuhan bahan
-                    kg_dibutuhkan = (jumlah_porsi * 0.25)  # 250g per porsi
-                    if bahan.get_jumlah() >= kg_dibutuhkan:
-                        bahan.kurangi_stok(kg_dibutuhkan)
-                        break
+            # Kurangi stok semua bahan resep. Cek di atas hanya perkiraan;
+            # pengurangan atomik inilah yang menentukan, sehingga posko yang
+            # berjalan bersamaan tidak oversell.
+            pengurangan = self._kurangi_stok_resep(jumlah_porsi)
+            if pengurangan is None:
+                raise ValueError(f"Stok bahan tidak cukup untuk {jumlah_porsi} porsi")
             
             # Buat distribusi
-            id_distribusi = f"DIST-{datetime.now().strftime('%Y%m%d%H%M%S')}-{id_korban}"
+            id_distribusi = f"{id_berikutnya('DIST')}-{id_korban}"
             distribusi = DistribusiMakanan(id_distribusi, id_korban, jumlah_porsi)
-            self.__distribusi_repo.add(distribusi)
+            try:
+                with self.__lock_prakiraan:
+                    self.__distribusi_repo.add(distribusi)
+                    self.__catat_prakiraan([distribusi])
+            except Exception:
+                self._kembalikan_stok(pengurangan)
+                raise
             
-            logger.info(f"Distribusi {jumlah_porsi} porsi ke {korban.get_name()} berhasil")
+            logger.info("Distribusi %s porsi ke %s berhasil", jumlah_porsi, korban.get_name())
             return distribusi
         except Exception as e:
-            logger.error(f"Error distribusi:  {e}")
+            logger.error("Error distribusi:  %s", e)
             raise
     
+    def distribusi_makanan_batch(self, permintaan: Iterable[Tuple[str, int]],
+                                 catatan: str = "") -> List[Dict[str, any]]:
+        """
+        Mendistribusikan makanan ke banyak korban sekaligus (misal saat jam makan).
+        
+        Korban divalidasi dalam satu lintasan, ketersediaan porsi dicek sekali,
+        stok dikurangi secara agregat dan semua record distribusi disimpan bersama.
+        Permintaan yang gagal dilaporkan per item tanpa membatalkan seluruh batch;
+        permintaan diproses berurutan sampai porsi tersedia habis.
+        
+        Args:
+            permintaan: Pasangan (id_korban, jumlah_porsi)
+            catatan: Catatan yang dilekatkan ke setiap distribusi
+            
+        Returns:
+            List[Dict]: Hasil per item sesuai urutan input, berisi key
+                'id_korban', 'jumlah_porsi', 'berhasil', 'distribusi' dan 'error'
+        """
+        permintaan = list(permintaan)
+        hasil = [{'id_korban': id_korban, 'jumlah_porsi': jumlah_porsi,
+                  'berhasil': False, 'distribusi': None, 'error': None}
+                 for id_korban, jumlah_porsi in permintaan]
+        
+        # Validasi korban: satu lookup per ID unik
+        korban_ada = {id_korban: self.__korban_repo.get_by_id(id_korban) is not None
+                      for id_korban in {p[0] for p in permintaan}}
+        
+        # Validasi ketersediaan porsi sekali untuk seluruh batch
+        porsi_tersisa = self.hitung_total_porsi_tersedia()
+        diterima = []
+        for item in hasil:
+            if not korban_ada[item['id_korban']]:
+                item['error'] = f"Korban dengan ID {item['id_korban']} tidak ditemukan"
+            elif item['jumlah_porsi'] < 1:
+                item['error'] = "Jumlah porsi minimal 1"
+            elif item['jumlah_porsi'] > porsi_tersisa:
+                item['error'] = (f"Porsi tidak cukup. Tersedia: {porsi_tersisa}, "
+                                 f"Diminta: {item['jumlah_porsi']}")
+            else:
+                porsi_tersisa -= item['jumlah_porsi']
+                diterima.append(item)
+        
+        if not diterima:
+            logger.warning("Distribusi batch: 0 dari %s permintaan diproses", len(hasil))
+            return hasil
+        
+        # Kurangi stok secara agregat lalu simpan semua record bersama
+        total_porsi = sum(item['jumlah_porsi'] for item in diterima)
+        pengurangan = self._kurangi_stok_resep(total_porsi)
+        if pengurangan is None:
+            # Stok berubah sejak dicek (posko lain): tolak tanpa mengubah stok
+            for item in diterima:
+                item['error'] = f"Stok bahan tidak cukup untuk {total_porsi} porsi batch"
+            logger.warning("Distribusi batch: stok bahan tidak cukup untuk %s porsi", total_porsi)
+            return hasil
+        
+        id_list = id_berikutnya_banyak('DIST', len(diterima))
+        try:
+            # Log per record dibungkam untuk thread ini saja; ringkasan batch
+            # tetap dicatat di bawah dan posko lain tetap tercatat per distribusi
+            with senyap_thread():
+                distribusi_list = [
+                    DistribusiMakanan(f"{id_distribusi}-{item['id_korban']}",
+                                      item['id_korban'], item['jumlah_porsi'], catatan)
+                    for id_distribusi, item in zip(id_list, diterima)
+                ]
+                with self.__lock_prakiraan:
+                    self.__distribusi_repo.add_many(distribusi_list)
+                    self.__catat_prakiraan(distribusi_list)
+        except Exception as e:
+            # Kembalikan stok agar tidak ada porsi yang hilang tanpa tercatat
+            self._kembalikan_stok(pengurangan)
+            for item in diterima:
+                item['error'] = f"Gagal menyimpan distribusi: {e}"
+            logger.error("Error distribusi batch: %s", e)
+            return hasil
+        
+        for item, distribusi in zip(diterima, distribusi_list):
+            item['berhasil'] = True
+            item['distribusi'] = distribusi
+        
+        logger.info("Distribusi batch: %s dari %s permintaan, %s porsi",
+                    len(diterima), len(hasil), total_porsi)
+        return hasil
+    
+    def __takaran_resep(self) -> Optional[List[Tuple[BahanMakanan, float]]]:
+        """
+        Pasangan (bahan, takaran per porsi) untuk resep aktif.
+        
+        Returns:
+            Optional[List]: None jika ada bahan resep yang tidak ada di inventori
+        """
+        if self.__resep is None:
+            return [(b, b.get_takaran_per_porsi()) for b in self.__bahan_repo.get_all()]
+        takaran_bahan = []
+        for nama, takaran in self.__resep.get_takaran().items():
+            bahan = self.__bahan_repo.get_by_id(nama)
+            if bahan is None:
+                return None
+            takaran_bahan.append((bahan, takaran))
+        return takaran_bahan
+    
+    def _kurangi_stok_resep(self, jumlah_porsi: int) -> Optional[List[Tuple[BahanMakanan, float]]]:
+        """
+        Mengurangi stok semua bahan resep untuk sejumlah porsi sekaligus.
+        Cek dan pengurangan diserahkan ke repository (kurangi_stok_bersama):
+        lock per bahan di memori, satu transaksi UPDATE ... WHERE jumlah >= ?
+        di SQLite. Pengurangan bersifat all-or-nothing, jadi aman dipanggil dari
+        beberapa thread dan tidak pernah menyisakan resep yang terpotong sebagian.
+        
+        Args:
+            jumlah_porsi: Jumlah porsi yang dimasak
+            
+        Returns:
+            Optional[List[Tuple[BahanMakanan, float]]]: Bahan dan jumlah yang
+                dikurangi, None jika ada bahan yang tidak cukup
+        """
+        takaran_bahan = self.__takaran_resep()
+        if not takaran_bahan:
+            return None
+        pengurangan = [(bahan, jumlah_porsi * takaran) for bahan, takaran in takaran_bahan]
+        if not self.__bahan_repo.kurangi_stok_bersama(pengurangan):
+            return None
+        return pengurangan
+    
+    def _kembalikan_stok(self, pengurangan: List[Tuple[BahanMakanan, float]]) -> None:
+        """
+        Mengembalikan stok yang sudah dikurangi _kurangi_stok_resep
+        (dipakai saat distribusi gagal disimpan).
+        
+        Args:
+            pengurangan: Pasangan (bahan, jumlah) dari _kurangi_stok_resep
+        """
+        self.__bahan_repo.kembalikan_stok(pengurangan)
+    
+    def __catat_prakiraan(self, distribusi_list: List[DistribusiMakanan]) -> None:
+        """Mencatat distribusi baru ke prakiraan (harus dipanggil di bawah __lock_prakiraan)."""
+        if self.__prakiraan is not None:
+            for distribusi in distribusi_list:
+                self.__prakiraan.catat(distribusi.get_jumlah_porsi(), distribusi.get_waktu_epoch())
+    
+    def get_prakiraan(self) -> PrakiraanKonsumsi:
+        """
+        Prakiraan laju konsumsi. Pemanggilan pertama membaca riwayat distribusi
+        sekali; setelah itu setiap distribusi baru dicatat dalam O(1).
+        Penyimpanan distribusi dan pencatatan prakiraan memakai lock yang sama
+        sehingga tidak ada distribusi yang terhitung dua kali.
+        
+        Returns:
+            PrakiraanKonsumsi: Prakiraan milik service ini
+        """
+        with self.__lock_prakiraan:
+            if self.__prakiraan is None:
+                self.__prakiraan = PrakiraanKonsumsi.dari_riwayat(
+                    self.__distribusi_repo.iter_semua(), hari_minimum=HARI_PRAKIRAAN_MINIMUM)
+            return self.__prakiraan
+    
+    def __porsi_bahan_terpakai(self) -> Dict[str, int]:
+        """Porsi yang bisa dibuat dari setiap bahan yang dipakai resep aktif."""
+        if self.__resep is None:
+            return self.hitung_porsi_per_bahan()
+        porsi = {}
+        for nama, takaran in self.__resep.get_takaran().items():
+            bahan = self.__bahan_repo.get_by_id(nama)
+            porsi[nama] = int(bahan.get_jumlah() / takaran) if bahan is not None else 0
+        return porsi
+    
     def hitung_total_porsi_tersedia(self) -> int:
         """
         Menghitung total porsi yang bisa dibuat dari semua bahan.
-        Menerapkan Polymorphism - memanggil hitung_porsi() yang berbeda untuk setiap jenis bahan.
+        Menerapkan Polymorphism - porsi tiap bahan dihitung dengan hitung_porsi() masing-masing.
+        
+        Tanpa resep, nilai bottleneck dibaca dari agregat yang dijaga repository
+        secara inkremental (get_porsi_minimum), sehingga tidak perlu menghitung
+        ulang semua bahan. Dengan resep, porsi dihitung dari stok bahan resep saja.
+        Keduanya memakai takaran yang sama dengan _kurangi_stok_resep.
         
         Returns:
             int: Total porsi minimum yang bisa dibuat
         """
         try:
-            bahan_list = self.__bahan_repo.get_all()
-            
-            if not bahan_list:
-                return 0
-            
-            # Hitung porsi minimum dari semua bahan (bottleneck)
-            porsi_list = [bahan.hitung_porsi() for bahan in bahan_list]
-            return min(porsi_list) if porsi_list else 0
+            if self.__resep is not None:
+                stok = {}
+                for nama in self.__resep.get_nama_bahan():
+                    bahan = self.__bahan_repo.get_by_id(nama)
+                    stok[nama] = bahan.get_jumlah() if bahan is not None else 0.0
+                return self.__resep.hitung_porsi(stok)
+            porsi_minimum = self.__bahan_repo.get_porsi_minimum()
+            return porsi_minimum if porsi_minimum is not None else 0
         except Exception as e: 
-            logger.error(f"Error hitung porsi: {e}")
+            logger.error("Error hitung porsi: %s", e)
             return 0
     
-    def get_laporan_stok(self) -> Dict[str, any]:
+    def hitung_porsi_per_bahan(self) -> Dict[str, int]:
         """
-        Mendapatkan laporan lengkap stok bahan. 
+        Menghitung porsi setiap bahan di inventori sekaligus.
+        Bahan dibaca per halaman ke KatalogPorsi lalu porsinya dihitung dalam
+        satu ekspresi vektor (NumPy jika tersedia); hasilnya sama dengan
+        hitung_porsi() masing-masing bahan.
         
         Returns:
-            Dict:  Laporan stok
+            Dict[str, int]: Nama bahan -> porsi yang bisa dibuat
         """
         try:
-            bahan_list = self.__bahan_repo.get_all()
-            total_porsi = self.hitung_total_porsi_tersedia()
-            stok_rendah = self.__bahan_repo.get_stok_rendah(15.0)
+            return KatalogPorsi.dari_bahan(self.__bahan_repo.iter_semua()).porsi_per_bahan()
+        except Exception as e:
+            logger.error("Error hitung porsi per bahan: %s", e)
+            return {}
+    
+    def __repo_detail(self, jenis: str) -> IRepository:
+        """
+        Memilih repository untuk detail laporan.
+        
+        Raises:
+            ValueError: Jika jenis tidak dikenal
+        """
+        repo = {
+            'bahan': self.__bahan_repo,
+            'korban': self.__korban_repo,
+            'distribusi': self.__distribusi_repo,
+        }.get(jenis)
+        if repo is None:
+            raise ValueError(f"Jenis detail tidak dikenal: {jenis} (pilih: {', '.join(JENIS_DETAIL)})")
+        return repo
+    
+    def get_halaman_detail(self, jenis: str, kursor: Optional[str] = None,
+                           ukuran: int = 50) -> Dict[str, any]:
+        """
+        Mengambil satu halaman baris detail laporan (cursor paging).
+        Hanya entitas di halaman tersebut yang dibaca dari repository.
+        
+        Args:
+            jenis: 'bahan', 'korban' atau 'distribusi'
+            kursor: Kursor dari halaman sebelumnya (None = halaman pertama)
+            ukuran: Jumlah baris per halaman
+            
+        Returns:
+            Dict: 'detail' (list get_info()) dan 'kursor_berikut' (None jika habis)
             
+        Raises:
+            ValueError: Jika jenis, kursor atau ukuran tidak valid
+        """
+        entitas, kursor_berikut = self.__repo_detail(jenis).get_halaman(kursor, ukuran)
+        return {
+            'detail': [e.get_info() for e in entitas],
+            'kursor_berikut': kursor_berikut
+        }
+    
+    def iter_detail(self, jenis: str, ukuran_halaman: int = 500) -> Iterator[str]:
+        """
+        Generator baris detail laporan (get_info() setiap entitas).
+        Data dibaca per halaman sehingga memori tetap sebesar satu halaman.
+        
+        Args:
+            jenis: 'bahan', 'korban' atau 'distribusi'
+            ukuran_halaman: Jumlah entitas yang dibaca sekaligus
+            
+        Yields:
+            str: Info satu entitas
+        """
+        for entity in self.__repo_detail(jenis).iter_semua(ukuran_halaman):
+            yield entity.get_info()
+    
+    def get_ringkasan_stok(self) -> Dict[str, any]:
+        """
+        Mendapatkan angka ringkasan stok tanpa membuat baris detail.
+        
+        Returns:
+            Dict: Ringkasan stok
+        """
+        try:
+            stok_rendah = self.__bahan_repo.get_stok_rendah(15.0)
             return {
-                'total_jenis_bahan': len(bahan_list),
-                'total_porsi_tersedia': total_porsi,
+                'total_jenis_bahan': self.__bahan_repo.count(),
+                'total_porsi_tersedia': self.hitung_total_porsi_tersedia(),
                 'bahan_stok_rendah': len(stok_rendah),
-                'detail_bahan': [b.get_info() for b in bahan_list],
                 'warning_stok_rendah': [b.get_nama() for b in stok_rendah]
             }
         except Exception as e:
-            logger. error(f"Error laporan stok: {e}")
+            logger.error("Error ringkasan stok: %s", e)
             return {
                 'total_jenis_bahan': 0,
                 'total_porsi_tersedia': 0,
                 'bahan_stok_rendah': 0,
-                'detail_bahan': [],
                 'warning_stok_rendah': []
             }
     
-    def get_laporan_korban(self) -> Dict[str, any]:
+    def get_riwayat_stok(self, nama_bahan: str, waktu: Optional[datetime] = None,
+                         mulai: Optional[datetime] = None) -> Dict[str, any]:
+        """
+        Stok bahan pada waktu tertentu dari ledger mutasi stok repository
+        (get_buku_stok), misal "stok beras jam 06:00 tadi pagi".
+        
+        Args:
+            nama_bahan: Nama bahan
+            waktu: Waktu yang ditanyakan (default: sekarang)
+            mulai: Jika diisi, sertakan ringkasan masuk/keluar dalam [mulai, waktu)
+            
+        Returns:
+            Dict: bahan, waktu, stok dan (opsional) mutasi
+            
+        Raises:
+            ValueError: Jika repository bahan tidak memakai ledger stok
+        """
+        buku_stok = self.__bahan_repo.get_buku_stok()
+        if buku_stok is None:
+            raise ValueError("Ledger stok tidak aktif untuk inventori ini")
+        waktu = waktu or datetime.now()
+        hasil = {
+            'bahan': nama_bahan,
+            'waktu': waktu.isoformat(timespec='seconds'),
+            'stok': buku_stok.get_stok_pada(nama_bahan, waktu),
+        }
+        if mulai is not None:
+            hasil['mutasi'] = buku_stok.get_ringkasan_mutasi(nama_bahan, mulai, waktu)
+        return hasil
+    
+    def get_ringkasan_korban(self) -> Dict[str, any]:
         """
-        Mendapatkan laporan data korban.
+        Mendapatkan angka ringkasan korban dari agregat repository
+        (count dan total tanggungan) tanpa membaca data korban.
         
         Returns:
-            Dict: Laporan korban
+            Dict: Ringkasan korban
         """
         try:
-            korban_list = self.__korban_repo.get_all()
-            total_tanggungan = self.__korban_repo.get_total_tanggungan()
-            
             return {
-                'total_korban': len(korban_list),
-                'total_tanggungan': total_tanggungan,
-                'detail_korban':  [k.get_info() for k in korban_list]
+                'total_korban': self.__korban_repo.count(),
+                'total_tanggungan': self.__korban_repo.get_total_tanggungan()
             }
         except Exception as e:
-            logger.error(f"Error laporan korban:  {e}")
+            logger.error("Error ringkasan korban: %s", e)
             return {
                 'total_korban': 0,
-                'total_tanggungan': 0,
-                'detail_korban': []
+                'total_tanggungan': 0
             }
     
-    def get_laporan_distribusi(self) -> Dict[str, any]:
+    def get_ringkasan_distribusi(self) -> Dict[str, any]:
         """
-        Mendapatkan laporan distribusi makanan.
+        Mendapatkan angka ringkasan distribusi dari agregat repository.
         
         Returns:
-            Dict: Laporan distribusi
+            Dict: Ringkasan distribusi
         """
-        try: 
-            distribusi_list = self.__distribusi_repo.get_all()
-            total_porsi = self.__distribusi_repo.get_total_porsi_terdistribusi()
-            
+        try:
             return {
-                'total_distribusi': len(distribusi_list),
-                'total_porsi_terdistribusi': total_porsi,
-                'detail_distribusi': [d.get_info() for d in distribusi_list]
+                'total_distribusi': self.__distribusi_repo.count(),
+                'total_porsi_terdistribusi': self.__distribusi_repo.get_total_porsi_terdistribusi()
             }
         except Exception as e:
-            logger.error(f"Error laporan distribusi: {e}")
+            logger.error("Error ringkasan distribusi: %s", e)
             return {
                 'total_distribusi': 0,
-                'total_porsi_terdistribusi': 0,
-                'detail_distribusi': []
+                'total_porsi_terdistribusi': 0
             }
     
+    def get_laporan_stok(self) -> Dict[str, any]:
+        """
+        Mendapatkan laporan lengkap stok bahan (ringkasan + semua detail).
+        Untuk data besar gunakan get_ringkasan_stok dan get_halaman_detail.
+        
+        Returns:
+            Dict:  Laporan stok
+        """
+        laporan = self.get_ringkasan_stok()
+        laporan['detail_bahan'] = self.__detail_lengkap('bahan')
+        return laporan
+    
+    def get_laporan_korban(self, jumlah_proses: int = 0) -> Dict[str, any]:
+        """
+        Mendapatkan laporan data korban (ringkasan + semua detail).
+        Untuk data besar gunakan get_ringkasan_korban dan get_halaman_detail.
+        
+        Args:
+            jumlah_proses: Jumlah worker MesinLaporan untuk baris detail
+                (0 = dihitung serial di proses ini; hasilnya sama)
+        
+        Returns:
+            Dict: Laporan korban
+        """
+        laporan = self.get_ringkasan_korban()
+        laporan['detail_korban'] = self.__detail_lengkap('korban', jumlah_proses)
+        return laporan
+    
+    def get_laporan_distribusi(self, jumlah_proses: int = 0) -> Dict[str, any]:
+        """
+        Mendapatkan laporan distribusi makanan (ringkasan + semua detail).
+        Untuk data besar gunakan get_ringkasan_distribusi dan get_halaman_detail.
+        
+        Args:
+            jumlah_proses: Jumlah worker MesinLaporan untuk baris detail
+                (0 = dihitung serial di proses ini; hasilnya sama)
+        
+        Returns:
+            Dict: Laporan distribusi
+        """
+        laporan = self.get_ringkasan_distribusi()
+        laporan['detail_distribusi'] = self.__detail_lengkap('distribusi', jumlah_proses)
+        return laporan
+    
+    def buat_mesin_laporan(self, jumlah_proses: int = 0, ukuran_chunk: int = 20000) -> MesinLaporan:
+        """
+        Membuat MesinLaporan di atas repository korban dan distribusi service ini.
+        
+        Args:
+            jumlah_proses: Jumlah worker process pool (0 = serial)
+            ukuran_chunk: Jumlah entitas per chunk
+            
+        Returns:
+            MesinLaporan: Mesin laporan partisi
+        """
+        return MesinLaporan(self.__korban_repo, self.__distribusi_repo, jumlah_proses, ukuran_chunk)
+    
+    def __detail_lengkap(self, jenis: str, jumlah_proses: int = 0) -> List[str]:
+        """Semua baris detail sebagai list (list kosong jika terjadi error)."""
+        try:
+            if jumlah_proses > 0 and jenis == 'korban':
+                return self.buat_mesin_laporan(jumlah_proses).laporan_korban()['detail_korban']
+            if jumlah_proses > 0 and jenis == 'distribusi':
+                return self.buat_mesin_laporan(jumlah_proses).laporan_distribusi()['detail_distribusi']
+            return list(self.iter_detail(jenis))
+        except Exception as e:
+            logger.error("Error detail laporan %s: %s", jenis, e)
+            return []
+    
     def cek_kebutuhan_gizi(self) -> Dict[str, any]: 
         """
-        Mengecek kecukupan gizi berdasarkan jumlah korban dan stok.
+        Mengecek kecukupan gizi berdasarkan laju konsumsi dan stok.
+        
+        Kebutuhan harian dibaca dari prakiraan EWMA riwayat distribusi
+        (get_prakiraan) setelah riwayat mencakup HARI_PRAKIRAAN_MINIMUM hari
+        penuh; sebelum itu dipakai asumsi MAKAN_PER_HARI porsi per tanggungan.
+        Prakiraan tidak pernah dipakai di bawah MAKAN_MINIMUM_PER_HARI porsi
+        per tanggungan (sumber 'batas_bawah'). Estimasi hari juga dihitung per
+        bahan yang dipakai resep, sehingga bahan yang habis duluan terlihat.
         
         Returns:
             Dict: Status kebutuhan gizi
@@ -240,9 +617,24 @@ class DapurService:
             total_tanggungan = self.__korban_repo.get_total_tanggungan()
             porsi_tersedia = self.hitung_total_porsi_tersedia()
             
-            # Asumsi: 3 kali makan per hari
-            kebutuhan_harian = total_tanggungan * 3
-            hari_bertahan = porsi_tersedia // kebutuhan_harian if kebutuhan_harian > 0 else 0
+            laju = self.get_prakiraan().laju_harian()
+            batas_bawah = total_tanggungan * MAKAN_MINIMUM_PER_HARI
+            if laju is None:
+                kebutuhan_harian = total_tanggungan * MAKAN_PER_HARI
+                sumber = 'asumsi'
+            elif laju < batas_bawah:
+                kebutuhan_harian = batas_bawah
+                sumber = 'batas_bawah'
+            else:
+                kebutuhan_harian = math.ceil(laju)
+                sumber = 'prakiraan'
+            
+            if kebutuhan_harian > 0:
+                hari_bertahan = porsi_tersedia // kebutuhan_harian
+                hari_per_bahan = {nama: porsi // kebutuhan_harian
+                                  for nama, porsi in self.__porsi_bahan_terpakai().items()}
+            else:
+                hari_bertahan, hari_per_bahan = 0, {}
             
             if hari_bertahan >= 7:
                 status = "AMAN"
@@ -255,15 +647,21 @@ class DapurService:
                 'total_tanggungan': total_tanggungan,
                 'porsi_tersedia': porsi_tersedia,
                 'kebutuhan_harian': kebutuhan_harian,
+                'sumber_kebutuhan': sumber,
+                'laju_konsumsi': round(laju, 2) if laju is not None else None,
                 'estimasi_hari':  hari_bertahan,
+                'estimasi_hari_per_bahan': hari_per_bahan,
                 'status': status
             }
         except Exception as e:
-            logger.error(f"Error cek gizi: {e}")
+            logger.error("Error cek gizi: %s", e)
             return {
                 'total_tanggungan': 0,
                 'porsi_tersedia': 0,
                 'kebutuhan_harian': 0,
+                'sumber_kebutuhan': 'asumsi',
+                'laju_konsumsi': None,
                 'estimasi_hari': 0,
+                'estimasi_hari_per_bahan': {},
                 'status': 'ERROR'
-            }
\ No newline at end of file
+            }
@@ -0,0 +1,96 @@
+"""
+Module untuk distribusi massal dari file CSV / JSONL (misal daftar jatah makan).
+Setiap chunk file diproses lewat DapurService.distribusi_makanan_batch.
+"""
+
+from typing import Dict, Optional, Tuple
+from services.dapur_service import DapurService
+from services.impor_file import PencatatTolak, baca_chunk, tentukan_format
+from utils.logging_config import mode_senyap
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def permintaan_dari_baris(baris: Optional[Dict]) -> Tuple[str, int]:
+    """
+    Mengambil (id_korban, jumlah_porsi) dari satu baris data.
+
+    Raises:
+        ValueError: Jika baris tidak valid
+    """
+    if not isinstance(baris, dict):
+        raise ValueError("Format baris tidak valid")
+    id_korban = str(baris.get("id_korban") or "").strip()
+    if not id_korban:
+        raise ValueError("ID korban tidak boleh kosong")
+    try:
+        jumlah_porsi = int(baris.get("jumlah_porsi"))
+    except (TypeError, ValueError):
+        raise ValueError(f"Jumlah porsi bukan bilangan bulat: {baris.get('jumlah_porsi')}")
+    return id_korban, jumlah_porsi
+
+
+class DistribusiImporter:
+    """
+    Distribusi streaming dari file: file dibaca per chunk dan setiap chunk
+    didistribusikan sebagai satu batch, sehingga memori tetap sebesar satu chunk
+    berapa pun panjang file.
+    """
+
+    def __init__(self, dapur_service: DapurService, ukuran_chunk: int = 5000):
+        """
+        Constructor dengan Dependency Injection service.
+
+        Args:
+            dapur_service: Service yang menjalankan distribusi batch
+            ukuran_chunk: Jumlah baris per batch distribusi
+        """
+        if ukuran_chunk < 1:
+            raise ValueError("Ukuran chunk minimal 1")
+        self.__service = dapur_service
+        self.__ukuran_chunk = ukuran_chunk
+
+    def impor(self, path: str, path_error: Optional[str] = None,
+              format_file: Optional[str] = None, catatan: str = "") -> Dict[str, int]:
+        """
+        Mendistribusikan makanan sesuai file CSV (header: id_korban,jumlah_porsi)
+        atau JSONL (satu object JSON per baris dengan key yang sama).
+
+        Args:
+            path: Path file sumber
+            path_error: Path file CSV untuk baris yang gagal (opsional)
+            format_file: "csv" atau "jsonl" (default: dari ekstensi file)
+            catatan: Catatan untuk setiap distribusi
+
+        Returns:
+            Dict: Ringkasan 'total_baris', 'berhasil', 'ditolak' dan 'total_porsi'
+        """
+        format_file = tentukan_format(path, format_file)
+        ringkasan = {'total_baris': 0, 'berhasil': 0, 'ditolak': 0, 'total_porsi': 0}
+        with PencatatTolak(path_error) as tolak, mode_senyap():
+            for chunk in baca_chunk(path, format_file, self.__ukuran_chunk):
+                ringkasan['total_baris'] += len(chunk)
+                permintaan, asal = [], []
+                for nomor, baris in chunk:
+                    try:
+                        permintaan.append(permintaan_dari_baris(baris))
+                    except ValueError as e:
+                        tolak(nomor, str(e), baris)
+                        continue
+                    asal.append((nomor, baris))
+                if not permintaan:
+                    continue
+
+                hasil = self.__service.distribusi_makanan_batch(permintaan, catatan)
+                for item, (nomor, baris) in zip(hasil, asal):
+                    if item['berhasil']:
+                        ringkasan['berhasil'] += 1
+                        ringkasan['total_porsi'] += item['jumlah_porsi']
+                    else:
+                        tolak(nomor, item['error'], baris)
+            ringkasan['ditolak'] = tolak.jumlah
+
+        logger.info("Distribusi dari %s: %s berhasil (%s porsi), %s ditolak", path,
+                    ringkasan['berhasil'], ringkasan['total_porsi'], ringkasan['ditolak'])
+        return ringkasan
@@ -0,0 +1,89 @@
+"""
+Module helper untuk impor file CSV / JSONL secara streaming.
+Dipakai bersama oleh importer korban, bahan dan distribusi.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import csv
+import json
+
+FORMAT_DIDUKUNG = ("csv", "jsonl")
+
+
+def tentukan_format(path: str, format_file: Optional[str] = None) -> str:
+    """
+    Menentukan format file dari argumen atau ekstensi file.
+
+    Raises:
+        ValueError: Jika format tidak didukung
+    """
+    format_file = (format_file or path.rsplit(".", 1)[-1]).lower()
+    if format_file not in FORMAT_DIDUKUNG:
+        raise ValueError(f"Format file tidak didukung: {format_file}")
+    return format_file
+
+
+def baca_baris(path: str, format_file: str) -> Iterator[Tuple[int, Optional[Dict]]]:
+    """
+    Membaca file baris demi baris sebagai (nomor_baris, dict).
+    Baris JSONL yang bukan JSON valid dikembalikan sebagai (nomor, None).
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if format_file == "csv":
+            for nomor, baris in enumerate(csv.DictReader(f), 1):
+                yield nomor, baris
+        else:
+            for nomor, teks in enumerate(f, 1):
+                if not teks.strip():
+                    continue
+                try:
+                    yield nomor, json.loads(teks)
+                except json.JSONDecodeError:
+                    yield nomor, None
+
+
+def baca_chunk(path: str, format_file: str, ukuran_chunk: int) -> Iterator[List[Tuple[int, Any]]]:
+    """Mengelompokkan baris file menjadi chunk berukuran tetap (memori tetap kecil)."""
+    baris = baca_baris(path, format_file)
+    while True:
+        chunk = list(islice(baris, ukuran_chunk))
+        if not chunk:
+            return
+        yield chunk
+
+
+class PencatatTolak:
+    """
+    Pencatat baris yang ditolak: menghitung jumlahnya dan (opsional)
+    menulisnya ke file CSV dengan kolom baris, alasan, data.
+    """
+
+    def __init__(self, path_error: Optional[str] = None):
+        """
+        Args:
+            path_error: Path file CSV untuk baris yang ditolak (None = hanya dihitung)
+        """
+        self.jumlah = 0
+        self.__file = open(path_error, "w", newline="", encoding="utf-8") if path_error else None
+        self.__penulis = csv.writer(self.__file) if self.__file else None
+        if self.__penulis:
+            self.__penulis.writerow(["baris", "alasan", "data"])
+
+    def __call__(self, nomor: int, alasan: str, baris: Any) -> None:
+        """Mencatat satu baris yang ditolak."""
+        self.jumlah += 1
+        if self.__penulis:
+            self.__penulis.writerow([nomor, alasan, json.dumps(baris, ensure_ascii=False)])
+
+    def tutup(self) -> None:
+        """Menutup file error (jika ada)."""
+        if self.__file:
+            self.__file.close()
+            self.__file = None
+
+    def __enter__(self) -> 'PencatatTolak':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.tutup()
@@ -0,0 +1,147 @@
+"""
+Module untuk impor massal data korban dari file CSV / JSONL.
+Menerapkan SRP - fokus pada pembacaan, validasi dan pemuatan data registrasi lapangan.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from repositories.base_repository import IRepository
+from models.person import Korban
+from services.impor_file import PencatatTolak, baca_chunk, tentukan_format
+from utils.logging_config import mode_senyap
+import logging
+
+logger = logging.getLogger(__name__)
+
+KEBUTUHAN_VALID = ("Umum", "Lansia", "Bayi", "Sakit")
+
+# Hasil validasi satu baris: (nomor_baris, data_valid atau None, alasan_ditolak atau None, baris_asli)
+HasilValidasi = Tuple[int, Optional[Tuple[str, str, str, int]], Optional[str], Dict]
+
+
+def validasi_baris(nomor: int, baris: Dict) -> HasilValidasi:
+    """
+    Memvalidasi satu baris registrasi korban.
+    Fungsi top-level (tanpa state) agar bisa dijalankan di process pool.
+
+    Args:
+        nomor: Nomor baris data (mulai dari 1)
+        baris: Data baris dengan key nama, id, kebutuhan_khusus, jumlah_tanggungan
+
+    Returns:
+        HasilValidasi: Data ternormalisasi (nama, id, kebutuhan, tanggungan) atau alasan ditolak
+    """
+    if not isinstance(baris, dict):
+        return nomor, None, "Format baris tidak valid", {}
+
+    nama = str(baris.get("nama") or "").strip()
+    id_korban = str(baris.get("id") or "").strip()
+    kebutuhan = str(baris.get("kebutuhan_khusus") or "Umum").strip() or "Umum"
+    tanggungan = baris.get("jumlah_tanggungan")
+
+    if not nama or not id_korban:
+        return nomor, None, "Nama dan ID tidak boleh kosong", baris
+    if kebutuhan not in KEBUTUHAN_VALID:
+        return nomor, None, f"Kebutuhan khusus tidak dikenal: {kebutuhan}", baris
+    try:
+        tanggungan = 1 if tanggungan in (None, "") else int(tanggungan)
+    except (TypeError, ValueError):
+        return nomor, None, f"Jumlah tanggungan bukan bilangan bulat: {tanggungan}", baris
+    if tanggungan < 1:
+        return nomor, None, "Jumlah tanggungan minimal 1", baris
+
+    return nomor, (nama, id_korban, kebutuhan, tanggungan), None, baris
+
+
+def validasi_chunk(chunk: List[Tuple[int, Dict]]) -> List[HasilValidasi]:
+    """Memvalidasi satu chunk baris (unit kerja untuk process pool)."""
+    return [validasi_baris(nomor, baris) for nomor, baris in chunk]
+
+
+class KorbanImporter:
+    """
+    Importer streaming untuk registrasi korban dalam jumlah besar.
+
+    File dibaca per chunk sehingga memori tetap kecil, validasi bisa dijalankan
+    paralel di process pool, dan korban valid dimuat lewat bulk path repository
+    (add_many). Baris yang ditolak ditulis ke file error (CSV).
+    """
+
+    def __init__(self, korban_repo: IRepository[Korban], ukuran_chunk: int = 5000,
+                 jumlah_proses: int = 0):
+        """
+        Constructor dengan Dependency Injection repository korban.
+
+        Args:
+            korban_repo: Repository korban yang menyediakan add_many
+            ukuran_chunk: Jumlah baris per chunk
+            jumlah_proses: Jumlah worker validasi (0 = validasi di proses ini)
+        """
+        if ukuran_chunk < 1:
+            raise ValueError("Ukuran chunk minimal 1")
+        self.__korban_repo = korban_repo
+        self.__ukuran_chunk = ukuran_chunk
+        self.__jumlah_proses = jumlah_proses
+
+    def _validasi_semua(self, chunks: Iterator[List]) -> Iterator[List[HasilValidasi]]:
+        """
+        Memvalidasi chunk secara berurutan atau di process pool.
+        Jumlah chunk yang sedang diproses dibatasi agar pembacaan tetap streaming.
+        """
+        if self.__jumlah_proses <= 0:
+            for chunk in chunks:
+                yield validasi_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.__jumlah_proses) as executor:
+            antrean = deque()
+            for chunk in chunks:
+                antrean.append(executor.submit(validasi_chunk, chunk))
+                if len(antrean) >= self.__jumlah_proses * 2:
+                    yield antrean.popleft().result()
+            while antrean:
+                yield antrean.popleft().result()
+
+    def impor(self, path: str, path_error: Optional[str] = None,
+              format_file: Optional[str] = None) -> Dict[str, int]:
+        """
+        Mengimpor korban dari file CSV (header: nama,id,kebutuhan_khusus,jumlah_tanggungan)
+        atau JSONL (satu object JSON per baris dengan key yang sama).
+
+        Args:
+            path: Path file sumber
+            path_error: Path file CSV untuk baris yang ditolak (opsional)
+            format_file: "csv" atau "jsonl" (default: dari ekstensi file)
+
+        Returns:
+            Dict: Ringkasan 'total_baris', 'berhasil' dan 'ditolak'
+        """
+        format_file = tentukan_format(path, format_file)
+        ringkasan = {'total_baris': 0, 'berhasil': 0, 'ditolak': 0}
+        with PencatatTolak(path_error) as tolak:
+            # Log per korban dibungkam selama impor; ringkasan dicatat di akhir
+            with mode_senyap():
+                chunks = baca_chunk(path, format_file, self.__ukuran_chunk)
+                for hasil_chunk in self._validasi_semua(chunks):
+                    ringkasan['total_baris'] += len(hasil_chunk)
+                    korban_valid, asal = [], {}
+                    for nomor, data, alasan, baris in hasil_chunk:
+                        if data is None:
+                            tolak(nomor, alasan, baris)
+                            continue
+                        nama, id_korban, kebutuhan, tanggungan = data
+                        korban = Korban(nama, id_korban, kebutuhan, tanggungan)
+                        korban_valid.append(korban)
+                        asal[id(korban)] = (nomor, baris)
+
+                    ditolak = self.__korban_repo.add_many(korban_valid)
+                    for korban in ditolak:
+                        nomor, baris = asal[id(korban)]
+                        tolak(nomor, f"ID {korban.get_id()} sudah terdaftar", baris)
+                    ringkasan['berhasil'] += len(korban_valid) - len(ditolak)
+            ringkasan['ditolak'] = tolak.jumlah
+
+        logger.info("Impor korban dari %s: %s berhasil, %s ditolak",
+                    path, ringkasan['berhasil'], ringkasan['ditolak'])
+        return ringkasan
@@ -0,0 +1,268 @@
+"""
+Module mesin laporan paralel untuk data korban dan distribusi yang besar.
+Data repository dipartisi menjadi chunk berisi tuple sederhana, agregat
+parsial tiap chunk dihitung di process pool, lalu digabung di proses utama.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+from repositories.base_repository import IRepository
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from utils.logging_config import senyap_thread
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def agregat_korban(chunk: List[tuple], dengan_detail: bool) -> Dict:
+    """
+    Agregat parsial satu chunk korban.
+    Fungsi top-level (tanpa state) agar bisa dijalankan di process pool.
+
+    Args:
+        chunk: Tuple (nama, id, kebutuhan_khusus, tanggungan, epoch_registrasi)
+        dengan_detail: True untuk ikut membuat baris get_info() setiap korban
+
+    Returns:
+        Dict: Agregat parsial (lihat gabung_parsial)
+    """
+    korban_per_kebutuhan: Dict[str, int] = {}
+    tanggungan_per_kebutuhan: Dict[str, int] = {}
+    detail = []
+    with senyap_thread(('models',)):
+        for nama, id_korban, kebutuhan, tanggungan, epoch in chunk:
+            korban_per_kebutuhan[kebutuhan] = korban_per_kebutuhan.get(kebutuhan, 0) + 1
+            tanggungan_per_kebutuhan[kebutuhan] = tanggungan_per_kebutuhan.get(kebutuhan, 0) + tanggungan
+            if dengan_detail:
+                korban = Korban(nama, id_korban, kebutuhan, tanggungan, datetime.fromtimestamp(epoch))
+                detail.append(korban.get_info())
+    return {
+        'total_korban': len(chunk),
+        'total_tanggungan': sum(tanggungan_per_kebutuhan.values()),
+        'korban_per_kebutuhan': korban_per_kebutuhan,
+        'tanggungan_per_kebutuhan': tanggungan_per_kebutuhan,
+        'detail_korban': detail,
+    }
+
+
+def agregat_distribusi(chunk: List[tuple], dengan_detail: bool) -> Dict:
+    """
+    Agregat parsial satu chunk distribusi.
+    Fungsi top-level (tanpa state) agar bisa dijalankan di process pool.
+
+    Args:
+        chunk: Tuple (id_distribusi, id_korban, jumlah_porsi, catatan, epoch_waktu)
+        dengan_detail: True untuk ikut membuat baris get_info() setiap distribusi
+
+    Returns:
+        Dict: Agregat parsial (lihat gabung_parsial)
+    """
+    porsi_per_hari: Dict[str, int] = {}
+    korban = set()
+    total_porsi = 0
+    detail = []
+    with senyap_thread(('models',)):
+        for id_distribusi, id_korban, porsi, catatan, epoch in chunk:
+            waktu = datetime.fromtimestamp(epoch)
+            hari = waktu.date().isoformat()
+            porsi_per_hari[hari] = porsi_per_hari.get(hari, 0) + porsi
+            korban.add(id_korban)
+            total_porsi += porsi
+            if dengan_detail:
+                distribusi = DistribusiMakanan(id_distribusi, id_korban, porsi, catatan, waktu)
+                detail.append(distribusi.get_info())
+    return {
+        'total_distribusi': len(chunk),
+        'total_porsi_terdistribusi': total_porsi,
+        'porsi_per_hari': porsi_per_hari,
+        'korban_terlayani': korban,
+        'detail_distribusi': detail,
+    }
+
+
+def gabung_parsial(total: Dict, parsial: Dict) -> Dict:
+    """
+    Menggabungkan agregat parsial ke total (in place): angka dijumlah, dict
+    dijumlah per key, list disambung dan set digabung.
+
+    Args:
+        total: Agregat gabungan sejauh ini
+        parsial: Agregat satu chunk
+
+    Returns:
+        Dict: total yang sudah diperbarui
+    """
+    for kunci, nilai in parsial.items():
+        if kunci not in total:
+            total[kunci] = nilai
+        elif isinstance(nilai, dict):
+            tujuan = total[kunci]
+            for k, v in nilai.items():
+                tujuan[k] = tujuan.get(k, 0) + v
+        elif isinstance(nilai, list):
+            total[kunci].extend(nilai)
+        elif isinstance(nilai, set):
+            total[kunci] |= nilai
+        else:
+            total[kunci] += nilai
+    return total
+
+
+def _baris_korban(korban: Korban) -> tuple:
+    return (korban.get_name(), korban.get_id(), korban.get_kebutuhan_khusus(),
+            korban.get_jumlah_tanggungan(), korban.get_registered_epoch())
+
+
+def _baris_distribusi(distribusi: DistribusiMakanan) -> tuple:
+    return (distribusi.get_id_distribusi(), distribusi.get_id_korban(),
+            distribusi.get_jumlah_porsi(), distribusi.get_catatan(), distribusi.get_waktu_epoch())
+
+
+class MesinLaporan:
+    """
+    Mesin laporan korban dan distribusi berbasis partisi.
+
+    Repository dibaca per halaman (iter_semua) dan diubah menjadi chunk tuple
+    sederhana yang bisa di-pickle; object model sendiri tidak dikirim karena
+    memegang lock dan pengamat. Agregat parsial (jumlah per kategori, porsi
+    per hari, korban terlayani, baris detail) dihitung per chunk lalu digabung
+    sesuai urutan chunk, sehingga hasilnya sama persis dengan perhitungan
+    serial. Jumlah chunk yang sedang diproses dibatasi agar memori tetap kecil.
+    """
+
+    def __init__(self, korban_repo: IRepository[Korban],
+                 distribusi_repo: IRepository[DistribusiMakanan],
+                 jumlah_proses: int = 0, ukuran_chunk: int = 20000):
+        """
+        Constructor dengan Dependency Injection repository.
+
+        Args:
+            korban_repo: Repository korban
+            distribusi_repo: Repository distribusi
+            jumlah_proses: Jumlah worker (0 = dihitung di proses ini)
+            ukuran_chunk: Jumlah entitas per chunk
+
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if ukuran_chunk < 1:
+            raise ValueError("Ukuran chunk minimal 1")
+        if jumlah_proses < 0:
+            raise ValueError("Jumlah proses tidak boleh negatif")
+        self.__korban_repo = korban_repo
+        self.__distribusi_repo = distribusi_repo
+        self.__jumlah_proses = jumlah_proses
+        self.__ukuran_chunk = ukuran_chunk
+
+    def __partisi(self, repo: IRepository, ke_baris: Callable) -> Iterator[List[tuple]]:
+        """Membaca repository per halaman dan menghasilkan chunk tuple."""
+        chunk = []
+        for entity in repo.iter_semua(self.__ukuran_chunk):
+            chunk.append(ke_baris(entity))
+            if len(chunk) >= self.__ukuran_chunk:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def __hitung(self, executor: Optional[Executor], fungsi: Callable,
+                 chunks: Iterator[List[tuple]], dengan_detail: bool) -> Dict:
+        """Menjalankan fungsi agregat per chunk (serial atau di pool) lalu menggabungkan hasil."""
+        total: Dict = {}
+        if executor is None:
+            for chunk in chunks:
+                gabung_parsial(total, fungsi(chunk, dengan_detail))
+            return total
+
+        antrean = deque()
+        for chunk in chunks:
+            antrean.append(executor.submit(fungsi, chunk, dengan_detail))
+            if len(antrean) >= self.__jumlah_proses * 2:
+                gabung_parsial(total, antrean.popleft().result())
+        while antrean:
+            gabung_parsial(total, antrean.popleft().result())
+        return total
+
+    def __laporan_korban(self, executor: Optional[Executor], dengan_detail: bool) -> Dict:
+        laporan = gabung_parsial({
+            'total_korban': 0,
+            'total_tanggungan': 0,
+            'korban_per_kebutuhan': {},
+            'tanggungan_per_kebutuhan': {},
+            'detail_korban': [],
+        }, self.__hitung(executor, agregat_korban,
+                         self.__partisi(self.__korban_repo, _baris_korban), dengan_detail))
+        if not dengan_detail:
+            del laporan['detail_korban']
+        return laporan
+
+    def __laporan_distribusi(self, executor: Optional[Executor], dengan_detail: bool) -> Dict:
+        laporan = gabung_parsial({
+            'total_distribusi': 0,
+            'total_porsi_terdistribusi': 0,
+            'porsi_per_hari': {},
+            'korban_terlayani': set(),
+            'detail_distribusi': [],
+        }, self.__hitung(executor, agregat_distribusi,
+                         self.__partisi(self.__distribusi_repo, _baris_distribusi), dengan_detail))
+        laporan['porsi_per_hari'] = dict(sorted(laporan['porsi_per_hari'].items()))
+        laporan['korban_terlayani'] = len(laporan['korban_terlayani'])
+        total = laporan['total_distribusi']
+        laporan['rata_rata_porsi'] = round(laporan['total_porsi_terdistribusi'] / total, 2) if total else 0
+        if not dengan_detail:
+            del laporan['detail_distribusi']
+        return laporan
+
+    def __dengan_executor(self, kerja: Callable[[Optional[Executor]], Dict]) -> Dict:
+        """Menjalankan kerja dengan process pool (atau tanpa pool jika jumlah_proses 0)."""
+        if self.__jumlah_proses <= 0:
+            return kerja(None)
+        with ProcessPoolExecutor(max_workers=self.__jumlah_proses) as executor:
+            return kerja(executor)
+
+    def laporan_korban(self, dengan_detail: bool = True) -> Dict:
+        """
+        Laporan korban: total, rincian per kebutuhan khusus dan baris detail.
+
+        Args:
+            dengan_detail: True untuk menyertakan 'detail_korban'
+
+        Returns:
+            Dict: Laporan korban
+        """
+        return self.__dengan_executor(lambda ex: self.__laporan_korban(ex, dengan_detail))
+
+    def laporan_distribusi(self, dengan_detail: bool = True) -> Dict:
+        """
+        Laporan distribusi: total, porsi per hari, korban terlayani dan baris detail.
+
+        Args:
+            dengan_detail: True untuk menyertakan 'detail_distribusi'
+
+        Returns:
+            Dict: Laporan distribusi
+        """
+        return self.__dengan_executor(lambda ex: self.__laporan_distribusi(ex, dengan_detail))
+
+    def laporan_lengkap(self, dengan_detail: bool = False) -> Dict:
+        """
+        Laporan korban dan distribusi dengan satu process pool bersama.
+
+        Args:
+            dengan_detail: True untuk menyertakan baris detail
+
+        Returns:
+            Dict: {'korban': ..., 'distribusi': ...}
+        """
+        def kerja(executor: Optional[Executor]) -> Dict:
+            hasil = {
+                'korban': self.__laporan_korban(executor, dengan_detail),
+                'distribusi': self.__laporan_distribusi(executor, dengan_detail),
+            }
+            logger.info("Laporan paralel selesai: %s korban, %s distribusi",
+                        hasil['korban']['total_korban'], hasil['distribusi']['total_distribusi'])
+            return hasil
+        return self.__dengan_executor(kerja)
@@ -0,0 +1,136 @@
+"""
+Module prakiraan laju konsumsi porsi dari riwayat distribusi.
+Distribusi dikelompokkan per hari (zona waktu lokal); setiap hari yang
+selesai dilipat ke rata-rata bergerak eksponensial (EWMA), sehingga
+pencatatan distribusi baru selalu O(1).
+"""
+
+from datetime import date, datetime, time as jam
+from typing import Dict, Iterable, Optional
+from models.distribusi import DistribusiMakanan
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _batas_hari(hari: int) -> tuple:
+    """Epoch awal dan akhir (eksklusif) hari ordinal lokal."""
+    awal = datetime.combine(date.fromordinal(hari), jam()).timestamp()
+    akhir = datetime.combine(date.fromordinal(hari + 1), jam()).timestamp()
+    return awal, akhir
+
+
+class PrakiraanKonsumsi:
+    """
+    Laju konsumsi harian berbasis EWMA per ember hari.
+
+    Porsi dijumlah ke ember hari aktif. Saat distribusi (atau waktu sekarang)
+    masuk hari berikutnya, total hari aktif dilipat ke EWMA:
+    ewma = alpha * porsi_hari + (1 - alpha) * ewma. Hari tanpa distribusi di
+    antaranya dihitung sebagai 0 porsi lewat bentuk tertutup (1 - alpha)^n.
+    Distribusi dengan waktu sebelum hari aktif (data terlambat) dimasukkan ke
+    hari aktif. Aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, rentang_hari: int = 7, hari_minimum: int = 3):
+        """
+        Args:
+            rentang_hari: Rentang EWMA dalam hari (alpha = 2 / (rentang + 1))
+            hari_minimum: Jumlah hari selesai sejak distribusi pertama (termasuk
+                hari kosong) sebelum prakiraan dianggap valid; hari pertama
+                biasanya tidak penuh sehingga satu hari saja tidak cukup
+
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if rentang_hari < 1:
+            raise ValueError("Rentang hari minimal 1")
+        if hari_minimum < 1:
+            raise ValueError("Hari minimum minimal 1")
+        self.__alpha = 2 / (rentang_hari + 1)
+        self.__hari_minimum = hari_minimum
+        self.__lock = threading.Lock()
+        self.__hari_aktif: Optional[int] = None
+        self.__batas_aktif = (0.0, 0.0)
+        self.__porsi_aktif = 0
+        self.__ewma: Optional[float] = None
+        self.__hari_selesai = 0
+
+    @classmethod
+    def dari_riwayat(cls, distribusi: Iterable[DistribusiMakanan], **kwargs) -> 'PrakiraanKonsumsi':
+        """
+        Membangun prakiraan dari riwayat distribusi dalam satu lintasan.
+        Porsi dijumlah per hari dulu (memori sebanding jumlah hari, bukan
+        jumlah distribusi) lalu diputar berurutan menurut tanggal.
+
+        Args:
+            distribusi: Riwayat distribusi (boleh generator, urutan bebas)
+            **kwargs: Parameter constructor
+
+        Returns:
+            PrakiraanKonsumsi: Prakiraan yang sudah memuat riwayat
+        """
+        per_hari: Dict[int, int] = {}
+        for d in distribusi:
+            hari = date.fromtimestamp(d.get_waktu_epoch()).toordinal()
+            per_hari[hari] = per_hari.get(hari, 0) + d.get_jumlah_porsi()
+        prakiraan = cls(**kwargs)
+        for hari in sorted(per_hari):
+            prakiraan.catat(per_hari[hari], _batas_hari(hari)[0])
+        return prakiraan
+
+    def __geser(self, epoch: float) -> None:
+        """Menutup hari aktif jika epoch sudah masuk hari berikutnya (di bawah lock)."""
+        if self.__hari_aktif is not None and epoch < self.__batas_aktif[1]:
+            return
+        hari = date.fromtimestamp(epoch).toordinal()
+        if self.__hari_aktif is not None:
+            self.__lipat(self.__porsi_aktif)
+            kosong = hari - self.__hari_aktif - 1
+            if kosong > 0:
+                self.__ewma *= (1 - self.__alpha) ** kosong
+                self.__hari_selesai += kosong
+        self.__hari_aktif = hari
+        self.__batas_aktif = _batas_hari(hari)
+        self.__porsi_aktif = 0
+
+    def __lipat(self, porsi: int) -> None:
+        """Memasukkan total satu hari selesai ke EWMA."""
+        if self.__ewma is None:
+            self.__ewma = float(porsi)
+        else:
+            self.__ewma = self.__alpha * porsi + (1 - self.__alpha) * self.__ewma
+        self.__hari_selesai += 1
+
+    def catat(self, jumlah_porsi: int, waktu_epoch: Optional[float] = None) -> None:
+        """
+        Mencatat porsi yang didistribusikan dalam O(1).
+
+        Args:
+            jumlah_porsi: Jumlah porsi
+            waktu_epoch: Waktu distribusi (default: sekarang)
+        """
+        epoch = time.time() if waktu_epoch is None else waktu_epoch
+        with self.__lock:
+            self.__geser(epoch)
+            self.__porsi_aktif += jumlah_porsi
+
+    def laju_harian(self, sekarang: Optional[float] = None) -> Optional[float]:
+        """
+        Prakiraan porsi per hari.
+
+        Args:
+            sekarang: Waktu acuan epoch (default: sekarang); hari yang sudah
+                lewat sebelum waktu ini ikut ditutup
+
+        Returns:
+            Optional[float]: Porsi per hari, None jika riwayat belum cukup
+        """
+        with self.__lock:
+            if self.__hari_aktif is not None:
+                self.__geser(time.time() if sekarang is None else sekarang)
+            if self.__hari_selesai < self.__hari_minimum:
+                return None
+            return self.__ewma
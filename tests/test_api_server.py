@@ -0,0 +1,149 @@
+"""
+Unit Testing untuk api/server.py
+Testing endpoint JSON, keep-alive, pipelining dan penanganan error
+"""
+
+import asyncio
+import json
+import logging
+import unittest
+from api.server import DapurHTTPServer, buat_service
+from models.bahan_makanan import BahanPokok
+from models.person import Korban
+from utils.logging_config import mode_senyap
+
+
+def buat_permintaan(metode: str, path: str, data=None, tutup: bool = False) -> bytes:
+    """Helper menyusun permintaan HTTP/1.1 mentah"""
+    body = json.dumps(data).encode() if data is not None else b""
+    kepala = f"{metode} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n"
+    if tutup:
+        kepala += "Connection: close\r\n"
+    return kepala.encode() + b"\r\n" + body
+
+
+async def baca_respons(reader: asyncio.StreamReader):
+    """Helper membaca satu respons: (status, header, payload JSON)"""
+    status = int((await reader.readline()).split()[1])
+    header = {}
+    while True:
+        baris = await reader.readline()
+        if baris == b"\r\n":
+            break
+        nama, _, nilai = baris.decode().partition(":")
+        header[nama.lower()] = nilai.strip()
+    body = await reader.readexactly(int(header["content-length"]))
+    return status, header, json.loads(body)
+
+
+class TestDapurHTTPServer(unittest.IsolatedAsyncioTestCase):
+    """Test case untuk DapurHTTPServer"""
+
+    async def asyncSetUp(self):
+        """Jalankan server di port acak dengan sedikit data"""
+        self.senyap = mode_senyap(('models', 'repositories', 'services', 'api'),
+                                  level=logging.CRITICAL)
+        self.senyap.__enter__()
+        self.service = buat_service()
+        self.service.tambah_bahan(BahanPokok("Beras", 10.0, "kg", 250.0))  # 40 porsi
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        self.server = DapurHTTPServer(self.service, port=0, jumlah_worker=4)
+        port = await self.server.mulai()
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        """Tutup koneksi dan hentikan server"""
+        self.writer.close()
+        await self.server.berhenti()
+        self.senyap.__exit__(None, None, None)
+
+    async def kirim(self, metode: str, path: str, data=None):
+        """Helper: kirim satu permintaan di koneksi keep-alive dan baca responsnya"""
+        self.writer.write(buat_permintaan(metode, path, data))
+        return await baca_respons(self.reader)
+
+    async def test_keep_alive(self):
+        """Test beberapa permintaan berurutan di satu koneksi"""
+        status, header, data = await self.kirim("GET", "/porsi")
+        self.assertEqual((status, data), (200, {'total_porsi_tersedia': 40}))
+        self.assertEqual(header["connection"], "keep-alive")
+
+        status, _, data = await self.kirim("POST", "/distribusi",
+                                           {"id_korban": "KRB-001", "jumlah_porsi": 8})
+        self.assertEqual(status, 201)
+        self.assertEqual(data['jumlah_porsi'], 8)
+
+        status, _, data = await self.kirim("GET", "/laporan/distribusi")
+        self.assertEqual(data['total_porsi_terdistribusi'], 8)
+
+    async def test_registrasi_dan_bahan(self):
+        """Test endpoint POST /korban dan /bahan"""
+        status, _, _ = await self.kirim("POST", "/korban", {"nama": "Siti", "id": "KRB-002",
+                                                           "kebutuhan_khusus": "Lansia",
+                                                           "jumlah_tanggungan": 2})
+        self.assertEqual(status, 201)
+        status, _, data = await self.kirim("POST", "/bahan", {"jenis": "pokok", "nama": "Mie",
+                                                             "jumlah": 5, "per_porsi": 100})
+        self.assertEqual((status, data['porsi']), (201, 50))
+
+        _, _, laporan = await self.kirim("GET", "/laporan/korban")
+        self.assertEqual(laporan['total_tanggungan'], 6)
+        _, _, stok = await self.kirim("GET", "/stok")
+        self.assertEqual(stok['total_jenis_bahan'], 2)
+
+    async def test_riwayat_stok(self):
+        """Test GET /stok/riwayat membaca ledger stok dengan parameter query"""
+        await self.kirim("POST", "/distribusi", {"id_korban": "KRB-001", "jumlah_porsi": 8})
+        status, _, data = await self.kirim("GET", "/stok/riwayat?bahan=Beras&mulai=2000-01-01T00:00")
+        self.assertEqual(status, 200)
+        self.assertAlmostEqual(data['stok'], 8.0)
+        self.assertAlmostEqual(data['mutasi']['keluar'], 2.0)
+
+        _, _, data = await self.kirim("GET", "/stok/riwayat?bahan=Beras&waktu=2000-01-01T06:00")
+        self.assertEqual(data['stok'], 0.0)
+        self.assertEqual((await self.kirim("GET", "/stok/riwayat"))[0], 400)
+        self.assertEqual((await self.kirim("GET", "/stok/riwayat?bahan=Beras&waktu=kemarin"))[0], 400)
+
+    async def test_pipelining_urutan_dipertahankan(self):
+        """Test permintaan pipelined dijawab berurutan dan POST tidak didahului GET"""
+        self.writer.write(
+            buat_permintaan("POST", "/korban", {"nama": "Siti", "id": "KRB-002"})
+            + buat_permintaan("POST", "/distribusi/batch",
+                              {"permintaan": [["KRB-001", 10], ["KRB-002", 5]]})
+            + buat_permintaan("GET", "/porsi")
+            + buat_permintaan("GET", "/laporan/distribusi")
+            + buat_permintaan("GET", "/porsi", tutup=True))
+        hasil = [await baca_respons(self.reader) for _ in range(5)]
+
+        self.assertEqual([status for status, _, _ in hasil], [201, 200, 200, 200, 200])
+        self.assertEqual(hasil[1][2]['berhasil'], 2)
+        self.assertEqual(hasil[2][2]['total_porsi_tersedia'], 25)
+        self.assertEqual(hasil[3][2]['total_distribusi'], 2)
+        self.assertEqual(hasil[4][1]['connection'], "close")
+        self.assertEqual(await self.reader.read(), b"")
+
+    async def test_error(self):
+        """Test error validasi, path dan method yang tidak dikenal"""
+        status, _, data = await self.kirim("POST", "/distribusi",
+                                           {"id_korban": "KRB-999", "jumlah_porsi": 1})
+        self.assertEqual(status, 400)
+        self.assertIn("tidak ditemukan", data['error'])
+        self.assertEqual((await self.kirim("GET", "/tidak-ada"))[0], 404)
+        self.assertEqual((await self.kirim("GET", "/distribusi"))[0], 405)
+
+        self.writer.write(b"POST /korban HTTP/1.1\r\nContent-Length: 5\r\n\r\n{bad}")
+        status, _, _ = await baca_respons(self.reader)
+        self.assertEqual(status, 400)
+        # Koneksi tetap bisa dipakai setelah error di level aplikasi
+        self.assertEqual((await self.kirim("GET", "/gizi"))[0], 200)
+
+    async def test_request_line_rusak(self):
+        """Test request line yang tidak valid dijawab 400 lalu koneksi ditutup"""
+        self.writer.write(b"GARBAGE\r\n\r\n")
+        status, header, _ = await baca_respons(self.reader)
+        self.assertEqual((status, header['connection']), (400, "close"))
+        self.assertEqual(await self.reader.read(), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,10 @@ Testing Class BahanPokok, BahanProtein, BahanSayuran
 """
 
 import unittest
-from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+from datetime import datetime
+from models.bahan_makanan import (
+    BahanMakanan, BahanPokok, BahanProtein, BahanSayuran, buat_bahan, jenis_dan_faktor
+)
 
 
 class TestBahanPokok(unittest.TestCase):
@@ -66,7 +69,13 @@ class TestBahanPokok(unittest.TestCase):
         """Test mengurangi stok melebihi yang tersedia (harus error)"""
         with self.assertRaises(ValueError):
             self.beras.kurangi_stok(150.0)  # Hanya ada 100 kg
-    
+
+    def test_kurangi_stok_jika_cukup(self):
+        """Test pengurangan bersyarat mengembalikan False tanpa mengubah stok"""
+        self.assertTrue(self.beras.kurangi_stok_jika_cukup(60.0))
+        self.assertFalse(self.beras.kurangi_stok_jika_cukup(60.0))
+        self.assertEqual(self.beras.get_jumlah(), 40.0)
+
     def test_get_info_format(self):
         """Test format output get_info()"""
         info = self.beras.get_info()
@@ -128,5 +137,38 @@ class TestBahanSayuran(unittest.TestCase):
         self.assertEqual(porsi, 300)
 
 
+class TestJenisDanFaktor(unittest.TestCase):
+    """Test encoding jenis/faktor yang dipakai SQLite dan snapshot biner"""
+    
+    def test_bolak_balik_dengan_buat_bahan(self):
+        """Test jenis_dan_faktor lalu buat_bahan menghasilkan bahan yang sama"""
+        masuk = datetime(2024, 1, 1, 6, 0)
+        for bahan in (BahanPokok("Beras", 100.0, "kg", 200.0, masuk),
+                      BahanProtein("Telur", 50.0, "butir", 2.0, masuk),
+                      BahanSayuran("Kangkung", 30.0, "kg", 0.1, masuk)):
+            jenis, faktor = jenis_dan_faktor(bahan)
+            salinan = buat_bahan(jenis, bahan.get_nama(), bahan.get_jumlah(),
+                                 bahan.get_satuan(), faktor, masuk)
+            self.assertIs(type(salinan), type(bahan))
+            self.assertEqual(salinan.hitung_porsi(), bahan.hitung_porsi())
+            self.assertEqual(salinan.get_tanggal_masuk(), masuk)
+        self.assertEqual(jenis_dan_faktor(BahanPokok("Mie", 5.0)), ('pokok', 250.0))
+    
+    def test_jenis_tidak_didukung(self):
+        """Test bahan di luar JENIS_BAHAN ditolak"""
+        class BahanLain(BahanMakanan):
+            def get_faktor_porsi(self):
+                return 1.0
+            
+            def get_takaran_per_porsi(self):
+                return 1.0
+            
+            def hitung_porsi(self):
+                return int(self.get_jumlah())
+        
+        with self.assertRaises(ValueError):
+            jenis_dan_faktor(BahanLain("Garam", 1.0, "kg"))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Unit Testing untuk mode batch main.py dan importer bahan / distribusi
+Testing subcommand, kode keluar dan keluaran JSON tanpa interaksi
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+import main
+from services.bahan_importer import bahan_dari_baris
+
+
+class TestBatchCLI(unittest.TestCase):
+    """Test case untuk subcommand batch main.py"""
+
+    def setUp(self):
+        """Setup folder sementara; root logger dikembalikan di tearDown"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = os.path.join(self.tmpdir, "dapur.db")
+        self.root = logging.getLogger()
+        self.handler_awal = list(self.root.handlers)
+        self.level_awal = self.root.level
+
+    def tearDown(self):
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        for handler in self.handler_awal:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.level_awal)
+        shutil.rmtree(self.tmpdir)
+
+    def _tulis_csv(self, nama, header, baris):
+        path = os.path.join(self.tmpdir, nama)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(baris)
+        return path
+
+    def jalankan(self, *argv):
+        """Helper: jalankan main() dengan database sementara -> (kode, stdout, stderr)"""
+        keluar, galat = io.StringIO(), io.StringIO()
+        with redirect_stdout(keluar), redirect_stderr(galat):
+            kode = main.main(["--db", self.db, "--log", os.path.join(self.tmpdir, "log"),
+                              *argv])
+        return kode, keluar.getvalue(), galat.getvalue()
+
+    def test_tanpa_penyimpanan_ditolak(self):
+        """Test perintah yang butuh penyimpanan persisten ditolak tanpa --db/--snapshot"""
+        korban = self._tulis_csv("korban.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+                                 [["Budi", "KRB-001", "Umum", "2"]])
+        env = {k: v for k, v in os.environ.items()
+               if k not in ("DAPUR_UMUM_DB", "DAPUR_UMUM_SNAPSHOT")}
+        for perintah in (("import-korban", korban), ("check-gizi",)):
+            galat = io.StringIO()
+            with mock.patch.dict(os.environ, env, clear=True), \
+                    redirect_stdout(io.StringIO()), redirect_stderr(galat):
+                kode = main.main(["--jurnal", self.tmpdir, "--log", os.path.join(self.tmpdir, "log"),
+                                  *perintah])
+            self.assertEqual(kode, main.KELUAR_USAGE, perintah)
+            self.assertIn("--db", galat.getvalue())
+
+        # Riwayat stok hanya persisten di SQLite, snapshot saja tidak cukup
+        galat = io.StringIO()
+        with mock.patch.dict(os.environ, env, clear=True), \
+                redirect_stdout(io.StringIO()), redirect_stderr(galat):
+            kode = main.main(["--snapshot", os.path.join(self.tmpdir, "state.snap"),
+                              "--log", os.path.join(self.tmpdir, "log"), "stock-at", "Beras"])
+        self.assertEqual(kode, main.KELUAR_USAGE)
+        self.assertIn("--db", galat.getvalue())
+
+    def test_snapshot_hanya_ditulis_setelah_perubahan(self):
+        """Test perintah baca tidak menulis ulang snapshot, perintah impor menulisnya"""
+        snapshot = os.path.join(self.tmpdir, "state.snap")
+        log = os.path.join(self.tmpdir, "log")
+
+        def jalankan_snapshot(*argv):
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                return main.main(["--snapshot", snapshot, "--log", log, *argv])
+
+        korban = self._tulis_csv("korban.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+                                 [["Budi", "KRB-001", "Umum", "2"]])
+        self.assertEqual(jalankan_snapshot("import-korban", korban), main.KELUAR_OK)
+        self.assertTrue(os.path.exists(snapshot))
+        os.utime(snapshot, (0, 0))
+
+        for perintah in (("report",), ("export", "korban"), ("check-gizi",)):
+            jalankan_snapshot(*perintah)
+            self.assertEqual(os.stat(snapshot).st_mtime, 0, perintah)
+
+        jalankan_snapshot("import-korban", self._tulis_csv(
+            "korban2.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+            [["Siti", "KRB-002", "Lansia", "1"]]))
+        self.assertNotEqual(os.stat(snapshot).st_mtime, 0)
+
+    def test_alur_impor_distribusi_laporan(self):
+        """Test impor korban & bahan, distribusi dari file, lalu laporan JSON"""
+        korban = self._tulis_csv("korban.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+                                 [["Budi", "KRB-001", "Umum", "2"], ["Siti", "KRB-002", "Lansia", "1"]])
+        kode, keluar, _ = self.jalankan("import-korban", korban)
+        self.assertEqual(kode, main.KELUAR_OK)
+        self.assertEqual(json.loads(keluar)['berhasil'], 2)
+
+        bahan = self._tulis_csv("bahan.csv", ["jenis", "nama", "jumlah", "satuan", "per_porsi"],
+                                [["pokok", "Beras", "10", "kg", "250"], ["protein", "Telur", "50", "butir", ""]])
+        kode, keluar, _ = self.jalankan("import-bahan", bahan)
+        self.assertEqual((kode, json.loads(keluar)['berhasil']), (main.KELUAR_OK, 2))
+
+        dist = self._tulis_csv("dist.csv", ["id_korban", "jumlah_porsi"],
+                               [["KRB-001", "6"], ["KRB-002", "3"]])
+        kode, keluar, _ = self.jalankan("distribute", "--file", dist, "--catatan", "Pagi")
+        self.assertEqual(kode, main.KELUAR_OK)
+        self.assertEqual(json.loads(keluar)['total_porsi'], 9)
+
+        kode, keluar, _ = self.jalankan("report", "--format", "json")
+        laporan = json.loads(keluar)
+        self.assertEqual(kode, main.KELUAR_OK)
+        self.assertEqual(laporan['korban']['total_korban'], 2)
+        self.assertEqual(laporan['distribusi']['total_porsi_terdistribusi'], 9)
+        self.assertEqual(laporan['stok']['total_porsi_tersedia'], 31)
+
+        kode, keluar, _ = self.jalankan("report", "--jenis", "distribusi", "--rinci", "--format", "json")
+        self.assertEqual(kode, main.KELUAR_OK)
+        self.assertEqual(json.loads(keluar)['korban_terlayani'], 2)
+
+        # Ledger stok tersimpan di database: 10 kg masuk, 9 porsi x 0.25 kg keluar
+        kode, keluar, _ = self.jalankan("stock-at", "Beras", "--mulai", "2000-01-01T00:00")
+        riwayat = json.loads(keluar)
+        self.assertEqual(kode, main.KELUAR_OK)
+        self.assertAlmostEqual(riwayat['stok'], 7.75)
+        self.assertAlmostEqual(riwayat['mutasi']['masuk'], 10.0)
+        self.assertAlmostEqual(riwayat['mutasi']['keluar'], 2.25)
+        kode, keluar, _ = self.jalankan("stock-at", "Beras", "--waktu", "2000-01-01T06:00")
+        self.assertEqual(json.loads(keluar)['stok'], 0.0)
+
+    def test_baris_ditolak_kode_sebagian(self):
+        """Test baris tidak valid ditulis ke file error dan kode keluar 3"""
+        self.jalankan("import-korban", self._tulis_csv(
+            "korban.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+            [["Budi", "KRB-001", "Umum", "2"]]))
+        self.jalankan("import-bahan", self._tulis_csv(
+            "bahan.csv", ["jenis", "nama", "jumlah", "satuan", "per_porsi"],
+            [["pokok", "Beras", "1", "kg", "250"], ["buah", "Apel", "1", "kg", ""]]))
+
+        dist = self._tulis_csv("dist.csv", ["id_korban", "jumlah_porsi"],
+                               [["KRB-001", "2"], ["KRB-999", "1"], ["KRB-001", "x"],
+                                ["KRB-001", "10"]])
+        path_error = os.path.join(self.tmpdir, "error.csv")
+        kode, keluar, _ = self.jalankan("distribute", "--file", dist, "--error", path_error)
+        ringkasan = json.loads(keluar)
+
+        self.assertEqual(kode, main.KELUAR_SEBAGIAN)
+        self.assertEqual((ringkasan['berhasil'], ringkasan['ditolak']), (1, 3))
+        with open(path_error, newline="", encoding="utf-8") as f:
+            self.assertEqual(sorted(b["baris"] for b in csv.DictReader(f)), ["2", "3", "4"])
+
+    def test_check_gizi_kode_keluar(self):
+        """Test kode keluar check-gizi mengikuti status"""
+        self.jalankan("import-korban", self._tulis_csv(
+            "korban.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+            [["Budi", "KRB-001", "Umum", "4"]]))
+        kode, keluar, _ = self.jalankan("check-gizi", "--format", "json")
+        self.assertEqual((kode, json.loads(keluar)['status']), (main.KELUAR_KRITIS, "KRITIS"))
+
+        # 4 orang x 3 = 12 porsi/hari; 40 porsi cukup 3 hari
+        self.jalankan("import-bahan", self._tulis_csv(
+            "bahan.csv", ["jenis", "nama", "jumlah", "satuan", "per_porsi"],
+            [["pokok", "Beras", "10", "kg", "250"]]))
+        kode, keluar, _ = self.jalankan("check-gizi")
+        self.assertEqual(kode, main.KELUAR_WASPADA)
+        self.assertIn("status: WASPADA", keluar)
+
+    def test_tanpa_data_dummy_dan_error(self):
+        """Test mode batch tidak memuat data demo dan error file menghasilkan kode 1"""
+        kode, keluar, _ = self.jalankan("report", "--jenis", "korban", "--format", "json")
+        self.assertEqual((kode, json.loads(keluar)['total_korban']), (main.KELUAR_OK, 0))
+
+        kode, keluar, galat = self.jalankan("import-korban", os.path.join(self.tmpdir, "tidak-ada.csv"))
+        self.assertEqual((kode, keluar), (main.KELUAR_ERROR, ""))
+        self.assertIn("Error", galat)
+
+    def test_export_distribusi(self):
+        """Test export riwayat distribusi sebagai CSV ke file dan teks ke stdout"""
+        self.jalankan("import-korban", self._tulis_csv(
+            "korban.csv", ["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"],
+            [["Budi", "KRB-001", "Umum", "2"]]))
+        self.jalankan("import-bahan", self._tulis_csv(
+            "bahan.csv", ["jenis", "nama", "jumlah", "satuan", "per_porsi"],
+            [["pokok", "Beras", "10", "kg", "250"]]))
+        self.jalankan("distribute", "--file", self._tulis_csv(
+            "dist.csv", ["id_korban", "jumlah_porsi"], [["KRB-001", "4"], ["KRB-001", "6"]]))
+
+        path = os.path.join(self.tmpdir, "riwayat.csv")
+        kode, keluar, _ = self.jalankan("export", "distribusi", "--output", path)
+        self.assertEqual((kode, keluar), (main.KELUAR_OK, ""))
+        with open(path, newline="", encoding="utf-8") as f:
+            baris = list(csv.DictReader(f))
+        self.assertEqual([b['Porsi'] for b in baris], ["4", "6"])
+
+        kode, keluar, _ = self.jalankan("export", "korban", "--format", "teks")
+        self.assertIn("DATA KORBAN", keluar)
+        self.assertIn("KRB-001", keluar)
+
+    def test_bahan_dari_baris(self):
+        """Test validasi baris bahan"""
+        bahan = bahan_dari_baris({"jenis": "Sayuran", "nama": "Bayam", "jumlah": "3"})
+        self.assertEqual((bahan.get_nama(), bahan.get_satuan()), ("Bayam", "kg"))
+        for baris in ({"jenis": "pokok", "nama": "Beras", "jumlah": "-1"},
+                      {"jenis": "pokok", "nama": "Beras", "jumlah": "abc"},
+                      {"jenis": "pokok", "nama": "Beras", "jumlah": "1", "per_porsi": "0"},
+                      None):
+            with self.assertRaises(ValueError):
+                bahan_dari_baris(baris)
+
+
+if __name__ == '__main__':
+    unittest.main()
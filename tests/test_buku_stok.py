@@ -0,0 +1,136 @@
+"""
+Unit Testing untuk repositories/buku_stok.py
+Testing pencatatan event, checkpoint, stok pada waktu tertentu dan integrasi BahanRepository
+"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+from repositories.buku_stok import BukuStok
+from repositories.bahan_repository import BahanRepository
+from models.bahan_makanan import BahanMakanan, BahanPokok, BahanProtein
+
+AWAL = datetime(2024, 1, 1, 6, 0)
+
+
+def jam(n: float) -> float:
+    """Epoch n jam setelah AWAL."""
+    return (AWAL + timedelta(hours=n)).timestamp()
+
+
+class TestBukuStok(unittest.TestCase):
+    """Test case untuk BukuStok"""
+
+    def setUp(self):
+        self.buku = BukuStok(interval_checkpoint=4)
+
+    def test_stok_pada_waktu(self):
+        """Test stok pada waktu tertentu sama dengan replay penuh di setiap titik"""
+        stok, riwayat = 0.0, []
+        for i in range(50):
+            stok = stok + 10 if i % 3 == 0 else max(stok - 3.5, 0.0)
+            self.buku.catat("Beras", stok, jam(i))
+            riwayat.append(stok)
+
+        self.assertEqual(self.buku.get_stok_pada("Beras", AWAL - timedelta(hours=1)), 0.0)
+        for i, diharapkan in enumerate(riwayat):
+            self.assertAlmostEqual(self.buku.get_stok_pada("Beras", AWAL + timedelta(hours=i)),
+                                   diharapkan)
+            self.assertAlmostEqual(self.buku.get_stok_pada("Beras", AWAL + timedelta(hours=i, minutes=30)),
+                                   diharapkan)
+        self.assertEqual(self.buku.get_stok_pada("Gula", AWAL), 0.0)
+
+    def test_event_tanpa_perubahan_dan_waktu_mundur(self):
+        """Test stok yang sama tidak dicatat dan waktu mundur disamakan dengan event terakhir"""
+        self.buku.catat("Beras", 10.0, jam(2))
+        self.buku.catat("Beras", 10.0, jam(3))
+        self.buku.catat("Beras", 8.0, jam(1))
+        self.assertEqual(self.buku.jumlah_event("Beras"), 2)
+        self.assertEqual(self.buku.get_mutasi("Beras"),
+                         [(AWAL + timedelta(hours=2), 10.0), (AWAL + timedelta(hours=2), -2.0)])
+
+    def test_ringkasan_mutasi(self):
+        """Test ringkasan masuk/keluar untuk audit susut stok"""
+        for i, stok in enumerate((100.0, 80.0, 130.0, 95.0, 90.0)):
+            self.buku.catat("Beras", stok, jam(i))
+        ringkasan = self.buku.get_ringkasan_mutasi("Beras", AWAL + timedelta(hours=1),
+                                                   AWAL + timedelta(hours=4))
+        self.assertEqual(ringkasan, {'stok_awal': 100.0, 'masuk': 50.0,
+                                     'keluar': 55.0, 'stok_akhir': 95.0})
+
+    def test_validasi(self):
+        """Test interval checkpoint tidak valid ditolak"""
+        with self.assertRaises(ValueError):
+            BukuStok(interval_checkpoint=0)
+
+
+class TestBahanRepositoryBukuStok(unittest.TestCase):
+    """Test BahanRepository mencatat semua mutasi stok ke ledger"""
+
+    def setUp(self):
+        self.buku = BukuStok()
+        self.repo = BahanRepository(self.buku)
+
+    def test_mutasi_tercatat(self):
+        """Test tambah, kurangi, pengurangan bersama, update dan delete tercatat"""
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        telur = BahanProtein("Telur", 50.0, "butir", 1.0)
+        self.repo.add(beras)
+        self.repo.add(telur)
+        self.repo.add(BahanPokok("Beras", 20.0, "kg", 250.0))
+        beras.kurangi_stok(30.0)
+        BahanMakanan.kurangi_stok_bersama([(beras, 10.0), (telur, 5.0)])
+
+        self.assertEqual([s for _, s in self.buku.get_mutasi("Beras")], [100.0, 20.0, -30.0, -10.0])
+        self.assertEqual(self.buku.get_stok_pada("Telur", datetime.now()), 45.0)
+
+        pengganti = BahanProtein("Telur", 60.0, "butir", 1.0)
+        self.repo.update(pengganti)
+        telur.tambah_stok(99.0)  # object lama tidak lagi diikuti
+        pengganti.kurangi_stok(10.0)
+        self.repo.delete("Beras")
+
+        self.assertEqual([s for _, s in self.buku.get_mutasi("Telur")], [50.0, -5.0, 15.0, -10.0])
+        self.assertEqual(self.buku.get_stok_pada("Beras", datetime.now()), 0.0)
+        self.assertIs(self.repo.get_buku_stok(), self.buku)
+
+    def test_mutasi_bersamaan_tidak_hilang(self):
+        """Test -5 lalu +5 sebelum pengamat berjalan tetap tercatat sebagai dua event"""
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        # Posko lain menambah stok setelah lock dilepas, sebelum pengamat lain dipanggil
+        sela = []
+
+        def posko_lain(bahan):
+            if not sela:
+                sela.append(bahan)
+                bahan.tambah_stok(5.0)
+
+        beras.tambah_pengamat(posko_lain)
+        self.repo.add(beras)
+        beras.kurangi_stok(5.0)
+
+        self.assertEqual([s for _, s in self.buku.get_mutasi("Beras")], [100.0, -5.0, 5.0])
+        self.assertEqual(self.buku.get_stok_pada("Beras", datetime.now()), 100.0)
+
+    def test_mutasi_dari_beberapa_thread(self):
+        """Test jumlah event sama dengan jumlah mutasi dari beberapa thread"""
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        self.repo.add(beras)
+
+        def posko():
+            for _ in range(200):
+                beras.kurangi_stok(5.0)
+                beras.tambah_stok(5.0)
+
+        threads = [threading.Thread(target=posko) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(self.buku.jumlah_event("Beras"), 1 + 4 * 200 * 2)
+        self.assertEqual(self.buku.get_stok_pada("Beras", datetime.now()), 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
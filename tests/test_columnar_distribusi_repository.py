@@ -0,0 +1,125 @@
+"""
+Unit Testing untuk repositories/columnar_distribusi_repository.py
+Testing penyimpanan kolom, materialisasi dan agregasi distribusi
+"""
+
+import unittest
+from datetime import date, datetime
+from unittest import mock
+from repositories import columnar_distribusi_repository
+from repositories.columnar_distribusi_repository import ColumnarDistribusiRepository
+from repositories.korban_repository import KorbanRepository
+from repositories.bahan_repository import BahanRepository
+from services.dapur_service import DapurService
+from models.distribusi import DistribusiMakanan
+from models.person import Korban
+from models.bahan_makanan import BahanPokok
+
+
+class TestColumnarDistribusiRepository(unittest.TestCase):
+    """Test case untuk ColumnarDistribusiRepository"""
+
+    def setUp(self):
+        """Setup repository dengan beberapa distribusi di dua hari"""
+        self.repo = ColumnarDistribusiRepository()
+        self.repo.add(DistribusiMakanan("DIST-001", "KRB-001", 10, "Pagi",
+                                        datetime(2024, 1, 1, 8, 0)))
+        self.repo.add(DistribusiMakanan("DIST-002", "KRB-001", 15, "",
+                                        datetime(2024, 1, 1, 18, 0)))
+        self.repo.add(DistribusiMakanan("DIST-003", "KRB-002", 5, "",
+                                        datetime(2024, 1, 2, 12, 0)))
+
+    def test_materialisasi_get_by_id(self):
+        """Test object dibuat ulang dari kolom dengan nilai yang sama"""
+        dist = self.repo.get_by_id("DIST-001")
+        self.assertEqual(dist.get_id_korban(), "KRB-001")
+        self.assertEqual(dist.get_jumlah_porsi(), 10)
+        self.assertEqual(dist.get_catatan(), "Pagi")
+        self.assertEqual(dist.get_waktu_distribusi(), datetime(2024, 1, 1, 8, 0))
+        self.assertIsNone(self.repo.get_by_id("DIST-999"))
+
+    def test_add_duplikat(self):
+        """Test ID duplikat ditolak, termasuk di dalam batch"""
+        with self.assertRaises(ValueError):
+            self.repo.add(DistribusiMakanan("DIST-001", "KRB-003", 1))
+        with self.assertRaises(ValueError):
+            self.repo.add_many([DistribusiMakanan("DIST-004", "KRB-003", 1),
+                                DistribusiMakanan("DIST-004", "KRB-003", 1)])
+        self.assertEqual(self.repo.count(), 3)
+
+    def test_update_dan_delete(self):
+        """Test counter dan riwayat konsisten setelah update/delete"""
+        self.repo.update(DistribusiMakanan("DIST-002", "KRB-002", 7, "Pindah",
+                                           datetime(2024, 1, 2, 9, 0)))
+        self.repo.delete("DIST-001")
+
+        self.assertEqual(self.repo.count(), 2)
+        self.assertEqual(self.repo.get_total_porsi_terdistribusi(), 12)
+        self.assertEqual(self.repo.hitung_total_porsi(), 12)
+        self.assertEqual(self.repo.get_total_porsi_korban("KRB-001"), 0)
+        self.assertEqual(len(self.repo.get_by_korban("KRB-002")), 2)
+        self.assertEqual([d.get_id_distribusi() for d in self.repo.get_all()],
+                         ["DIST-002", "DIST-003"])
+        self.assertFalse(self.repo.delete("DIST-001"))
+    def test_get_by_waktu(self):
+        """Test query rentang waktu tetap benar setelah sisip tidak urut, update dan delete"""
+        self.repo.add(DistribusiMakanan("DIST-004", "KRB-003", 2, "", datetime(2024, 1, 1, 12, 0)))
+        hari_pertama = self.repo.get_by_waktu(datetime(2024, 1, 1), datetime(2024, 1, 2))
+        self.assertEqual([d.get_id_distribusi() for d in hari_pertama],
+                         ["DIST-001", "DIST-004", "DIST-002"])
+        self.assertEqual(self.repo.count_by_waktu(akhir=datetime(2024, 1, 1, 12, 0)), 1)
+
+        self.repo.update(DistribusiMakanan("DIST-001", "KRB-001", 10, "", datetime(2024, 1, 3)))
+        self.repo.delete("DIST-004")
+        self.assertEqual(self.repo.count_by_waktu(datetime(2024, 1, 1), datetime(2024, 1, 2)), 1)
+        self.assertEqual([d.get_id_distribusi() for d in self.repo.get_by_waktu(datetime(2024, 1, 2))],
+                         ["DIST-003", "DIST-001"])
+        self.assertEqual(self.repo.count_by_waktu(), self.repo.count())
+
+    def test_get_halaman_melewati_tombstone(self):
+        """Test paging melewati baris terhapus tanpa halaman kosong"""
+        self.repo.delete("DIST-002")
+        self.repo.delete("DIST-003")
+
+        halaman, kursor = self.repo.get_halaman(None, 1)
+        self.assertEqual([d.get_id_distribusi() for d in halaman], ["DIST-001"])
+        self.assertIsNone(kursor)
+
+        self.repo.add(DistribusiMakanan("DIST-004", "KRB-003", 2))
+        halaman, kursor = self.repo.get_halaman(None, 1)
+        halaman2, kursor = self.repo.get_halaman(kursor, 1)
+        self.assertEqual([d.get_id_distribusi() for d in halaman + halaman2],
+                         ["DIST-001", "DIST-004"])
+        self.assertIsNone(kursor)
+
+
+    def test_agregasi(self):
+        """Test jumlah per korban dan per hari"""
+        self.assertEqual(self.repo.get_porsi_per_korban(), {"KRB-001": 25, "KRB-002": 5})
+        self.assertEqual(self.repo.get_porsi_per_hari(),
+                         {date(2024, 1, 1): 25, date(2024, 1, 2): 5})
+
+    def test_agregasi_tanpa_numpy(self):
+        """Test jalur fallback Python memberi hasil yang sama"""
+        with mock.patch.object(columnar_distribusi_repository, "np", None):
+            self.assertEqual(self.repo.hitung_total_porsi(), 30)
+            self.assertEqual(self.repo.get_porsi_per_korban(), {"KRB-001": 25, "KRB-002": 5})
+            self.assertEqual(self.repo.get_porsi_per_hari(),
+                             {date(2024, 1, 1): 25, date(2024, 1, 2): 5})
+
+    def test_dipakai_dapur_service(self):
+        """Test repository kolom bisa diinjeksikan ke DapurService"""
+        korban_repo = KorbanRepository()
+        bahan_repo = BahanRepository()
+        korban_repo.add(Korban("Budi", "KRB-010", "Umum", 2))
+        bahan_repo.add(BahanPokok("Beras", 10.0, "kg", 250.0))
+        service = DapurService(bahan_repo, korban_repo, ColumnarDistribusiRepository())
+
+        service.distribusi_makanan("KRB-010", 4)
+        laporan = service.get_laporan_distribusi()
+        self.assertEqual(laporan['total_distribusi'], 1)
+        self.assertEqual(laporan['total_porsi_terdistribusi'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
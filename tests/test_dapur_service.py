@@ -4,12 +4,15 @@ Testing Business Logic Layer
 """
 
 import unittest
+from datetime import datetime, timedelta
 from services.dapur_service import DapurService
 from repositories.bahan_repository import BahanRepository
 from repositories.korban_repository import KorbanRepository
 from repositories.distribusi_repository import DistribusiRepository
-from models.bahan_makanan import BahanPokok, BahanProtein
+from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
 from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from models.resep import Resep
 
 
 class TestDapurService(unittest.TestCase):
@@ -85,6 +88,20 @@ class TestDapurService(unittest.TestCase):
         self.assertIsNotNone(distribusi)
         self.assertEqual(distribusi.get_jumlah_porsi(), 10)
     
+    def test_distribusi_detik_sama_tidak_bertabrakan(self):
+        """Test distribusi berulang ke korban yang sama dalam detik yang sama"""
+        self.service.tambah_bahan(BahanPokok("Beras", 100.0, "kg", 250.0))
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        
+        ids = [self.service.distribusi_makanan("KRB-001", 1).get_id_distribusi()
+               for _ in range(20)]
+        ids += [h['distribusi'].get_id_distribusi() for h in
+                self.service.distribusi_makanan_batch([("KRB-001", 1)] * 20)]
+        
+        self.assertEqual(len(set(ids)), 40)
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(self.distribusi_repo.count(), 40)
+    
     def test_distribusi_makanan_korban_not_found(self):
         """Test distribusi ke korban yang tidak ada"""
         beras = BahanPokok("Beras", 100.0, "kg", 250.0)
@@ -104,6 +121,116 @@ class TestDapurService(unittest.TestCase):
         with self. assertRaises(ValueError):
             self.service.distribusi_makanan("KRB-001", 100)  # Minta 100 porsi
     
+    def test_distribusi_makanan_batch(self):
+        """Test distribusi batch dengan hasil per item"""
+        beras = BahanPokok("Beras", 10.0, "kg", 250.0)  # 40 porsi
+        self.service.tambah_bahan(beras)
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        self.service.registrasi_korban(Korban("Siti", "KRB-002", "Lansia", 2))
+        
+        hasil = self.service.distribusi_makanan_batch([
+            ("KRB-001", 20),
+            ("KRB-999", 5),    # korban tidak ada
+            ("KRB-002", 15),
+            ("KRB-001", 10),   # melebihi sisa porsi (5)
+        ])
+        
+        self.assertEqual([h['berhasil'] for h in hasil], [True, False, True, False])
+        self.assertIn("tidak ditemukan", hasil[1]['error'])
+        self.assertIn("Porsi tidak cukup", hasil[3]['error'])
+        self.assertEqual(self.distribusi_repo.count(), 2)
+        self.assertEqual(self.distribusi_repo.get_total_porsi_korban("KRB-001"), 20)
+        # Stok dikurangi sekali secara agregat: 35 porsi x 0.25 kg
+        self.assertAlmostEqual(beras.get_jumlah(), 1.25)
+    
+    def test_distribusi_makanan_batch_gagal_simpan_kembalikan_stok(self):
+        """Test stok dikembalikan jika penyimpanan batch gagal"""
+        beras = BahanPokok("Beras", 10.0, "kg", 250.0)
+        self.service.tambah_bahan(beras)
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        
+        def gagal(entities):
+            raise ValueError("disk penuh")
+        self.distribusi_repo.add_many = gagal
+        
+        hasil = self.service.distribusi_makanan_batch([("KRB-001", 4)])
+        
+        self.assertFalse(hasil[0]['berhasil'])
+        self.assertEqual(beras.get_jumlah(), 10.0)
+    
+    def test_distribusi_mengurangi_semua_bahan(self):
+        """Test tanpa resep semua bahan dikurangi sesuai takaran masing-masing"""
+        beras = BahanPokok("Beras", 10.0, "kg", 250.0)     # 40 porsi
+        ayam = BahanProtein("Ayam", 3.0, "kg", 0.15)       # 20 porsi
+        kangkung = BahanSayuran("Kangkung", 5.0, "kg", 0.1)
+        for bahan in (beras, ayam, kangkung):
+            self.service.tambah_bahan(bahan)
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        
+        self.service.distribusi_makanan("KRB-001", 10)
+        
+        self.assertAlmostEqual(beras.get_jumlah(), 7.5)
+        self.assertAlmostEqual(ayam.get_jumlah(), 1.5)
+        self.assertAlmostEqual(kangkung.get_jumlah(), 4.0)
+        self.assertEqual(self.service.hitung_total_porsi_tersedia(), 10)
+        with self.assertRaises(ValueError):
+            self.service.distribusi_makanan("KRB-001", 11)
+        self.assertAlmostEqual(beras.get_jumlah(), 7.5)
+    
+    def test_hitung_porsi_per_bahan(self):
+        """Test porsi per bahan sama dengan hitung_porsi() masing-masing"""
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        ayam = BahanProtein("Ayam", 50.0, "kg", 0.15)
+        self.service.tambah_bahan(beras)
+        self.service.tambah_bahan(ayam)
+        
+        self.assertEqual(self.service.hitung_porsi_per_bahan(),
+                         {"Beras": beras.hitung_porsi(), "Ayam": ayam.hitung_porsi()})
+    
+    def test_distribusi_dengan_resep(self):
+        """Test resep menentukan porsi tersedia dan bahan yang dikurangi"""
+        beras = BahanPokok("Beras", 10.0, "kg", 250.0)
+        telur = BahanProtein("Telur", 30.0, "butir", 1.0)
+        bayam = BahanSayuran("Bayam", 1.0, "kg", 0.1)      # tidak dipakai resep
+        for bahan in (beras, telur, bayam):
+            self.service.tambah_bahan(bahan)
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        self.service.set_resep(Resep("Nasi Telur", {"Beras": 0.2, "Telur": 2.0}))
+        
+        self.assertEqual(self.service.hitung_total_porsi_tersedia(), 15)
+        hasil = self.service.distribusi_makanan_batch([("KRB-001", 5), ("KRB-001", 5)])
+        
+        self.assertTrue(all(h['berhasil'] for h in hasil))
+        self.assertAlmostEqual(beras.get_jumlah(), 8.0)
+        self.assertAlmostEqual(telur.get_jumlah(), 10.0)
+        self.assertEqual(bayam.get_jumlah(), 1.0)
+        self.assertEqual(self.service.hitung_total_porsi_tersedia(), 5)
+        
+        # Bahan resep yang tidak ada di inventori berarti 0 porsi
+        self.service.set_resep(Resep("Nasi Ikan", {"Beras": 0.2, "Ikan": 0.1}))
+        self.assertEqual(self.service.hitung_total_porsi_tersedia(), 0)
+    
+    def test_distribusi_batch_stok_berubah_ditolak(self):
+        """Test batch ditolak tanpa menyimpan apa pun jika stok habis setelah dicek"""
+        beras = BahanPokok("Beras", 10.0, "kg", 250.0)
+        self.service.tambah_bahan(beras)
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        
+        # Posko lain memakai stok di antara cek porsi dan pengurangan
+        hitung_asli = self.service.hitung_total_porsi_tersedia
+        def hitung_lalu_habiskan():
+            porsi = hitung_asli()
+            beras.kurangi_stok(9.0)
+            return porsi
+        self.service.hitung_total_porsi_tersedia = hitung_lalu_habiskan
+        
+        hasil = self.service.distribusi_makanan_batch([("KRB-001", 10)])
+        
+        self.assertFalse(hasil[0]['berhasil'])
+        self.assertIn("Stok bahan tidak cukup", hasil[0]['error'])
+        self.assertEqual(self.distribusi_repo.count(), 0)
+        self.assertAlmostEqual(beras.get_jumlah(), 1.0)
+    
     def test_get_laporan_stok(self):
         """Test generate laporan stok"""
         beras = BahanPokok("Beras", 100.0, "kg", 250.0)
@@ -114,6 +241,25 @@ class TestDapurService(unittest.TestCase):
         self.assertEqual(laporan['total_jenis_bahan'], 1)
         self.assertGreater(laporan['total_porsi_tersedia'], 0)
     
+    def test_ringkasan_dan_halaman_detail(self):
+        """Test ringkasan tanpa detail dan detail laporan per halaman"""
+        for i in range(3):
+            self.service.registrasi_korban(Korban(f"Korban {i}", f"KRB-{i:03d}", "Umum", 2))
+        
+        ringkasan = self.service.get_ringkasan_korban()
+        self.assertEqual(ringkasan, {'total_korban': 3, 'total_tanggungan': 6})
+        
+        halaman = self.service.get_halaman_detail('korban', None, 2)
+        self.assertEqual(len(halaman['detail']), 2)
+        halaman = self.service.get_halaman_detail('korban', halaman['kursor_berikut'], 2)
+        self.assertEqual(len(halaman['detail']), 1)
+        self.assertIsNone(halaman['kursor_berikut'])
+        
+        self.assertEqual(list(self.service.iter_detail('korban', 2)),
+                         self.service.get_laporan_korban()['detail_korban'])
+        with self.assertRaises(ValueError):
+            self.service.get_halaman_detail('relawan')
+    
     def test_cek_kebutuhan_gizi(self):
         """Test analisis kebutuhan gizi"""
         beras = BahanPokok("Beras", 100.0, "kg", 250.0)  # 400 porsi
@@ -127,7 +273,60 @@ class TestDapurService(unittest.TestCase):
         self.assertEqual(status['total_tanggungan'], 4)
         self.assertEqual(status['kebutuhan_harian'], 12)  # 4 * 3
         self.assertIn(status['status'], ['AMAN', 'WASPADA', 'KRITIS'])
-
+        self.assertEqual(status['sumber_kebutuhan'], 'asumsi')
+        self.assertEqual(status['estimasi_hari_per_bahan'], {'Beras': 33})
+    
+    def _riwayat_distribusi(self, porsi_per_hari_lalu):
+        """Menambah distribusi lampau langsung ke repository: {hari_lalu: porsi}."""
+        sekarang = datetime.now()
+        for i, (hari_lalu, porsi) in enumerate(porsi_per_hari_lalu.items()):
+            self.distribusi_repo.add(DistribusiMakanan(
+                f"DIST-LAMA-{i}", "KRB-001", porsi, "", sekarang - timedelta(days=hari_lalu)))
+    
+    def test_cek_kebutuhan_gizi_dari_riwayat(self):
+        """Test kebutuhan harian mengikuti riwayat distribusi, bukan asumsi 3x makan"""
+        self.service.tambah_bahan(BahanPokok("Beras", 100.0, "kg", 250.0))  # 400 porsi
+        self.service.tambah_bahan(BahanProtein("Telur", 200.0, "butir", 2.0))  # 100 porsi
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        self._riwayat_distribusi({3: 20, 2: 20, 1: 20})
+        
+        status = self.service.cek_kebutuhan_gizi()
+        
+        self.assertEqual(status['sumber_kebutuhan'], 'prakiraan')
+        self.assertEqual(status['kebutuhan_harian'], 20)
+        self.assertEqual(status['estimasi_hari'], 5)
+        self.assertEqual(status['estimasi_hari_per_bahan'], {'Beras': 20, 'Telur': 5})
+        self.assertEqual(status['status'], 'WASPADA')
+        
+        # Distribusi baru dicatat inkremental dan terhitung saat harinya selesai
+        self.service.distribusi_makanan("KRB-001", 60)
+        besok = (datetime.now() + timedelta(days=1)).timestamp()
+        self.assertAlmostEqual(self.service.get_prakiraan().laju_harian(besok), 30.0)
+    
+    def test_cek_kebutuhan_gizi_riwayat_tipis(self):
+        """Test satu distribusi kemarin tidak menggantikan asumsi 3x makan"""
+        self.service.tambah_bahan(BahanProtein("Telur", 2000.0, "butir", 1.0))  # 2000 porsi
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 1000))
+        self._riwayat_distribusi({1: 5})
+        
+        status = self.service.cek_kebutuhan_gizi()
+        
+        self.assertEqual(status['sumber_kebutuhan'], 'asumsi')
+        self.assertEqual(status['kebutuhan_harian'], 3000)
+        self.assertEqual(status['status'], 'KRITIS')
+    
+    def test_cek_kebutuhan_gizi_riwayat_basi(self):
+        """Test prakiraan yang meluruh karena hari tanpa distribusi dibatasi dari bawah"""
+        self.service.tambah_bahan(BahanProtein("Telur", 2000.0, "butir", 1.0))  # 2000 porsi
+        self.service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 1000))
+        self._riwayat_distribusi({40: 3000, 39: 3000, 38: 3000})
+        
+        status = self.service.cek_kebutuhan_gizi()
+        
+        self.assertEqual(status['sumber_kebutuhan'], 'batas_bawah')
+        self.assertEqual(status['kebutuhan_harian'], 2000)
+        self.assertEqual(status['estimasi_hari'], 1)
+        self.assertEqual(status['status'], 'KRITIS')
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Unit Testing untuk utils/id_generator.py
+Testing keunikan, urutan monoton dan keamanan thread generator ID
+"""
+
+import threading
+import unittest
+from unittest import mock
+from utils.id_generator import GeneratorID, URUT_MAKS, format_id, id_berikutnya
+from utils.formatter import buat_id_unik
+
+
+class TestGeneratorID(unittest.TestCase):
+    """Test case untuk GeneratorID"""
+
+    def test_monoton_dan_terurut_sebagai_string(self):
+        """Test ID naik monoton dan urutan string sama dengan urutan angka"""
+        gen = GeneratorID(node_id=1)
+        ids = [gen.berikutnya() for _ in range(10000)] + gen.berikutnya_banyak(10000)
+        self.assertEqual(ids, sorted(set(ids)))
+        teks = [format_id(n) for n in ids]
+        self.assertEqual(teks, sorted(teks))
+
+    def test_urutan_habis_pinjam_milidetik(self):
+        """Test lebih dari 4096 ID dalam milidetik yang sama tetap unik"""
+        gen = GeneratorID(node_id=0)
+        with mock.patch("utils.id_generator.time.time_ns", return_value=1704067200000 * 10**6 + 5):
+            ids = gen.berikutnya_banyak(URUT_MAKS + 10)
+        self.assertEqual(len(set(ids)), URUT_MAKS + 10)
+        self.assertEqual(gen.waktu_dari(ids[-1]), 1704067200.001)
+
+    def test_jam_mundur_tetap_monoton(self):
+        """Test ID tetap naik walaupun jam sistem mundur"""
+        gen = GeneratorID(node_id=0)
+        with mock.patch("utils.id_generator.time.time_ns", return_value=1800000000000 * 10**6):
+            pertama = gen.berikutnya()
+        with mock.patch("utils.id_generator.time.time_ns", return_value=1700000000000 * 10**6):
+            kedua = gen.berikutnya()
+        self.assertGreater(kedua, pertama)
+
+    def test_node_berbeda_tidak_bertabrakan(self):
+        """Test dua node pada milidetik yang sama menghasilkan ID berbeda"""
+        with mock.patch("utils.id_generator.time.time_ns", return_value=1800000000000 * 10**6):
+            a = GeneratorID(node_id=1).berikutnya_banyak(100)
+            b = GeneratorID(node_id=2).berikutnya_banyak(100)
+        self.assertFalse(set(a) & set(b))
+        self.assertEqual(GeneratorID(node_id=2).node_id, 2)
+        with self.assertRaises(ValueError):
+            GeneratorID(node_id=1024)
+
+    def test_thread_safe(self):
+        """Test 8 thread menerbitkan ID bersamaan tanpa duplikat"""
+        gen = GeneratorID(node_id=3)
+        hasil = [[] for _ in range(8)]
+
+        def kerja(i):
+            hasil[i].extend(gen.berikutnya() for _ in range(5000))
+
+        threads = [threading.Thread(target=kerja, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        semua = [n for bagian in hasil for n in bagian]
+        self.assertEqual(len(set(semua)), 40000)
+        for bagian in hasil:
+            self.assertEqual(bagian, sorted(bagian))
+
+    def test_id_string(self):
+        """Test helper string dan buat_id_unik"""
+        self.assertRegex(id_berikutnya("DIST"), r"^DIST-[0-9A-F]{16}$")
+        self.assertNotEqual(buat_id_unik("KRB"), buat_id_unik("KRB"))
+
+
+if __name__ == '__main__':
+    unittest.main()
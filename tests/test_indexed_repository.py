@@ -0,0 +1,99 @@
+"""
+Unit Testing untuk repositories/indexed_repository.py
+Testing konsistensi secondary index pada KorbanRepository dan BahanRepository
+"""
+
+import unittest
+from repositories.korban_repository import KorbanRepository
+from repositories.bahan_repository import BahanRepository
+from models.person import Korban
+from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+
+
+class TestIndexKorbanRepository(unittest.TestCase):
+    """Test index kebutuhan dan tanggungan tetap konsisten"""
+
+    def setUp(self):
+        """Setup repository dengan beberapa korban"""
+        self.repo = KorbanRepository()
+        self.budi = Korban("Budi", "KRB-001", "Umum", 4)
+        self.siti = Korban("Siti", "KRB-002", "Lansia", 2)
+        self.ahmad = Korban("Ahmad", "KRB-003", "Lansia", 6)
+        for k in (self.budi, self.siti, self.ahmad):
+            self.repo.add(k)
+
+    def test_hash_index_lookup(self):
+        """Test pencarian kebutuhan lewat hash index"""
+        ids = [k.get_id() for k in self.repo.get_by_kebutuhan("Lansia")]
+        self.assertEqual(ids, ["KRB-002", "KRB-003"])
+        self.assertEqual(self.repo.idx_kebutuhan.hitung("Bayi"), 0)
+
+    def test_ordered_index_ikut_setter(self):
+        """Test index terurut diperbarui saat set_jumlah_tanggungan dipanggil"""
+        self.siti.set_jumlah_tanggungan(9)
+
+        ids = [k.get_id() for k in self.repo.get_by_tanggungan_minimal(5)]
+        self.assertEqual(ids, ["KRB-003", "KRB-002"])
+        self.assertEqual(self.repo.idx_tanggungan.hitung_rentang(bawah=5), 2)
+
+    def test_delete_mengeluarkan_dari_index(self):
+        """Test entitas yang dihapus tidak lagi muncul dan tidak diamati"""
+        self.repo.delete("KRB-002")
+        self.siti.set_jumlah_tanggungan(10)
+
+        self.assertEqual([k.get_id() for k in self.repo.get_by_kebutuhan("Lansia")], ["KRB-003"])
+        self.assertEqual(self.repo.idx_tanggungan.hitung_rentang(bawah=10), 0)
+
+    def test_update_dengan_object_baru(self):
+        """Test update mengganti object lama di index"""
+        siti_baru = Korban("Siti", "KRB-002", "Sakit", 3)
+        self.repo.update(siti_baru)
+        self.siti.set_jumlah_tanggungan(8)  # object lama tidak lagi diamati
+
+        self.assertEqual(self.repo.get_by_kebutuhan("Sakit")[0], siti_baru)
+        self.assertEqual(len(self.repo.get_by_kebutuhan("Lansia")), 1)
+        self.assertEqual(self.repo.idx_tanggungan.hitung_rentang(bawah=8), 0)
+
+
+class TestIndexBahanRepository(unittest.TestCase):
+    """Test index jumlah stok mengikuti tambah/kurangi stok"""
+
+    def test_stok_rendah_ikut_perubahan_stok(self):
+        """Test get_stok_rendah konsisten setelah stok berubah"""
+        repo = BahanRepository()
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        gula = BahanPokok("Gula", 5.0, "kg", 50.0)
+        repo.add(beras)
+        repo.add(gula)
+
+        beras.kurangi_stok(95.0)
+        repo.add(BahanPokok("Gula", 20.0, "kg", 50.0))  # aggregate stok
+
+        self.assertEqual([b.get_nama() for b in repo.get_stok_rendah(10.0)], ["Beras"])
+
+    def test_porsi_minimum_inkremental(self):
+        """Test agregat bottleneck mengikuti add/delete dan perubahan stok"""
+        repo = BahanRepository()
+        self.assertIsNone(repo.get_porsi_minimum())
+
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)      # 400 porsi
+        ayam = BahanProtein("Ayam", 50.0, "kg", 0.15)        # 333 porsi
+        sayur = BahanSayuran("Kangkung", 30.0, "kg", 0.1)   # 300 porsi
+        for b in (beras, ayam, sayur):
+            repo.add(b)
+        self.assertEqual(repo.get_porsi_minimum(), 300)
+
+        beras.kurangi_stok(90.0)                            # 40 porsi
+        self.assertEqual(repo.get_porsi_minimum(), 40)
+
+        beras.tambah_stok(90.0)
+        repo.delete("Kangkung")
+        self.assertEqual(repo.get_porsi_minimum(), 333)
+
+        # Bandingkan dengan perhitungan penuh
+        self.assertEqual(repo.get_porsi_minimum(),
+                         min(b.hitung_porsi() for b in repo.get_all()))
+
+
+if __name__ == '__main__':
+    unittest.main()
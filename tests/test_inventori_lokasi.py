@@ -0,0 +1,77 @@
+"""
+Unit Testing untuk repositories/inventori_lokasi.py
+Testing stok per lokasi, agregat porsi lintas shard dan transfer atomik
+"""
+
+import unittest
+from models.bahan_makanan import BahanPokok, BahanProtein
+from models.person import Korban
+from repositories.inventori_lokasi import InventoriMultiLokasi
+from repositories.korban_repository import KorbanRepository
+from repositories.distribusi_repository import DistribusiRepository
+from services.dapur_service import DapurService
+
+
+class TestInventoriMultiLokasi(unittest.TestCase):
+    """Test case untuk InventoriMultiLokasi"""
+
+    def setUp(self):
+        """Setup gudang pusat dan dua posko"""
+        self.inventori = InventoriMultiLokasi(["Gudang", "Posko A", "Posko B"])
+        self.inventori.add("Gudang", BahanPokok("Beras", 100.0, "kg", 250.0))      # 400 porsi
+        self.inventori.add("Gudang", BahanProtein("Telur", 300.0, "butir", 1.0))   # 300 porsi
+        self.inventori.add("Posko A", BahanPokok("Beras", 5.0, "kg", 250.0))       # 20 porsi
+
+    def test_bahan_sama_di_beberapa_lokasi(self):
+        """Test bahan bernama sama disimpan terpisah per lokasi"""
+        self.assertEqual(self.inventori.get_stok("Beras"), {"Gudang": 100.0, "Posko A": 5.0})
+        self.assertEqual(self.inventori.get_lokasi(), ["Gudang", "Posko A", "Posko B"])
+        with self.assertRaises(ValueError):
+            self.inventori.add("Posko Z", BahanPokok("Beras", 1.0))
+
+    def test_porsi_lintas_lokasi(self):
+        """Test total porsi menggabungkan agregat bottleneck tiap lokasi"""
+        self.assertEqual(self.inventori.get_porsi_per_lokasi(),
+                         {"Gudang": 300, "Posko A": 20, "Posko B": 0})
+        self.assertEqual(self.inventori.hitung_total_porsi_tersedia(), 320)
+        self.assertEqual(self.inventori.get_ringkasan()["Gudang"],
+                         {'total_jenis_bahan': 2, 'total_porsi_tersedia': 300})
+
+    def test_transfer_batch(self):
+        """Test transfer memindahkan stok dan membuat lot baru dengan takaran sama"""
+        jumlah = self.inventori.transfer([("Gudang", "Posko B", "Beras", 10.0),
+                                          ("Gudang", "Posko B", "Telur", 20.0),
+                                          ("Gudang", "Posko A", "Beras", 5.0)])
+        self.assertEqual(jumlah, 3)
+        self.assertEqual(self.inventori.get_stok("Beras"),
+                         {"Gudang": 85.0, "Posko A": 10.0, "Posko B": 10.0})
+        telur = self.inventori.get_repo("Posko B").get_by_id("Telur")
+        self.assertIsInstance(telur, BahanProtein)
+        self.assertEqual(telur.get_unit_per_porsi(), 1.0)
+        self.assertEqual(self.inventori.get_porsi_per_lokasi(),
+                         {"Gudang": 280, "Posko A": 40, "Posko B": 20})
+
+    def test_transfer_gagal_tidak_mengubah_stok(self):
+        """Test satu perintah gagal membatalkan seluruh batch"""
+        for perintah in ([("Gudang", "Posko B", "Beras", 10.0), ("Posko A", "Posko B", "Beras", 6.0)],
+                         [("Gudang", "Posko B", "Beras", 10.0), ("Posko B", "Gudang", "Telur", 1.0)],
+                         [("Gudang", "Gudang", "Beras", 1.0)],
+                         [("Gudang", "Posko B", "Beras", 0)]):
+            with self.assertRaises(ValueError):
+                self.inventori.transfer(perintah)
+        self.assertEqual(self.inventori.get_stok("Beras"), {"Gudang": 100.0, "Posko A": 5.0})
+        self.assertEqual(self.inventori.get_repo("Posko B").count(), 0)
+
+    def test_repo_lokasi_untuk_dapur_service(self):
+        """Test distribusi di posko mengurangi stok posko dan ringkasan ikut berubah"""
+        korban_repo = KorbanRepository()
+        korban_repo.add(Korban("Budi", "KRB-001", "Umum", 2))
+        service = DapurService(self.inventori.get_repo("Posko A"), korban_repo, DistribusiRepository())
+
+        service.distribusi_makanan("KRB-001", 8)
+        self.assertEqual(self.inventori.get_stok("Beras"), {"Gudang": 100.0, "Posko A": 3.0})
+        self.assertEqual(self.inventori.hitung_total_porsi_tersedia(), 312)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit Testing untuk repositories/jurnal.py
+Testing jurnal append-only, snapshot dan pemulihan DistribusiRepository
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from repositories.jurnal import Jurnal
+from repositories.distribusi_repository import DistribusiRepository
+from models.distribusi import DistribusiMakanan
+
+
+class TestJurnal(unittest.TestCase):
+    """Test case untuk Jurnal"""
+
+    def setUp(self):
+        """Buat direktori jurnal sementara"""
+        self.direktori = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Hapus direktori jurnal sementara"""
+        shutil.rmtree(self.direktori)
+
+    def test_catat_dan_muat(self):
+        """Test record yang dicatat bisa dibaca kembali berurutan"""
+        with Jurnal(self.direktori) as jurnal:
+            list(jurnal.muat())
+            jurnal.catat("add", [1])
+            jurnal.catat("delete", "x")
+
+        self.assertEqual(list(Jurnal(self.direktori).muat()), [("add", [1]), ("delete", "x")])
+
+    def test_snapshot_dan_ekor(self):
+        """Test snapshot mengosongkan jurnal dan hanya ekor yang diputar ulang"""
+        with Jurnal(self.direktori) as jurnal:
+            list(jurnal.muat())
+            jurnal.catat("add", [1])
+            jurnal.simpan_snapshot([[1], [2]])
+            jurnal.catat("add", [3])
+            self.assertEqual(jurnal.entri_sejak_snapshot(), 1)
+
+        jurnal = Jurnal(self.direktori)
+        self.assertEqual(list(jurnal.muat()), [("add", [1]), ("add", [2]), ("add", [3])])
+        self.assertEqual(jurnal.entri_sejak_snapshot(), 1)
+
+    def test_ekor_terpotong_dibuang(self):
+        """Test baris terakhir yang tidak utuh diabaikan dan dibuang dari file"""
+        with Jurnal(self.direktori) as jurnal:
+            list(jurnal.muat())
+            jurnal.catat("add", [1])
+        with open(os.path.join(self.direktori, "distribusi.jurnal"), "ab") as f:
+            f.write(b'[2,"add",[')
+
+        with Jurnal(self.direktori) as jurnal:
+            self.assertEqual(list(jurnal.muat()), [("add", [1])])
+            jurnal.catat("add", [3])
+        self.assertEqual(list(Jurnal(self.direktori).muat()), [("add", [1]), ("add", [3])])
+
+    def test_wajib_muat_sebelum_catat(self):
+        """Test jurnal yang sudah ada tidak boleh ditulis tanpa dimuat"""
+        with Jurnal(self.direktori) as jurnal:
+            list(jurnal.muat())
+            jurnal.catat("add", [1])
+        with self.assertRaises(RuntimeError):
+            Jurnal(self.direktori).catat("add", [2])
+
+
+class TestDistribusiRepositoryJurnal(unittest.TestCase):
+    """Test case DistribusiRepository dengan jurnal"""
+
+    def setUp(self):
+        """Buat direktori jurnal sementara"""
+        self.direktori = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Hapus direktori jurnal sementara"""
+        shutil.rmtree(self.direktori)
+
+    def buka(self, snapshot_minimal: int = 10000) -> DistribusiRepository:
+        """Helper membuat repository dari direktori jurnal yang sama"""
+        return DistribusiRepository(Jurnal(self.direktori), snapshot_minimal)
+
+    def test_pulih_setelah_restart(self):
+        """Test add/update/delete dan perubahan setter dipulihkan"""
+        repo = self.buka()
+        waktu = datetime(2024, 1, 1, 12, 30)
+        dist = DistribusiMakanan("DIST-001", "KRB-001", 10, "", waktu)
+        repo.add(dist)
+        repo.add_many([DistribusiMakanan("DIST-002", "KRB-002", 5),
+                       DistribusiMakanan("DIST-003", "KRB-002", 7)])
+        repo.update(DistribusiMakanan("DIST-002", "KRB-002", 6))
+        repo.delete("DIST-003")
+        dist.set_catatan("Lansia")
+        repo.tutup()
+
+        repo = self.buka()
+        self.assertEqual(repo.count(), 2)
+        self.assertEqual(repo.get_total_porsi_terdistribusi(), 16)
+        self.assertEqual(repo.get_by_id("DIST-001").get_catatan(), "Lansia")
+        self.assertEqual(repo.get_by_id("DIST-001").get_waktu_distribusi(), waktu)
+        self.assertEqual(repo.get_total_porsi_korban("KRB-002"), 6)
+        repo.tutup()
+
+    def test_snapshot_periodik(self):
+        """Test snapshot dibuat otomatis dan jurnal dikosongkan"""
+        repo = self.buka(snapshot_minimal=3)
+        for i in range(5):
+            repo.add(DistribusiMakanan(f"DIST-{i}", "KRB-001", 1))
+        repo.tutup()
+
+        self.assertTrue(os.path.exists(os.path.join(self.direktori, "distribusi.snapshot")))
+        jurnal = Jurnal(self.direktori)
+        operasi = [op for op, _ in jurnal.muat()]
+        self.assertEqual(len(operasi), 5)
+        self.assertLess(jurnal.entri_sejak_snapshot(), 3)
+
+        repo = self.buka(snapshot_minimal=3)
+        self.assertEqual(repo.count(), 5)
+        repo.tutup()
+
+
+if __name__ == '__main__':
+    unittest.main()
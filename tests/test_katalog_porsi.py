@@ -0,0 +1,61 @@
+"""
+Unit Testing untuk models/katalog_porsi.py
+Testing hasil vektor sama persis dengan hitung_porsi() tiap class bahan
+"""
+
+import random
+import unittest
+from unittest import mock
+from models import katalog_porsi
+from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+from models.katalog_porsi import KatalogPorsi
+from utils.logging_config import mode_senyap
+
+
+class TestKatalogPorsi(unittest.TestCase):
+    """Test case untuk KatalogPorsi"""
+
+    def setUp(self):
+        """Setup katalog acak berisi tiga jenis bahan"""
+        acak = random.Random(20)
+        jenis = [
+            lambda i: BahanPokok(f"Pokok {i}", acak.uniform(0, 500), "kg", acak.choice([100.0, 250.0, 333.3])),
+            lambda i: BahanProtein(f"Protein {i}", acak.uniform(0, 200), "kg", acak.choice([0.1, 0.15, 2.0])),
+            lambda i: BahanSayuran(f"Sayur {i}", acak.uniform(0, 50), "kg", acak.choice([0.1, 0.3, 0.07])),
+        ]
+        with mode_senyap(('models',)):
+            self.bahan = [jenis[i % 3](i) for i in range(3000)]
+            self.bahan.append(BahanSayuran("Kangkung", 0.3, "kg", 0.1))   # 2.9999... -> 2
+        self.katalog = KatalogPorsi.dari_bahan(self.bahan)
+
+    def test_sama_dengan_polymorphic(self):
+        """Test porsi per item dan minimum sama dengan hitung_porsi()"""
+        harapan = [b.hitung_porsi() for b in self.bahan]
+        self.assertEqual(len(self.katalog), len(self.bahan))
+        self.assertEqual(self.katalog.porsi_per_item(), harapan)
+        self.assertEqual(self.katalog.porsi_minimum(), min(harapan))
+        self.assertEqual(self.katalog.porsi_per_bahan()["Kangkung"], 2)
+
+    def test_tanpa_numpy(self):
+        """Test jalur fallback Python memberi hasil yang sama"""
+        harapan = [b.hitung_porsi() for b in self.bahan]
+        with mock.patch.object(katalog_porsi, "np", None):
+            self.assertEqual(self.katalog.porsi_per_item(), harapan)
+            self.assertEqual(self.katalog.porsi_minimum(), min(harapan))
+
+    def test_simpan_memperbarui_baris(self):
+        """Test simpan bahan dengan nama sama memperbarui barisnya"""
+        katalog = KatalogPorsi()
+        self.assertIsNone(katalog.porsi_minimum())
+        with mode_senyap(('models',)):
+            beras = BahanPokok("Beras", 10.0, "kg", 250.0)
+            katalog.simpan(beras)
+            beras.kurangi_stok(5.0)
+            katalog.simpan(beras)
+            with self.assertRaises(ValueError):
+                katalog.simpan(BahanProtein("Telur", 10.0, "butir", 0.0))
+        self.assertEqual(katalog.porsi_per_bahan(), {"Beras": 20})
+
+
+if __name__ == '__main__':
+    unittest.main()
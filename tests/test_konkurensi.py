@@ -0,0 +1,202 @@
+"""
+Unit Testing konkurensi: beberapa posko (thread) memakai inventori yang sama
+Testing stok tidak pernah negatif dan repository tetap konsisten
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from models.bahan_makanan import BahanPokok, BahanProtein
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from repositories.bahan_repository import BahanRepository
+from repositories.korban_repository import KorbanRepository
+from repositories.distribusi_repository import DistribusiRepository
+from repositories.columnar_distribusi_repository import ColumnarDistribusiRepository
+from repositories.sqlite_repository import (
+    buka_koneksi, SQLiteBahanRepository, SQLiteKorbanRepository, SQLiteDistribusiRepository
+)
+from services.dapur_service import DapurService
+from utils.logging_config import mode_senyap
+
+JUMLAH_POSKO = 8
+
+
+def jalankan_paralel(target, jumlah_thread: int = JUMLAH_POSKO) -> None:
+    """Helper menjalankan target(nomor_thread) di beberapa thread yang mulai bersamaan"""
+    mulai = threading.Barrier(jumlah_thread)
+
+    def kerja(nomor: int) -> None:
+        mulai.wait()
+        target(nomor)
+
+    threads = [threading.Thread(target=kerja, args=(i,)) for i in range(jumlah_thread)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestBahanKonkuren(unittest.TestCase):
+    """Test case pengurangan stok bersamaan pada satu bahan"""
+
+    def test_tidak_ada_pengurangan_hilang(self):
+        """Test setiap pengurangan yang berhasil tercatat dan stok tidak negatif"""
+        beras = BahanPokok("Beras", 1000.0, "kg", 250.0)
+        berhasil = [0] * JUMLAH_POSKO
+
+        def kurangi(nomor: int) -> None:
+            for _ in range(300):
+                if beras.kurangi_stok_jika_cukup(1.0):
+                    berhasil[nomor] += 1
+
+        with mode_senyap(('models',)):
+            jalankan_paralel(kurangi)
+
+        self.assertEqual(sum(berhasil), 1000)
+        self.assertEqual(beras.get_jumlah(), 0.0)
+
+    def test_index_repository_konsisten(self):
+        """Test index BahanRepository tetap konsisten saat stok diubah bersamaan"""
+        repo = BahanRepository()
+        with mode_senyap():
+            for i in range(JUMLAH_POSKO):
+                repo.add(BahanPokok(f"Beras-{i}", 100.0, "kg", 250.0))
+
+            def ubah(nomor: int) -> None:
+                for i in range(200):
+                    bahan = repo.get_by_id(f"Beras-{(nomor + i) % JUMLAH_POSKO}")
+                    if i % 2:
+                        bahan.tambah_stok(0.5)
+                    else:
+                        bahan.kurangi_stok_jika_cukup(0.75)
+
+            jalankan_paralel(ubah)
+
+        porsi = [b.hitung_porsi() for b in repo.get_all()]
+        self.assertEqual(repo.get_porsi_minimum(), min(porsi))
+        stok_rendah = sorted(b.get_nama() for b in repo.get_all() if b.get_jumlah() < 99.0)
+        self.assertEqual(sorted(b.get_nama() for b in repo.get_stok_rendah(99.0)), stok_rendah)
+
+
+class TestDistribusiKonkuren(unittest.TestCase):
+    """Test case distribusi bersamaan dari beberapa posko"""
+
+    def jalankan_posko(self, distribusi_repo) -> None:
+        """Helper: 8 posko mendistribusikan 2000 porsi dari stok 1200 porsi"""
+        self.beras = BahanPokok("Beras", 300.0, "kg", 250.0)
+        self.distribusi_repo = distribusi_repo
+        service = DapurService(BahanRepository(), KorbanRepository(), distribusi_repo)
+        self.gagal = [0] * JUMLAH_POSKO
+        self.stok_negatif = []
+        # Error "porsi tidak cukup" memang diharapkan untuk 800 permintaan
+        with mode_senyap(level=logging.CRITICAL):
+            service.tambah_bahan(self.beras)
+            for i in range(2000):
+                service.registrasi_korban(Korban(f"Korban {i}", f"KRB-{i:04d}", "Umum", 1))
+
+            def posko(nomor: int) -> None:
+                for i in range(nomor, 2000, JUMLAH_POSKO):
+                    try:
+                        service.distribusi_makanan(f"KRB-{i:04d}", 1)
+                    except ValueError:
+                        self.gagal[nomor] += 1
+                    if self.beras.get_jumlah() < 0:
+                        self.stok_negatif.append(self.beras.get_jumlah())
+
+            jalankan_paralel(posko)
+
+    def periksa(self) -> None:
+        """Helper: tidak ada oversell dan stok sesuai porsi yang tercatat"""
+        self.assertEqual(self.distribusi_repo.count(), 1200)
+        self.assertEqual(self.distribusi_repo.get_total_porsi_terdistribusi(), 1200)
+        self.assertEqual(sum(self.gagal), 800)
+        self.assertEqual(self.stok_negatif, [])
+        self.assertEqual(self.beras.get_jumlah(), 0.0)
+
+    def test_tidak_oversell(self):
+        """Test stok tidak pernah negatif dan sesuai distribusi yang tersimpan"""
+        self.jalankan_posko(DistribusiRepository())
+        self.periksa()
+
+    def test_tidak_oversell_kolom(self):
+        """Test hal yang sama dengan repository distribusi berbasis kolom"""
+        self.jalankan_posko(ColumnarDistribusiRepository())
+        self.periksa()
+
+    def test_resep_tidak_terpotong_sebagian(self):
+        """Test pengurangan banyak bahan bersamaan tetap all-or-nothing"""
+        beras = BahanPokok("Beras", 30.0, "kg", 250.0)        # 120 porsi
+        telur = BahanProtein("Telur", 200.0, "butir", 2.0)    # 100 porsi
+        distribusi_repo = DistribusiRepository()
+        service = DapurService(BahanRepository(), KorbanRepository(), distribusi_repo)
+        with mode_senyap(level=logging.CRITICAL):
+            service.tambah_bahan(beras)
+            service.tambah_bahan(telur)
+            for i in range(JUMLAH_POSKO):
+                service.registrasi_korban(Korban(f"Korban {i}", f"KRB-{i}", "Umum", 1))
+
+            def posko(nomor: int) -> None:
+                for _ in range(30):
+                    try:
+                        service.distribusi_makanan(f"KRB-{nomor}", 1)
+                    except ValueError:
+                        pass
+
+            jalankan_paralel(posko)
+
+        self.assertEqual(distribusi_repo.get_total_porsi_terdistribusi(), 100)
+        self.assertEqual(telur.get_jumlah(), 0.0)
+        self.assertAlmostEqual(beras.get_jumlah(), 5.0)
+
+    def test_tidak_oversell_sqlite(self):
+        """Test posko bersamaan pada database SQLite tidak oversell (cek-dan-kurangi di SQL)"""
+        tmpdir = tempfile.mkdtemp()
+        koneksi = buka_koneksi(os.path.join(tmpdir, "dapur.db"))
+        try:
+            bahan_repo = SQLiteBahanRepository(koneksi)
+            distribusi_repo = SQLiteDistribusiRepository(koneksi)
+            service = DapurService(bahan_repo, SQLiteKorbanRepository(koneksi), distribusi_repo)
+            gagal = [0] * JUMLAH_POSKO
+            with mode_senyap(level=logging.CRITICAL):
+                service.tambah_bahan(BahanPokok("Beras", 100.0, "kg", 250.0))  # 400 porsi
+                service.registrasi_korban(Korban("Budi", "K1", "Umum", 1))
+
+                def posko(nomor: int) -> None:
+                    for _ in range(75):
+                        try:
+                            service.distribusi_makanan("K1", 1)
+                        except ValueError:
+                            gagal[nomor] += 1
+
+                jalankan_paralel(posko)
+
+            self.assertEqual(distribusi_repo.count(), 400)
+            self.assertEqual(sum(gagal), JUMLAH_POSKO * 75 - 400)
+            self.assertEqual(bahan_repo.get_by_id("Beras").get_jumlah(), 0.0)
+        finally:
+            koneksi.close()
+            shutil.rmtree(tmpdir)
+
+    def test_add_bersamaan(self):
+        """Test add bersamaan ke DistribusiRepository menjaga counter dan index"""
+        repo = DistribusiRepository()
+
+        def tambah(nomor: int) -> None:
+            for i in range(250):
+                repo.add(DistribusiMakanan(f"DIST-{nomor}-{i}", f"KRB-{i % 10}", 2))
+
+        with mode_senyap():
+            jalankan_paralel(tambah)
+
+        self.assertEqual(repo.count(), 2000)
+        self.assertEqual(repo.get_total_porsi_terdistribusi(), 4000)
+        self.assertEqual(repo.get_total_porsi_korban("KRB-3"), 400)
+        self.assertEqual(len(repo.get_by_korban("KRB-3")), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit Testing untuk services/korban_importer.py
+Testing impor streaming korban dari CSV dan JSONL
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from services.korban_importer import KorbanImporter, validasi_baris
+from repositories.korban_repository import KorbanRepository
+from models.person import Korban
+
+
+class TestKorbanImporter(unittest.TestCase):
+    """Test case untuk KorbanImporter"""
+    
+    def setUp(self):
+        """Setup folder sementara dan repository kosong"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.repo = KorbanRepository()
+        self.repo.add(Korban("Lama", "KRB-000", "Umum", 1))
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    
+    def _tulis_csv(self, baris):
+        path = os.path.join(self.tmpdir, "korban.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["nama", "id", "kebutuhan_khusus", "jumlah_tanggungan"])
+            writer.writerows(baris)
+        return path
+    
+    def _baca_error(self, path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    
+    def test_validasi_baris(self):
+        """Test normalisasi dan penolakan baris"""
+        _, data, alasan, _ = validasi_baris(1, {"nama": " Budi ", "id": "KRB-1"})
+        self.assertEqual(data, ("Budi", "KRB-1", "Umum", 1))
+        self.assertIsNone(alasan)
+        
+        _, data, alasan, _ = validasi_baris(2, {"nama": "Siti", "id": "KRB-2",
+                                                "jumlah_tanggungan": "0"})
+        self.assertIsNone(data)
+        self.assertIn("minimal 1", alasan)
+    
+    def test_impor_csv_dengan_file_error(self):
+        """Test impor CSV: baris valid dimuat, baris invalid & duplikat dilaporkan"""
+        path = self._tulis_csv([
+            ["Budi", "KRB-001", "Umum", "4"],
+            ["", "KRB-002", "Lansia", "2"],          # nama kosong
+            ["Siti", "KRB-003", "Lansia", "dua"],    # tanggungan invalid
+            ["Ahmad", "KRB-000", "Bayi", "3"],       # sudah terdaftar
+            ["Dewi", "KRB-004", "Sakit", ""],        # default tanggungan 1
+            ["Budi2", "KRB-001", "Umum", "1"],       # duplikat di file
+        ])
+        path_error = os.path.join(self.tmpdir, "error.csv")
+        
+        importer = KorbanImporter(self.repo, ukuran_chunk=2)
+        ringkasan = importer.impor(path, path_error)
+        
+        self.assertEqual(ringkasan, {'total_baris': 6, 'berhasil': 2, 'ditolak': 4})
+        self.assertEqual(self.repo.get_by_id("KRB-004").get_jumlah_tanggungan(), 1)
+        self.assertEqual([e["baris"] for e in self._baca_error(path_error)],
+                         ["2", "3", "4", "6"])
+    
+    def test_impor_jsonl_process_pool(self):
+        """Test impor JSONL dengan validasi di process pool"""
+        path = os.path.join(self.tmpdir, "korban.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(1, 51):
+                f.write(json.dumps({"nama": f"Korban {i}", "id": f"KRB-{i:03d}",
+                                    "kebutuhan_khusus": "Umum", "jumlah_tanggungan": 2}) + "\n")
+            f.write("{rusak\n")
+        
+        importer = KorbanImporter(self.repo, ukuran_chunk=7, jumlah_proses=2)
+        ringkasan = importer.impor(path)
+        
+        self.assertEqual(ringkasan['berhasil'], 50)
+        self.assertEqual(ringkasan['ditolak'], 1)
+        self.assertEqual(self.repo.get_total_tanggungan(), 101)
+    
+    def test_format_tidak_didukung(self):
+        """Test format file selain CSV/JSONL ditolak"""
+        with self.assertRaises(ValueError):
+            KorbanImporter(self.repo).impor(os.path.join(self.tmpdir, "data.xlsx"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit Testing untuk services/laporan_paralel.py
+Testing agregat per chunk, penggabungan dan hasil pool sama dengan serial
+"""
+
+import unittest
+from datetime import datetime
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+from repositories.bahan_repository import BahanRepository
+from repositories.korban_repository import KorbanRepository
+from repositories.distribusi_repository import DistribusiRepository
+from services.dapur_service import DapurService
+from services.laporan_paralel import MesinLaporan, gabung_parsial
+from utils.logging_config import mode_senyap
+
+
+class TestMesinLaporan(unittest.TestCase):
+    """Test case untuk MesinLaporan"""
+
+    def setUp(self):
+        """Setup 50 korban dan 120 distribusi pada dua hari"""
+        self.korban_repo = KorbanRepository()
+        self.distribusi_repo = DistribusiRepository()
+        with mode_senyap():
+            self.korban_repo.add_many(
+                Korban(f"Korban {i}", f"KRB-{i:03d}", ("Umum", "Lansia")[i % 2], 1 + i % 3)
+                for i in range(50))
+            self.distribusi_repo.add_many(
+                DistribusiMakanan(f"DIST-{i:03d}", f"KRB-{i % 40:03d}", 1 + i % 4, "",
+                                  datetime(2024, 1, 1 + i % 2, 12, 0))
+                for i in range(120))
+
+    def test_rincian_serial(self):
+        """Test rincian per kebutuhan, per hari dan korban terlayani"""
+        laporan = MesinLaporan(self.korban_repo, self.distribusi_repo, ukuran_chunk=7).laporan_lengkap()
+        korban, distribusi = laporan['korban'], laporan['distribusi']
+
+        self.assertEqual(korban['total_korban'], 50)
+        self.assertEqual(korban['total_tanggungan'], self.korban_repo.get_total_tanggungan())
+        self.assertEqual(korban['korban_per_kebutuhan'], {"Umum": 25, "Lansia": 25})
+        self.assertNotIn('detail_korban', korban)
+        self.assertEqual(distribusi['total_porsi_terdistribusi'], 300)
+        self.assertEqual(distribusi['porsi_per_hari'], {"2024-01-01": 120, "2024-01-02": 180})
+        self.assertEqual(distribusi['korban_terlayani'], 40)
+        self.assertEqual(distribusi['rata_rata_porsi'], 2.5)
+
+    def test_pool_sama_dengan_serial(self):
+        """Test hasil process pool (chunk kecil) sama persis dengan serial, termasuk urutan detail"""
+        serial = MesinLaporan(self.korban_repo, self.distribusi_repo, 0, 16).laporan_lengkap(True)
+        paralel = MesinLaporan(self.korban_repo, self.distribusi_repo, 2, 16).laporan_lengkap(True)
+        self.assertEqual(paralel, serial)
+        self.assertEqual(serial['korban']['detail_korban'],
+                         [k.get_info() for k in self.korban_repo.get_all()])
+
+    def test_laporan_service_dengan_proses(self):
+        """Test get_laporan_* dengan jumlah_proses memberi detail yang sama"""
+        service = DapurService(BahanRepository(), self.korban_repo, self.distribusi_repo)
+        self.assertEqual(service.get_laporan_korban(jumlah_proses=2), service.get_laporan_korban())
+        self.assertEqual(service.get_laporan_distribusi(jumlah_proses=2),
+                         service.get_laporan_distribusi())
+
+    def test_gabung_parsial_dan_validasi(self):
+        """Test penggabungan angka, dict, list dan set serta parameter tidak valid"""
+        total = {'n': 1, 'per': {'a': 1}, 'baris': ['x'], 'id': {1}}
+        gabung_parsial(total, {'n': 2, 'per': {'a': 1, 'b': 2}, 'baris': ['y'], 'id': {1, 2}})
+        self.assertEqual(total, {'n': 3, 'per': {'a': 2, 'b': 2}, 'baris': ['x', 'y'], 'id': {1, 2}})
+        with self.assertRaises(ValueError):
+            MesinLaporan(self.korban_repo, self.distribusi_repo, ukuran_chunk=0)
+        with self.assertRaises(ValueError):
+            MesinLaporan(self.korban_repo, self.distribusi_repo, jumlah_proses=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Unit Testing untuk utils/logging_config.py
+Testing sampling, mode senyap dan pipeline logging berbasis antrean
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from utils.logging_config import (
+    FilterSampel, FilterSenyapThread, hentikan_logging, mode_senyap, senyap_thread, setup_logging
+)
+
+
+def buat_record(nama: str, level: int = logging.INFO, msg: str = "Korban %s terdaftar"):
+    """Helper membuat LogRecord tanpa melewati logger."""
+    return logging.LogRecord(nama, level, __file__, 1, msg, ("KRB-001",), None)
+
+
+class TestFilterSampel(unittest.TestCase):
+    """Test case untuk FilterSampel"""
+
+    def test_sampling_per_event(self):
+        """Test hanya 1 dari N event yang sama yang diteruskan"""
+        filter_sampel = FilterSampel(setiap=3)
+        lolos = [filter_sampel.filter(buat_record("models.person")) for _ in range(7)]
+        self.assertEqual(lolos, [True, False, False, True, False, False, True])
+
+        # Template lain dihitung terpisah
+        self.assertTrue(filter_sampel.filter(buat_record("models.person", msg="Lain %s")))
+
+    def test_warning_selalu_lolos(self):
+        """Test record WARNING ke atas tidak pernah disampling"""
+        filter_sampel = FilterSampel(setiap=100)
+        hasil = [filter_sampel.filter(buat_record("models", logging.WARNING)) for _ in range(3)]
+        self.assertEqual(hasil, [True, True, True])
+
+    def test_rasio_per_logger(self):
+        """Test override rasio berdasarkan prefix nama logger"""
+        filter_sampel = FilterSampel(per_logger={"models": 2})
+        self.assertEqual([filter_sampel.filter(buat_record("models.person")) for _ in range(2)],
+                         [True, False])
+        self.assertEqual([filter_sampel.filter(buat_record("services.x")) for _ in range(2)],
+                         [True, True])
+
+    def test_rasio_tidak_valid(self):
+        """Test rasio sampling < 1 ditolak"""
+        with self.assertRaises(ValueError):
+            FilterSampel(setiap=0)
+
+
+class TestModeSenyap(unittest.TestCase):
+    """Test case untuk mode_senyap"""
+
+    def test_level_dikembalikan(self):
+        """Test INFO dibungkam selama context dan level lama dikembalikan"""
+        logger = logging.getLogger("models.person")
+        induk = logging.getLogger("models")
+        level_awal = induk.level
+        with mode_senyap():
+            self.assertFalse(logger.isEnabledFor(logging.INFO))
+            self.assertTrue(logger.isEnabledFor(logging.WARNING))
+            with mode_senyap():
+                pass
+            self.assertFalse(logger.isEnabledFor(logging.INFO))
+        self.assertEqual(induk.level, level_awal)
+
+    def test_context_tumpang_tindih(self):
+        """Test context yang keluar tidak berurutan tetap mengembalikan level asli"""
+        nama = ("models", "repositories", "services")
+        level_awal = [logging.getLogger(n).level for n in nama]
+        a, b = mode_senyap(), mode_senyap()
+        a.__enter__()
+        b.__enter__()
+        a.__exit__(None, None, None)
+        self.assertFalse(logging.getLogger("models.person").isEnabledFor(logging.INFO))
+        b.__exit__(None, None, None)
+        self.assertEqual([logging.getLogger(n).level for n in nama], level_awal)
+
+
+class TestSenyapThread(unittest.TestCase):
+    """Test case untuk senyap_thread"""
+
+    def test_hanya_thread_pemanggil(self):
+        """Test record thread lain tetap lolos dan level logger global tidak berubah"""
+        filter_senyap = FilterSenyapThread()
+        level_awal = logging.getLogger("models").level
+        dari_thread_lain = []
+
+        def posko_lain():
+            dari_thread_lain.append(filter_senyap.filter(buat_record("models.distribusi")))
+
+        with senyap_thread():
+            self.assertFalse(filter_senyap.filter(buat_record("models.distribusi")))
+            self.assertTrue(filter_senyap.filter(buat_record("models.distribusi", logging.WARNING)))
+            self.assertTrue(filter_senyap.filter(buat_record("api.server")))
+            self.assertEqual(logging.getLogger("models").level, level_awal)
+            t = threading.Thread(target=posko_lain)
+            t.start()
+            t.join()
+            with senyap_thread(("api",)):
+                self.assertFalse(filter_senyap.filter(buat_record("api.server")))
+            self.assertTrue(filter_senyap.filter(buat_record("api.server")))
+
+        self.assertEqual(dari_thread_lain, [True])
+        self.assertTrue(filter_senyap.filter(buat_record("models.distribusi")))
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Test case untuk setup_logging"""
+
+    def setUp(self):
+        """Simpan konfigurasi root logger agar bisa dikembalikan"""
+        self.root = logging.getLogger()
+        self.handler_awal = list(self.root.handlers)
+        self.level_awal = self.root.level
+
+    def tearDown(self):
+        """Kembalikan konfigurasi root logger"""
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        for handler in self.handler_awal:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.level_awal)
+
+    def test_record_ditulis_oleh_listener(self):
+        """Test pesan lazy %-style sampai ke file lewat QueueListener"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.log")
+            setup_logging(log_file=path, konsol=False)
+            logging.getLogger("models.person").info("Korban %s terdaftar", "KRB-001")
+            hentikan_logging()
+
+            with open(path, encoding="utf-8") as f:
+                isi = f.read()
+        self.assertIn("models.person - INFO - Korban KRB-001 terdaftar", isi)
+
+    def test_senyap_thread_lewat_pipeline(self):
+        """Test handler antrean setup_logging menerapkan senyap_thread"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.log")
+            setup_logging(log_file=path, konsol=False)
+            logger = logging.getLogger("models.distribusi")
+            with senyap_thread():
+                logger.info("Distribusi %s dibungkam", "D1")
+                t = threading.Thread(target=logger.info, args=("Distribusi %s posko lain", "D2"))
+                t.start()
+                t.join()
+            hentikan_logging()
+
+            with open(path, encoding="utf-8") as f:
+                isi = f.read()
+        self.assertNotIn("D1", isi)
+        self.assertIn("Distribusi D2 posko lain", isi)
+
+
+if __name__ == '__main__':
+    unittest.main()
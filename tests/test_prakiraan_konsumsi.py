@@ -0,0 +1,81 @@
+"""
+Unit Testing untuk services/prakiraan_konsumsi.py
+Testing EWMA per hari, hari kosong, batas riwayat minimum dan pembangunan dari riwayat
+"""
+
+import unittest
+from datetime import date, datetime
+from models.distribusi import DistribusiMakanan
+from services.prakiraan_konsumsi import PrakiraanKonsumsi, _batas_hari
+
+HARI = date(2026, 1, 5).toordinal()
+
+
+def siang(hari_ke: int) -> float:
+    """Epoch pukul 12 siang pada HARI + hari_ke."""
+    return _batas_hari(HARI + hari_ke)[0] + 12 * 3600
+
+
+class TestPrakiraanKonsumsi(unittest.TestCase):
+    """Test case untuk PrakiraanKonsumsi"""
+
+    def setUp(self):
+        self.prakiraan = PrakiraanKonsumsi(rentang_hari=3, hari_minimum=1)  # alpha = 0.5
+
+    def test_tanpa_riwayat(self):
+        """Test prakiraan belum tersedia tanpa hari yang selesai"""
+        self.assertIsNone(self.prakiraan.laju_harian(siang(0)))
+        self.prakiraan.catat(10, siang(0))
+        self.assertIsNone(self.prakiraan.laju_harian(siang(0)))
+
+    def test_ewma_per_hari(self):
+        """Test total per hari dilipat ke EWMA saat hari berganti"""
+        self.prakiraan.catat(4, siang(0))
+        self.prakiraan.catat(6, siang(0))
+        self.prakiraan.catat(20, siang(1))
+        self.assertAlmostEqual(self.prakiraan.laju_harian(siang(1)), 10.0)
+        self.assertAlmostEqual(self.prakiraan.laju_harian(siang(2)), 15.0)
+
+    def test_hari_kosong_meluruhkan_laju(self):
+        """Test hari tanpa distribusi dihitung sebagai 0 porsi"""
+        self.prakiraan.catat(10, siang(0))
+        self.prakiraan.catat(8, siang(3))
+        # hari 0 = 10, hari 1 dan 2 = 0 -> 10 * 0.5^2
+        self.assertAlmostEqual(self.prakiraan.laju_harian(siang(3)), 2.5)
+        self.assertAlmostEqual(self.prakiraan.laju_harian(siang(4)), 5.25)
+
+    def test_distribusi_terlambat_masuk_hari_aktif(self):
+        """Test distribusi dengan waktu lampau tidak membuka ulang hari yang sudah ditutup"""
+        self.prakiraan.catat(10, siang(0))
+        self.prakiraan.catat(10, siang(1))
+        self.prakiraan.catat(5, siang(0))
+        self.assertAlmostEqual(self.prakiraan.laju_harian(siang(2)), 12.5)
+
+    def test_hari_minimum(self):
+        """Test prakiraan menunggu jumlah hari selesai minimum"""
+        prakiraan = PrakiraanKonsumsi(rentang_hari=3, hari_minimum=2)
+        prakiraan.catat(10, siang(0))
+        self.assertIsNone(prakiraan.laju_harian(siang(1)))
+        self.assertAlmostEqual(prakiraan.laju_harian(siang(2)), 5.0)
+
+    def test_dari_riwayat_sama_dengan_inkremental(self):
+        """Test membangun dari riwayat (urutan acak) sama dengan pencatatan berurutan"""
+        porsi = [(3, 12), (0, 5), (1, 7), (0, 3), (3, 1)]
+        riwayat = [DistribusiMakanan(f"DIST-{i}", "KRB-001", jumlah, "",
+                                     datetime.fromtimestamp(siang(hari_ke)))
+                   for i, (hari_ke, jumlah) in enumerate(porsi)]
+        dibangun = PrakiraanKonsumsi.dari_riwayat(riwayat, rentang_hari=3, hari_minimum=1)
+        for hari_ke, jumlah in sorted(porsi):
+            self.prakiraan.catat(jumlah, siang(hari_ke))
+        self.assertAlmostEqual(dibangun.laju_harian(siang(5)), self.prakiraan.laju_harian(siang(5)))
+
+    def test_validasi(self):
+        """Test parameter tidak valid ditolak"""
+        with self.assertRaises(ValueError):
+            PrakiraanKonsumsi(rentang_hari=0)
+        with self.assertRaises(ValueError):
+            PrakiraanKonsumsi(hari_minimum=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ Testing KorbanRepository, BahanRepository, DistribusiRepository
 """
 
 import unittest
+from datetime import datetime
 from repositories.korban_repository import KorbanRepository
 from repositories.bahan_repository import BahanRepository
 from repositories.distribusi_repository import DistribusiRepository
@@ -103,6 +104,41 @@ class TestKorbanRepository(unittest.TestCase):
         total = self. repo.get_total_tanggungan()
         self.assertEqual(total, 6)
 
+    
+    def test_get_halaman(self):
+        """Test cursor paging dan iter_semua menurut urutan registrasi"""
+        for i in range(5):
+            self.repo.add(Korban(f"Korban {i}", f"KRB-{i:03d}", "Umum", 1))
+        
+        halaman1, kursor = self.repo.get_halaman(None, 2)
+        halaman2, kursor = self.repo.get_halaman(kursor, 2)
+        halaman3, kursor = self.repo.get_halaman(kursor, 2)
+        
+        self.assertEqual([k.get_id() for k in halaman1 + halaman2 + halaman3],
+                         [f"KRB-{i:03d}" for i in range(5)])
+        self.assertIsNone(kursor)
+        self.assertEqual(len(list(self.repo.iter_semua(ukuran_halaman=2))), 5)
+        with self.assertRaises(ValueError):
+            self.repo.get_halaman("bukan-angka", 2)
+        with self.assertRaises(ValueError):
+            self.repo.get_halaman(None, 0)
+    
+    def test_get_halaman_keyset_setelah_hapus(self):
+        """Test hapus di antara dua halaman tidak membuat korban terlewat"""
+        for i in range(10):
+            self.repo.add(Korban(f"Korban {i}", f"K{i}", "Umum", 1))
+        
+        halaman1, kursor = self.repo.get_halaman(None, 5)
+        self.repo.delete("K0")
+        self.repo.delete("K6")
+        self.repo.add(Korban("Korban 10", "K10", "Umum", 1))
+        halaman2, kursor = self.repo.get_halaman(kursor, 5)
+        
+        self.assertEqual([k.get_id() for k in halaman1], ["K0", "K1", "K2", "K3", "K4"])
+        self.assertEqual([k.get_id() for k in halaman2], ["K5", "K7", "K8", "K9", "K10"])
+        self.assertIsNone(kursor)
+        self.assertEqual([k.get_id() for k in self.repo.iter_semua(ukuran_halaman=3)],
+                         [k.get_id() for k in self.repo.get_all()])
 
 class TestBahanRepository(unittest.TestCase):
     """Test case untuk BahanRepository"""
@@ -176,6 +212,41 @@ class TestDistribusiRepository(unittest.TestCase):
         
         total = self.repo.get_total_porsi_terdistribusi()
         self.assertEqual(total, 25)
+    
+    def test_counter_berjalan_update_delete(self):
+        """Test counter total dan per korban konsisten setelah update/delete"""
+        self.repo.add(self.dist1)  # KRB-001, 10 porsi
+        self.repo.add(self.dist2)  # KRB-001, 15 porsi
+        self.repo.add(DistribusiMakanan("DIST-003", "KRB-002", 5))
+        
+        self.repo.update(DistribusiMakanan("DIST-002", "KRB-002", 7))
+        self.repo.delete("DIST-001")
+        
+        self.assertEqual(self.repo.count(), 2)
+        self.assertEqual(self.repo.get_total_porsi_terdistribusi(), 12)
+        self.assertEqual(self.repo.get_total_porsi_korban("KRB-001"), 0)
+        self.assertEqual(self.repo.get_total_porsi_korban("KRB-002"), 12)
+        self.assertEqual(len(self.repo.get_by_korban("KRB-002")), 2)
+        self.assertEqual(self.repo.get_by_korban("KRB-001"), [])
+    
+    def test_get_by_waktu(self):
+        """Test query rentang waktu [mulai, akhir) terurut menurut waktu"""
+        for i, jam in enumerate((18, 8, 12, 7)):
+            hari = 2 if jam == 7 else 1
+            self.repo.add(DistribusiMakanan(f"DIST-{i}", "KRB-001", 1, "",
+                                            datetime(2024, 1, hari, jam)))
+        
+        pagi_siang = self.repo.get_by_waktu(datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 18))
+        self.assertEqual([d.get_id_distribusi() for d in pagi_siang], ["DIST-1", "DIST-2"])
+        self.assertEqual(self.repo.count_by_waktu(datetime(2024, 1, 1), datetime(2024, 1, 2)), 3)
+        self.assertEqual(self.repo.count_by_waktu(mulai=datetime(2024, 1, 1, 12)), 3)
+        self.assertEqual(self.repo.count_by_waktu(), 4)
+        
+        self.repo.update(DistribusiMakanan("DIST-0", "KRB-001", 1, "", datetime(2024, 1, 3)))
+        self.repo.delete("DIST-2")
+        self.assertEqual(self.repo.count_by_waktu(datetime(2024, 1, 1), datetime(2024, 1, 2)), 1)
+        self.assertEqual([d.get_id_distribusi() for d in self.repo.get_by_waktu(datetime(2024, 1, 2))],
+                         ["DIST-3", "DIST-0"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,79 @@
+"""
+Unit Testing untuk models/resep.py dan pengurangan stok bersama
+Testing takaran per porsi, hitung porsi dan pengurangan all-or-nothing
+"""
+
+import unittest
+from models.bahan_makanan import BahanMakanan, BahanPokok, BahanProtein, BahanSayuran
+from models.resep import Resep
+
+
+class TestResep(unittest.TestCase):
+    """Test case untuk class Resep"""
+
+    def setUp(self):
+        self.resep = Resep("Nasi Ayam", {"Beras": 0.2, "Ayam": 0.1, "Kangkung": 0.05})
+
+    def test_kebutuhan(self):
+        """Test kebutuhan bahan untuk sejumlah porsi"""
+        kebutuhan = self.resep.kebutuhan(10)
+        self.assertAlmostEqual(kebutuhan["Beras"], 2.0)
+        self.assertAlmostEqual(kebutuhan["Ayam"], 1.0)
+        self.assertAlmostEqual(kebutuhan["Kangkung"], 0.5)
+
+    def test_hitung_porsi_bottleneck(self):
+        """Test porsi dibatasi bahan yang paling sedikit, bahan hilang = 0"""
+        self.assertEqual(self.resep.hitung_porsi({"Beras": 10.0, "Ayam": 3.0, "Kangkung": 5.0}), 30)
+        self.assertEqual(self.resep.hitung_porsi({"Beras": 10.0, "Ayam": 3.0}), 0)
+
+    def test_dari_bahan(self):
+        """Test resep bawaan memakai takaran per porsi setiap bahan"""
+        resep = Resep.dari_bahan([BahanPokok("Beras", 10.0, "kg", 250.0),
+                                  BahanProtein("Telur", 30.0, "butir", 2.0),
+                                  BahanSayuran("Bayam", 5.0, "kg", 0.1)])
+        self.assertEqual(resep.get_takaran(), {"Beras": 0.25, "Telur": 2.0, "Bayam": 0.1})
+        self.assertEqual(resep.get_nama_bahan(), ["Bayam", "Beras", "Telur"])
+
+    def test_validasi(self):
+        """Test resep tidak valid ditolak"""
+        for nama, takaran in (("", {"Beras": 0.2}), ("Kosong", {}), ("Nol", {"Beras": 0})):
+            with self.assertRaises(ValueError):
+                Resep(nama, takaran)
+        with self.assertRaises(ValueError):
+            self.resep.kebutuhan(-1)
+
+
+class TestKurangiStokBersama(unittest.TestCase):
+    """Test case untuk BahanMakanan.kurangi_stok_bersama"""
+
+    def setUp(self):
+        self.beras = BahanPokok("Beras", 10.0, "kg", 250.0)
+        self.ayam = BahanProtein("Ayam", 1.0, "kg", 0.15)
+
+    def test_semua_dikurangi(self):
+        """Test semua stok dikurangi sekaligus dan pengamat dipanggil"""
+        dipanggil = []
+        self.ayam.tambah_pengamat(lambda b: dipanggil.append(b.get_nama()))
+        self.assertTrue(BahanMakanan.kurangi_stok_bersama([(self.beras, 2.5), (self.ayam, 0.6)]))
+        self.assertAlmostEqual(self.beras.get_jumlah(), 7.5)
+        self.assertAlmostEqual(self.ayam.get_jumlah(), 0.4)
+        self.assertEqual(dipanggil, ["Ayam"])
+
+    def test_tidak_ada_yang_berubah_jika_kurang(self):
+        """Test satu bahan kurang membatalkan seluruh pengurangan"""
+        self.assertFalse(BahanMakanan.kurangi_stok_bersama([(self.beras, 2.5), (self.ayam, 1.5)]))
+        self.assertEqual((self.beras.get_jumlah(), self.ayam.get_jumlah()), (10.0, 1.0))
+        with self.assertRaises(ValueError):
+            BahanMakanan.kurangi_stok_bersama([(self.beras, -1.0)])
+
+    def test_takaran_sesuai_hitung_porsi(self):
+        """Test takaran per porsi habis tepat setelah hitung_porsi() porsi"""
+        kangkung = BahanSayuran("Kangkung", 0.3, "kg", 0.1)
+        porsi = kangkung.hitung_porsi()
+        self.assertTrue(BahanMakanan.kurangi_stok_bersama(
+            [(kangkung, porsi * kangkung.get_takaran_per_porsi())]))
+        self.assertGreaterEqual(kangkung.get_jumlah(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
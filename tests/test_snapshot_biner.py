@@ -0,0 +1,160 @@
+"""
+Unit Testing untuk repositories/snapshot_biner.py dan repositories/snapshot_repository.py
+Testing format snapshot biner, materialisasi lazy dan overlay perubahan
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from repositories.snapshot_biner import SnapshotBiner, tulis_snapshot
+from repositories.snapshot_repository import SnapshotKorbanRepository, SnapshotDistribusiRepository
+from services.laporan_paralel import MesinLaporan
+from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+from models.person import Korban
+from models.distribusi import DistribusiMakanan
+
+
+class TestSnapshotBiner(unittest.TestCase):
+    """Test case untuk format SnapshotBiner"""
+
+    def setUp(self):
+        """Tulis snapshot kecil ke direktori sementara"""
+        self.direktori = tempfile.mkdtemp()
+        self.path = os.path.join(self.direktori, "state.snap")
+        self.waktu = datetime(2024, 1, 1, 7, 30)
+        tulis_snapshot(
+            self.path,
+            [BahanPokok("Beras", 100.0, "kg", 250.0, self.waktu),
+             BahanProtein("Telur", 60.0, "butir", 1.0),
+             BahanSayuran("Kangkung", 30.0, "kg", 0.1)],
+            [Korban("Siti", "KRB-002", "Lansia", 2), Korban("Budi", "KRB-001", "Umum", 4),
+             Korban("Ahmad", "KRB-003", "Bayi", 1)],
+            [DistribusiMakanan("DIST-002", "KRB-001", 5, "", self.waktu),
+             DistribusiMakanan("DIST-001", "KRB-001", 10, "Pagi", self.waktu),
+             DistribusiMakanan("DIST-003", "KRB-002", 3)])
+        self.snapshot = SnapshotBiner(self.path)
+
+    def tearDown(self):
+        """Tutup snapshot dan hapus direktori sementara"""
+        self.snapshot.tutup()
+        shutil.rmtree(self.direktori)
+
+    def test_header_dan_agregat(self):
+        """Test jumlah record dan agregat dibaca dari header"""
+        self.assertEqual(self.snapshot.jumlah('bahan'), 3)
+        self.assertEqual(self.snapshot.jumlah('korban'), 3)
+        self.assertEqual(self.snapshot.get_total_tanggungan(), 7)
+        self.assertEqual(self.snapshot.get_total_porsi(), 18)
+        self.assertEqual(self.snapshot.get_porsi_korban("KRB-001"), 15)
+        self.assertEqual(self.snapshot.get_porsi_korban("KRB-999"), 0)
+
+    def test_materialisasi(self):
+        """Test object dibuat ulang dengan nilai dan jenis yang sama"""
+        beras = self.snapshot.bahan(0)
+        self.assertIsInstance(beras, BahanPokok)
+        self.assertEqual(beras.hitung_porsi(), 400)
+        self.assertEqual(beras.get_tanggal_masuk(), self.waktu)
+        self.assertIsInstance(self.snapshot.bahan(1), BahanProtein)
+
+        budi = self.snapshot.korban(self.snapshot.cari('korban', "KRB-001"))
+        self.assertEqual((budi.get_name(), budi.get_jumlah_tanggungan()), ("Budi", 4))
+        dist = self.snapshot.distribusi(self.snapshot.cari('distribusi', "DIST-001"))
+        self.assertEqual(dist.get_catatan(), "Pagi")
+        self.assertEqual(dist.get_waktu_distribusi(), self.waktu)
+
+    def test_file_bukan_snapshot(self):
+        """Test file dengan magic salah ditolak"""
+        path = os.path.join(self.direktori, "lain.bin")
+        with open(path, "wb") as f:
+            f.write(b"X" * 256)
+        with self.assertRaises(ValueError):
+            SnapshotBiner(path)
+
+
+class TestSnapshotRepository(TestSnapshotBiner):
+    """Test case untuk repository lazy di atas snapshot"""
+
+    def test_korban_overlay(self):
+        """Test add/update/delete korban dan total tanggungan"""
+        repo = SnapshotKorbanRepository(self.snapshot)
+        self.assertEqual(repo.count(), 3)
+
+        budi = repo.get_by_id("KRB-001")
+        self.assertIs(repo.get_by_id("KRB-001"), budi)
+        budi.set_jumlah_tanggungan(6)
+        repo.add(Korban("Dewi", "KRB-010", "Sakit", 3))
+        repo.delete("KRB-003")
+        with self.assertRaises(ValueError):
+            repo.add(Korban("Siti", "KRB-002"))
+
+        self.assertEqual(repo.count(), 3)
+        self.assertEqual(repo.get_total_tanggungan(), 11)
+        self.assertIsNone(repo.get_by_id("KRB-003"))
+        self.assertEqual([k.get_id() for k in repo.get_all()], ["KRB-001", "KRB-002", "KRB-010"])
+        self.assertEqual([k.get_id() for k in repo.get_by_kebutuhan("Lansia")], ["KRB-002"])
+        self.assertEqual([k.get_id() for k in repo.get_by_tanggungan_minimal(3)],
+                         ["KRB-010", "KRB-001"])
+
+    def test_distribusi_overlay(self):
+        """Test total porsi dikoreksi oleh perubahan di overlay"""
+        repo = SnapshotDistribusiRepository(self.snapshot)
+        repo.update(DistribusiMakanan("DIST-001", "KRB-002", 4))
+        repo.delete("DIST-002")
+        repo.add_many([DistribusiMakanan("DIST-004", "KRB-001", 2)])
+        with self.assertRaises(ValueError):
+            repo.add_many([DistribusiMakanan("DIST-003", "KRB-001", 1)])
+
+        self.assertEqual(repo.count(), 3)
+        self.assertEqual(repo.get_total_porsi_terdistribusi(), 9)
+        self.assertEqual(repo.get_total_porsi_korban("KRB-001"), 2)
+        self.assertEqual(repo.get_total_porsi_korban("KRB-002"), 7)
+        self.assertEqual([d.get_id_distribusi() for d in repo.get_by_korban("KRB-002")],
+                         ["DIST-001", "DIST-003"])
+
+    def test_get_halaman(self):
+        """Test paging snapshot + overlay tanpa memasukkan record ke overlay"""
+        repo = SnapshotKorbanRepository(self.snapshot)
+        repo.add(Korban("Dewi", "KRB-010", "Sakit", 3))
+        repo.delete("KRB-002")
+
+        halaman1, kursor = repo.get_halaman(None, 2)
+        halaman2, kursor = repo.get_halaman(kursor, 2)
+
+        self.assertEqual([k.get_id() for k in halaman1 + halaman2],
+                         ["KRB-001", "KRB-003", "KRB-010"])
+        self.assertIsNone(kursor)
+        self.assertEqual(len(list(repo._overlay())), 1)
+
+    def test_iterasi_tidak_mengisi_overlay(self):
+        """Test iterasi penuh, filter dan laporan tidak memasukkan record snapshot ke overlay"""
+        korban_repo = SnapshotKorbanRepository(self.snapshot)
+        distribusi_repo = SnapshotDistribusiRepository(self.snapshot)
+
+        self.assertEqual(len(list(korban_repo.iter_semua())), 3)
+        self.assertEqual(len(korban_repo.get_by_kebutuhan("Umum")), 1)
+        self.assertEqual(len(distribusi_repo.get_by_korban("KRB-001")), 2)
+        laporan = MesinLaporan(korban_repo, distribusi_repo).laporan_lengkap()
+        self.assertEqual(laporan['korban']['total_tanggungan'], 7)
+
+        self.assertEqual(len(list(korban_repo._overlay())), 0)
+        self.assertEqual(len(list(distribusi_repo._overlay())), 0)
+        self.assertEqual(korban_repo.get_total_tanggungan(), 7)
+
+
+    def test_simpan_ulang(self):
+        """Test state dari repository overlay bisa disimpan dan dibuka lagi"""
+        korban_repo = SnapshotKorbanRepository(self.snapshot)
+        korban_repo.add(Korban("Dewi", "KRB-010", "Sakit", 3))
+        data = ([self.snapshot.bahan(i) for i in range(3)], korban_repo.get_all(), [])
+        path = os.path.join(self.direktori, "baru.snap")
+        tulis_snapshot(path, *data)
+
+        with SnapshotBiner(path) as snapshot:
+            self.assertEqual(SnapshotKorbanRepository(snapshot).count(), 4)
+            self.assertEqual(snapshot.get_total_tanggungan(), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,286 @@
+"""
+Unit Testing untuk repositories/sqlite_repository.py
+Testing SQLiteBahanRepository, SQLiteKorbanRepository, SQLiteDistribusiRepository
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from repositories.sqlite_repository import (
+    buka_koneksi, SQLiteBahanRepository, SQLiteKorbanRepository, SQLiteDistribusiRepository,
+    VERSI_SKEMA
+)
+from services.dapur_service import DapurService
+from models.person import Korban
+from models.bahan_makanan import BahanPokok, BahanProtein, BahanSayuran
+from models.distribusi import DistribusiMakanan
+
+
+class TestSQLiteKorbanRepository(unittest.TestCase):
+    """Test case untuk SQLiteKorbanRepository"""
+
+    def setUp(self):
+        """Setup database in-memory sebelum setiap test"""
+        self.koneksi = buka_koneksi(":memory:")
+        self.repo = SQLiteKorbanRepository(self.koneksi)
+        self.korban1 = Korban("Budi", "KRB-001", "Umum", 4)
+        self.korban2 = Korban("Siti", "KRB-002", "Lansia", 2)
+
+    def tearDown(self):
+        self.koneksi.close()
+
+    def test_add_dan_get_by_id(self):
+        """Test menyimpan lalu membaca kembali korban"""
+        self.repo.add(self.korban1)
+        retrieved = self.repo.get_by_id("KRB-001")
+
+        self.assertEqual(retrieved.get_name(), "Budi")
+        self.assertEqual(retrieved.get_jumlah_tanggungan(), 4)
+        self.assertEqual(retrieved.get_registered_date(), self.korban1.get_registered_date())
+
+    def test_add_duplicate_id(self):
+        """Test ID duplikat ditolak dengan ValueError"""
+        self.repo.add(self.korban1)
+        with self.assertRaises(ValueError):
+            self.repo.add(self.korban1)
+
+    def test_add_many_melewati_duplikat(self):
+        """Test bulk insert menolak ID duplikat tanpa membatalkan sisa batch"""
+        self.repo.add(self.korban1)
+        korban3 = Korban("Ahmad", "KRB-003", "Bayi", 3)
+
+        ditolak = self.repo.add_many([self.korban1, self.korban2, korban3, self.korban2])
+
+        self.assertEqual([k.get_id() for k in ditolak], ["KRB-001", "KRB-002"])
+        self.assertEqual(self.repo.count(), 3)
+
+    def test_update_dan_delete(self):
+        """Test update dan delete korban"""
+        self.repo.add(self.korban1)
+        self.korban1.set_jumlah_tanggungan(7)
+        self.assertTrue(self.repo.update(self.korban1))
+        self.assertEqual(self.repo.get_by_id("KRB-001").get_jumlah_tanggungan(), 7)
+
+        self.assertTrue(self.repo.delete("KRB-001"))
+        self.assertFalse(self.repo.delete("KRB-001"))
+        self.assertFalse(self.repo.update(self.korban1))
+
+    def test_get_by_kebutuhan_dan_total(self):
+        """Test filter kebutuhan dan agregasi tanggungan"""
+        self.repo.add_many([self.korban1, self.korban2])
+
+        lansia = self.repo.get_by_kebutuhan("Lansia")
+        self.assertEqual([k.get_id() for k in lansia], ["KRB-002"])
+        self.assertEqual(self.repo.get_total_tanggungan(), 6)
+
+    def test_query_memakai_index(self):
+        """Test query kebutuhan memakai index, bukan full table scan"""
+        plan = self.koneksi.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM korban WHERE kebutuhan_khusus = ?",
+            ("Lansia",)).fetchall()
+        self.assertIn("idx_korban_kebutuhan", str(plan))
+
+
+    def test_get_halaman_keyset(self):
+        """Test keyset paging tetap utuh walaupun ada baris dihapus di antara halaman"""
+        self.repo.add_many([Korban(f"K{i}", f"KRB-{i:03d}", "Umum", 1) for i in range(5)])
+
+        halaman1, kursor = self.repo.get_halaman(None, 2)
+        self.repo.delete("KRB-001")
+        sisa = list(self.repo.iter_semua(ukuran_halaman=2))
+        halaman2, kursor = self.repo.get_halaman(kursor, 2)
+        halaman3, kursor = self.repo.get_halaman(kursor, 2)
+
+        self.assertEqual([k.get_id() for k in halaman1], ["KRB-000", "KRB-001"])
+        self.assertEqual([k.get_id() for k in halaman2 + halaman3], ["KRB-002", "KRB-003", "KRB-004"])
+        self.assertIsNone(kursor)
+        self.assertEqual(len(sisa), 4)
+
+class TestSQLiteBahanRepository(unittest.TestCase):
+    """Test case untuk SQLiteBahanRepository"""
+
+    def setUp(self):
+        """Setup database in-memory sebelum setiap test"""
+        self.koneksi = buka_koneksi(":memory:")
+        self.repo = SQLiteBahanRepository(self.koneksi)
+
+    def tearDown(self):
+        self.koneksi.close()
+
+    def test_rekonstruksi_polymorphism(self):
+        """Test jenis bahan dan faktor porsi terjaga setelah disimpan"""
+        self.repo.add_many([BahanPokok("Beras", 100.0, "kg", 250.0),
+                            BahanProtein("Ayam", 50.0, "kg", 0.15),
+                            BahanSayuran("Kangkung", 30.0, "kg", 0.1)])
+
+        self.assertIsInstance(self.repo.get_by_id("Beras"), BahanPokok)
+        self.assertEqual(self.repo.get_by_id("Beras").hitung_porsi(), 400)
+        self.assertEqual(self.repo.get_by_id("Ayam").hitung_porsi(), 333)
+        self.assertEqual(self.repo.get_by_id("Kangkung").hitung_porsi(), 300)
+
+    def test_add_existing_aggregates(self):
+        """Test bahan yang sudah ada di-aggregate stoknya"""
+        self.repo.add(BahanPokok("Beras", 100.0, "kg", 250.0))
+        self.repo.add(BahanPokok("Beras", 50.0, "kg", 250.0))
+        self.repo.add_many([BahanPokok("Beras", 25.0, "kg", 250.0)])
+
+        self.assertEqual(self.repo.get_by_id("Beras").get_jumlah(), 175.0)
+        self.assertEqual(len(self.repo.get_all()), 1)
+
+    def test_get_stok_rendah(self):
+        """Test filter stok rendah"""
+        self.repo.add(BahanPokok("Beras", 100.0, "kg", 250.0))
+        self.repo.add(BahanPokok("Gula", 5.0, "kg", 50.0))
+
+        stok_rendah = self.repo.get_stok_rendah(10.0)
+        self.assertEqual([b.get_nama() for b in stok_rendah], ["Gula"])
+
+    def test_porsi_minimum_sama_dengan_hitung_porsi(self):
+        """Test kolom porsi (trigger) konsisten dengan hitung_porsi()"""
+        self.assertIsNone(self.repo.get_porsi_minimum())
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        self.repo.add_many([beras, BahanProtein("Ayam", 50.0, "kg", 0.15)])
+        self.assertEqual(self.repo.get_porsi_minimum(), 333)
+
+        beras.kurangi_stok(97.3)
+        self.repo.update(beras)
+        self.assertEqual(self.repo.get_porsi_minimum(), beras.hitung_porsi())
+
+
+class TestSQLiteDistribusiRepository(unittest.TestCase):
+    """Test case untuk SQLiteDistribusiRepository"""
+
+    def setUp(self):
+        """Setup database in-memory sebelum setiap test"""
+        self.koneksi = buka_koneksi(":memory:")
+        self.repo = SQLiteDistribusiRepository(self.koneksi)
+
+    def tearDown(self):
+        self.koneksi.close()
+
+    def test_get_by_korban_dan_total(self):
+        """Test riwayat per korban dan total porsi"""
+        self.repo.add_many([DistribusiMakanan("DIST-001", "KRB-001", 10),
+                            DistribusiMakanan("DIST-002", "KRB-002", 5)])
+        self.repo.add(DistribusiMakanan("DIST-003", "KRB-001", 15, "Susulan"))
+
+        riwayat = self.repo.get_by_korban("KRB-001")
+        self.assertEqual([d.get_id_distribusi() for d in riwayat], ["DIST-001", "DIST-003"])
+        self.assertEqual(riwayat[1].get_catatan(), "Susulan")
+        self.assertEqual(self.repo.get_total_porsi_terdistribusi(), 30)
+        self.assertEqual(self.repo.get_total_porsi_korban("KRB-001"), 25)
+        self.assertEqual(self.repo.count(), 3)
+
+    def test_get_by_waktu(self):
+        """Test query rentang waktu memakai index waktu dan terurut menurut waktu"""
+        self.repo.add_many([
+            DistribusiMakanan("DIST-001", "KRB-001", 10, "", datetime(2024, 1, 1, 18)),
+            DistribusiMakanan("DIST-002", "KRB-002", 5, "", datetime(2024, 1, 1, 8)),
+            DistribusiMakanan("DIST-003", "KRB-001", 15, "", datetime(2024, 1, 2, 8)),
+        ])
+
+        hari_pertama = self.repo.get_by_waktu(datetime(2024, 1, 1), datetime(2024, 1, 2))
+        self.assertEqual([d.get_id_distribusi() for d in hari_pertama], ["DIST-002", "DIST-001"])
+        self.assertEqual(self.repo.count_by_waktu(mulai=datetime(2024, 1, 1, 18)), 2)
+        self.assertEqual(self.repo.count_by_waktu(), 3)
+        rencana = " ".join(str(b) for b in self.koneksi.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM distribusi WHERE waktu_distribusi >= ?", (0,)))
+        self.assertIn("idx_distribusi_waktu", rencana)
+
+    def test_update_waktu_lalu_count_by_waktu(self):
+        """Test update memindahkan waktu distribusi sehingga query rentang ikut berubah"""
+        self.repo.add(DistribusiMakanan("D1", "KRB-001", 10, "", datetime(2026, 1, 1)))
+        self.assertTrue(self.repo.update(
+            DistribusiMakanan("D1", "KRB-001", 12, "Koreksi", datetime(2026, 1, 2))))
+
+        self.assertEqual(self.repo.count_by_waktu(datetime(2026, 1, 2), datetime(2026, 1, 3)), 1)
+        self.assertEqual(self.repo.count_by_waktu(datetime(2026, 1, 1), datetime(2026, 1, 2)), 0)
+        self.assertEqual(self.repo.get_by_id("D1").get_waktu_distribusi(), datetime(2026, 1, 2))
+
+    def test_add_duplicate_id(self):
+        """Test ID distribusi duplikat ditolak"""
+        self.repo.add(DistribusiMakanan("DIST-001", "KRB-001", 10))
+        with self.assertRaises(ValueError):
+            self.repo.add(DistribusiMakanan("DIST-001", "KRB-001", 10))
+
+
+class TestSQLitePersistensi(unittest.TestCase):
+    """Test data tetap ada setelah koneksi ditutup dan dibuka kembali"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "dapur.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_distribusi_tersimpan_setelah_restart(self):
+        """Test stok yang dikurangi service ikut tersimpan di database"""
+        koneksi = buka_koneksi(self.db_path)
+        service = DapurService(SQLiteBahanRepository(koneksi),
+                               SQLiteKorbanRepository(koneksi),
+                               SQLiteDistribusiRepository(koneksi))
+        service.tambah_bahan(BahanPokok("Beras", 100.0, "kg", 250.0))
+        service.registrasi_korban(Korban("Budi", "KRB-001", "Umum", 4))
+        service.distribusi_makanan("KRB-001", 10)
+        koneksi.close()
+
+        koneksi = buka_koneksi(self.db_path)
+        self.assertEqual(koneksi.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(SQLiteBahanRepository(koneksi).get_by_id("Beras").get_jumlah(), 97.5)
+        self.assertEqual(SQLiteDistribusiRepository(koneksi).get_total_porsi_terdistribusi(), 10)
+        koneksi.close()
+
+    def test_migrasi_database_tanpa_kolom_porsi(self):
+        """Test database lama (tanpa bahan.porsi) dimigrasi dan kolom porsi diisi"""
+        lama = sqlite3.connect(self.db_path)
+        lama.executescript("""
+            CREATE TABLE bahan (nama TEXT PRIMARY KEY, jenis TEXT NOT NULL, jumlah REAL NOT NULL,
+                                satuan TEXT NOT NULL, faktor_porsi REAL NOT NULL,
+                                tanggal_masuk REAL NOT NULL);
+            INSERT INTO bahan VALUES ('Beras', 'pokok', 100.0, 'kg', 250.0, 0);
+            INSERT INTO bahan VALUES ('Ayam', 'protein', 50.0, 'kg', 0.15, 0);
+        """)
+        lama.close()
+
+        koneksi = buka_koneksi(self.db_path)
+        repo = SQLiteBahanRepository(koneksi)
+        self.assertEqual(koneksi.execute("PRAGMA user_version").fetchone()[0], VERSI_SKEMA)
+        self.assertEqual(repo.get_porsi_minimum(), 333)
+        repo.add(BahanSayuran("Kangkung", 3.0, "kg", 0.1))
+        self.assertEqual(repo.get_porsi_minimum(), 30)
+        koneksi.close()
+
+        koneksi = buka_koneksi(self.db_path)  # migrasi tidak diulang
+        repo = SQLiteBahanRepository(koneksi)
+        self.assertEqual(repo.get_porsi_minimum(), 30)
+        # Stok lama tercatat sekali sebagai mutasi awal
+        self.assertEqual([s for _, s in repo.get_buku_stok().get_mutasi("Beras")], [100.0])
+        koneksi.close()
+
+    def test_buku_stok_tersimpan_setelah_restart(self):
+        """Test mutasi stok dicatat trigger dan ledger dibangun ulang setelah restart"""
+        koneksi = buka_koneksi(self.db_path)
+        repo = SQLiteBahanRepository(koneksi)
+        beras = BahanPokok("Beras", 100.0, "kg", 250.0)
+        repo.add(beras)
+        repo.add_many([BahanPokok("Beras", 20.0, "kg", 250.0)])
+        self.assertTrue(repo.kurangi_stok_bersama([(beras, 30.0)]))
+        self.assertFalse(repo.kurangi_stok_bersama([(beras, 500.0)]))
+        self.assertEqual(repo.get_buku_stok().get_stok_pada("Beras", datetime.now()), 90.0)
+        repo.kembalikan_stok([(beras, 5.0)])
+        repo.delete("Beras")
+        koneksi.close()
+
+        koneksi = buka_koneksi(self.db_path)
+        buku = SQLiteBahanRepository(koneksi).get_buku_stok()
+        self.assertEqual([s for _, s in buku.get_mutasi("Beras")], [100.0, 20.0, -30.0, 5.0, -95.0])
+        self.assertEqual(buku.get_stok_pada("Beras", datetime(2000, 1, 1)), 0.0)
+        koneksi.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit Testing untuk utils/tabel.py dan tulis_daftar di utils/formatter.py
+Testing lebar kolom, pemotongan sel, format CSV/TSV dan render streaming
+"""
+
+import csv
+import io
+import tracemalloc
+import unittest
+from utils.formatter import format_laporan_tabel, tulis_daftar
+from utils.tabel import Kolom, PenulisTabel, tulis_tabel
+
+
+class SinkHitung:
+    """Sink yang hanya menghitung karakter (tidak menyimpan keluaran)"""
+
+    def __init__(self):
+        self.karakter = 0
+
+    def write(self, teks):
+        self.karakter += len(teks)
+        return len(teks)
+
+
+class TestPenulisTabel(unittest.TestCase):
+    """Test case untuk PenulisTabel"""
+
+    def setUp(self):
+        self.kolom = [Kolom("ID"), Kolom("Porsi", rata="kanan")]
+
+    def test_lebar_dari_sampel(self):
+        """Test lebar kolom dihitung dari sampel dan angka rata kanan"""
+        sink = io.StringIO()
+        jumlah = tulis_tabel(sink, [("DIST-1", 5), ("DIST-22", 120)], self.kolom, judul="RIWAYAT")
+        baris = sink.getvalue().splitlines()
+
+        self.assertEqual(jumlah, 2)
+        self.assertEqual(baris[1].strip(), "RIWAYAT")
+        self.assertEqual(baris[3], "ID      | Porsi")
+        self.assertEqual(baris[5], "DIST-1  |     5")
+        self.assertEqual(baris[6], "DIST-22 |   120")
+        self.assertEqual(baris[-1], "=" * 15)
+
+    def test_lebar_tetap_dan_potong(self):
+        """Test lebar yang dideklarasikan memotong sel yang terlalu panjang"""
+        sink = io.StringIO()
+        kolom = [Kolom("Nama", lambda k: k['nama'], lebar=5), Kolom("N", lambda k: k['n'], lebar=2)]
+        with PenulisTabel(sink, kolom) as tabel:
+            # Kepala tabel langsung ditulis karena semua lebar sudah diketahui
+            self.assertIn("Nama", sink.getvalue())
+            tabel.tulis({'nama': "Budi Santoso", 'n': 3})
+        self.assertIn("Budi… | 3\n", sink.getvalue())
+
+    def test_sampel_dikunci_lalu_streaming(self):
+        """Test baris setelah sampel langsung ditulis (dipotong ke lebar sampel)"""
+        sink = io.StringIO()
+        tabel = PenulisTabel(sink, self.kolom, sampel=2)
+        tabel.tulis(("A", 1))
+        self.assertEqual(sink.getvalue(), "")
+        tabel.tulis(("BB", 2))
+        tabel.tulis(("CCCCCC", 3))
+        self.assertIn("C… |     3", sink.getvalue())
+        self.assertEqual(tabel.selesai(), 3)
+
+    def test_csv_dan_tsv(self):
+        """Test format CSV/TSV berisi header dan nilai apa adanya"""
+        data = [("DIST-1", 5), ("DIST, 2", 1.5)]
+        sink = io.StringIO()
+        tulis_tabel(sink, data, self.kolom, "csv", judul="diabaikan")
+        self.assertEqual(list(csv.reader(io.StringIO(sink.getvalue()))),
+                         [["ID", "Porsi"], ["DIST-1", "5"], ["DIST, 2", "1.5"]])
+
+        sink = io.StringIO()
+        tulis_tabel(sink, data, self.kolom, "tsv")
+        self.assertEqual(sink.getvalue().splitlines()[1], "DIST-1\t5")
+
+    def test_tabel_kosong_dan_validasi(self):
+        """Test tabel tanpa baris dan parameter tidak valid"""
+        sink = io.StringIO()
+        self.assertEqual(tulis_tabel(sink, [], self.kolom), 0)
+        self.assertIn("ID | Porsi", sink.getvalue())
+        with self.assertRaises(ValueError):
+            PenulisTabel(sink, self.kolom, "xlsx")
+        with self.assertRaises(ValueError):
+            Kolom("X", rata="tengah")
+
+    def test_memori_tetap(self):
+        """Test 50 ribu baris dari generator dirender dengan memori tetap kecil"""
+        sink = SinkHitung()
+        data = ((f"DIST-{i:07d}", i % 50) for i in range(50_000))
+        tracemalloc.start()
+        try:
+            tulis_tabel(sink, data, self.kolom)
+            _, puncak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(sink.karakter, 50_000 * 15)
+        self.assertLess(puncak, 1_000_000)
+
+
+class TestTulisDaftar(unittest.TestCase):
+    """Test case untuk tulis_daftar dan format_laporan_tabel"""
+
+    def test_format_sama(self):
+        """Test format_laporan_tabel tetap menghasilkan format lama"""
+        hasil = format_laporan_tabel(["a", "b"], "JUDUL")
+        separator = "=" * 80
+        self.assertEqual(hasil, f"\n{separator}\n{'JUDUL'.center(80)}\n{separator}\n"
+                                f"1. a\n2. b\n{separator}\n")
+
+    def test_generator(self):
+        """Test tulis_daftar menerima generator dan mengembalikan jumlah baris"""
+        sink = io.StringIO()
+        self.assertEqual(tulis_daftar(sink, (str(i) for i in range(3)), "X"), 3)
+        self.assertIn("3. 2\n", sink.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,9 @@ Menerapkan SRP - fokus pada formatting dan helper functions.
 """
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, List, TextIO
+import io
+from utils.id_generator import id_berikutnya
 
 
 def format_tanggal(dt: datetime) -> str:
@@ -20,29 +22,46 @@ def format_tanggal(dt: datetime) -> str:
     return dt.strftime("%d %B %Y, %H:%M")
 
 
-def format_laporan_tabel(data: List[str], header: str) -> str:
+def tulis_daftar(sink: TextIO, data: Iterable[str], header: str, width: int = 80) -> int:
     """
-    Format data menjadi tabel sederhana untuk CLI.
+    Menulis data sebagai daftar bernomor langsung ke sink (streaming).
+    Setiap baris ditulis begitu dibaca sehingga data boleh berupa generator.
     
     Args:
-        data: List data string
+        sink: Tujuan tulis (file, sys.stdout, io.StringIO, ...)
+        data: Data string (list atau generator)
         header: Header tabel
+        width: Lebar garis pemisah
         
     Returns:
-        str: Tabel terformat
+        int: Jumlah baris yang ditulis
     """
-    width = 80
     separator = "=" * width
+    sink.write(f"\n{separator}\n{header.center(width)}\n{separator}\n")
     
-    output = f"\n{separator}\n"
-    output += f"{header. center(width)}\n"
-    output += f"{separator}\n"
+    jumlah = 0
+    for jumlah, item in enumerate(data, 1):
+        sink.write(f"{jumlah}. {item}\n")
     
-    for i, item in enumerate(data, 1):
-        output += f"{i}. {item}\n"
+    sink.write(f"{separator}\n")
+    return jumlah
+
+
+def format_laporan_tabel(data: List[str], header: str) -> str:
+    """
+    Format data menjadi tabel sederhana untuk CLI.
+    Untuk data besar gunakan tulis_daftar (langsung ke sink) atau utils.tabel.
     
-    output += f"{separator}\n"
-    return output
+    Args:
+        data: List data string
+        header: Header tabel
+        
+    Returns:
+        str: Tabel terformat
+    """
+    buffer = io.StringIO()
+    tulis_daftar(buffer, data, header)
+    return buffer.getvalue()
 
 
 def format_status_gizi(status_dict: Dict) -> str:
@@ -70,8 +89,16 @@ def format_status_gizi(status_dict: Dict) -> str:
     output += "="*60 + "\n"
     output += f"Total Tanggungan      : {status_dict['total_tanggungan']} orang\n"
     output += f"Porsi Tersedia        : {status_dict['porsi_tersedia']} porsi\n"
-    output += f"Kebutuhan Harian      : {status_dict['kebutuhan_harian']} porsi\n"
+    sumber = status_dict.get('sumber_kebutuhan')
+    keterangan = {'prakiraan': ' (prakiraan riwayat)', 'asumsi': ' (asumsi 3x makan)',
+                  'batas_bawah': ' (batas minimum 2x makan)'}.get(sumber, '')
+    output += f"Kebutuhan Harian      : {status_dict['kebutuhan_harian']} porsi{keterangan}\n"
     output += f"Estimasi Bertahan     : {status_dict['estimasi_hari']} hari\n"
+    per_bahan = status_dict.get('estimasi_hari_per_bahan') or {}
+    if per_bahan:
+        output += "Estimasi per Bahan    :\n"
+        for nama, hari in sorted(per_bahan.items(), key=lambda item: item[1]):
+            output += f"  - {nama:<19}: {hari} hari\n"
     output += f"Status                : {color_code. get(status, '')}{status}{reset}\n"
     output += "="*60 + "\n"
     
@@ -124,7 +151,9 @@ def validasi_input_integer(prompt: str, min_value:  int = 0) -> int:
 
 def buat_id_unik(prefix: str) -> str:
     """
-    Membuat ID unik dengan timestamp.
+    Membuat ID unik (Snowflake: waktu + node + urutan, lihat utils.id_generator).
+    ID yang dibuat berurutan waktu dan tidak bertabrakan walaupun dibuat
+    dalam detik yang sama.
     
     Args:
         prefix: Prefix ID (misal: KRB untuk korban)
@@ -132,5 +161,4 @@ def buat_id_unik(prefix: str) -> str:
     Returns:
         str: ID unik
     """
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    return f"{prefix}-{timestamp}"
\ No newline at end of file
+    return id_berikutnya(prefix)
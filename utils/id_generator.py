@@ -0,0 +1,153 @@
+"""
+Module generator ID unik bergaya Snowflake.
+
+Setiap ID adalah integer 63-bit yang tersusun dari:
+
+    | 41 bit milidetik sejak EPOCH_MS | 10 bit node | 12 bit urutan |
+
+sehingga ID dari satu generator selalu naik (bisa diurutkan menurut waktu)
+dan ID dari node berbeda tidak pernah sama. Dalam satu milidetik tersedia
+4096 nomor urut; jika habis, generator "meminjam" milidetik berikutnya
+alih-alih menunggu, sehingga jutaan ID per detik tetap bisa diterbitkan
+dan urutan tetap monoton walaupun jam sistem mundur.
+"""
+
+from typing import List, Optional
+import os
+import threading
+import time
+
+EPOCH_MS = 1704067200000     # 2024-01-01 00:00:00 UTC
+BIT_NODE = 10
+BIT_URUT = 12
+NODE_MAKS = (1 << BIT_NODE) - 1
+URUT_MAKS = (1 << BIT_URUT) - 1
+PANJANG_HEKSA = 16           # lebar tetap agar ID string juga terurut
+
+
+def _node_default() -> int:
+    """
+    Node ID default: DAPUR_UMUM_NODE_ID jika diset, jika tidak diambil dari PID.
+    Untuk beberapa mesin/proses yang berjalan lama, set DAPUR_UMUM_NODE_ID
+    berbeda per proses agar keunikan terjamin (PID bisa bertabrakan modulo 1024).
+    """
+    nilai = os.environ.get("DAPUR_UMUM_NODE_ID")
+    return int(nilai) if nilai else os.getpid() & NODE_MAKS
+
+
+class GeneratorID:
+    """
+    Generator ID Snowflake yang thread-safe.
+
+    Keamanan antar proses dijamin oleh node ID yang berbeda; generator default
+    (lihat id_berikutnya) membuat ulang dirinya di proses anak setelah fork.
+    """
+
+    def __init__(self, node_id: Optional[int] = None, epoch_ms: int = EPOCH_MS):
+        """
+        Args:
+            node_id: Nomor node 0..1023 (default: DAPUR_UMUM_NODE_ID atau PID)
+            epoch_ms: Titik nol waktu dalam milidetik epoch
+
+        Raises:
+            ValueError: Jika node_id di luar jangkauan
+        """
+        node_id = _node_default() if node_id is None else node_id
+        if not 0 <= node_id <= NODE_MAKS:
+            raise ValueError(f"Node ID harus 0..{NODE_MAKS}, bukan {node_id}")
+        self.__node = node_id << BIT_URUT
+        self.__epoch_ms = epoch_ms
+        self.__lock = threading.Lock()
+        self.__ms_terakhir = -1
+        self.__urut = 0
+
+    @property
+    def node_id(self) -> int:
+        return self.__node >> BIT_URUT
+
+    def __maju(self, jumlah: int) -> List[int]:
+        """Menerbitkan 'jumlah' ID berurutan; harus dipanggil di bawah lock."""
+        ms = time.time_ns() // 1_000_000 - self.__epoch_ms
+        if ms > self.__ms_terakhir:
+            self.__ms_terakhir, self.__urut = ms, -1
+        hasil = []
+        for _ in range(jumlah):
+            self.__urut += 1
+            if self.__urut > URUT_MAKS:
+                # Nomor urut habis (atau jam mundur): pinjam milidetik berikutnya
+                self.__ms_terakhir += 1
+                self.__urut = 0
+            hasil.append((self.__ms_terakhir << (BIT_NODE + BIT_URUT)) | self.__node | self.__urut)
+        return hasil
+
+    def berikutnya(self) -> int:
+        """Menerbitkan satu ID integer."""
+        with self.__lock:
+            return self.__maju(1)[0]
+
+    def berikutnya_banyak(self, jumlah: int) -> List[int]:
+        """
+        Menerbitkan banyak ID sekaligus dengan satu kali ambil lock (untuk batch).
+
+        Args:
+            jumlah: Jumlah ID
+
+        Returns:
+            List[int]: ID yang naik monoton
+        """
+        if jumlah < 0:
+            raise ValueError("Jumlah ID tidak boleh negatif")
+        with self.__lock:
+            return self.__maju(jumlah)
+
+    def waktu_dari(self, id_int: int) -> float:
+        """Waktu penerbitan ID (epoch detik)."""
+        return ((id_int >> (BIT_NODE + BIT_URUT)) + self.__epoch_ms) / 1000
+
+
+def format_id(id_int: int) -> str:
+    """ID integer sebagai heksadesimal lebar tetap (urutan string = urutan angka)."""
+    return f"{id_int:0{PANJANG_HEKSA}X}"
+
+
+_generator: Optional[GeneratorID] = None
+_lock_generator = threading.Lock()
+
+
+def generator_default() -> GeneratorID:
+    """Generator bersama untuk proses ini (dibuat saat pertama dipakai)."""
+    global _generator
+    if _generator is None:
+        with _lock_generator:
+            if _generator is None:
+                _generator = GeneratorID()
+    return _generator
+
+
+def _reset_setelah_fork() -> None:
+    # Proses anak mendapat PID baru sehingga node ID default-nya juga baru
+    global _generator, _lock_generator
+    _generator = None
+    _lock_generator = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_setelah_fork)
+
+
+def id_berikutnya(prefix: str) -> str:
+    """
+    Menerbitkan satu ID string, misal 'DIST-0A1B2C3D4E5F6071'.
+
+    Args:
+        prefix: Prefix ID
+
+    Returns:
+        str: ID unik
+    """
+    return f"{prefix}-{format_id(generator_default().berikutnya())}"
+
+
+def id_berikutnya_banyak(prefix: str, jumlah: int) -> List[str]:
+    """Menerbitkan banyak ID string sekaligus (lihat GeneratorID.berikutnya_banyak)."""
+    return [f"{prefix}-{format_id(n)}" for n in generator_default().berikutnya_banyak(jumlah)]
@@ -0,0 +1,225 @@
+"""
+Module untuk konfigurasi logging aplikasi.
+Menerapkan SRP - fokus pada pipeline logging yang tidak memblokir hot path.
+
+Record log dimasukkan ke antrean (QueueHandler) di thread pemanggil, lalu
+ditulis ke file/console oleh thread QueueListener. Pesan memakai argumen
+%-style sehingga string hanya diformat jika record benar-benar ditulis.
+"""
+
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import atexit
+import logging
+import queue
+import threading
+
+FORMAT_LOG = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Logger modul yang aktif pada operasi massal (entitas dibuat ribuan kali)
+LOGGER_HOT_PATH = ('models', 'repositories', 'services')
+
+_listener_aktif: Optional[QueueListener] = None
+
+# Context senyap_thread aktif di thread ini: list (prefix logger, level minimum)
+_senyap_thread = threading.local()
+
+
+class FilterSampel(logging.Filter):
+    """
+    Filter sampling per event.
+
+    Event dikenali dari (nama logger, template pesan), sehingga hanya 1 dari
+    setiap N kejadian event yang sama yang diteruskan. Record WARNING ke atas
+    selalu diteruskan.
+    """
+
+    def __init__(self, setiap: int = 1, per_logger: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            setiap: Teruskan 1 dari setiap N event yang sama (1 = semua)
+            per_logger: Override N per prefix nama logger, misal {'models': 100}
+        """
+        super().__init__()
+        if setiap < 1:
+            raise ValueError("Rasio sampling minimal 1")
+        self.__setiap = setiap
+        self.__per_logger = dict(per_logger or {})
+        self.__hitungan: Dict[Tuple[str, str], int] = {}
+        self.__lock = threading.Lock()
+
+    def __rasio(self, nama: str) -> int:
+        """Mencari rasio sampling untuk logger (prefix terpanjang menang)."""
+        cocok = [p for p in self.__per_logger if nama == p or nama.startswith(p + ".")]
+        return self.__per_logger[max(cocok, key=len)] if cocok else self.__setiap
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rasio = self.__rasio(record.name)
+        if rasio == 1:
+            return True
+        kunci = (record.name, str(record.msg))
+        with self.__lock:
+            ke = self.__hitungan.get(kunci, 0)
+            self.__hitungan[kunci] = ke + 1
+        return ke % rasio == 0
+
+
+class FilterSenyapThread(logging.Filter):
+    """
+    Filter untuk senyap_thread: menolak record di bawah level context dari
+    logger yang dibungkam, hanya jika record dibuat di thread yang sedang
+    berada di dalam senyap_thread. Thread lain tidak terpengaruh.
+    Dipasang setup_logging pada handler antrean (filter handler berjalan di
+    thread pemanggil logger); pasang sendiri jika memakai handler lain.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        aktif = getattr(_senyap_thread, 'aktif', None)
+        if not aktif:
+            return True
+        nama = record.name
+        for prefix, level in aktif:
+            if record.levelno < level and (nama == prefix or nama.startswith(prefix + ".")):
+                return False
+        return True
+
+
+def setup_logging(level: int = logging.INFO, log_file: Optional[str] = 'dapur_umum.log',
+                  konsol: bool = True, sampel: int = 1,
+                  sampel_per_logger: Optional[Dict[str, int]] = None) -> QueueListener:
+    """
+    Memasang pipeline logging berbasis antrean pada root logger.
+
+    Args:
+        level: Level minimum root logger
+        log_file: Path file log (None = tanpa file)
+        konsol: True untuk juga menulis ke console (stderr)
+        sampel: Teruskan 1 dari setiap N event INFO/DEBUG yang sama
+        sampel_per_logger: Override rasio sampling per prefix logger
+
+    Returns:
+        QueueListener: Listener yang sudah berjalan (dihentikan otomatis saat exit)
+    """
+    global _listener_aktif
+    hentikan_logging()
+
+    formatter = logging.Formatter(FORMAT_LOG)
+    handlers = []
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    if konsol:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    antrean = queue.SimpleQueue()
+    handler_antrean = QueueHandler(antrean)
+    handler_antrean.addFilter(FilterSenyapThread())
+    if sampel > 1 or sampel_per_logger:
+        handler_antrean.addFilter(FilterSampel(sampel, sampel_per_logger))
+
+    root = logging.getLogger()
+    for lama in list(root.handlers):
+        root.removeHandler(lama)
+    root.addHandler(handler_antrean)
+    root.setLevel(level)
+
+    listener = QueueListener(antrean, *handlers, respect_handler_level=True)
+    listener.start()
+    _listener_aktif = listener
+    return listener
+
+
+@atexit.register
+def hentikan_logging() -> None:
+    """
+    Menghentikan listener aktif: record yang masih di antrean ditulis dulu,
+    lalu handler file/console ditutup. Aman dipanggil berulang kali.
+    """
+    global _listener_aktif
+    listener, _listener_aktif = _listener_aktif, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# State mode_senyap bersama: per nama logger, level asli dan level context aktif
+_lock_senyap = threading.Lock()
+_senyap_aktif: Dict[str, Tuple[int, int, List[int]]] = {}
+
+
+def _terapkan_senyap(nama: str) -> None:
+    """Memasang level logger sesuai context yang masih aktif (di bawah _lock_senyap)."""
+    level_asli, efektif_asli, aktif = _senyap_aktif[nama]
+    tertinggi = max(aktif)
+    logging.getLogger(nama).setLevel(tertinggi if efektif_asli < tertinggi else level_asli)
+
+
+@contextmanager
+def mode_senyap(nama_logger: Iterable[str] = LOGGER_HOT_PATH,
+                level: int = logging.WARNING) -> Iterator[None]:
+    """
+    Context manager untuk operasi massal: menaikkan level logger hot path
+    sementara, sehingga logger.info() per entitas langsung ditolak tanpa
+    membuat record.
+
+    Berlaku untuk semua thread selama context aktif, jadi hanya untuk CLI,
+    importer batch dan benchmark; kode yang berjalan di thread request (service,
+    API) memakai senyap_thread. Context boleh tumpang
+    tindih (misal dua batch di thread berbeda yang selesai tidak berurutan):
+    context aktif dihitung per logger di bawah lock, dan level asli baru
+    dikembalikan saat context terakhir keluar.
+
+    Args:
+        nama_logger: Nama logger (beserta child-nya) yang dibungkam
+        level: Level minimum selama context aktif
+    """
+    nama_logger = list(nama_logger)
+    with _lock_senyap:
+        for nama in nama_logger:
+            if nama not in _senyap_aktif:
+                lg = logging.getLogger(nama)
+                _senyap_aktif[nama] = (lg.level, lg.getEffectiveLevel(), [])
+            _senyap_aktif[nama][2].append(level)
+            _terapkan_senyap(nama)
+    try:
+        yield
+    finally:
+        with _lock_senyap:
+            for nama in nama_logger:
+                level_asli, _, aktif = _senyap_aktif[nama]
+                aktif.remove(level)
+                if aktif:
+                    _terapkan_senyap(nama)
+                else:
+                    del _senyap_aktif[nama]
+                    logging.getLogger(nama).setLevel(level_asli)
+
+
+@contextmanager
+def senyap_thread(nama_logger: Iterable[str] = LOGGER_HOT_PATH,
+                  level: int = logging.WARNING) -> Iterator[None]:
+    """
+    Seperti mode_senyap, tetapi hanya untuk thread pemanggil: record dari
+    logger hot path di bawah level ditolak FilterSenyapThread, sementara log
+    per distribusi dari thread lain (posko/request bersamaan) tetap tertulis.
+    Level logger global tidak diubah.
+
+    Args:
+        nama_logger: Nama logger (beserta child-nya) yang dibungkam
+        level: Level minimum selama context aktif
+    """
+    aktif = getattr(_senyap_thread, 'aktif', None)
+    if aktif is None:
+        aktif = _senyap_thread.aktif = []
+    tambahan = [(nama, level) for nama in nama_logger]
+    aktif.extend(tambahan)
+    try:
+        yield
+    finally:
+        del aktif[len(aktif) - len(tambahan):]
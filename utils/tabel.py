@@ -0,0 +1,204 @@
+"""
+Module renderer tabel streaming untuk CLI dan ekspor.
+Baris ditulis langsung ke sink (file-like object) sehingga waktu render
+linear terhadap jumlah baris dan memori tidak bergantung pada panjang tabel.
+"""
+
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TextIO
+import csv
+
+FORMAT_TABEL = ("teks", "csv", "tsv")
+
+
+class Kolom:
+    """
+    Definisi satu kolom tabel.
+
+    Attributes:
+        judul: Judul kolom
+        ambil: Fungsi item -> nilai sel (None = item[posisi kolom])
+        lebar: Lebar tetap kolom teks (None = dihitung dari sampel baris)
+        rata: 'kiri' atau 'kanan' (angka sebaiknya rata kanan)
+    """
+
+    __slots__ = ('judul', 'ambil', 'lebar', 'rata')
+
+    def __init__(self, judul: str, ambil: Optional[Callable[[Any], Any]] = None,
+                 lebar: Optional[int] = None, rata: str = "kiri"):
+        if rata not in ("kiri", "kanan"):
+            raise ValueError(f"Perataan tidak dikenal: {rata}")
+        if lebar is not None and lebar < 1:
+            raise ValueError("Lebar kolom minimal 1")
+        self.judul = judul
+        self.ambil = ambil
+        self.lebar = lebar
+        self.rata = rata
+
+
+def _teks_sel(nilai: Any) -> str:
+    """Mengubah nilai sel menjadi teks satu baris."""
+    if nilai is None:
+        return ""
+    if isinstance(nilai, float):
+        return f"{nilai:g}"
+    return str(nilai).replace("\n", " ")
+
+
+class PenulisTabel:
+    """
+    Renderer tabel streaming.
+
+    Format 'teks': lebar kolom yang tidak ditentukan dihitung dari sejumlah
+    baris pertama (sampel). Hanya sampel itu yang ditahan di memori; setelah
+    lebar dikunci setiap baris langsung ditulis ke sink, dan sel yang lebih
+    panjang dari lebar kolom dipotong. Format 'csv'/'tsv' ditulis apa adanya
+    tanpa buffer.
+
+    Contoh::
+
+        with PenulisTabel(sys.stdout, [Kolom("ID"), Kolom("Porsi", rata="kanan")]) as tabel:
+            for baris in data:
+                tabel.tulis(baris)
+    """
+
+    def __init__(self, sink: TextIO, kolom: Sequence[Kolom], format_keluaran: str = "teks",
+                 judul: Optional[str] = None, sampel: int = 100, lebar_maks: int = 40):
+        """
+        Args:
+            sink: Tujuan tulis (file, sys.stdout, io.StringIO, ...)
+            kolom: Definisi kolom
+            format_keluaran: 'teks', 'csv' atau 'tsv'
+            judul: Judul tabel (hanya format teks)
+            sampel: Jumlah baris pertama untuk menghitung lebar kolom
+            lebar_maks: Batas lebar kolom hasil perhitungan sampel
+
+        Raises:
+            ValueError: Jika format atau parameter tidak valid
+        """
+        if format_keluaran not in FORMAT_TABEL:
+            raise ValueError(f"Format tabel tidak didukung: {format_keluaran}")
+        if not kolom:
+            raise ValueError("Tabel minimal punya satu kolom")
+        if sampel < 1 or lebar_maks < 1:
+            raise ValueError("Sampel dan lebar maksimum minimal 1")
+        self.__sink = sink
+        self.__kolom = list(kolom)
+        self.__format = format_keluaran
+        self.__judul = judul
+        self.__sampel = sampel
+        self.__lebar_maks = lebar_maks
+        self.__buffer: List[List[str]] = []
+        self.__lebar: Optional[List[int]] = None
+        self.__csv = None
+        self.__selesai = False
+        self.jumlah = 0
+
+        if format_keluaran != "teks":
+            self.__csv = csv.writer(sink, delimiter="," if format_keluaran == "csv" else "\t",
+                                    lineterminator="\n")
+            self.__csv.writerow([k.judul for k in self.__kolom])
+        elif all(k.lebar is not None for k in self.__kolom):
+            self.__kunci_lebar()
+
+    def __sel(self, item: Any) -> List[str]:
+        return [_teks_sel(k.ambil(item) if k.ambil else item[i])
+                for i, k in enumerate(self.__kolom)]
+
+    def __garis(self, sel: Sequence[str]) -> str:
+        bagian = []
+        for teks, lebar, k in zip(sel, self.__lebar, self.__kolom):
+            if len(teks) > lebar:
+                teks = teks[:lebar - 1] + "…" if lebar > 1 else teks[:lebar]
+            bagian.append(teks.rjust(lebar) if k.rata == "kanan" else teks.ljust(lebar))
+        return " | ".join(bagian).rstrip() + "\n"
+
+    def __kunci_lebar(self) -> None:
+        """Menetapkan lebar kolom, menulis kepala tabel lalu baris sampel."""
+        self.__lebar = []
+        for i, k in enumerate(self.__kolom):
+            if k.lebar is not None:
+                self.__lebar.append(k.lebar)
+                continue
+            terlebar = max((len(sel[i]) for sel in self.__buffer), default=0)
+            self.__lebar.append(min(max(len(k.judul), terlebar), self.__lebar_maks))
+
+        total = sum(self.__lebar) + 3 * (len(self.__lebar) - 1)
+        tulis = self.__sink.write
+        if self.__judul:
+            tulis("=" * total + "\n")
+            tulis(self.__judul.center(total).rstrip() + "\n")
+        tulis("=" * total + "\n")
+        tulis(self.__garis([k.judul for k in self.__kolom]))
+        tulis("-" * total + "\n")
+        for sel in self.__buffer:
+            tulis(self.__garis(sel))
+        self.__buffer = []
+
+    def tulis(self, item: Any) -> None:
+        """
+        Menulis satu baris.
+
+        Args:
+            item: Object/sequence yang dibaca oleh Kolom.ambil (atau per posisi)
+        """
+        sel = self.__sel(item)
+        self.jumlah += 1
+        if self.__csv is not None:
+            self.__csv.writerow(sel)
+        elif self.__lebar is None:
+            self.__buffer.append(sel)
+            if len(self.__buffer) >= self.__sampel:
+                self.__kunci_lebar()
+        else:
+            self.__sink.write(self.__garis(sel))
+
+    def tulis_semua(self, data: Iterable[Any]) -> int:
+        """Menulis semua baris dari iterable (boleh generator). Returns: jumlah baris ditulis."""
+        for item in data:
+            self.tulis(item)
+        return self.jumlah
+
+    def selesai(self) -> int:
+        """
+        Menutup tabel: menulis sisa sampel dan garis penutup (format teks).
+        Aman dipanggil berulang kali; sink tidak ditutup.
+
+        Returns:
+            int: Jumlah baris yang ditulis
+        """
+        if self.__selesai:
+            return self.jumlah
+        self.__selesai = True
+        if self.__csv is None:
+            if self.__lebar is None:
+                self.__kunci_lebar()
+            self.__sink.write("=" * (sum(self.__lebar) + 3 * (len(self.__lebar) - 1)) + "\n")
+        return self.jumlah
+
+    def __enter__(self) -> 'PenulisTabel':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.selesai()
+
+
+def tulis_tabel(sink: TextIO, data: Iterable[Any], kolom: Sequence[Kolom],
+                format_keluaran: str = "teks", judul: Optional[str] = None,
+                sampel: int = 100) -> int:
+    """
+    Merender seluruh data (boleh generator) sebagai tabel ke sink.
+
+    Args:
+        sink: Tujuan tulis
+        data: Baris tabel
+        kolom: Definisi kolom
+        format_keluaran: 'teks', 'csv' atau 'tsv'
+        judul: Judul tabel (hanya format teks)
+        sampel: Jumlah baris pertama untuk menghitung lebar kolom
+
+    Returns:
+        int: Jumlah baris yang ditulis
+    """
+    with PenulisTabel(sink, kolom, format_keluaran, judul, sampel) as tabel:
+        tabel.tulis_semua(data)
+    return tabel.jumlah